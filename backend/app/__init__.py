@@ -3,9 +3,6 @@ Uygulama Başlatma ve Yapılandırma Modülü
 --------------------------------------
 Flask uygulamasını başlatır ve gerekli bileşenleri yapılandırır.
 """
-import sys, io
-import os
-import logging
 from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
@@ -13,9 +10,17 @@ from flask_jwt_extended import JWTManager
 # Konfigürasyon ve hata yönetimi
 from app.config import get_config
 from app.middleware.error_handler import register_error_handlers
+from app.middleware.instrumentation import register_instrumentation
+from app.middleware.request_id import register_request_id
+from app.utils.log import configure_logging, get_logger
+from app.utils.universities import get_university_registry
+from app.feed.hot import check_backend as check_feed_backend
+from app.utils.username import check_permutation_key
 
 # Veritabanı hizmetlerini içe aktar
 from app.services import initialize_database_services
+from app.services.UserTableDatabaseService import UserDatabaseService
+from app.services.ReactionTableDatabaseService import ReactionDatabaseService
 
 # Blueprint'ları içe aktar
 from app.api.auth import auth_bp
@@ -25,32 +30,9 @@ from app.api.comment import comment_bp
 from app.api.poll import poll_bp
 from app.api.group import group_bp
 from app.api.media import media_bp
+from app.api.feed import feed_bp
 
-def configure_logging(app):
-    """
-    Uygulama için günlük kaydı yapılandırır
-    
-    Args:
-        app (Flask): Flask uygulama örneği
-    """
-    # Wrap stdout in a TextIOWrapper that uses UTF-8
-    sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding='utf-8', errors='replace')
-
-    # Log seviyesini ayarla
-    log_level = getattr(logging, app.config['LOG_LEVEL'].upper(), logging.INFO)
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Dosyaya günlük kaydetme (isteğe bağlı)
-    if app.config.get('LOG_FILE'):
-        file_handler = logging.FileHandler(app.config['LOG_FILE'])
-        file_handler.setLevel(log_level)
-        app.logger.addHandler(file_handler)
-    
-    app.logger.info('Logging configured')
+logger = get_logger(__name__)
 
 def create_app(config=None):
     """
@@ -74,40 +56,55 @@ def create_app(config=None):
     # Günlük kaydını yapılandır
     configure_logging(app)
     
+    # Süreç içi sıcak akış yalnızca geliştirme ve testlerde kullanılabilir
+    check_feed_backend(app)
+    # Kullanıcı adı permütasyonu üretimde kendi anahtarını ister
+    check_permutation_key(app)
+    
     
     # CORS'u etkinleştir
     if app.config.get('CORS_ENABLED', True):
-        # prints CORS state in green using ansi escape codes
-        print ("\033[92mCORS enabled\033[0m", flush=True)
+        logger.debug("cors_enabled")
         CORS(app)
     else:
-        # prints CORS state in red using ansi escape codes
-        print ("\033[91mCORS disabled\033[0m", flush=True)
+        logger.debug("cors_disabled")
     
     # JWT'yi başlat
     JWTManager(app)
     
-    # prints "JWT initialized" in green using ansi escape codes
-    print ("\033[92mJWT initialized\033[0m", flush=True)
+    logger.debug("jwt_initialized")
 
     # Veritabanı hizmetlerini başlat
     initialize_database_services(app)
     
-    # prints "Database services initialized" in green using ansi escape codes
-    print ("\033[92mDatabase services initialized\033[0m", flush=True)
+    logger.debug("database_services_initialized")
+
+    # Üniversite alan adı listesini ilk kayıt isteğinden önce yükle
+    get_university_registry()
+
     # Blueprint'ları kaydet
     register_blueprints(app)
 
-    # prints "Blueprints registered" in green using ansi escape codes
-    print ("\033[92mBlueprints registered\033[0m", flush=True)
+    logger.debug("blueprints_registered")
     
     # Hata işleyicileri kaydet
     register_error_handlers(app)
     
+    # İstek kimliği ve istek başına arka uç çağrı ölçümü (Server-Timing)
+    register_request_id(app)
+    register_instrumentation(app)
+    
     # Sağlık kontrolü endpoint'i
     @app.route(f"{app.config['API_PREFIX']}/health")
     def health_check():
-        return {"status": "OK", "message": "Sunucu çalışıyor"}
+        return {
+            "status": "OK",
+            "message": "Sunucu çalışıyor",
+            "caches": {
+                "users": UserDatabaseService.get_instance().user_cache.stats(),
+                "reaction_counts": ReactionDatabaseService.get_instance().count_cache.stats()
+            }
+        }
     
     app.logger.info(f"Uygulama {app.config['LOG_LEVEL']} modunda başlatıldı")
     
@@ -127,13 +124,13 @@ def register_blueprints(app):
         (comment_bp, 'comments'),
         (poll_bp, 'polls'),
         (group_bp, 'groups'),
-        (media_bp, 'media')
+        (media_bp, 'media'),
+        (feed_bp, 'feed')
     ]
     
     for blueprint, name in blueprints:
         url_prefix = f"{app.config['API_PREFIX']}/{name}"
-        #prints the url_prefix in yellow using ansi escape codes
-        print ("\033[93m" + url_prefix + "\033[0m", flush=True)
+        logger.debug("blueprint_registered", name=name, url_prefix=url_prefix)
         app.register_blueprint(
             blueprint, 
             url_prefix=url_prefix
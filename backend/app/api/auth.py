@@ -1,10 +1,11 @@
 from flask import Blueprint, request, jsonify, g
 from marshmallow import Schema, fields, validate
 from app.services.auth_service import AuthService
+from app.services.UserTableDatabaseService import UsernameAlreadyExistsError
 from app.utils.responses import success_response, error_response, created_response
 from app.middleware.validation import validate_schema
 from app.middleware.auth import authenticate
-from app.utils.exceptions import AuthError, ValidationError
+from app.utils.exceptions import ApiError, AuthError, ValidationError
 from app.utils.auth import check_university_email
 from app.utils.username import get_new_username_for_university
 
@@ -26,6 +27,10 @@ auth_bp = Blueprint('auth', __name__)
 
 auth_service = AuthService()
 
+# Usernames are unique across universities while allocation sequences are
+# per university, so a generated name may already be taken elsewhere
+USERNAME_ALLOCATION_ATTEMPTS = 5
+
 # Schemas
 class RegisterSchema(Schema):
     """Registration schema"""
@@ -73,9 +78,15 @@ def register():
         
         data['university'] = university
 
-        data['username'] = get_new_username_for_university(university)
-        # Register user
-        result = auth_service.register(data)
+        # Register user, drawing a fresh username if the generated one is taken
+        for attempt in range(USERNAME_ALLOCATION_ATTEMPTS):
+            data['username'] = get_new_username_for_university(university)
+            try:
+                result = auth_service.register(data)
+                break
+            except UsernameAlreadyExistsError:
+                if attempt == USERNAME_ALLOCATION_ATTEMPTS - 1:
+                    return error_response("Kullanıcı adı atanamadı, lütfen tekrar deneyin", 409)
         
         return created_response(result, "Kullanıcı başarıyla kaydedildi")
     
@@ -85,6 +96,9 @@ def register():
     except ValidationError as e:
         return error_response(e.message, e.status_code, e.errors)
     
+    except ApiError:
+        raise
+    
     except Exception as e:
         return error_response(str(e), 500)
 
@@ -104,6 +118,9 @@ def login():
     except AuthError as e:
         return error_response(e.message, e.status_code)
     
+    except ApiError:
+        raise
+    
     except Exception as e:
         return error_response(str(e), 500)
 
@@ -157,6 +174,9 @@ def change_password():
     except AuthError as e:
         return error_response(e.message, e.status_code)
     
+    except ApiError:
+        raise
+    
     except Exception as e:
         return error_response(str(e), 500)
 
@@ -196,5 +216,8 @@ def reset_password():
     except AuthError as e:
         return error_response(e.message, e.status_code)
     
+    except ApiError:
+        raise
+    
     except Exception as e:
         return error_response(str(e), 500)
\ No newline at end of file
@@ -6,7 +6,8 @@ from app.utils.responses import (
     list_response, 
     created_response, 
     updated_response, 
-    deleted_response
+    deleted_response,
+    cursor_list_response
 )
 from app.middleware.auth import authenticate
 from app.middleware.validation import (
@@ -16,13 +17,16 @@ from app.middleware.validation import (
     is_positive_integer
 )
 from app.services.comment_service import CommentService
-import traceback
+from app.utils.exceptions import ApiError, ValidationError
+from app.utils.images import image_variants
+from app.utils.log import get_logger
 """
 API endpoints for comment operations.
 
 Endpoints:
 - /comments/ [POST]: Create a new comment
 - /comments/commented_on_id=<commented_on_id> [GET]: Retrieve comments for a specific post
+- /comments/commented_on_id=<commented_on_id>/thread [GET]: Retrieve a page of comments with nested replies
 - /comments/<comment_id> [GET]: Get a specific comment
 - /comments/<comment_id> [PUT]: Update an existing comment
 - /comments/<comment_id> [DELETE]: Delete a comment
@@ -34,6 +38,15 @@ Endpoints:
 
 # Blueprint and Database Service
 comment_bp = Blueprint('comment', __name__)
+logger = get_logger(__name__)
+
+MAX_PER_PAGE = 100
+
+def _comment_response(comment) -> dict:
+    """Yorum yanıtı; to_dict kalıcı öğe biçimi olduğundan türev URL'leri burada eklenir."""
+    data = comment.to_dict()
+    data['photo_variants'] = [image_variants(url) for url in comment.photo_urls or []]
+    return data
 
 # Schemas
 class CommentCreateSchema(Schema):
@@ -73,8 +86,6 @@ def create_comment():
         
         # Get validated data from request
         data = request.validated_data
-
-        print (data)
         
         # Create comment
         comment = CommentService.create_comment(
@@ -84,8 +95,7 @@ def create_comment():
             photo_urls=data.get('photo_urls', [])
         )
         
-        print (comment.to_dict())
-        return created_response(comment.to_dict(), "Yorum başarıyla oluşturuldu")
+        return created_response(_comment_response(comment), "Yorum başarıyla oluşturuldu")
     
     except ValueError as e:
         return error_response(str(e), 400)
@@ -102,12 +112,47 @@ def get_comments(commented_on_id):
         # Get comments
         comments = CommentService.get_comments_by_commented_on_id(commented_on_id)
         
-        return success_response(data=[comment.to_dict() for comment in comments], 
+        return success_response(data=[_comment_response(comment) for comment in comments], 
             message="Yorumlar başarıyla getirildi"
         )
     
     except Exception as e:
-        print (traceback.format_exc(), flush=True)
+        logger.exception("get_comments_failed")
+        return error_response(str(e), 500)
+    
+@comment_bp.route('/commented_on_id=<commented_on_id>/thread', methods=['GET'])
+@authenticate
+@validate_query_params({
+    'per_page': is_positive_integer,
+    'depth': lambda value: value.isdigit()
+})
+def get_comment_thread(commented_on_id):
+    """
+    Retrieve a page of comments with nested replies
+    """
+    try:
+        per_page = min(int(request.args.get('per_page', 20)), MAX_PER_PAGE)
+        depth = int(request.args.get('depth', 3))
+        cursor = request.args.get('cursor')
+        
+        result = CommentService.get_comment_thread(
+            commented_on_id,
+            per_page=per_page,
+            cursor=cursor,
+            depth=depth
+        )
+        
+        return cursor_list_response(
+            result['comments'],
+            result['meta']['next_cursor'],
+            result['meta']['per_page'],
+            "Yorumlar başarıyla getirildi"
+        )
+    
+    except ValidationError as e:
+        return error_response(e.message, 400)
+    except Exception as e:
+        logger.exception("get_comment_thread_failed")
         return error_response(str(e), 500)
     
 @comment_bp.route('/<comment_id>', methods=['GET'])
@@ -122,8 +167,10 @@ def get_comment(comment_id):
         if not comment:
             return error_response("Yorum bulunamadı", 404)
         
-        return success_response(comment.to_dict(), "Yorum başarıyla getirildi")
+        return success_response(_comment_response(comment), "Yorum başarıyla getirildi")
     
+    except ApiError:
+        raise
     except Exception as e:
         return error_response(str(e), 500)
 
@@ -151,7 +198,7 @@ def update_comment(comment_id):
             update_data=update_data
         )
         
-        return updated_response(updated_comment.to_dict(), "Yorum başarıyla güncellendi")
+        return updated_response(_comment_response(updated_comment), "Yorum başarıyla güncellendi")
     
     except ValueError as e:
         return error_response(str(e), 400)
@@ -197,13 +244,13 @@ def get_comment_replies(comment_id):
         )
         
         return success_response(
-            result, 
+            [_comment_response(reply) for reply in result], 
             "Yorum yanıtları başarıyla getirildi",
             200
         )
     
     except Exception as e:
-        print (traceback.format_exc(), flush=True)
+        logger.exception("get_comment_replies_failed")
         return error_response(str(e), 500)
 
 @comment_bp.route('/<comment_id>/react', methods=['POST'])
@@ -232,7 +279,7 @@ def react_to_comment(comment_id):
     except ValueError as e:
         return error_response(str(e), 400)
     except Exception as e:
-        print (traceback.format_exc(), flush=True)
+        logger.exception("react_to_comment_failed")
         return error_response("Reaksiyon eklenemedi", 500)
     
 @comment_bp.route('/<comment_id>/creator_info', methods=['GET'])
@@ -251,7 +298,7 @@ def get_comment_creator_info(comment_id):
         return success_response(creator_info, "Kullanıcı bilgileri başarıyla getirildi")
     
     except Exception as e:
-        print (traceback.format_exc(), flush=True)
+        logger.exception("get_comment_creator_info_failed")
         return error_response(str(e), 500)
     
 @comment_bp.route('/<comment_id>/reply', methods=['POST'])
@@ -275,10 +322,10 @@ def reply_comment(comment_id):
             photo_urls=data.get('photo_urls', [])
         )
         
-        return created_response(result.to_dict(), "Yanıt başarıyla eklendi")
+        return created_response(_comment_response(result), "Yanıt başarıyla eklendi")
     
     except ValueError as e:
         return error_response(str(e), 400)
     except Exception as e:
-        print (traceback.format_exc(), flush=True)
+        logger.exception("reply_comment_failed")
         return error_response("Yanıt eklenemedi", 500)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from flask import Blueprint, request
+from marshmallow import Schema, fields
+from app.utils.responses import error_response, cursor_list_response
+from app.middleware.auth import authenticate
+from app.middleware.validation import validate_schema, is_positive_integer
+from app.services.feed_service import FeedService
+from app.utils.exceptions import ApiError, ValidationError
+from app.utils.log import get_logger
+
+"""
+API endpoints for feeds.
+
+Endpoints:
+- /feed/hot [GET]: Forums and polls ranked by time-decayed activity (cursor paginated)
+"""
+
+feed_bp = Blueprint('feed', __name__)
+logger = get_logger(__name__)
+
+# Upper bound for a single page of the feed
+MAX_PER_PAGE = 100
+
+class HotFeedRequestSchema(Schema):
+    cursor = fields.Str()
+    per_page = fields.Int(validate=is_positive_integer)
+    university = fields.Str()
+
+@feed_bp.route('/hot', methods=['GET'])
+@authenticate
+@validate_schema(HotFeedRequestSchema())
+def get_hot_feed():
+    """
+    Retrieve the hot feed of a university, or of all universities
+    """
+    try:
+        per_page = min(int(request.args.get('per_page', 20)), MAX_PER_PAGE)
+        cursor = request.args.get('cursor')
+        university = request.args.get('university')
+
+        result = FeedService.get_hot_feed(
+            per_page=per_page,
+            cursor=cursor,
+            university=university
+        )
+
+        return cursor_list_response(
+            result['items'],
+            result['meta']['next_cursor'],
+            result['meta']['per_page'],
+            "Akış başarıyla getirildi"
+        )
+
+    except ValidationError as e:
+        return error_response(e.message, 400)
+    except ApiError:
+        raise
+    except Exception as e:
+        logger.exception("get_hot_feed_failed")
+        return error_response("Akış getirilemedi", 500)
@@ -1,20 +1,22 @@
 from flask import Blueprint, request, g
 from marshmallow import Schema, fields, validate
-from app.utils.responses import success_response, error_response, list_response, created_response, updated_response, deleted_response
+from app.utils.responses import success_response, error_response, cursor_list_response, created_response, updated_response, deleted_response
 from app.middleware.auth import authenticate
 from app.middleware.validation import validate_schema, is_positive_integer, is_uuid
 from app.services.forum_service import ForumService
 from app.services.user_service import UserService
 from app.models.UserModel import UserRoles
-import traceback
+from app.utils.exceptions import ApiError, ValidationError
+from app.utils.log import get_logger
 
 """
 API endpoints for forum operations.
 
 Endpoints:
-- /forums/ [GET]: Retrieve forums
+- /forums/ [GET]: Retrieve forums (cursor paginated)
 - /forums/<forum_id> [GET]: Retrieve a specific forum
 - /forums/<forum_id>/creator_info [GET]: Retrieve creator information for a specific forum
+- /forums/<forum_id>/react [POST]: Add a reaction to a forum
 - /forums/ [POST]: Create a new forum
 - /forums/<forum_id> [PUT]: Update an existing forum
 - /forums/<forum_id> [DELETE]: Hard delete a forum
@@ -22,6 +24,10 @@ Endpoints:
 
 # Blueprint and Database Service
 forum_bp = Blueprint('forum', __name__)
+logger = get_logger(__name__)
+
+# Upper bound for a single page of forums
+MAX_PER_PAGE = 100
 
 # Schemas
 class ForumCreateSchema(Schema):
@@ -37,8 +43,15 @@ class ForumUpdateSchema(Schema):
     category = fields.Str()
     photo_urls = fields.List(fields.Url())
 
+class ForumReactionSchema(Schema):
+    reaction_type = fields.Str(
+        required=True, 
+        validate=validate.OneOf(['like', 'dislike']), 
+        error_messages={'required': 'Reaksiyon türü gereklidir'}
+    )
+
 class ForumRequestSchema(Schema):
-    page = fields.Int(validate=is_positive_integer)
+    cursor = fields.Str()
     per_page = fields.Int(validate=is_positive_integer)
     category = fields.Str()
     university = fields.Str()
@@ -51,37 +64,36 @@ class ForumRequestSchema(Schema):
 @validate_schema(ForumRequestSchema())
 def get_forums():
     """
-    Retrieve forums with optional filtering and pagination
+    Retrieve forums with optional filtering and cursor pagination
     """
     try:
         # Extract query parameters
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 10))
+        per_page = min(int(request.args.get('per_page', 10)), MAX_PER_PAGE)
+        cursor = request.args.get('cursor')
         category = request.args.get('category')
         university = request.args.get('university')
         search = request.args.get('search')
         
         # Get forums
         result = ForumService.get_forums(
-            page=page,
             per_page=per_page,
+            cursor=cursor,
             category=category,
             university=university,
             search=search
         )
 
-        print (result)
-        
-        return list_response(
+        return cursor_list_response(
             result['forums'], 
-            result['meta']['total'], 
-            result['meta']['page'],
+            result['meta']['next_cursor'], 
             result['meta']['per_page'],
             "Forumlar başarıyla getirildi"
         )
     
+    except ValidationError as e:
+        return error_response(e.message, 400)
     except Exception as e:
-        print (traceback.format_exc(), flush=True)
+        logger.exception("get_forums_failed")
         return error_response(str(e), 500)
 
 @forum_bp.route('/<forum_id>', methods=['GET'])
@@ -98,6 +110,8 @@ def get_forum(forum_id):
         
         return success_response(forum.to_dict(), "Forum başarıyla getirildi")
     
+    except ApiError:
+        raise
     except Exception as e:
         return error_response(str(e), 500)
 
@@ -117,9 +131,32 @@ def get_forum_creator_info(forum_id):
         return success_response(creator_info, "Kullanıcı bilgileri başarıyla getirildi")
     
     except Exception as e:
-        print (traceback.format_exc(), flush=True)
+        logger.exception("get_forum_creator_info_failed")
         return error_response(str(e), 500)
     
+@forum_bp.route('/<forum_id>/react', methods=['POST'])
+@authenticate
+@validate_schema(ForumReactionSchema())
+def react_to_forum(forum_id):
+    """
+    Add a reaction to a forum
+    """
+    try:
+        data = request.validated_data
+        
+        result = ForumService.react_to_forum(
+            forum_id=forum_id,
+            user_id=g.user.user_id,
+            reaction=data['reaction_type']
+        )
+        
+        return success_response(result, "Reaksiyon başarıyla eklendi")
+    
+    except ValueError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        logger.exception("react_to_forum_failed")
+        return error_response("Reaksiyon eklenemedi", 500)
 
 @forum_bp.route('/', methods=['POST'])
 @authenticate
@@ -147,11 +184,10 @@ def create_forum():
         return created_response(forum.to_dict(), "Forum başarıyla oluşturuldu")
     
     except ValueError as e:
-        # prints the traceback of the error in red using ansi color codes
-        print ("\033[91m", traceback.format_exc(), "\033[0m", flush=True)
+        logger.info("create_forum_rejected", error=str(e))
         return error_response(str(e), 400)
     except Exception as e:
-        print ("\033[91m", traceback.format_exc(), "\033[0m", flush=True)
+        logger.exception("create_forum_failed")
         return error_response("Forum oluşturulamadı", 500)
 
 @forum_bp.route('/<forum_id>', methods=['PUT'])
@@ -213,5 +249,5 @@ def delete_forum(forum_id):
     except ValueError as e:
         return error_response(str(e), 400)
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("delete_forum_failed")
         return error_response("Forum silinemedi", 500)
\ No newline at end of file
@@ -1,13 +1,16 @@
 from flask import Blueprint, request, g
 from marshmallow import Schema, fields, validate
 from app.services.GroupTableDatabaseService import GroupDatabaseService
-from app.utils.responses import success_response, error_response, list_response, created_response, updated_response, deleted_response
+from app.utils.responses import success_response, error_response, list_response, cursor_list_response, created_response, updated_response, deleted_response
+from app.utils.exceptions import ValidationError
 from app.middleware.auth import authenticate
-from app.middleware.validation import validate_schema, is_uuid, is_positive_integer
+from app.middleware.validation import validate_schema, validate_path_param, is_uuid, is_positive_integer
 
 # Blueprint and Database Service
 group_bp = Blueprint('group', __name__)
 group_db_service = GroupDatabaseService()
+# Upper bound for the per_page query parameter
+MAX_PER_PAGE = 100
 
 # Schemas
 class GroupCreateSchema(Schema):
@@ -63,7 +66,7 @@ def get_groups():
         return error_response(str(e), 500)
 
 @group_bp.route('/<group_id>', methods=['GET'])
-@validate_schema({'group_id': fields.Str(validate=is_uuid)})
+@validate_path_param('group_id', is_uuid)
 def get_group(group_id):
     """
     Retrieve a specific group by ID
@@ -222,12 +225,12 @@ def leave_group(group_id):
 @group_bp.route('/<group_id>/members', methods=['GET'])
 def get_group_members(group_id):
     """
-    Retrieve group members
+    Retrieve group members (cursor paginated)
     """
     try:
         # Extract query parameters
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 20))
+        per_page = min(int(request.args.get('per_page', 20)), MAX_PER_PAGE)
+        cursor = request.args.get('cursor')
         status = request.args.get('status')
         role = request.args.get('role')
         
@@ -237,31 +240,23 @@ def get_group_members(group_id):
         if not group:
             return error_response("Grup bulunamadı", 404)
         
-        # Filter members based on query parameters
-        members = group.uyeler
-        
-        # Filter by status if specified
-        if status:
-            members = [m for m in members if m.durum == status]
-        
-        # Filter by role if specified
-        if role:
-            members = [m for m in members if m.rol == role]
-        
-        # Paginate results
-        total_count = len(members)
-        start_index = (page - 1) * per_page
-        end_index = start_index + per_page
-        paginated_members = members[start_index:end_index]
+        result = group_db_service.get_group_members(
+            group_id,
+            per_page=per_page,
+            cursor=cursor,
+            status=status,
+            role=role
+        )
         
-        return list_response(
-            [member.to_dict() for member in paginated_members],
-            total_count,
-            page,
-            per_page,
+        return cursor_list_response(
+            result['members'],
+            result['meta']['next_cursor'],
+            result['meta']['per_page'],
             "Grup üyeleri başarıyla getirildi"
         )
     
+    except ValidationError as e:
+        return error_response(e.message, 400)
     except Exception as e:
         return error_response(str(e), 500)
 
@@ -309,37 +304,14 @@ def update_member_role(group_id, user_id):
         if not new_role or new_role not in ['uye', 'moderator', 'yonetici']:
             return error_response("Geçersiz rol", 400)
         
-        # Retrieve the group first
-        group = group_db_service.get_group_by_id(group_id)
-        
-        if not group:
-            return error_response("Grup bulunamadı", 404)
-        
-        # Update member role
-        # Note: This would require a custom method in the database service
-        # For now, we'll use the update_group method as a workaround
-        update_data = {
-            'uyeler': [
-                {
-                    'kullanici_id': member.kullanici_id,
-                    'rol': new_role if member.kullanici_id == user_id else member.rol,
-                    'katilma_tarihi': member.katilma_tarihi,
-                    'durum': member.durum
-                } 
-                for member in group.uyeler
-            ]
-        }
-        
-        updated_group = group_db_service.update_group(
+        result = group_db_service.update_member_role(
             group_id=group_id,
-            user_id=admin_id,
-            update_data=update_data
+            admin_id=admin_id,
+            user_id=user_id,
+            rol=new_role
         )
         
-        return updated_response(
-            {'role': new_role, 'user_id': user_id}, 
-            "Üye rolü başarıyla güncellendi"
-        )
+        return updated_response(result, "Üye rolü başarıyla güncellendi")
     
     except ValueError as e:
         return error_response(str(e), 400)
@@ -10,11 +10,12 @@ from app.services.media_service import MediaService
 from app.utils.responses import success_response, error_response, list_response, created_response, deleted_response
 from app.middleware.validation import validate_schema, validate_path_param, validate_query_params, is_uuid, is_positive_integer
 from app.middleware.auth import authenticate
-from app.utils.exceptions import NotFoundError, ValidationError, ForbiddenError
-import traceback
+from app.utils.exceptions import ApiError, NotFoundError, ValidationError, ForbiddenError
+from app.utils.log import get_logger
 
 # Blueprint tanımla
 media_bp = Blueprint('media', __name__)
+logger = get_logger(__name__)
 
 media_service = MediaService.get_instance()
 # Şemalar
@@ -24,6 +25,12 @@ class MediaUploadMetadataSchema(Schema):
     model_id = fields.Str()
     description = fields.Str()
 
+class MediaUploadRequestSchema(MediaUploadMetadataSchema):
+    """Doğrudan S3 yükleme isteği şeması"""
+    content_type = fields.Str(required=True, error_messages={'required': 'İçerik türü zorunludur'})
+    size = fields.Int(validate=validate.Range(min=1))
+    filename = fields.Str(validate=validate.Length(max=255))
+
 class MediaDeleteSchema(Schema):
     """Medya silme şeması"""
     storage_path = fields.Str(required=True, error_messages={'required': 'Depolama yolu zorunludur'})
@@ -52,9 +59,7 @@ def upload_file():
             return error_response("Dosya bulunamadı", 400)
         
         file = request.files['file']
-        # prints file in green using ansi escape codes
-        print ("\033[92m", file, "\033[0m", flush=True)
-        print ("\033[92m", file.filename, "\033[0m", flush=True)
+        logger.debug("upload_received", filename=file.filename, content_type=file.content_type)
         if file.filename == '':
             return error_response("Dosya seçilmedi", 400)
         
@@ -72,13 +77,74 @@ def upload_file():
         return created_response(result, "Dosya başarıyla yüklendi")
     
     except ValidationError as e:
-        print ("\033[91m", traceback.format_exc(), "\033[0m", flush=True)
+        logger.info("upload_file_rejected", error=str(e))
         return error_response(e.message, 400, e.errors if hasattr(e, 'errors') else None)
     
     except Exception as e:
-        print ("\033[91m", traceback.format_exc(), "\033[0m", flush=True)
+        logger.exception("upload_file_failed")
         return error_response(str(e), 500)
 
+@media_bp.route('/uploads', methods=['POST'])
+@authenticate
+@validate_schema(MediaUploadRequestSchema())
+def create_upload():
+    """
+    Dosyanın doğrudan S3'e yüklenmesi için imzalı POST formu oluşturur.
+    
+    İstemci dönen upload.fields alanlarını ve dosyayı (en sonda 'file' alanı
+    olarak) upload.url adresine multipart/form-data ile gönderir, ardından
+    /uploads/<media_id>/complete çağırır.
+    
+    Returns:
+        tuple: Yanıt ve HTTP durum kodu
+    """
+    try:
+        data = request.validated_data
+        metadata = {key: data[key] for key in ('model_type', 'model_id', 'description') if key in data}
+        
+        result = media_service.create_upload(
+            user_id=g.user.user_id,
+            content_type=data['content_type'],
+            size=data.get('size'),
+            filename=data.get('filename', ''),
+            metadata=metadata
+        )
+        
+        return created_response(result, "Yükleme formu oluşturuldu")
+    
+    except ApiError as e:
+        logger.info("create_upload_rejected", error=e.message)
+        return error_response(e.message, e.status_code, e.errors)
+    
+    except Exception as e:
+        logger.exception("create_upload_failed")
+        return error_response("Yükleme formu oluşturulamadı", 500)
+
+@media_bp.route('/uploads/<media_id>/complete', methods=['POST'])
+@authenticate
+def complete_upload(media_id):
+    """
+    Doğrudan S3 yüklemesinin bittiğini kaydeder.
+    
+    Args:
+        media_id (str): Medya ID'si
+    
+    Returns:
+        tuple: Yanıt ve HTTP durum kodu
+    """
+    try:
+        result = media_service.complete_upload(media_id, g.user.user_id)
+        
+        return success_response(result, "Dosya başarıyla yüklendi")
+    
+    except ApiError as e:
+        logger.info("complete_upload_rejected", media_id=media_id, error=e.message)
+        return error_response(e.message, e.status_code, e.errors)
+    
+    except Exception as e:
+        logger.exception("complete_upload_failed", media_id=media_id)
+        return error_response("Yükleme tamamlanamadı", 500)
+
 '''
 @media_bp.route('/upload-multiple', methods=['POST'])
 @authenticate
@@ -7,11 +7,13 @@ from app.utils.responses import (
     list_response, 
     created_response, 
     updated_response, 
-    deleted_response
+    deleted_response,
+    cached_response
 )
 from app.middleware.auth import authenticate
 from app.middleware.validation import (
     validate_schema, 
+    validate_path_param, 
     is_uuid, 
     is_positive_integer, 
     is_boolean
@@ -64,6 +66,7 @@ def get_polls():
         per_page = int(request.args.get('per_page', 10))
         category = request.args.get('category')
         university = request.args.get('university')
+        search = request.args.get('search')
         
         # Aktiflik filtresi (boolean kontrolü)
         aktif = None
@@ -80,7 +83,8 @@ def get_polls():
             per_page=per_page,
             category=category,
             university=university,
-            aktif=aktif
+            aktif=aktif,
+            search=search
         )
         
         return list_response(
@@ -95,7 +99,7 @@ def get_polls():
         return error_response(str(e), 500)
 
 @poll_bp.route('/<poll_id>', methods=['GET'])
-@validate_schema({'poll_id': fields.Str(validate=is_uuid)})
+@validate_path_param('poll_id', is_uuid)
 def get_poll(poll_id):
     """
     Retrieve a specific poll by ID
@@ -245,7 +249,8 @@ def get_poll_results(poll_id):
         # Get poll results
         results = poll_db_service.get_poll_results(poll_id)
         
-        return success_response(results, "Anket sonuçları başarıyla getirildi")
+        # Clients polling live results revalidate with If-None-Match
+        return cached_response(results, "Anket sonuçları başarıyla getirildi")
     
     except ValueError as e:
         return error_response(str(e), 404)
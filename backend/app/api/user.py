@@ -1,17 +1,19 @@
 from flask import Blueprint, request, jsonify, g
 from marshmallow import Schema, fields, validate
-from app.services.UserTableDatabaseService import UserDatabaseService
+from app.services.UserTableDatabaseService import UserDatabaseService, BATCH_GET_USERS_MAX
+from app.services.GroupTableDatabaseService import GroupDatabaseService
 from app.utils.responses import success_response, error_response
 from app.middleware.auth import authenticate
 from app.middleware.validation import validate_schema, validate_path_param, is_uuid, is_positive_integer
 from app.utils.auth import generate_token
-import traceback
+from app.utils.log import get_logger
 
 """
 API endpoints for user operations.
 
 Endpoints:
 - /users/by-username/<username> [GET]: Get user by username
+- /users/batch [POST]: Get public info of several users at once
 - /users/profile [PUT]: Update current user's profile
 - /users/account [DELETE]: Delete current user's account
 - /users/forums [GET]: Get forums of current user
@@ -21,7 +23,9 @@ Endpoints:
 
 # Blueprint and Database Service
 user_bp = Blueprint('user', __name__)
+logger = get_logger(__name__)
 user_db_service = UserDatabaseService.get_instance()
+group_db_service = GroupDatabaseService()
 
 # Şemalar
 class UserUpdateSchema(Schema):
@@ -31,6 +35,14 @@ class UserUpdateSchema(Schema):
     gender = fields.Str(validate=validate.OneOf(['Erkek', 'Kadın', 'Diğer']))
     university = fields.Str()
     profile_image_url = fields.Url()
+
+class UserBatchSchema(Schema):
+    """Toplu kullanıcı bilgisi şeması"""
+    user_ids = fields.List(
+        fields.Str(),
+        required=True,
+        validate=validate.Length(min=1, max=BATCH_GET_USERS_MAX)
+    )
     
 @user_bp.route('/by-username/<username>', methods=['GET'])
 @authenticate
@@ -44,6 +56,23 @@ def get_user_by_username(username):
     except Exception as e:
         return error_response("User retrieval failed", 500)
     
+@user_bp.route('/batch', methods=['POST'])
+@authenticate
+@validate_schema(UserBatchSchema())
+def get_users_batch():
+    """
+    Get public info of several users, e.g. the creators of a page of comments
+    """
+    try:
+        users = user_db_service.batch_get_users(request.validated_data['user_ids'])
+        return success_response(
+            {user_id: user.safe_dict() for user_id, user in users.items()},
+            "Users retrieved"
+        )
+    except Exception as e:
+        logger.exception("get_users_batch_failed")
+        return error_response("User retrieval failed", 500)
+
 @user_bp.route('/profile', methods=['PUT'])
 @authenticate
 @validate_schema(UserUpdateSchema())
@@ -60,7 +89,7 @@ def update_profile():
         
         return success_response(user.to_dict(), "Profile updated")
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("update_profile_failed")
         return error_response("Profile update failed", 500)
 
 @user_bp.route('/account', methods=['DELETE'])
@@ -73,7 +102,7 @@ def delete_account():
         user_db_service.delete_user(g.user.user_id)
         return success_response({}, "Account deleted")
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("delete_account_failed")
         return error_response("Account deletion failed", 500)
     
 @user_bp.route('/forums', methods=['GET'])
@@ -83,7 +112,7 @@ def get_my_forums():
         forums = user_db_service._get_user_forums_by_user_id(g.user.user_id)
         return success_response(forums, "Forums retrieved")
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("get_my_forums_failed")
         return error_response("Forum retrieval failed", 500)
     
 @user_bp.route('/polls', methods=['GET'])
@@ -93,15 +122,17 @@ def get_my_polls():
         polls = user_db_service._get_user_polls_by_user_id(g.user.user_id)
         return success_response(polls, "Polls retrieved")
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("get_my_polls_failed")
         return error_response("Poll retrieval failed", 500)
     
 @user_bp.route('/groups', methods=['GET'])
 @authenticate
 def get_my_groups():
     try:
-        groups = user_db_service._get_user_groups_by_user_id(g.user.user_id)
+        # Yanıt önceki gibi üye olunan grupların ID listesidir
+        memberships = group_db_service.get_user_groups(g.user.user_id)
+        groups = [member['group_id'] for member in memberships if member['durum'] == 'aktif']
         return success_response(groups, "Groups retrieved")
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("get_my_groups_failed")
         return error_response("Group retrieval failed", 500)
\ No newline at end of file
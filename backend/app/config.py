@@ -39,6 +39,19 @@ class BaseConfig:
     # Logging ayarları
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'console')  # console veya json
+    # Logger bazında seviyeler: "logger=SEVİYE,..."
+    LOG_LEVELS = os.getenv(
+        'LOG_LEVELS',
+        'botocore=WARNING,boto3=WARNING,s3transfer=WARNING,urllib3=WARNING'
+    )
+    # Debug olaylarının (istek gövdeleri vb.) tutulma oranı, 0-1
+    LOG_DEBUG_SAMPLE_RATE = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', '1.0'))
+    
+    # İstek başına arka uç çağrılarını Server-Timing başlığında raporla.
+    # Başlık tablo adlarını ve kapasite tüketimini istemciye açtığı için
+    # yalnızca geliştirmede varsayılan olarak açıktır
+    SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'False').lower() in ('true', '1', 'yes')
     
     # Dosya yükleme ayarları
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16 MB
@@ -48,7 +61,8 @@ class BaseConfig:
 class DevelopmentConfig(BaseConfig):
     """Geliştirme ortamı konfigürasyonu"""
     DEBUG = True
-    LOG_LEVEL = 'DEBUG'
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG')
+    SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'True').lower() in ('true', '1', 'yes')
 
 class TestingConfig(BaseConfig):
     """Test ortamı konfigürasyonu"""
@@ -59,7 +73,7 @@ class TestingConfig(BaseConfig):
 class ProductionConfig(BaseConfig):
     """Üretim ortamı konfigürasyonu"""
     DEBUG = False
-    LOG_LEVEL = 'WARNING'
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'WARNING')
 
 def get_config():
     """
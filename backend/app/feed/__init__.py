@@ -0,0 +1,25 @@
+"""
+Akış
+----
+Üniversite başına, zamanla sönümlenen etkinlik puanıyla sıralanan
+forum ve anket akışı (/feed/hot).
+"""
+
+from app.feed.hot import (
+    HotFeed,
+    get_hot_feed,
+    record_activity,
+    record_item,
+    remove_item
+)
+from app.feed.store import MemoryHotFeedStore, RedisHotFeedStore
+
+__all__ = [
+    'HotFeed',
+    'MemoryHotFeedStore',
+    'RedisHotFeedStore',
+    'get_hot_feed',
+    'record_activity',
+    'record_item',
+    'remove_item'
+]
@@ -0,0 +1,425 @@
+"""
+Sıcak Akış
+----------
+Forum ve anketleri üniversite başına, zamanla sönümlenen etkinlik
+puanına göre sıralayan akış.
+
+Her öğe oluşturulurken akışa FEED_WEIGHT_CREATE ağırlığıyla girer; ilk
+beğeni/beğenmeme, yorum ve ilk oy kendi ağırlığını etkinlik anında ekler.
+Eklenen her ağırlık FEED_HALF_LIFE_HOURS saatte yarıya iner. Güncellemeler
+artımlıdır (tek bir sıralı küme artırması), okuma en sıcak k öğeyi
+O(log n + k) sürede verir.
+
+Depo FEED_BACKEND ile seçilir: 'redis' (FEED_REDIS_URL, varsayılan) veya
+'memory' (süreç içi). Redis deposu kalıcıdır, tüm süreçlerce paylaşılır ve
+migrations/build_hot_feed.py ile doldurulur. Süreç içi depo yalnızca
+geliştirme ve testler içindir (check_backend): tablolardan arka planda
+kurulur ve FEED_REFRESH_INTERVAL saniyede bir yeniden kurulur.
+"""
+
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.feed.store import MemoryHotFeedStore, RedisHotFeedStore
+from app.utils.exceptions import ServiceUnavailableError
+from app.utils.log import get_logger
+
+FEED_BACKEND = os.getenv('FEED_BACKEND', 'redis')
+FEED_REDIS_URL = os.getenv('FEED_REDIS_URL', 'redis://localhost:6379/1')
+# Redis komutu ve bağlantısı için en uzun bekleme (saniye); akış yazmaları
+# istek içinde çalıştığından Redis takılırsa istekler bu süre sonunda devam eder
+FEED_REDIS_SOCKET_TIMEOUT = float(os.getenv('FEED_REDIS_SOCKET_TIMEOUT', '0.2'))
+FEED_REDIS_CONNECT_TIMEOUT = float(os.getenv('FEED_REDIS_CONNECT_TIMEOUT', '0.2'))
+# Süreç içi deponun tablolardan yeniden kurulma aralığı (saniye)
+FEED_REFRESH_INTERVAL = float(os.getenv('FEED_REFRESH_INTERVAL', '300'))
+# Süreç içi depo henüz kurulmadıysa bir okumanın bekleyeceği en uzun süre (saniye)
+FEED_LOAD_TIMEOUT = float(os.getenv('FEED_LOAD_TIMEOUT', '2'))
+# Etkinlik ağırlığının yarıya inme süresi (saat)
+FEED_HALF_LIFE_HOURS = float(os.getenv('FEED_HALF_LIFE_HOURS', '12'))
+# Öğelerin akışta kalacağı en uzun süre, oluşturulmadan itibaren (gün)
+FEED_MAX_AGE_DAYS = float(os.getenv('FEED_MAX_AGE_DAYS', '14'))
+
+FEED_WEIGHTS = {
+    'create': float(os.getenv('FEED_WEIGHT_CREATE', '2')),
+    'like': float(os.getenv('FEED_WEIGHT_LIKE', '1')),
+    'dislike': float(os.getenv('FEED_WEIGHT_DISLIKE', '0.5')),
+    'comment': float(os.getenv('FEED_WEIGHT_COMMENT', '2')),
+    'vote': float(os.getenv('FEED_WEIGHT_VOTE', '1')),
+}
+
+logger = get_logger(__name__)
+
+# (öğe kimliği, üniversite, oluşturulma zamanı, toplam ağırlık)
+HotItem = Tuple[str, Optional[str], float, float]
+
+
+def _timestamp(value) -> float:
+    """ISO tarih metnini veya sayıyı epoch saniyeye çevirir."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.fromisoformat(value).timestamp()
+
+
+class HotFeed:
+    """
+    Sıcak akış motoru.
+
+    Süreç içi depo (loader verildiğinde) tablolardan arka planda kurulur ve
+    refresh_interval saniyede bir arka planda yeniden kurulur: yeni depo
+    hazırlanırken okumalar eski depodan sunulur, bu sırada gelen yazmalar
+    yeni depoya da uygulanır. Böylece başka süreçlerin etkinlikleri en geç
+    bir yenileme aralığında görünür. Redis deposu (loader yok) kalıcıdır
+    ve yenilenmez.
+
+    Attributes:
+        store: MemoryHotFeedStore veya RedisHotFeedStore
+        weights (dict): Etkinlik türü -> ağırlık
+        refresh_interval (float): Süreç içi deponun yeniden kurulma aralığı (saniye)
+        load_timeout (float): İlk kurulum için bir okumanın en fazla bekleyeceği süre (saniye)
+    """
+
+    def __init__(
+        self,
+        store,
+        weights: Optional[Dict[str, float]] = None,
+        loader: Optional[Callable[[float], Iterable[HotItem]]] = None,
+        refresh_interval: float = FEED_REFRESH_INTERVAL,
+        load_timeout: float = FEED_LOAD_TIMEOUT,
+        timer=time.time
+    ):
+        self.store = store
+        self.weights = dict(FEED_WEIGHTS, **(weights or {}))
+        self.refresh_interval = refresh_interval
+        self.load_timeout = load_timeout
+        self._loader = loader
+        self._timer = timer
+        self._loaded = threading.Event()
+        if loader is None:
+            self._loaded.set()
+        self._rebuild_lock = threading.Lock()
+        self._lock = threading.Lock()
+        # Kurulum sürerken gelen yazmalar; yeni depoya da uygulanır
+        self._pending: Optional[List[Callable[[Any], Any]]] = None
+        self._next_refresh = 0.0
+
+    def _new_store(self):
+        return type(self.store)(self.store.half_life, self.store.max_age, self.store.rebase_after)
+
+    def _reload(self):
+        """Yeni bir depoyu tablolardan kurup bekleyen yazmalarla devreye alır."""
+        started = self._timer()
+        with self._lock:
+            self._pending = []
+        try:
+            store = self._new_store()
+            count = self._fill(store, self._loader(started - store.max_age), started)
+        except Exception:
+            logger.exception("hot_feed_build_failed")
+            with self._lock:
+                self._pending = None
+                # Hata veren kurulum her okumada tekrarlanmasın
+                self._next_refresh = started + min(self.refresh_interval, 60)
+            return
+
+        with self._lock:
+            for write in self._pending:
+                write(store)
+            self.store = store
+            self._pending = None
+            self._next_refresh = started + self.refresh_interval
+        self._loaded.set()
+        logger.info("hot_feed_built", items=count,
+                    duration_ms=round((self._timer() - started) * 1000, 1))
+
+    def _refresh(self):
+        if self._rebuild_lock.acquire(blocking=False):
+            try:
+                self._reload()
+            finally:
+                self._rebuild_lock.release()
+
+    def _refresh_if_due(self):
+        """Süresi dolan süreç içi depoyu arka planda yeniden kurar; okumayı bekletmez."""
+        if self._loader is None:
+            return
+        if self._timer() < self._next_refresh or self._rebuild_lock.locked():
+            return
+        thread = threading.Thread(target=self._refresh, name='hot-feed-refresh', daemon=True)
+        thread.start()
+
+    def _write(self, write: Callable[[Any], Any]):
+        """
+        Yazmayı depoya uygular.
+
+        Depo henüz kurulmadıysa yazma atlanır: kaynak kayıt tabloya zaten
+        yazıldığı için kurulum onu okur. Kurulum sürerken gelen yazmalar
+        kurulan depoya da uygulanır.
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(write)
+            store = self.store if self._loaded.is_set() else None
+        if store is not None:
+            write(store)
+
+    @staticmethod
+    def _fill(store, items: Iterable[HotItem], now: float) -> int:
+        count = 0
+        for item_id, university, created_at, weight in items:
+            store.add(item_id, university, created_at, weight, now)
+            count += 1
+        return count
+
+    def rebuild(self, items: Iterable[HotItem]) -> int:
+        """
+        Akışı verilen öğelerle baştan kurar.
+
+        Geçmiş etkinliklerin zamanı bilinmediğinden her öğenin toplam
+        ağırlığı oluşturulma anına yazılır.
+
+        Args:
+            items (iterable): (öğe, üniversite, oluşturulma zamanı, ağırlık) dörtlüleri
+
+        Returns:
+            int: Akışa eklenen öğe sayısı
+        """
+        self.store.clear()
+        count = self._fill(self.store, items, self._timer())
+        logger.info("hot_feed_built", items=count)
+        return count
+
+    def record_item(self, item_id: str, university: Optional[str], created_at=None):
+        """
+        Yeni öğeyi akışa ekler.
+
+        Args:
+            item_id (str): Forum veya anket kimliği
+            university (str, optional): Öğenin üniversitesi
+            created_at (str|float, optional): Oluşturulma zamanı; verilmezse şu an
+        """
+        now = self._timer()
+        created = _timestamp(created_at) if created_at is not None else now
+        weight = self.weights['create']
+        self._write(lambda store: store.add(item_id, university, created, weight, now))
+
+    def record_activity(self, item_id: str, event: str, count: int = 1):
+        """
+        Öğeye etkinlik ekler; akışta olmayan öğeler yok sayılır.
+
+        Args:
+            item_id (str): Forum veya anket kimliği
+            event (str): 'like', 'dislike', 'comment' veya 'vote'
+            count (int): Etkinlik sayısı
+        """
+        now = self._timer()
+        weight = self.weights[event] * count
+        self._write(lambda store: store.incr(item_id, weight, now))
+
+    def remove_item(self, item_id: str):
+        """
+        Öğeyi akıştan çıkarır.
+
+        Args:
+            item_id (str): Öğe kimliği
+        """
+        self._write(lambda store: store.remove(item_id))
+
+    def top(self, university: Optional[str] = None, limit: int = 20, offset: int = 0) -> Tuple[List[Tuple[str, float]], int]:
+        """
+        En sıcak öğeleri döndürür.
+
+        Args:
+            university (str, optional): Üniversite; verilmezse tüm üniversiteler
+            limit (int): Döndürülecek en fazla öğe
+            offset (int): Atlanacak öğe sayısı
+
+        Returns:
+            tuple: ([(öğe, şu anki puan)], akıştaki öğe sayısı)
+
+        Raises:
+            ServiceUnavailableError: Süreç içi depo load_timeout içinde kurulamazsa
+        """
+        self._refresh_if_due()
+        if not self._loaded.wait(self.load_timeout):
+            raise ServiceUnavailableError("Akış hazırlanıyor, lütfen tekrar deneyin", retry_after=5)
+        if limit <= 0:
+            return [], 0
+        return self.store.top(university, offset, limit, self._timer())
+
+
+def load_hot_items(since: float) -> Iterable[HotItem]:
+    """
+    Akışa girecek forum ve anketleri toplam etkinlik ağırlıklarıyla okur.
+
+    Forumlar, anketler ve yorumlar taranır; forumların beğeni sayıları
+    sayaç parçalarından toplu okunur.
+
+    Args:
+        since (float): Bu zamandan önce oluşturulan öğeler atlanır (epoch saniye)
+
+    Returns:
+        iterable: (öğe, üniversite, oluşturulma zamanı, ağırlık) dörtlüleri
+    """
+    from app.services.ReactionTableDatabaseService import ReactionDatabaseService
+    from app.services.schema import COMMENTS_TABLE_NAME, FORUMS_TABLE_NAME, POLLS_TABLE_NAME
+    from app.storage import get_dynamodb
+
+    dynamodb = get_dynamodb(os.getenv('AWS_DEFAULT_REGION'))
+
+    def scan(table_name: str, **params) -> Iterable[Dict[str, Any]]:
+        table = dynamodb.Table(table_name)
+        while True:
+            response = table.scan(**params)
+            yield from response.get('Items', [])
+            if 'LastEvaluatedKey' not in response:
+                break
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def recent(items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            item for item in items
+            if item.get('is_active', True) and item.get('created_at')
+            and _timestamp(item['created_at']) >= since
+        ]
+
+    forums = recent(scan(FORUMS_TABLE_NAME))
+    polls = recent(scan(POLLS_TABLE_NAME))
+    comments = Counter(
+        item['commented_on_id']
+        for item in scan(COMMENTS_TABLE_NAME, ProjectionExpression='commented_on_id')
+        if item.get('commented_on_id')
+    )
+    reactions = ReactionDatabaseService.get_instance().get_counts_many([forum['forum_id'] for forum in forums])
+
+    weights = FEED_WEIGHTS
+    for forum in forums:
+        counts = reactions.get(forum['forum_id'], {})
+        weight = (
+            weights['create']
+            + weights['like'] * counts.get('like_count', 0)
+            + weights['dislike'] * counts.get('dislike_count', 0)
+            + weights['comment'] * comments[forum['forum_id']]
+        )
+        yield forum['forum_id'], forum.get('university'), _timestamp(forum['created_at']), weight
+    for poll in polls:
+        votes = sum(int(option.get('oy_sayisi', 0)) for option in poll.get('secenekler') or [])
+        weight = (
+            weights['create']
+            + weights['vote'] * votes
+            + weights['comment'] * comments[poll['poll_id']]
+        )
+        yield poll['poll_id'], poll.get('university'), _timestamp(poll['created_at']), weight
+
+
+def create_store(backend: str = FEED_BACKEND):
+    """
+    FEED_BACKEND'e göre akış deposunu oluşturur.
+
+    Args:
+        backend (str): 'memory' veya 'redis'
+
+    Returns:
+        Depo örneği
+
+    Raises:
+        ValueError: Bilinmeyen arka uç
+    """
+    half_life = FEED_HALF_LIFE_HOURS * 3600
+    max_age = FEED_MAX_AGE_DAYS * 86400
+    if backend == 'memory':
+        return MemoryHotFeedStore(half_life, max_age)
+    if backend == 'redis':
+        import redis
+        client = redis.Redis.from_url(
+            FEED_REDIS_URL,
+            socket_timeout=FEED_REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=FEED_REDIS_CONNECT_TIMEOUT
+        )
+        return RedisHotFeedStore(client, half_life, max_age)
+    raise ValueError(f"Bilinmeyen FEED_BACKEND: {backend}")
+
+
+def check_backend(app):
+    """
+    Süreç içi deponun geliştirme/test dışında kullanılmasını engeller.
+
+    Süreç içi depo her worker'da ayrı tutulur ve tabloları tarayarak
+    kurulur; üretimde akış Redis'te tutulmalıdır.
+
+    Args:
+        app (Flask): Uygulama
+
+    Raises:
+        RuntimeError: Üretimde FEED_BACKEND=memory ise
+    """
+    if FEED_BACKEND == 'memory' and not (app.config.get('DEBUG') or app.config.get('TESTING')):
+        raise RuntimeError("FEED_BACKEND=memory yalnızca geliştirme ve testler içindir; FEED_BACKEND=redis kullanın")
+
+
+_hot_feed: Optional[HotFeed] = None
+_hot_feed_lock = threading.Lock()
+
+
+def get_hot_feed() -> HotFeed:
+    """
+    Süreç genelindeki sıcak akışı döndürür.
+
+    Returns:
+        HotFeed: Akış
+    """
+    global _hot_feed
+    if _hot_feed is None:
+        with _hot_feed_lock:
+            if _hot_feed is None:
+                # Redis deposu kalıcıdır; yalnızca süreç içi depo tablolardan kurulur
+                loader = load_hot_items if FEED_BACKEND == 'memory' else None
+                _hot_feed = HotFeed(create_store(), loader=loader)
+    return _hot_feed
+
+
+def record_item(item_id: str, university: Optional[str], created_at=None):
+    """
+    Yeni forum/anketi akışa ekler; hata yazmayı başarısız yapmaz.
+
+    Args:
+        item_id (str): Öğe kimliği
+        university (str, optional): Öğenin üniversitesi
+        created_at (str, optional): Oluşturulma zamanı (ISO)
+    """
+    try:
+        get_hot_feed().record_item(item_id, university, created_at)
+    except Exception:
+        logger.exception("hot_feed_update_failed", item_id=item_id)
+
+
+def record_activity(item_id: str, event: str, count: int = 1):
+    """
+    Öğeye etkinlik ekler; akışta olmayan öğeler (ör. yorumlar) yok sayılır.
+    Hata yazmayı başarısız yapmaz.
+
+    Args:
+        item_id (str): Öğe kimliği
+        event (str): 'like', 'dislike', 'comment' veya 'vote'
+        count (int): Etkinlik sayısı
+    """
+    try:
+        get_hot_feed().record_activity(item_id, event, count)
+    except Exception:
+        logger.exception("hot_feed_update_failed", item_id=item_id, event=event)
+
+
+def remove_item(item_id: str):
+    """
+    Silinen öğeyi akıştan çıkarır; hata silmeyi başarısız yapmaz.
+
+    Args:
+        item_id (str): Öğe kimliği
+    """
+    try:
+        get_hot_feed().remove_item(item_id)
+    except Exception:
+        logger.exception("hot_feed_update_failed", item_id=item_id)
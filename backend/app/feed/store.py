@@ -0,0 +1,372 @@
+"""
+Sıralı Küme Depoları
+------------------
+Sıcak akışın üniversite başına sıralı kümelerini tutan iki depo: süreç
+içi (MemoryHotFeedStore) ve Redis (RedisHotFeedStore).
+
+Puanlar ileri sönümlemeyle (forward decay) tutulur: t anındaki w
+ağırlıklı bir etkinlik puana w * 2^((t - epoch) / half_life) olarak
+eklenir. Bir öğenin şu anki sönümlenmiş puanı, bu toplamın
+2^((now - epoch) / half_life) ile bölümüdür ve bölen tüm öğeler için
+aynıdır; bu yüzden sıralama hiç yeniden hesaplanmadan korunur ve her
+etkinlik tek bir artırmadır (ZINCRBY). Üsler büyüdüğünde (rebase_after
+yarı ömür) tüm kümeler aynı katsayıyla küçültülüp epoch ileri alınır.
+
+Öğeler oluşturulma zamanından max_age saniye sonra akıştan çıkarılır.
+Oluşturulurken kaydedilmemiş öğelere gelen etkinlikler yok sayılır.
+"""
+
+import bisect
+import heapq
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Genel (üniversiteden bağımsız) akışın anahtarı
+ALL_UNIVERSITIES = '*'
+
+
+class _SortedSet:
+    """Puanı yüksekten düşüğe sıralı üye kümesi (Redis sıralı kümesinin süreç içi karşılığı)."""
+
+    def __init__(self):
+        self._scores: Dict[str, float] = {}
+        # (-puan, üye) sıralı; ilk eleman en yüksek puan
+        self._order: List[Tuple[float, str]] = []
+
+    def __len__(self):
+        return len(self._scores)
+
+    def incr(self, member: str, amount: float):
+        score = self._scores.get(member)
+        if score is not None:
+            del self._order[bisect.bisect_left(self._order, (-score, member))]
+            amount += score
+        self._scores[member] = amount
+        bisect.insort(self._order, (-amount, member))
+
+    def discard(self, member: str):
+        score = self._scores.pop(member, None)
+        if score is not None:
+            del self._order[bisect.bisect_left(self._order, (-score, member))]
+
+    def scale(self, factor: float):
+        self._scores = {member: score * factor for member, score in self._scores.items()}
+        self._order = sorted((-score, member) for member, score in self._scores.items())
+
+    def range(self, offset: int, limit: int) -> List[Tuple[str, float]]:
+        return [(member, -score) for score, member in self._order[offset:offset + limit]]
+
+
+class MemoryHotFeedStore:
+    """
+    Süreç içi sıcak akış deposu.
+
+    Güncelleme O(log n) arama ve liste kaydırması, okuma O(k) dilimdir.
+    Yalnızca bu sürecin gördüğü etkinlikleri içerir; birden çok worker
+    çalışan kurulumlarda RedisHotFeedStore kullanılmalıdır.
+
+    Attributes:
+        half_life (float): Yarı ömür (saniye)
+        max_age (float): Öğenin akışta kalacağı en uzun süre (saniye)
+        rebase_after (float): Epoch'un ileri alınacağı yarı ömür sayısı
+    """
+
+    def __init__(self, half_life: float, max_age: float, rebase_after: float = 32):
+        self.half_life = half_life
+        self.max_age = max_age
+        self.rebase_after = rebase_after
+        self._lock = threading.RLock()
+        self._epoch: Optional[float] = None
+        # Öğe -> (üniversite, oluşturulma zamanı)
+        self._items: Dict[str, Tuple[Optional[str], float]] = {}
+        self._sets: Dict[str, _SortedSet] = {}
+        # (oluşturulma zamanı, öğe); süresi dolanları çıkarmak için
+        self._created: List[Tuple[float, str]] = []
+
+    def _keys(self, university: Optional[str]) -> List[str]:
+        return [ALL_UNIVERSITIES, university] if university else [ALL_UNIVERSITIES]
+
+    def _increment(self, keys: List[str], item_id: str, weight: float, at: float):
+        if self._epoch is None:
+            self._epoch = at
+        elif (at - self._epoch) / self.half_life > self.rebase_after:
+            factor = 2 ** ((self._epoch - at) / self.half_life)
+            for sorted_set in self._sets.values():
+                sorted_set.scale(factor)
+            self._epoch = at
+
+        amount = weight * 2 ** ((at - self._epoch) / self.half_life)
+        for key in keys:
+            self._sets.setdefault(key, _SortedSet()).incr(item_id, amount)
+
+    def _prune(self, now: float):
+        cutoff = now - self.max_age
+        while self._created and self._created[0][0] < cutoff:
+            created_at, item_id = heapq.heappop(self._created)
+            entry = self._items.get(item_id)
+            if entry is not None and entry[1] == created_at:
+                self._remove(item_id)
+
+    def _remove(self, item_id: str):
+        entry = self._items.pop(item_id, None)
+        if entry is None:
+            return
+        for key in self._keys(entry[0]):
+            sorted_set = self._sets.get(key)
+            if sorted_set is not None:
+                sorted_set.discard(item_id)
+                if not sorted_set:
+                    del self._sets[key]
+
+    def add(self, item_id: str, university: Optional[str], created_at: float, weight: float, now: float):
+        """
+        Öğeyi akışa kaydeder ve oluşturulma anındaki ağırlığını ekler.
+
+        Args:
+            item_id (str): Forum veya anket kimliği
+            university (str, optional): Öğenin üniversitesi
+            created_at (float): Oluşturulma zamanı (epoch saniye)
+            weight (float): Oluşturulma anına yazılacak ağırlık
+            now (float): Şu an (süresi dolanları çıkarmak için)
+        """
+        with self._lock:
+            self._prune(now)
+            if created_at < now - self.max_age:
+                return
+            self._remove(item_id)
+            self._items[item_id] = (university, created_at)
+            heapq.heappush(self._created, (created_at, item_id))
+            self._increment(self._keys(university), item_id, weight, created_at)
+
+    def incr(self, item_id: str, weight: float, at: float) -> bool:
+        """
+        Akıştaki öğeye t anındaki etkinliği ekler.
+
+        Args:
+            item_id (str): Öğe kimliği
+            weight (float): Etkinlik ağırlığı
+            at (float): Etkinlik zamanı (epoch saniye)
+
+        Returns:
+            bool: Öğe akıştaysa True
+        """
+        with self._lock:
+            entry = self._items.get(item_id)
+            if entry is None:
+                return False
+            self._increment(self._keys(entry[0]), item_id, weight, at)
+            return True
+
+    def remove(self, item_id: str):
+        """
+        Öğeyi akıştan çıkarır.
+
+        Args:
+            item_id (str): Öğe kimliği
+        """
+        with self._lock:
+            self._remove(item_id)
+
+    def top(self, university: Optional[str], offset: int, limit: int, now: float) -> Tuple[List[Tuple[str, float]], int]:
+        """
+        En sıcak öğeleri şu anki sönümlenmiş puanlarıyla döndürür.
+
+        Args:
+            university (str, optional): Üniversite; verilmezse genel akış
+            offset (int): Atlanacak öğe sayısı
+            limit (int): Döndürülecek en fazla öğe
+            now (float): Şu an (epoch saniye)
+
+        Returns:
+            tuple: ([(öğe, puan)], kümedeki öğe sayısı)
+        """
+        with self._lock:
+            self._prune(now)
+            sorted_set = self._sets.get(university or ALL_UNIVERSITIES)
+            if sorted_set is None:
+                return [], 0
+            decay = 2 ** ((self._epoch - now) / self.half_life)
+            return [(item_id, score * decay) for item_id, score in sorted_set.range(offset, limit)], len(sorted_set)
+
+    def clear(self):
+        """Tüm akışı siler."""
+        with self._lock:
+            self._epoch = None
+            self._items.clear()
+            self._sets.clear()
+            self._created.clear()
+
+    def is_empty(self) -> bool:
+        """Akışta hiç öğe yoksa True."""
+        return not self._items
+
+
+# Redis tarafı: her işlem tek bir Lua betiğidir, böylece epoch okuma,
+# artırma ve yeniden ölçekleme başka bir sürecin yazmasıyla araya girmez.
+# Üniversite kümelerinin anahtarları betik içinde türetildiği için depo tek
+# bir Redis örneği (cluster olmayan) varsayar.
+
+_REDIS_COMMON = """
+local prefix = KEYS[1]
+local half_life = tonumber(ARGV[1])
+local rebase_after = tonumber(ARGV[2])
+
+local function set_keys(university)
+    if university == '' then
+        return {prefix .. ':set:*'}
+    end
+    return {prefix .. ':set:*', prefix .. ':set:' .. university}
+end
+
+local function increment(university, item_id, weight, at)
+    local epoch = tonumber(redis.call('GET', prefix .. ':epoch'))
+    if not epoch then
+        epoch = at
+        redis.call('SET', prefix .. ':epoch', tostring(at))
+    elseif (at - epoch) / half_life > rebase_after then
+        local factor = 2 ^ ((epoch - at) / half_life)
+        for _, key in ipairs(redis.call('SMEMBERS', prefix .. ':sets')) do
+            redis.call('ZUNIONSTORE', key, 1, key, 'WEIGHTS', tostring(factor))
+        end
+        epoch = at
+        redis.call('SET', prefix .. ':epoch', tostring(at))
+    end
+    local amount = weight * 2 ^ ((at - epoch) / half_life)
+    for _, key in ipairs(set_keys(university)) do
+        redis.call('ZINCRBY', key, tostring(amount), item_id)
+        redis.call('SADD', prefix .. ':sets', key)
+    end
+end
+
+local function remove(item_id)
+    local university = redis.call('HGET', prefix .. ':items', item_id)
+    if not university then
+        return
+    end
+    for _, key in ipairs(set_keys(university)) do
+        redis.call('ZREM', key, item_id)
+    end
+    redis.call('HDEL', prefix .. ':items', item_id)
+    redis.call('ZREM', prefix .. ':created', item_id)
+end
+
+local function prune(now, max_age)
+    local expired = redis.call('ZRANGEBYSCORE', prefix .. ':created', '-inf', '(' .. tostring(now - max_age), 'LIMIT', 0, 500)
+    for _, item_id in ipairs(expired) do
+        remove(item_id)
+    end
+end
+"""
+
+_REDIS_ADD = _REDIS_COMMON + """
+local item_id, university = ARGV[3], ARGV[4]
+local created_at, weight = tonumber(ARGV[5]), tonumber(ARGV[6])
+local now, max_age = tonumber(ARGV[7]), tonumber(ARGV[8])
+prune(now, max_age)
+if created_at < now - max_age then
+    return 0
+end
+remove(item_id)
+redis.call('HSET', prefix .. ':items', item_id, university)
+redis.call('ZADD', prefix .. ':created', tostring(created_at), item_id)
+increment(university, item_id, weight, created_at)
+return 1
+"""
+
+_REDIS_INCR = _REDIS_COMMON + """
+local item_id, weight, at = ARGV[3], tonumber(ARGV[4]), tonumber(ARGV[5])
+local university = redis.call('HGET', prefix .. ':items', item_id)
+if not university then
+    return 0
+end
+increment(university, item_id, weight, at)
+return 1
+"""
+
+_REDIS_REMOVE = _REDIS_COMMON + """
+remove(ARGV[3])
+return 1
+"""
+
+_REDIS_TOP = _REDIS_COMMON + """
+local university, offset, limit = ARGV[3], tonumber(ARGV[4]), tonumber(ARGV[5])
+local now, max_age = tonumber(ARGV[6]), tonumber(ARGV[7])
+prune(now, max_age)
+local key = prefix .. ':set:' .. (university == '' and '*' or university)
+local epoch = redis.call('GET', prefix .. ':epoch') or tostring(now)
+local entries = redis.call('ZREVRANGE', key, offset, offset + limit - 1, 'WITHSCORES')
+return {epoch, redis.call('ZCARD', key), entries}
+"""
+
+
+class RedisHotFeedStore:
+    """
+    Redis sıralı kümeleriyle sıcak akış deposu.
+
+    Tüm süreçler aynı akışı görür ve akış yeniden başlatmalarda korunur.
+    Anahtarlar `prefix` ile başlar: <prefix>:set:<üniversite> (genel akış
+    için '*'), <prefix>:items (öğe -> üniversite), <prefix>:created,
+    <prefix>:epoch ve <prefix>:sets.
+
+    Attributes:
+        half_life (float): Yarı ömür (saniye)
+        max_age (float): Öğenin akışta kalacağı en uzun süre (saniye)
+        rebase_after (float): Epoch'un ileri alınacağı yarı ömür sayısı
+    """
+
+    def __init__(self, client, half_life: float, max_age: float, rebase_after: float = 32,
+                 prefix: str = 'feed:hot'):
+        self.client = client
+        self.half_life = half_life
+        self.max_age = max_age
+        self.rebase_after = rebase_after
+        self.prefix = prefix
+        self._add = client.register_script(_REDIS_ADD)
+        self._incr = client.register_script(_REDIS_INCR)
+        self._remove = client.register_script(_REDIS_REMOVE)
+        self._top = client.register_script(_REDIS_TOP)
+
+    def _args(self, *args) -> list:
+        return [repr(self.half_life), repr(self.rebase_after)] + [
+            repr(arg) if isinstance(arg, float) else arg for arg in args
+        ]
+
+    def add(self, item_id: str, university: Optional[str], created_at: float, weight: float, now: float):
+        """Bkz. MemoryHotFeedStore.add"""
+        self._add(keys=[self.prefix], args=self._args(
+            item_id, university or '', float(created_at), float(weight), float(now), float(self.max_age)
+        ))
+
+    def incr(self, item_id: str, weight: float, at: float) -> bool:
+        """Bkz. MemoryHotFeedStore.incr"""
+        return bool(self._incr(keys=[self.prefix], args=self._args(item_id, float(weight), float(at))))
+
+    def remove(self, item_id: str):
+        """Bkz. MemoryHotFeedStore.remove"""
+        self._remove(keys=[self.prefix], args=self._args(item_id))
+
+    def top(self, university: Optional[str], offset: int, limit: int, now: float) -> Tuple[List[Tuple[str, float]], int]:
+        """Bkz. MemoryHotFeedStore.top"""
+        epoch, total, entries = self._top(keys=[self.prefix], args=self._args(
+            university or '', offset, limit, float(now), float(self.max_age)
+        ))
+        decay = 2 ** ((float(epoch) - now) / self.half_life)
+        items = [
+            (_text(entries[i]), float(entries[i + 1]) * decay)
+            for i in range(0, len(entries), 2)
+        ]
+        return items, int(total)
+
+    def clear(self):
+        """Tüm akışı siler."""
+        keys = [_text(key) for key in self.client.smembers(f'{self.prefix}:sets')]
+        self.client.delete(*keys, f'{self.prefix}:sets', f'{self.prefix}:items',
+                           f'{self.prefix}:created', f'{self.prefix}:epoch')
+
+    def is_empty(self) -> bool:
+        """Akışta hiç öğe yoksa True."""
+        return not self.client.exists(f'{self.prefix}:items')
+
+
+def _text(value) -> str:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
@@ -6,6 +6,8 @@ Uygulama için middleware modüllerini içerir.
 
 from app.middleware.auth import authenticate, authorize, get_current_user
 from app.middleware.error_handler import register_error_handlers
+from app.middleware.instrumentation import register_instrumentation
+from app.middleware.request_id import register_request_id
 from app.middleware.validation import (
     validate_schema, 
     validate_path_param, 
@@ -20,6 +22,8 @@ __all__ = [
     'authorize',
     'get_current_user',
     'register_error_handlers',
+    'register_instrumentation',
+    'register_request_id',
     'validate_schema',
     'validate_path_param',
     'validate_query_params',
@@ -10,7 +10,9 @@ from flask import request, current_app, g
 from app.utils.exceptions import AuthError, ForbiddenError, NotFoundError
 from app.services.UserTableDatabaseService import UserDatabaseService
 from app.models.UserModel import UserModel
-import traceback
+from app.utils.log import get_logger
+
+logger = get_logger(__name__)
 
 def get_token_from_header():
     """
@@ -96,9 +98,9 @@ def authenticate(f):
             raise AuthError('Geçersiz token: Kullanıcı kimliği bulunamadı')
         
         try:
-            # Get user from database
+            # Get user from the user cache (falls back to the database)
             user_db = UserDatabaseService.get_instance()
-            user: UserModel = user_db._get_user_by_user_id(user_id)
+            user: UserModel = user_db.get_cached_user(user_id)
             
             # Check if user is active
             if not user or not user.is_active:
@@ -109,8 +111,7 @@ def authenticate(f):
             g.user_id = user_id
             
         except Exception as e:
-            _traceback = traceback.format_exc()
-            print ("\033[93m" + _traceback + "\033[0m", flush=True)
+            logger.warning("user_lookup_failed", user_id=user_id, exc_info=True)
             raise AuthError('Kullanıcı bulunamadı')
         
         return f(*args, **kwargs)
@@ -33,7 +33,10 @@ def register_error_handlers(app):
         """
         response = error.to_dict()
         logger.error(f"API Error: {error.message}", exc_info=True)
-        return jsonify(response), error.status_code
+        headers = {}
+        if getattr(error, 'retry_after', None):
+            headers['Retry-After'] = str(error.retry_after)
+        return jsonify(response), error.status_code, headers
     
     @app.errorhandler(AuthError)
     def handle_auth_error(error):
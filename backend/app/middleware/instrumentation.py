@@ -0,0 +1,61 @@
+"""
+İstek Ölçümü Middleware
+---------------------
+Her istekte yapılan arka uç çağrılarını Server-Timing başlığı ve bir debug
+log satırı olarak raporlar.
+"""
+
+import logging
+import time
+
+from flask import g, request
+
+from app.utils.instrumentation import end_request, server_timing, start_request
+from app.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+def register_instrumentation(app):
+    """
+    Uygulamaya istek başına arka uç çağrı ölçümünü kaydeder.
+
+    Server-Timing başlığı yalnızca SERVER_TIMING_ENABLED açıksa eklenir
+    (varsayılan olarak yalnızca geliştirmede); debug log satırı
+    LOG_LEVEL=DEBUG iken her durumda yazılır.
+
+    Args:
+        app: Flask uygulaması
+    """
+
+    @app.before_request
+    def start_backend_stats():
+        g.backend_stats = start_request()
+
+    @app.after_request
+    def report_backend_stats(response):
+        stats = g.pop('backend_stats', None)
+        if stats is None:
+            return response
+
+        total_ms = (time.perf_counter() - stats.started_at) * 1000
+        if app.config.get('SERVER_TIMING_ENABLED', False):
+            response.headers['Server-Timing'] = server_timing(stats, total_ms)
+
+        # Özet yalnızca debug açıkken hesaplanır
+        if logging.getLogger(__name__).isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "request_backend_calls",
+                method=request.method,
+                path=request.path,
+                status=response.status_code,
+                backend_calls=stats.total_calls,
+                backend_ms=round(stats.total_duration_ms, 1),
+                total_ms=round(total_ms, 1),
+                operations={name: entry['count'] for name, entry in stats.summary().items()}
+            )
+        return response
+
+    @app.teardown_request
+    def clear_backend_stats(exception=None):
+        end_request()
@@ -0,0 +1,49 @@
+"""
+İstek Kimliği Middleware
+----------------------
+Her isteğe bir request_id atar ve log olaylarını bu kimlikle ilişkilendirir.
+"""
+
+import re
+import uuid
+
+import structlog
+from flask import g, request
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+
+# İstemciden gelen kimlik yalnızca makul biçimdeyse kullanılır
+_VALID_REQUEST_ID = re.compile(r'^[A-Za-z0-9._-]{1,128}$')
+
+
+def register_request_id(app):
+    """
+    Uygulamaya request_id atamasını kaydeder.
+
+    İstemci X-Request-ID gönderdiyse (ör. yük dengeleyici) o kullanılır,
+    yoksa yeni bir kimlik üretilir. Kimlik structlog contextvars'a bağlanır
+    ve yanıtta aynı başlıkla döndürülür.
+
+    Args:
+        app: Flask uygulaması
+    """
+
+    @app.before_request
+    def bind_request_id():
+        request_id = request.headers.get(REQUEST_ID_HEADER, '')
+        if not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+        g.request_id = request_id
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(request_id=request_id)
+
+    @app.after_request
+    def add_request_id_header(response):
+        request_id = g.get('request_id')
+        if request_id:
+            response.headers[REQUEST_ID_HEADER] = request_id
+        return response
+
+    @app.teardown_request
+    def unbind_request_id(exception=None):
+        structlog.contextvars.clear_contextvars()
@@ -10,6 +10,9 @@ from functools import wraps
 from flask import request, jsonify, g
 from app.utils.exceptions import ValidationError
 from app.utils.responses import error_response
+from app.utils.log import get_logger
+
+logger = get_logger(__name__)
 
 def validate_schema(schema):
     """
@@ -32,7 +35,7 @@ def validate_schema(schema):
             else:
                 data = request.form.to_dict()
             
-            print (data, flush=True)
+            logger.debug("request_body", fields=sorted(data or {}))
             # Şema ile doğrula
             errors = schema.validate(data)
             
@@ -69,8 +72,7 @@ def validate_path_param(param_name, validator_func):
         def wrapper(*args, **kwargs):
             if param_name in kwargs:
                 value = kwargs[param_name]
-                # prints the value of the parameter in purple using ansii color codes
-                print(f"\033[95m{value}\033[0m", flush=True)
+                logger.debug("path_param", name=param_name, value=value)
                 
                 if not validator_func(value):
                     return error_response(f"Geçersiz {param_name} parametresi", 400)
@@ -119,16 +121,13 @@ def is_uuid(value):
         bool: Değer geçerli bir UUID ise True, değilse False
     """
     try:
-        # prints the value of the parameter in purple using ansii color codes
-        if value.startswith("usr_"):
-            value = value[len("usr_"):]
-        elif value.startswith("frm_"):
-            value = value[len("frm_"):]
+        for prefix in ('usr_', 'frm_', 'cmt_', 'grp_', 'pol_', 'med_'):
+            if value.startswith(prefix):
+                value = value[len(prefix):]
+                break
         uuid_obj = uuid.UUID(str(value))
         return str(uuid_obj) == value or value.startswith(('usr_', 'frm_', 'cmt_', 'grp_', 'pol_', 'med_'))
     except (ValueError, AttributeError):
-        import traceback
-        print (traceback.format_exc())
         return False
 
 def is_positive_integer(value):
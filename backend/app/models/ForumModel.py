@@ -1,6 +1,8 @@
 from datetime import datetime
 import uuid
 
+from app.utils.images import image_variants
+
 class ForumModel:
     """
     Forum model representing a discussion forum in the system.
@@ -13,6 +15,7 @@ class ForumModel:
         university (str, optional): Associated university
         category (str, optional): Forum category
         photo_urls (list): List of photo URLs associated with the forum
+            (to_dict adds photo_variants: thumb/medium WebP URLs per photo)
         like_count (int): Number of likes
         dislike_count (int): Number of dislikes
         is_active (bool): Forum active status
@@ -59,6 +62,7 @@ class ForumModel:
             'university': self.university,
             'category': self.category,
             'photo_urls': self.photo_urls,
+            'photo_variants': [image_variants(url) for url in self.photo_urls],
             'like_count': self.like_count,
             'dislike_count': self.dislike_count,
             'is_active': self.is_active,
@@ -26,6 +26,8 @@ class MediaModel(BaseModel):
         ilgili_id (str): Related model ID
         description (str): File description
         meta_data (dict): Additional metadata
+        durum (str): Upload state (beklemede, hazir)
+        varyantlar (dict): Derivative object keys (variant -> {extension: key})
     """
     
     def __init__(self,
@@ -43,6 +45,8 @@ class MediaModel(BaseModel):
                  ilgili_id=None,
                  description=None,
                  meta_data=None,
+                 durum="hazir",
+                 varyantlar=None,
                  is_active=True,
                  created_at=None,
                  updated_at=None):
@@ -61,6 +65,8 @@ class MediaModel(BaseModel):
         self.ilgili_id = ilgili_id
         self.description = description
         self.meta_data = meta_data or {}
+        self.durum = durum
+        self.varyantlar = varyantlar or {}
     
     def is_image(self):
         """Check if file is an image"""
@@ -101,13 +107,10 @@ class MediaModel(BaseModel):
     
     def to_dict(self):
         """Return a dictionary representation with additional fields"""
-        data = super().to_dict()
+        # vars() örneğin kendi sözlüğüdür; türetilmiş alanlar kopyaya eklenir
+        data = dict(super().to_dict())
         data['dosya_boyutu_formatli'] = self.get_file_size_formatted()
         data['dosya_uzantisi'] = self.get_file_extension()
         data['resim_mi'] = self.is_image()
         data['dokuman_mi'] = self.is_document()
-        return data
-
-    def __dict__(self):
-        """For compatibility with original code"""
-        return self.to_dict()
\ No newline at end of file
+        return data
\ No newline at end of file
@@ -68,7 +68,8 @@ class PollModel:
         created_at (str): Poll creation timestamp
         bitis_tarihi (str, optional): Poll closing timestamp
         secenekler (List[PollOption]): List of poll options
-        oylar (List[PollVote]): List of votes
+        oylar (List[PollVote]): Votes stored on legacy poll items; votes
+            now live in the PollVotes table
         university (str, optional): Associated university
         category (str, optional): Poll category
         is_active (bool): Poll active status
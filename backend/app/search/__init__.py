@@ -0,0 +1,30 @@
+"""
+Arama
+-----
+Forum, anket ve gruplar için süreç içi ters dizin ve BM25 sıralaması.
+
+Liste endpoint'lerinin `search=` parametresi tablo taraması yerine bu
+dizinden sunulur; eşleşen kimlikler sıralı olarak döner ve öğeler
+BatchGetItem ile okunur.
+"""
+
+from app.search.analyzer import fold, tokenize
+from app.search.index import SearchIndex
+from app.search.registry import (
+    SearchRegistry,
+    get_search_registry,
+    index_document,
+    remove_document,
+    search
+)
+
+__all__ = [
+    'fold',
+    'tokenize',
+    'SearchIndex',
+    'SearchRegistry',
+    'get_search_registry',
+    'index_document',
+    'remove_document',
+    'search'
+]
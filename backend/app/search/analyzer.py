@@ -0,0 +1,89 @@
+"""
+Türkçe Metin Çözümleyici
+----------------------
+Arama metnini dizin terimlerine çevirir.
+
+Küçük harfe çevirme Türkçe kurallarıyla yapılır ve I/İ/ı/i aynı harfe
+indirgenir; ardından aksanlar atılır (ç -> c, ş -> s, ğ -> g, ö -> o,
+ü -> u). Böylece 'İSTANBUL', 'istanbul' ve 'Istanbul' ile 'Öğrenci' ve
+'ogrenci' aynı terimi verir.
+
+Dizinlenen metin için her kelimenin önekleri de (SEARCH_MIN_PREFIX
+uzunluğundan başlayarak) ayrı terimler olarak üretilir; yazılmakta olan
+bir kelime ('kita') tam kelimeyi ('kitaplar') bulur.
+"""
+
+import os
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List
+
+# Dizinlenen en kısa ve en uzun önek (karakter)
+SEARCH_MIN_PREFIX = int(os.getenv('SEARCH_MIN_PREFIX', '2'))
+SEARCH_MAX_PREFIX = int(os.getenv('SEARCH_MAX_PREFIX', '15'))
+
+# Önek terimlerini tam kelimelerden ayıran işaret (kelime karakteri olamaz)
+PREFIX_MARK = '>'
+
+_TURKISH_I = str.maketrans({'I': 'i', 'İ': 'i', 'ı': 'i'})
+_WORD = re.compile(r'\w+')
+
+
+def fold(text: str) -> str:
+    """
+    Metni Türkçe kurallarıyla küçük harfe çevirip aksanlarını atar.
+
+    Args:
+        text (str): Metin
+
+    Returns:
+        str: Katlanmış metin
+    """
+    text = unicodedata.normalize('NFC', text or '').translate(_TURKISH_I).lower()
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Metni katlanmış kelimelere ayırır.
+
+    Args:
+        text (str): Metin
+
+    Returns:
+        list: Kelimeler (metindeki sırayla)
+    """
+    return _WORD.findall(fold(text))
+
+
+def prefix_term(word: str) -> str:
+    """Kelimenin önek dizinindeki terimi ('>kita')."""
+    return PREFIX_MARK + word[:SEARCH_MAX_PREFIX]
+
+
+def index_terms(fields: Dict[str, str], weights: Dict[str, int]) -> Counter:
+    """
+    Belgenin alanlarından ağırlıklı terim frekanslarını üretir.
+
+    Her kelime kendisi ve tam kelimeden kısa önekleri olarak sayılır;
+    alan ağırlığı kelimenin kaç kez sayıldığını belirler (ör. başlıktaki
+    kelime açıklamadakinden daha ağır).
+
+    Args:
+        fields (dict): Alan adı -> metin
+        weights (dict): Alan adı -> ağırlık (tanımsız alanlar 1)
+
+    Returns:
+        Counter: Terim -> ağırlıklı frekans
+    """
+    terms = Counter()
+    for name, text in fields.items():
+        weight = weights.get(name, 1)
+        for word in tokenize(text):
+            terms[word] += weight
+            # Uzun kelimelerin en uzun öneki SEARCH_MAX_PREFIX karakterdir
+            for length in range(SEARCH_MIN_PREFIX, min(len(word), SEARCH_MAX_PREFIX + 1)):
+                terms[PREFIX_MARK + word[:length]] += weight
+    return terms
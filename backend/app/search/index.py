@@ -0,0 +1,268 @@
+"""
+Ters Dizin
+--------
+Belgeleri terim -> {belge numarası: frekans} listelerinde tutan ve
+sorguları BM25 ile sıralayan bellek içi dizin.
+
+Belgeler eklenip silinebilir (artımlı güncelleme). Anlık görüntü
+(snapshot) yalnızca belge başına terim vektörlerini saklar; terim
+listeleri yüklemede bu vektörlerden yeniden kurulur, tablo taranmaz.
+"""
+
+import gzip
+import heapq
+import json
+import math
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.search.analyzer import PREFIX_MARK, index_terms, prefix_term, tokenize
+
+# BM25 parametreleri: terim frekansı doygunluğu ve uzunluk normalizasyonu
+BM25_K1 = float(os.getenv('SEARCH_BM25_K1', '1.2'))
+BM25_B = float(os.getenv('SEARCH_BM25_B', '0.75'))
+# Önek eşleşmesinin tam kelime eşleşmesine göre ağırlığı
+SEARCH_PREFIX_WEIGHT = float(os.getenv('SEARCH_PREFIX_WEIGHT', '0.5'))
+
+SNAPSHOT_VERSION = 1
+
+
+class SearchIndex:
+    """
+    BM25 sıralamalı ters dizin.
+
+    Belge kimlikleri dizin içinde küçük tamsayılara eşlenir; terim
+    listeleri bu numaraları tutar. Sorgudaki her kelime belgede tam
+    kelime ya da önek olarak geçmelidir (VE anlamı).
+
+    Attributes:
+        weights (dict): Alan adı -> ağırlık
+    """
+
+    def __init__(self, weights: Optional[Dict[str, int]] = None):
+        self.weights = dict(weights or {})
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._numbers: Dict[str, int] = {}
+        self._doc_ids: Dict[int, str] = {}
+        # Belge numarası -> (uzunluk, öznitelikler, terim vektörü)
+        self._documents: Dict[int, Tuple[int, Dict[str, Any], Dict[str, int]]] = {}
+        self._next_number = 0
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, doc_id: str, fields: Dict[str, str], attributes: Optional[Dict[str, Any]] = None):
+        """
+        Belgeyi dizine ekler; aynı kimlikle varsa yerine koyar.
+
+        Args:
+            doc_id (str): Belge kimliği (ör. forum_id)
+            fields (dict): Alan adı -> aranabilir metin
+            attributes (dict, optional): Filtrelemede kullanılan öznitelikler
+        """
+        self._add_terms(doc_id, dict(index_terms(fields, self.weights)), attributes or {})
+
+    def _add_terms(self, doc_id: str, terms: Dict[str, int], attributes: Dict[str, Any]):
+        # Önek terimleri belge uzunluğuna sayılmaz
+        length = sum(count for term, count in terms.items() if not term.startswith(PREFIX_MARK))
+
+        with self._lock:
+            self.remove(doc_id)
+            number = self._next_number
+            self._next_number += 1
+            self._numbers[doc_id] = number
+            self._doc_ids[number] = doc_id
+            self._documents[number] = (length, attributes, terms)
+            self._total_length += length
+            for term, count in terms.items():
+                self._postings.setdefault(term, {})[number] = count
+
+    def remove(self, doc_id: str) -> bool:
+        """
+        Belgeyi dizinden çıkarır.
+
+        Args:
+            doc_id (str): Belge kimliği
+
+        Returns:
+            bool: Belge dizindeyse True
+        """
+        with self._lock:
+            number = self._numbers.pop(doc_id, None)
+            if number is None:
+                return False
+            del self._doc_ids[number]
+            length, _, terms = self._documents.pop(number)
+            self._total_length -= length
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(number, None)
+                    if not postings:
+                        del self._postings[term]
+            return True
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._numbers
+
+    @staticmethod
+    def _matches(attributes: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        """
+        Öznitelikler filtrelere uyuyor mu.
+
+        Liste öznitelikte üyelik yeterlidir; liste olarak verilen filtre
+        değerlerinden herhangi birinin tutması yeterlidir (VEYA).
+        """
+        for name, expected in filters.items():
+            value = attributes.get(name)
+            values = value if isinstance(value, list) else [value]
+            candidates = expected if isinstance(expected, (list, tuple, set)) else [expected]
+            if not any(candidate in values for candidate in candidates):
+                return False
+        return True
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        offset: int = 0
+    ) -> Tuple[List[str], int]:
+        """
+        Sorguya uyan belgeleri BM25 puanına göre sıralı döndürür.
+
+        Args:
+            query (str): Arama metni
+            filters (dict, optional): Öznitelik adı -> beklenen değer (None olanlar yok sayılır)
+            limit (int): Döndürülecek en fazla belge
+            offset (int): Atlanacak belge sayısı
+
+        Returns:
+            tuple: (belge kimlikleri, toplam eşleşme sayısı)
+        """
+        words = list(dict.fromkeys(tokenize(query)))
+        filters = {name: value for name, value in (filters or {}).items() if value is not None}
+        if not words:
+            return [], 0
+
+        with self._lock:
+            count = len(self._documents)
+            if not count:
+                return [], 0
+            average_length = (self._total_length / count) or 1.0
+
+            scores: Optional[Dict[int, float]] = None
+            for word in words:
+                matched: Dict[int, float] = {}
+                for term, weight in ((word, 1.0), (prefix_term(word), SEARCH_PREFIX_WEIGHT)):
+                    postings = self._postings.get(term)
+                    if not postings:
+                        continue
+                    idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for number, frequency in postings.items():
+                        length = self._documents[number][0]
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                        matched[number] = matched.get(number, 0.0) + (
+                            weight * idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                        )
+
+                if scores is None:
+                    scores = matched
+                else:
+                    scores = {
+                        number: score + matched[number]
+                        for number, score in scores.items() if number in matched
+                    }
+                if not scores:
+                    return [], 0
+
+            if filters:
+                scores = {
+                    number: score for number, score in scores.items()
+                    if self._matches(self._documents[number][1], filters)
+                }
+
+            top = heapq.nsmallest(
+                offset + limit,
+                scores.items(),
+                key=lambda entry: (-entry[1], self._doc_ids[entry[0]])
+            )
+            return [self._doc_ids[number] for number, _ in top[offset:]], len(scores)
+
+    # Anlık görüntü
+
+    def save(self, path: str):
+        """
+        Dizini gzip'li JSON olarak kaydeder.
+
+        Dosya önce geçici bir ada yazılıp tek adımda yerine taşınır; aynı
+        dosyayı okuyan başka bir süreç yarım yazılmış dosya görmez.
+
+        Args:
+            path (str): Dosya yolu
+        """
+        with self._lock:
+            documents = [
+                [self._doc_ids[number], attributes, terms]
+                for number, (_, attributes, terms) in self._documents.items()
+            ]
+        payload = {'version': SNAPSHOT_VERSION, 'weights': self.weights, 'documents': documents}
+
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=5) as f:
+                f.write(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+            os.replace(temporary, path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> 'SearchIndex':
+        """
+        Kaydedilmiş dizini yükler.
+
+        Args:
+            path (str): Dosya yolu
+
+        Returns:
+            SearchIndex: Yüklenen dizin
+
+        Raises:
+            OSError: Dosya okunamazsa
+            ValueError: Dosya bozuksa veya sürümü farklıysa
+        """
+        with gzip.open(path, 'rb') as f:
+            payload = json.loads(f.read().decode('utf-8'))
+        if not isinstance(payload, dict) or payload.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"Desteklenmeyen arama dizini sürümü: {path}")
+
+        index = cls(payload.get('weights'))
+        for doc_id, attributes, terms in payload['documents']:
+            index._add_terms(doc_id, terms, attributes)
+        return index
+
+    @classmethod
+    def build(cls, documents: Iterable[Tuple[str, Dict[str, str], Dict[str, Any]]],
+              weights: Optional[Dict[str, int]] = None) -> 'SearchIndex':
+        """
+        (kimlik, alanlar, öznitelikler) üçlülerinden yeni bir dizin kurar.
+
+        Args:
+            documents (iterable): Belgeler
+            weights (dict, optional): Alan adı -> ağırlık
+
+        Returns:
+            SearchIndex: Kurulan dizin
+        """
+        index = cls(weights)
+        for doc_id, fields, attributes in documents:
+            index.add(doc_id, fields, attributes)
+        return index
@@ -0,0 +1,359 @@
+"""
+Arama Dizini Kaydı
+----------------
+Forum, anket ve grup tabloları için süreç başına birer arama dizini tutar.
+
+Dizin ilk kullanımda anlık görüntüden (SEARCH_SNAPSHOT_DIR) yüklenir; dosya
+yoksa tablo taranarak kurulur ve kaydedilir. Bu süreçteki yazmalar
+(index_document/remove_document) dizine hemen uygulanır. Diğer süreçlerin
+yazmaları, SEARCH_REFRESH_INTERVAL saniyede bir arka planda yapılan yeniden
+kurmayla gelir; yeniden kurma sürerken gelen yazmalar kaybolmaz, yeni
+dizine ayrıca uygulanır. Dizin henüz yüklenmemişken gelen yazmalar
+tutulmaz: kaynak tablodadırlar ve yükleme ya da sonraki yeniden kurma
+onları okur.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from app.paths import DATA_DIRECTORY
+from app.search.index import SearchIndex
+from app.services.schema import FORUMS_TABLE_NAME, GROUPS_TABLE_NAME, POLLS_TABLE_NAME
+from app.utils.log import get_logger
+
+DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
+# Anlık görüntülerin dizini; boş bırakılırsa dosyaya yazılmaz
+SEARCH_SNAPSHOT_DIR = os.getenv('SEARCH_SNAPSHOT_DIR', os.path.join(DATA_DIRECTORY, 'search'))
+# Dizinin tablodan yeniden kurulma aralığı (saniye)
+SEARCH_REFRESH_INTERVAL = float(os.getenv('SEARCH_REFRESH_INTERVAL', '300'))
+
+logger = get_logger(__name__)
+
+Document = Tuple[Dict[str, str], Dict[str, Any]]
+
+
+class SearchSource:
+    """
+    Bir tablonun aranabilir belgelere dönüşümü.
+
+    Attributes:
+        table_name (str): Tablo adı
+        id_attribute (str): Belge kimliğini taşıyan öznitelik
+        weights (dict): Alan adı -> ağırlık
+        document (callable): Öğe -> (alanlar, öznitelikler) veya dizine girmeyecekse None
+    """
+
+    def __init__(self, table_name: str, id_attribute: str, weights: Dict[str, int],
+                 document: Callable[[Dict[str, Any]], Optional[Document]]):
+        self.table_name = table_name
+        self.id_attribute = id_attribute
+        self.weights = weights
+        self.document = document
+
+
+def _forum_document(item: Dict[str, Any]) -> Optional[Document]:
+    if not item.get('is_active', True):
+        return None
+    return (
+        {'header': item.get('header') or '', 'description': item.get('description') or ''},
+        {'category': item.get('category'), 'university': item.get('university')}
+    )
+
+
+def _poll_document(item: Dict[str, Any]) -> Optional[Document]:
+    if not item.get('is_active', True):
+        return None
+    options = ' '.join(option.get('metin') or '' for option in item.get('secenekler') or [])
+    return (
+        {
+            'header': item.get('header') or '',
+            'description': item.get('description') or '',
+            'secenekler': options
+        },
+        {'category': item.get('category'), 'university': item.get('university')}
+    )
+
+
+def _group_document(item: Dict[str, Any]) -> Optional[Document]:
+    if not item.get('is_active', True):
+        return None
+    categories = list(item.get('kategoriler') or [])
+    return (
+        {
+            'grup_adi': item.get('grup_adi') or '',
+            'description': item.get('description') or '',
+            'kategoriler': ' '.join(categories)
+        },
+        {'kategoriler': categories}
+    )
+
+
+SEARCH_SOURCES = {
+    'forums': SearchSource(FORUMS_TABLE_NAME, 'forum_id', {'header': 3}, _forum_document),
+    'polls': SearchSource(POLLS_TABLE_NAME, 'poll_id', {'header': 3}, _poll_document),
+    'groups': SearchSource(GROUPS_TABLE_NAME, 'group_id', {'grup_adi': 3, 'kategoriler': 2}, _group_document),
+}
+
+
+class SearchRegistry:
+    """
+    Bir kaynağın arama dizinini yükler, günceller ve tazeler.
+
+    Attributes:
+        source (SearchSource): Dizinlenen tablo
+        snapshot_path (str): Anlık görüntü dosyası veya None
+        refresh_interval (float): Yeniden kurma aralığı (saniye)
+    """
+
+    def __init__(
+        self,
+        source: SearchSource,
+        snapshot_path: Optional[str] = None,
+        refresh_interval: float = SEARCH_REFRESH_INTERVAL,
+        scan: Optional[Callable[[], Iterable[Dict[str, Any]]]] = None,
+        timer=time.time
+    ):
+        self.source = source
+        self.snapshot_path = snapshot_path
+        self.refresh_interval = refresh_interval
+        self._scan = scan or self._scan_table
+        self._timer = timer
+        self._lock = threading.RLock()
+        self._rebuild_lock = threading.Lock()
+        self._index: Optional[SearchIndex] = None
+        # Dizin yüklenirken/yeniden kurulurken gelen yazmalar (yeni dizine
+        # uygulanır); yalnızca bir yükleme sürerken liste olur
+        self._pending: Optional[List[Tuple[str, Optional[Dict[str, Any]]]]] = None
+        self._next_refresh = 0.0
+
+    def _scan_table(self) -> Iterable[Dict[str, Any]]:
+        """Tablodaki tüm öğeleri sayfa sayfa okur."""
+        from app.storage import get_dynamodb
+        table = get_dynamodb(DEFAULT_REGION).Table(self.source.table_name)
+        params = {}
+        while True:
+            response = table.scan(**params)
+            yield from response.get('Items', [])
+            if 'LastEvaluatedKey' not in response:
+                break
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def _documents(self, items: Iterable[Dict[str, Any]]):
+        for item in items:
+            document = self.source.document(item)
+            if document is not None:
+                yield (item[self.source.id_attribute],) + document
+
+    def _apply(self, index: SearchIndex, doc_id: str, item: Optional[Dict[str, Any]]):
+        document = self.source.document(item) if item is not None else None
+        if document is None:
+            index.remove(doc_id)
+        else:
+            index.add(doc_id, *document)
+
+    def _install(self, index: SearchIndex, refreshed_at: float):
+        """Yeni dizini bekleyen yazmaları uygulayıp devreye alır."""
+        with self._lock:
+            for doc_id, item in self._pending or []:
+                self._apply(index, doc_id, item)
+            self._index = index
+            self._pending = None
+            self._next_refresh = refreshed_at + self.refresh_interval
+
+    def _ensure_loaded(self) -> SearchIndex:
+        index = self._index
+        if index is not None:
+            return index
+
+        with self._rebuild_lock:
+            if self._index is not None:
+                return self._index
+            if self.snapshot_path and os.path.exists(self.snapshot_path):
+                with self._lock:
+                    self._pending = []
+                try:
+                    mtime = os.stat(self.snapshot_path).st_mtime
+                    self._install(SearchIndex.load(self.snapshot_path), mtime)
+                    logger.info("search_index_loaded", source=self.source.table_name,
+                                documents=len(self._index))
+                    return self._index
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    logger.warning("search_snapshot_unreadable", path=self.snapshot_path, error=str(e))
+            self._rebuild()
+            return self._index
+
+    def rebuild(self) -> SearchIndex:
+        """
+        Dizini tablodan yeniden kurar ve anlık görüntüyü kaydeder.
+
+        Returns:
+            SearchIndex: Devreye alınan dizin
+        """
+        with self._rebuild_lock:
+            self._rebuild()
+            return self._index
+
+    def _rebuild(self):
+        started = self._timer()
+        with self._lock:
+            if self._pending is None:
+                self._pending = []
+
+        try:
+            index = SearchIndex.build(self._documents(self._scan()), self.source.weights)
+        except ClientError as e:
+            logger.error("search_index_build_failed", source=self.source.table_name, error=str(e))
+            with self._lock:
+                if self._index is None:
+                    # Boş dizinle devam et; sonraki denemede yeniden kurulur
+                    self._install(SearchIndex(self.source.weights), started - self.refresh_interval)
+                else:
+                    self._pending = None
+            return
+
+        self._install(index, started)
+        logger.info("search_index_built", source=self.source.table_name, documents=len(index),
+                    duration_ms=round((self._timer() - started) * 1000, 1))
+
+        if self.snapshot_path:
+            try:
+                index.save(self.snapshot_path)
+            except OSError as e:
+                logger.warning("search_snapshot_save_failed", path=self.snapshot_path, error=str(e))
+
+    def _refresh_if_due(self):
+        """Süresi dolan dizini arka planda yeniden kurar; aramayı bekletmez."""
+        if self._timer() < self._next_refresh or self._rebuild_lock.locked():
+            return
+        thread = threading.Thread(target=self._refresh, name='search-refresh', daemon=True)
+        thread.start()
+
+    def _refresh(self):
+        if self._rebuild_lock.acquire(blocking=False):
+            try:
+                self._rebuild()
+            finally:
+                self._rebuild_lock.release()
+
+    def update(self, item: Dict[str, Any]):
+        """
+        Öğeyi dizine ekler veya günceller; aranmayacak öğeyi (ör. silinmiş) çıkarır.
+
+        Args:
+            item (dict): Tablo öğesi veya aynı alanları taşıyan model sözlüğü
+        """
+        self._write(item[self.source.id_attribute], item)
+
+    def remove(self, doc_id: str):
+        """
+        Belgeyi dizinden çıkarır.
+
+        Args:
+            doc_id (str): Belge kimliği
+        """
+        self._write(doc_id, None)
+
+    def _write(self, doc_id: str, item: Optional[Dict[str, Any]]):
+        with self._lock:
+            if self._index is not None:
+                self._apply(self._index, doc_id, item)
+            if self._pending is not None:
+                self._pending.append((doc_id, item))
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        offset: int = 0
+    ) -> Tuple[List[str], int]:
+        """
+        Dizinde arama yapar.
+
+        Args:
+            query (str): Arama metni
+            filters (dict, optional): Öznitelik filtreleri
+            limit (int): Döndürülecek en fazla belge
+            offset (int): Atlanacak belge sayısı
+
+        Returns:
+            tuple: (BM25 sırasıyla belge kimlikleri, toplam eşleşme sayısı)
+        """
+        index = self._ensure_loaded()
+        self._refresh_if_due()
+        return index.search(query, filters, limit, offset)
+
+
+_registries: Dict[str, SearchRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_search_registry(kind: str) -> SearchRegistry:
+    """
+    Kaynağın süreç genelindeki arama dizinini döndürür.
+
+    Args:
+        kind (str): 'forums', 'polls' veya 'groups'
+
+    Returns:
+        SearchRegistry: Dizin kaydı
+    """
+    registry = _registries.get(kind)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(kind)
+            if registry is None:
+                snapshot_path = os.path.join(SEARCH_SNAPSHOT_DIR, f'{kind}.json.gz') if SEARCH_SNAPSHOT_DIR else None
+                registry = SearchRegistry(SEARCH_SOURCES[kind], snapshot_path)
+                _registries[kind] = registry
+    return registry
+
+
+def index_document(kind: str, item: Dict[str, Any]):
+    """
+    Yazılan öğeyi arama dizinine yansıtır; hata yazmayı başarısız yapmaz.
+
+    Args:
+        kind (str): Kaynak adı
+        item (dict): Tablo öğesi veya model sözlüğü
+    """
+    try:
+        get_search_registry(kind).update(item)
+    except Exception:
+        logger.exception("search_index_update_failed", kind=kind)
+
+
+def remove_document(kind: str, doc_id: str):
+    """
+    Silinen öğeyi arama dizininden çıkarır; hata silmeyi başarısız yapmaz.
+
+    Args:
+        kind (str): Kaynak adı
+        doc_id (str): Belge kimliği
+    """
+    try:
+        get_search_registry(kind).remove(doc_id)
+    except Exception:
+        logger.exception("search_index_update_failed", kind=kind)
+
+
+def search(kind: str, query: str, filters: Optional[Dict[str, Any]] = None,
+           limit: int = 10, offset: int = 0) -> Tuple[List[str], int]:
+    """
+    Kaynağın dizininde arama yapar.
+
+    Args:
+        kind (str): Kaynak adı
+        query (str): Arama metni
+        filters (dict, optional): Öznitelik filtreleri
+        limit (int): Döndürülecek en fazla belge
+        offset (int): Atlanacak belge sayısı
+
+    Returns:
+        tuple: (belge kimlikleri, toplam eşleşme sayısı)
+    """
+    return get_search_registry(kind).search(query, filters, limit, offset)
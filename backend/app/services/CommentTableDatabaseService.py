@@ -1,17 +1,27 @@
 import os
 import uuid
-import boto3
+from boto3.dynamodb.conditions import Key, Attr
 from typing import List, Optional, Dict
 from datetime import datetime
 from botocore.exceptions import ClientError
 
+from app.feed import record_activity
 from app.models.CommentModel import CommentModel
 from app.models.ForumModel import ForumModel
 from app.models.UserModel import UserModel
-import traceback
+from app.services.ReactionTableDatabaseService import ReactionDatabaseService
+from app.services.schema import COMMENTS_COMMENTED_ON_INDEX_NAME as COMMENTED_ON_INDEX_NAME
+from app.utils.dynamodb import batch_get_items, transact_write, cancellation_reasons
+from app.utils.pagination import encode_cursor, decode_cursor, read_page
+from app.storage import get_dynamodb
+from app.utils.log import get_logger
 
 DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
 DEFAULT_COMMENTS_TABLE_NAME = os.getenv('COMMENTS_TABLE_NAME', 'Comments')
+# Deepest reply level loaded together with a page of comments
+MAX_THREAD_DEPTH = int(os.getenv('COMMENT_THREAD_MAX_DEPTH', '3'))
+
+logger = get_logger(__name__)
 
 class CommentDatabaseService:
 
@@ -40,20 +50,9 @@ class CommentDatabaseService:
             raise Exception("This class is a singleton!")
         else:
             CommentDatabaseService.__instance = self
-        # AWS Credentials
-        self.access_key = os.getenv('AWS_ACCESS_KEY_ID', '').strip()
-        self.secret_key = os.getenv('AWS_SECRET_ACCESS_KEY', '').strip()
-        
-        if not self.access_key or not self.secret_key:
-            raise ValueError("AWS credentials must be provided")
-        
-        # Setup AWS Resources
-        self.session = boto3.Session(
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            region_name=region_name
-        )
-        self.dynamodb = self.session.resource('dynamodb')
+        # DynamoDB or the local SQLite engine, per STORAGE_BACKEND
+        self.dynamodb = get_dynamodb(region_name)
+        self.client = self.dynamodb.meta.client
         self.table = self.dynamodb.Table(table_name)
         return
 
@@ -80,24 +79,7 @@ class CommentDatabaseService:
         Raises:
             ValueError: If comment creation fails
         """
-        # Validate inputs
-        if not content:
-            raise ValueError("Yorum içeriği zorunludur")
-        
-        # Generate unique comment ID
-        comment_id = f"cmt_{str(uuid.uuid4())}"
-        
-        # Prepare comment data
-        comment_data = {
-            'comment_id': comment_id,
-            'commented_on_id': commented_on_id,
-            'creator_id': user_id,
-            'content': content,
-            'created_at': datetime.now().isoformat(),
-            'photo_urls': photo_urls or []
-        }
-
-        new_comment = CommentModel(**comment_data)
+        new_comment = self._build_comment(user_id, commented_on_id, content, photo_urls)
         
         # Save to DynamoDB
         try:
@@ -105,8 +87,37 @@ class CommentDatabaseService:
         except ClientError as e:
             raise ValueError(f"Error creating comment: {e}")
         
+        # Forum and poll comments count towards the hot feed; other targets are ignored
+        record_activity(commented_on_id, 'comment')
         return new_comment
 
+    @staticmethod
+    def _build_comment(
+        user_id: str,
+        commented_on_id: str,
+        content: str,
+        photo_urls: Optional[List[str]] = None
+    ) -> CommentModel:
+        """
+        Validate input and build a new comment with a fresh ID
+        
+        Raises:
+            ValueError: If content is empty
+        """
+        # Validate inputs
+        if not content:
+            raise ValueError("Yorum içeriği zorunludur")
+        
+        # Prepare comment data
+        return CommentModel(
+            comment_id=f"cmt_{str(uuid.uuid4())}",
+            commented_on_id=commented_on_id,
+            creator_id=user_id,
+            content=content,
+            created_at=datetime.now().isoformat(),
+            photo_urls=photo_urls or []
+        )
+
     def get_comment_by_id(self, comment_id: str) -> Optional[CommentModel]:
         """
         Get comment by its ID
@@ -131,86 +142,103 @@ class CommentDatabaseService:
     def get_comments_for_id(
         self, 
         commented_on_id: str,
-        page: int = 1, 
-        per_page: int = 20
+        per_page: int = 20,
+        cursor: Optional[str] = None,
+        depth: int = MAX_THREAD_DEPTH
     ) -> Dict[str, any]:
         """
-        Retrieve comments for a specific forum
+        Retrieve a page of comments on an object together with their reply threads
+        
+        Top-level comments come from the commented_on_id GSI. Replies are
+        loaded one level at a time with BatchGetItem on the parents'
+        `sub_comment_list`, so a thread costs O(depth) round trips instead of
+        one query per comment.
         
         Args:
-            forum_id (str): Forum's unique identifier
-            page (int): Page number
-            per_page (int): Comments per page
+            commented_on_id (str): ID of the forum/poll/comment
+            per_page (int): Top-level comments per page
+            cursor (str, optional): Continuation cursor from a previous page
+            depth (int): Reply levels to load (0 loads no replies)
         
         Returns:
-            Dict containing comments and metadata
+            Dict containing comments (each with nested `replies`) and metadata
+        
+        Raises:
+            ValidationError: If the cursor is invalid
         """
+        params = {
+            'IndexName': COMMENTED_ON_INDEX_NAME,
+            'KeyConditionExpression': Key('commented_on_id').eq(commented_on_id),
+            'FilterExpression': Attr('is_active').eq(True)
+        }
+        exclusive_start_key = decode_cursor(cursor, COMMENTED_ON_INDEX_NAME)
+        
         try:
-            # Retrieve main comments (top-level comments)
-            scan_params = {
-                'FilterExpression': 'commented_on_id = :commented_on_id AND is_active = :active',
-                'ExpressionAttributeValues': {
-                    ':commented_on_id': commented_on_id,
-                    ':active': True
-                }
+            items, last_key = read_page(
+                self.table.query, params, per_page, exclusive_start_key,
+                ('comment_id', 'commented_on_id')
+            )
+            comments = [self._thread_node(item) for item in items]
+            nodes = self._load_replies(comments, min(depth, MAX_THREAD_DEPTH))
+            ReactionDatabaseService.get_instance().apply_counts(nodes, 'comment_id')
+        except ClientError:
+            comments, last_key = [], None
+        
+        return {
+            'comments': comments,
+            'meta': {
+                'per_page': per_page,
+                'next_cursor': encode_cursor(last_key, COMMENTED_ON_INDEX_NAME)
             }
+        }
+
+    @staticmethod
+    def _thread_node(item: Dict[str, any]) -> Dict[str, any]:
+        """Comment dictionary with an empty `replies` list to be filled in"""
+        node = CommentModel(**item).to_dict()
+        node['replies'] = []
+        return node
+
+    def _load_replies(self, parents: List[Dict[str, any]], depth: int) -> List[Dict[str, any]]:
+        """
+        Fill in `replies` of the given comments level by level
+        
+        Args:
+            parents (List[Dict]): Thread nodes of the current level
+            depth (int): Remaining levels to load
+        
+        Returns:
+            List[Dict]: All thread nodes, parents included
+        """
+        nodes = list(parents)
+        level = parents
+        for _ in range(depth):
+            child_ids = list(dict.fromkeys(
+                child_id for node in level for child_id in node['sub_comment_list']
+            ))
+            if not child_ids:
+                break
             
-            # Perform scan
-            response = self.table.scan(**scan_params)
-            
-            # Process and paginate results
-            items = response.get('Items', [])
-            total_count = len(items)
-            
-            # Apply pagination
-            start_index = (page - 1) * per_page
-            end_index = start_index + per_page
-            paginated_items = items[start_index:end_index]
+            # One batched read per level instead of one query per parent
+            items = batch_get_items(
+                self.dynamodb,
+                self.table.name,
+                [{'comment_id': child_id} for child_id in child_ids]
+            )
+            children = {
+                item['comment_id']: self._thread_node(item)
+                for item in items if item.get('is_active', True)
+            }
             
-            # Convert to CommentModel objects and fetch replies
-            main_comments = []
-            for item in paginated_items:
-                comment = CommentModel(**item)
-                
-                # Fetch replies for this comment
-                replies_params = {
-                    'FilterExpression': 'commented_on_id = :commented_on_id AND is_active = :active',
-                    'ExpressionAttributeValues': {
-                        ':commented_on_id': commented_on_id,
-                        ':active': True,
-                        ':parent_id': comment.comment_id
-                    }
-                }
-                replies_response = self.table.scan(**replies_params)
-                
-                # Add replies to the comment
-                comment.yanit_listesi = [
-                    CommentModel(**reply_item) 
-                    for reply_item in replies_response.get('Items', [])
+            for node in level:
+                node['replies'] = [
+                    children[child_id] for child_id in node['sub_comment_list']
+                    if child_id in children
                 ]
-                
-                main_comments.append(comment)
-            
-            return {
-                'comments': [comment.to_dict() for comment in main_comments],
-                'meta': {
-                    'total': total_count,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': (total_count + per_page - 1) // per_page
-                }
-            }
+            level = list(children.values())
+            nodes.extend(level)
         
-        except ClientError:
-            return {
-                'comments': [],
-                'meta': {
-                    'total': 0,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': 0
-                }
-            }
+        return nodes
 
     def get_comments_by_commented_on_id(self,
         commented_on_id: str
@@ -226,23 +254,16 @@ class CommentDatabaseService:
         """
         try:
             response = self.table.query(
-                IndexName='commented_on_id-index',
+                IndexName=COMMENTED_ON_INDEX_NAME,
                 KeyConditionExpression='commented_on_id = :commented_on_id',
                 ExpressionAttributeValues={':commented_on_id': commented_on_id}
             )
             
-            # prints the response in orange color using ansi escape code
-            print(f"\033[93m{response}\033[00m", flush=True)
             items = response.get('Items', [])
             return [CommentModel(**item) for item in items]
         
-        except ClientError:
-            # prints the traceback in red color using ansi escape code
-            print(f"\033[91m{traceback.format_exc()}\033[00m", flush=True)
-            return []
-        except Exception as e:
-            # prints the error message in red color using ansi escape code
-            print(f"\033[91m{str(e)}\033[00m", flush=True)
+        except Exception:
+            logger.exception("comments_query_failed", commented_on_id=commented_on_id)
             return []
         
     def add_sub_comment(self,
@@ -260,9 +281,124 @@ class CommentDatabaseService:
                 authorized=True
             )
         except Exception as e:
-            print(f"\033[91m{traceback.format_exc()}\033[00m", flush=True)
+            logger.exception("add_sub_comment_failed", comment_id=comment_id)
             raise e
 
+    def create_reply(
+        self,
+        comment_id: str,
+        user_id: str,
+        content: str,
+        photo_urls: Optional[List[str]] = None
+    ) -> CommentModel:
+        """
+        Create a reply to an existing comment
+        
+        The reply put and a check that the parent exists are a single
+        TransactWriteItems call, so no reply is left without its parent.
+        Linking the reply into the parent's sub_comment_list is a separate
+        follow-up write (see link_reply).
+        
+        Args:
+            comment_id (str): Parent comment ID
+            user_id (str): ID of the user replying
+            content (str): Reply content
+            photo_urls (List[str], optional): Reply photo URLs
+        
+        Returns:
+            CommentModel: Created reply
+        
+        Raises:
+            ValueError: If the parent does not exist or the write fails
+        """
+        reply = self._build_comment(user_id, comment_id, content, photo_urls)
+        
+        try:
+            transact_write(self.client, [
+                {'Put': {
+                    'TableName': self.table.name,
+                    'Item': reply.to_dict(),
+                    'ConditionExpression': 'attribute_not_exists(comment_id)'
+                }},
+                {'ConditionCheck': {
+                    'TableName': self.table.name,
+                    'Key': {'comment_id': comment_id},
+                    'ConditionExpression': 'attribute_exists(comment_id)'
+                }}
+            ])
+        except ClientError as e:
+            reasons = cancellation_reasons(e) or []
+            if len(reasons) > 1 and reasons[1] == 'ConditionalCheckFailed':
+                raise ValueError("Comment not found")
+            raise ValueError(f"Error creating reply: {e}")
+        
+        return reply
+
+    def link_reply(self, comment_id: str, reply: Dict[str, any]) -> bool:
+        """
+        Append a reply to its parent's sub_comment_list and latest_sub_comment
+        
+        Safe to repeat: a reply already in the list is not appended again.
+        latest_sub_comment only moves forward, so links applied out of order
+        (e.g. a retried task) never replace a newer reply with an older one.
+        
+        Args:
+            comment_id (str): Parent comment ID
+            reply (Dict): Reply data (CommentModel.to_dict())
+        
+        Returns:
+            bool: True if the parent was updated, False if already linked or gone
+        """
+        linked = self._conditional_update(
+            comment_id,
+            'SET sub_comment_list = list_append(if_not_exists(sub_comment_list, :empty), :reply_ids)',
+            'attribute_exists(comment_id) AND NOT contains(sub_comment_list, :reply_id)',
+            {
+                ':empty': [],
+                ':reply_ids': [reply['comment_id']],
+                ':reply_id': reply['comment_id']
+            }
+        )
+        # Also runs when already linked, in case an earlier attempt stopped here
+        self._conditional_update(
+            comment_id,
+            'SET latest_sub_comment = :latest',
+            'attribute_exists(comment_id) AND ('
+            'attribute_not_exists(latest_sub_comment.created_at) OR '
+            'latest_sub_comment.created_at < :created_at)',
+            {':latest': reply, ':created_at': reply['created_at']}
+        )
+        return linked
+
+    def _conditional_update(
+        self,
+        comment_id: str,
+        update_expression: str,
+        condition_expression: str,
+        values: Dict[str, any]
+    ) -> bool:
+        """
+        Update a comment if the condition holds
+        
+        Returns:
+            bool: False if the condition failed
+        
+        Raises:
+            ValueError: If the write fails for another reason
+        """
+        try:
+            self.table.update_item(
+                Key={'comment_id': comment_id},
+                UpdateExpression=update_expression,
+                ConditionExpression=condition_expression,
+                ExpressionAttributeValues=values
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise ValueError(f"Error linking reply: {e}")
+        return True
+
     def update_comment(
         self, 
         comment_id: str, 
@@ -328,7 +464,7 @@ class CommentDatabaseService:
         except ClientError as e:
             raise ValueError(f"Error updating comment: {e}")
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
+            logger.exception("comment_update_failed", comment_id=comment_id)
             raise e
 
     def delete_comment(
@@ -399,37 +535,15 @@ class CommentDatabaseService:
         Raises:
             ValueError: If reaction is invalid or comment not found
         """
-        try:
-            # Validate reaction type
-            if reaction_type not in ['like', 'dislike']:
-                raise ValueError("Geçersiz reaksiyon türü")
-            
-            # Retrieve existing comment
-            comment = self.get_comment_by_id(comment_id)
-            
-            if not comment:
-                raise ValueError("Yorum bulunamadı")
-            
-            # Prepare update expression
-            update_expr = f"SET {reaction_type}_count = {reaction_type}_count + :increment"
-            
-            # Perform update
-            self.table.update_item(
-                Key={'comment_id': comment_id},
-                UpdateExpression=update_expr,
-                ExpressionAttributeValues={':increment': 1}
-            )
-            
-            # Retrieve updated comment to get latest counts
-            updated_comment = self.get_comment_by_id(comment_id)
-            
-            return {
-                'like_count': updated_comment.like_count,
-                'dislike_count': updated_comment.dislike_count
-            }
+        # Existence check is a read; the reaction itself is one transactional write
+        comment = self.get_comment_by_id(comment_id)
         
-        except ClientError as e:
-            raise ValueError(f"Reaksiyon eklenemedi: {e}")
+        if not comment:
+            raise ValueError("Yorum bulunamadı")
+        
+        return ReactionDatabaseService.get_instance().react(
+            comment_id, user_id, reaction_type
+        )
 
     def get_sub_comments(
         self, 
@@ -446,7 +560,7 @@ class CommentDatabaseService:
         """
         try:
             response = self.table.query(
-                IndexName='commented_on_id-index',
+                IndexName=COMMENTED_ON_INDEX_NAME,
                 KeyConditionExpression='commented_on_id = :commented_on_id',
                 ExpressionAttributeValues={':commented_on_id': comment_id}
             )
@@ -1,15 +1,27 @@
 import os
 import uuid
-import boto3
+from boto3.dynamodb.conditions import Key, Attr
 from typing import List, Optional, Dict
 from datetime import datetime
 from botocore.exceptions import ClientError
 
+from app.feed import record_activity, record_item, remove_item
 from app.models.ForumModel import ForumModel
 from app.models.UserModel import UserModel
+from app.search import index_document, remove_document, search as search_index
+from app.services.ReactionTableDatabaseService import ReactionDatabaseService
+from app.services.schema import (
+    FORUMS_CATEGORY_INDEX_NAME as CATEGORY_INDEX_NAME,
+    FORUMS_UNIVERSITY_INDEX_NAME as UNIVERSITY_INDEX_NAME
+)
+from app.utils.dynamodb import batch_get_items
+from app.utils.pagination import encode_cursor, decode_cursor, read_page
+from app.storage import get_dynamodb
 
 DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
 DEFAULT_FORUMS_TABLE_NAME = os.getenv('FORUMS_TABLE_NAME', 'Forums')
+# Cursor namespace of search result pages (they are paged by offset)
+SEARCH_CURSOR_NAME = 'search'
 
 class ForumDatabaseService:
     
@@ -37,20 +49,8 @@ class ForumDatabaseService:
             region_name (str): AWS region
             table_name (str): DynamoDB table name
         """
-        # AWS Credentials
-        self.access_key = os.getenv('AWS_ACCESS_KEY_ID', '').strip()
-        self.secret_key = os.getenv('AWS_SECRET_ACCESS_KEY', '').strip()
-        
-        if not self.access_key or not self.secret_key:
-            raise ValueError("AWS credentials must be provided")
-        
-        # Setup AWS Resources
-        self.session = boto3.Session(
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            region_name=region_name
-        )
-        self.dynamodb = self.session.resource('dynamodb')
+        # DynamoDB or the local SQLite engine, per STORAGE_BACKEND
+        self.dynamodb = get_dynamodb(region_name)
         self.table = self.dynamodb.Table(table_name)
 
     def create_forum(
@@ -97,12 +97,20 @@ class ForumDatabaseService:
             'created_at': datetime.now().isoformat()
         }
         
+        # Index key attributes cannot be null; leave them out so the GSIs stay sparse
+        item = {
+            key: value for key, value in forum_data.items()
+            if not (key in ('university', 'category') and not value)
+        }
+
         # Save to DynamoDB
         try:
-            self.table.put_item(Item=forum_data)
+            self.table.put_item(Item=item)
         except ClientError as e:
             raise ValueError(f"Error creating forum: {e}")
         
+        index_document('forums', forum_data)
+        record_item(forum_data['forum_id'], university, forum_data['created_at'])
         return ForumModel(**forum_data)
 
     def get_forum_by_id(self, forum_id: str) -> Optional[ForumModel]:
@@ -128,84 +136,139 @@ class ForumDatabaseService:
 
     def get_forums(
         self, 
-        page: int = 1, 
         per_page: int = 10,
+        cursor: Optional[str] = None,
         category: Optional[str] = None,
         university: Optional[str] = None,
         search: Optional[str] = None
     ) -> Dict[str, any]:
         """
-        Retrieve forums with optional filtering and pagination
+        Retrieve forums with optional filtering and cursor pagination
+        
+        Category and university filters are served by GSIs sorted by
+        `created_at` (newest first), so a page costs reads proportional to
+        the page size. Without a filter the table is scanned page by page.
+        A search term is answered by the in-process search index, ranked by
+        relevance (see app.search).
         
         Args:
-            page (int): Page number
             per_page (int): Forums per page
+            cursor (str, optional): Continuation cursor from a previous page
             category (str, optional): Filter by category
             university (str, optional): Filter by university
             search (str, optional): Search term
         
         Returns:
             Dict containing forums and metadata
+        
+        Raises:
+            ValidationError: If the cursor is invalid
         """
-        try:
-            # Base scan parameters
-            scan_params = {
-                'FilterExpression': 'is_active = :active',
-                'ExpressionAttributeValues': {':active': True}
+        if search:
+            return self._search_forums(search, per_page, cursor, category, university)
+        
+        # Pick the access path: university index, category index or scan
+        if university:
+            index_name = UNIVERSITY_INDEX_NAME
+            index_keys = ('university', 'created_at')
+            params = {
+                'IndexName': index_name,
+                'KeyConditionExpression': Key('university').eq(university),
+                'ScanIndexForward': False
             }
-            
-            # Add category filter if provided
-            if category:
-                scan_params['FilterExpression'] += ' AND category = :category'
-                scan_params['ExpressionAttributeValues'][':category'] = category
-            
-            # Add university filter if provided
-            if university:
-                scan_params['FilterExpression'] += ' AND university = :university'
-                scan_params['ExpressionAttributeValues'][':university'] = university
-            
-            # Add search filter if provided
-            if search:
-                scan_params['FilterExpression'] += ' AND contains(header, :search)'
-                scan_params['ExpressionAttributeValues'][':search'] = search
-            
-            # Perform scan
-            response = self.table.scan(**scan_params)
-            
-            # Process and paginate results
-            items = response.get('Items', [])
-            total_count = len(items)
-            
-            # Apply pagination
-            start_index = (page - 1) * per_page
-            end_index = start_index + per_page
-            paginated_items = items[start_index:end_index]
-            
-            # Convert to ForumModel objects
-            forums = [ForumModel(**item) for item in paginated_items]
-            
-            # prints the total count of forums in orange using ansi color codes
-            print(f"\033[93mTotal Forums: {total_count}\033[0m")
-            return {
-                'forums': [forum.to_dict() for forum in forums],
-                'meta': {
-                    'total': total_count,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': (total_count + per_page - 1) // per_page
-                }
+        elif category:
+            index_name = CATEGORY_INDEX_NAME
+            index_keys = ('category', 'created_at')
+            params = {
+                'IndexName': index_name,
+                'KeyConditionExpression': Key('category').eq(category),
+                'ScanIndexForward': False
             }
+        else:
+            index_name = None
+            index_keys = ()
+            params = {}
+        
+        # Remaining filters are applied on the items read from the index
+        filter_expression = Attr('is_active').eq(True)
+        if category and university:
+            filter_expression = filter_expression & Attr('category').eq(category)
+        params['FilterExpression'] = filter_expression
         
+        exclusive_start_key = decode_cursor(cursor, index_name)
+        operation = self.table.query if index_name else self.table.scan
+        
+        try:
+            items, last_key = read_page(
+                operation, params, per_page, exclusive_start_key,
+                ('forum_id',) + index_keys
+            )
         except ClientError:
-            return {
-                'forums': [],
-                'meta': {
-                    'total': 0,
-                    'page': page,
-                    'per_page': per_page,
-                    'total_pages': 0
-                }
+            items, last_key = [], None
+        
+        forums = [ForumModel(**item) for item in items]
+        next_cursor = encode_cursor(last_key, index_name)
+        
+        return {
+            'forums': [forum.to_dict() for forum in forums],
+            'meta': {
+                'per_page': per_page,
+                'next_cursor': next_cursor
             }
+        }
+
+    def _search_forums(
+        self,
+        search: str,
+        per_page: int,
+        cursor: Optional[str],
+        category: Optional[str],
+        university: Optional[str]
+    ) -> Dict[str, any]:
+        """
+        Retrieve a page of forums matching a search term, most relevant first
+        
+        Args:
+            search (str): Search term
+            per_page (int): Forums per page
+            cursor (str, optional): Continuation cursor from a previous page
+            category (str, optional): Filter by category
+            university (str, optional): Filter by university
+        
+        Returns:
+            Dict containing forums and metadata
+        
+        Raises:
+            ValidationError: If the cursor is invalid
+        """
+        offset = int((decode_cursor(cursor, SEARCH_CURSOR_NAME) or {}).get('offset', 0))
+        forum_ids, total = search_index(
+            'forums', search,
+            filters={'category': category, 'university': university},
+            limit=per_page,
+            offset=offset
+        )
+        
+        try:
+            items = batch_get_items(
+                self.dynamodb, self.table.name,
+                [{'forum_id': forum_id} for forum_id in forum_ids]
+            )
+        except ClientError:
+            items = []
+        
+        # BatchGetItem does not keep the order; restore the ranking
+        by_id = {item['forum_id']: item for item in items if item.get('is_active', True)}
+        forums = [ForumModel(**by_id[forum_id]) for forum_id in forum_ids if forum_id in by_id]
+        
+        next_offset = offset + len(forum_ids)
+        return {
+            'forums': [forum.to_dict() for forum in forums],
+            'meta': {
+                'per_page': per_page,
+                'next_cursor': encode_cursor({'offset': next_offset}, SEARCH_CURSOR_NAME) if next_offset < total else None
+            }
+        }
 
     def update_forum(
         self, 
@@ -265,6 +328,8 @@ class ForumDatabaseService:
             
             # Retrieve and return updated forum
             updated_forum = self.get_forum_by_id(forum_id)
+            if updated_forum:
+                index_document('forums', updated_forum.to_dict())
             return updated_forum
         
         except ClientError as e:
@@ -289,7 +354,41 @@ class ForumDatabaseService:
             
             # Perform delete
             self.table.delete_item(Key={'forum_id': forum_id})
+            remove_document('forums', forum_id)
+            remove_item(forum_id)
         
         except ClientError as e:
             raise ValueError(f"Error deleting forum: {e}")
-        
\ No newline at end of file
+
+    def react_to_forum(
+        self, 
+        forum_id: str, 
+        user_id: str, 
+        reaction_type: str
+    ) -> Dict[str, int]:
+        """
+        Add a reaction to a forum
+        
+        Args:
+            forum_id (str): Forum's unique identifier
+            user_id (str): User adding the reaction
+            reaction_type (str): Type of reaction ('like' or 'dislike')
+        
+        Returns:
+            Dict: Updated reaction counts
+        
+        Raises:
+            ValueError: If reaction is invalid or forum not found
+        """
+        forum = self.get_forum_by_id(forum_id)
+        
+        if not forum:
+            raise ValueError("Forum bulunamadı")
+        
+        counts, previous = ReactionDatabaseService.get_instance().record_reaction(
+            forum_id, user_id, reaction_type
+        )
+        # Only a first reaction is new activity for the hot feed
+        if previous is None:
+            record_activity(forum_id, reaction_type)
+        return counts
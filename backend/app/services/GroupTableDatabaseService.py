@@ -1,48 +1,148 @@
 import os
+import re
+import unicodedata
 import uuid
-import boto3
+from boto3.dynamodb.conditions import Key, Attr
 from typing import List, Optional, Dict
 from datetime import datetime
 from botocore.exceptions import ClientError
 
 from app.models.GroupModel import GroupModel, GroupMember
+from app.search import index_document, search as search_index
+from app.services.schema import (
+    MEMBERSHIPS_STATUS_ROLE_INDEX_NAME as MEMBER_STATUS_ROLE_INDEX_NAME,
+    MEMBERSHIPS_USER_INDEX_NAME as USER_GROUPS_INDEX_NAME
+)
+from app.utils.dynamodb import transact_write, cancellation_reasons, batch_get_items
+from app.utils.pagination import encode_cursor, decode_cursor, read_page
+from app.storage import get_dynamodb
 
 DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
-DEFAULT_GROUPS_TABLE_NAME = os.getenv('GROUPS_TABLE_NAME')
+DEFAULT_GROUPS_TABLE_NAME = os.getenv('GROUPS_TABLE_NAME', 'Groups')
+DEFAULT_GROUP_MEMBERSHIPS_TABLE_NAME = os.getenv('GROUP_MEMBERSHIPS_TABLE_NAME', 'GroupMemberships')
+DEFAULT_GROUP_NAMES_TABLE_NAME = os.getenv('GROUP_NAMES_TABLE_NAME', 'GroupNames')
+MEMBER_ROLES = ('uye', 'moderator', 'yonetici')
+
+# Turkish I/İ/ı/i are all folded to 'i' so that 'Istanbul', 'İSTANBUL' and
+# 'ıstanbul' reserve the same name
+_TURKISH_I = str.maketrans({'I': 'i', 'İ': 'i', 'ı': 'i'})
+_WHITESPACE = re.compile(r'\s+')
+
+def group_name_key(grup_adi: str) -> str:
+    """
+    Normalize a group name to the key that reserves it
+
+    Args:
+        grup_adi (str): Group name
+
+    Returns:
+        str: Unicode-normalized, case- and Turkish i-folded name with
+             single spaces
+    """
+    # NFC first, so a decomposed 'I' + U+0307 is folded as 'İ'
+    name = unicodedata.normalize('NFC', grup_adi or '').translate(_TURKISH_I)
+    return _WHITESPACE.sub(' ', name.casefold()).strip()
 
 class GroupDatabaseService:
     def __init__(
-        self, 
-        region_name: str = DEFAULT_REGION, 
-        table_name: str = DEFAULT_GROUPS_TABLE_NAME
+        self,
+        region_name: str = DEFAULT_REGION,
+        table_name: str = DEFAULT_GROUPS_TABLE_NAME,
+        memberships_table_name: str = DEFAULT_GROUP_MEMBERSHIPS_TABLE_NAME,
+        names_table_name: str = DEFAULT_GROUP_NAMES_TABLE_NAME
     ):
         """
         Initialize DynamoDB Group Service
         
+        Members are stored one item per (group_id, user_id) in the
+        memberships table instead of a list inside the group item, so
+        membership checks and changes touch a single item and the group
+        item does not grow with its member count. `uye_sayisi` on the group
+        is kept in step inside the same transaction.
+        
+        Group names are unique: each group reserves group_name_key(grup_adi)
+        in the names table with a conditional put written in the same
+        transaction as the group item.
+        
         Args:
             region_name (str): AWS region
             table_name (str): DynamoDB table name
+            memberships_table_name (str): DynamoDB table holding one item per member
+            names_table_name (str): DynamoDB table reserving group names
         """
-        # AWS Credentials
-        self.access_key = os.getenv('AWS_ACCESS_KEY_ID', '').strip()
-        self.secret_key = os.getenv('AWS_SECRET_ACCESS_KEY', '').strip()
-        
-        if not self.access_key or not self.secret_key:
-            raise ValueError("AWS credentials must be provided")
-        
-        # Setup AWS Resources
-        self.session = boto3.Session(
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            region_name=region_name
-        )
-        self.dynamodb = self.session.resource('dynamodb')
+        # DynamoDB or the local SQLite engine, per STORAGE_BACKEND
+        self.dynamodb = get_dynamodb(region_name)
+        self.client = self.dynamodb.meta.client
         self.table = self.dynamodb.Table(table_name)
+        self.memberships_table = self.dynamodb.Table(memberships_table_name)
+        self.names_table = self.dynamodb.Table(names_table_name)
+
+    @staticmethod
+    def _membership_item(
+        group_id: str,
+        user_id: str,
+        rol: str,
+        durum: str,
+        katilma_tarihi: Optional[str] = None
+    ) -> Dict[str, any]:
+        """
+        Build a membership item
+        
+        `durum_rol` ('aktif#yonetici') is the sort key of the
+        group_id-durum_rol-index GSI, so members can be listed by status or
+        by status and role without a filter.
+        """
+        return {
+            'group_id': group_id,
+            'user_id': user_id,
+            'rol': rol,
+            'durum': durum,
+            'durum_rol': f"{durum}#{rol}",
+            'katilma_tarihi': katilma_tarihi or datetime.now().isoformat()
+        }
+
+    @staticmethod
+    def _member(item: Dict[str, any]) -> GroupMember:
+        """Convert a membership item to a GroupMember"""
+        return GroupMember(
+            kullanici_id=item['user_id'],
+            rol=item.get('rol', 'uye'),
+            katilma_tarihi=item.get('katilma_tarihi'),
+            durum=item.get('durum', 'aktif'),
+            group_id=item['group_id']
+        )
+
+    def _reserve_name(self, grup_adi: str, group_id: str) -> Dict[str, any]:
+        """Transaction action reserving a group name for a group"""
+        return {'Put': {
+            'TableName': self.names_table.name,
+            'Item': {'name_key': group_name_key(grup_adi), 'group_id': group_id},
+            'ConditionExpression': 'attribute_not_exists(name_key)'
+        }}
+
+    def _release_name(self, grup_adi: str, group_id: str) -> Dict[str, any]:
+        """Transaction action releasing a group name owned by a group"""
+        return {'Delete': {
+            'TableName': self.names_table.name,
+            'Key': {'name_key': group_name_key(grup_adi)},
+            'ConditionExpression': 'attribute_not_exists(name_key) OR group_id = :group_id',
+            'ExpressionAttributeValues': {':group_id': group_id}
+        }}
+
+    def _member_count_update(self, group_id: str, increment: int) -> Dict[str, any]:
+        """Transaction action that changes the group's active member count"""
+        return {'Update': {
+            'TableName': self.table.name,
+            'Key': {'group_id': group_id},
+            'UpdateExpression': 'SET uye_sayisi = uye_sayisi + :increment',
+            'ConditionExpression': 'attribute_exists(group_id)',
+            'ExpressionAttributeValues': {':increment': increment}
+        }}
 
     def create_group(
-        self, 
-        user_id: str, 
-        grup_adi: str, 
+        self,
+        user_id: str,
+        grup_adi: str,
         description: Optional[str] = None,
         logo_url: Optional[str] = None,
         kapak_resmi_url: Optional[str] = None,
@@ -52,6 +152,10 @@ class GroupDatabaseService:
         """
         Create a new group in the database
         
+        The group, its name reservation and its creator's admin membership
+        are written in one transaction; of two concurrent creates with the
+        same name exactly one succeeds.
+        
         Args:
             user_id (str): ID of the user creating the group
             grup_adi (str): Group name
@@ -65,10 +169,11 @@ class GroupDatabaseService:
             GroupModel: Created group object
         
         Raises:
-            ValueError: If group creation fails
+            ValueError: If the name is taken or group creation fails
         """
         # Generate unique group ID
         group_id = f"grp_{str(uuid.uuid4())}"
+        created_at = datetime.now().isoformat()
         
         # Prepare group data
         group_data = {
@@ -76,27 +181,36 @@ class GroupDatabaseService:
             'grup_adi': grup_adi,
             'description': description or '',
             'olusturan_id': user_id,
-            'olusturulma_tarihi': datetime.now().isoformat(),
+            'olusturulma_tarihi': created_at,
             'logo_url': logo_url,
             'kapak_resmi_url': kapak_resmi_url,
             'gizlilik': gizlilik,
             'kategoriler': kategoriler or [],
             'is_active': True,
-            'uyeler': [{
-                'kullanici_id': user_id,
-                'rol': 'yonetici',
-                'katilma_tarihi': datetime.now().isoformat(),
-                'durum': 'aktif'
-            }],
             'uye_sayisi': 1
         }
         
         # Save to DynamoDB
         try:
-            self.table.put_item(Item=group_data)
+            transact_write(self.client, [
+                {'Put': {
+                    'TableName': self.table.name,
+                    'Item': group_data,
+                    'ConditionExpression': 'attribute_not_exists(group_id)'
+                }},
+                self._reserve_name(grup_adi, group_id),
+                {'Put': {
+                    'TableName': self.memberships_table.name,
+                    'Item': self._membership_item(group_id, user_id, 'yonetici', 'aktif', created_at)
+                }}
+            ])
         except ClientError as e:
+            reasons = cancellation_reasons(e) or []
+            if len(reasons) > 1 and reasons[1] == 'ConditionalCheckFailed':
+                raise ValueError("Bu grup adı zaten kullanılıyor")
             raise ValueError(f"Error creating group: {e}")
         
+        index_document('groups', group_data)
         return GroupModel(**group_data)
 
     def get_group_by_id(self, group_id: str) -> Optional[GroupModel]:
@@ -120,9 +234,37 @@ class GroupDatabaseService:
         except ClientError:
             return None
 
+    def get_membership(self, group_id: str, user_id: str) -> Optional[GroupMember]:
+        """
+        Get a user's membership in a group
+        
+        Args:
+            group_id (str): Group's unique identifier
+            user_id (str): User ID
+        
+        Returns:
+            Optional[GroupMember]: Membership if the user joined or applied, else None
+        """
+        try:
+            response = self.memberships_table.get_item(
+                Key={'group_id': group_id, 'user_id': user_id},
+                ConsistentRead=True
+            )
+            item = response.get('Item')
+            return self._member(item) if item else None
+        except ClientError:
+            return None
+
+    def _has_role(self, group: GroupModel, user_id: str, roles: tuple) -> bool:
+        """Whether the user created the group or is an active member with one of the roles"""
+        if group.olusturan_id == user_id:
+            return True
+        member = self.get_membership(group.group_id, user_id)
+        return member is not None and member.durum == 'aktif' and member.rol in roles
+
     def get_groups(
-        self, 
-        page: int = 1, 
+        self,
+        page: int = 1,
         per_page: int = 10,
         search: Optional[str] = None,
         kategoriler: Optional[List[str]] = None
@@ -130,6 +272,9 @@ class GroupDatabaseService:
         """
         Retrieve groups with optional filtering and pagination
         
+        A search term is answered by the in-process search index, most
+        relevant first (see app.search).
+        
         Args:
             page (int): Page number
             per_page (int): Groups per page
@@ -139,6 +284,9 @@ class GroupDatabaseService:
         Returns:
             Dict containing groups and metadata
         """
+        if search:
+            return self._search_groups(search, page, per_page, kategoriler)
+        
         try:
             # Base scan parameters
             scan_params = {
@@ -146,11 +294,6 @@ class GroupDatabaseService:
                 'ExpressionAttributeValues': {':active': True}
             }
             
-            # Add search filter if provided
-            if search:
-                scan_params['FilterExpression'] += ' AND contains(grup_adi, :search)'
-                scan_params['ExpressionAttributeValues'][':search'] = search
-            
             # Add category filter if provided
             if kategoriler:
                 # Create an OR condition for multiple categories
@@ -198,15 +341,59 @@ class GroupDatabaseService:
                 }
             }
 
+    def _search_groups(
+        self,
+        search: str,
+        page: int,
+        per_page: int,
+        kategoriler: Optional[List[str]]
+    ) -> Dict[str, any]:
+        """
+        Retrieve a page of groups matching a search term
+        
+        Groups in any of the given categories match, as in the scan path.
+        """
+        group_ids, total = search_index(
+            'groups', search,
+            filters={'kategoriler': list(kategoriler) if kategoriler else None},
+            limit=per_page,
+            offset=(page - 1) * per_page
+        )
+        
+        try:
+            items = batch_get_items(
+                self.dynamodb, self.table.name,
+                [{'group_id': group_id} for group_id in group_ids]
+            )
+        except ClientError:
+            items = []
+        
+        # BatchGetItem does not keep the order; restore the ranking
+        by_id = {item['group_id']: item for item in items if item.get('is_active', True)}
+        groups = [GroupModel(**by_id[group_id]) for group_id in group_ids if group_id in by_id]
+        
+        return {
+            'groups': [group.to_dict() for group in groups],
+            'meta': {
+                'total': total,
+                'page': page,
+                'per_page': per_page,
+                'total_pages': (total + per_page - 1) // per_page
+            }
+        }
+
     def update_group(
-        self, 
-        group_id: str, 
-        user_id: str, 
+        self,
+        group_id: str,
+        user_id: str,
         update_data: Dict[str, any]
     ) -> Optional[GroupModel]:
         """
         Update an existing group
         
+        A rename moves the name reservation in the same transaction as the
+        update, and only if the group still has the name that was read.
+        
         Args:
             group_id (str): Group's unique identifier
             user_id (str): User attempting to update the group
@@ -216,7 +403,7 @@ class GroupDatabaseService:
             Optional[GroupModel]: Updated group object
         
         Raises:
-            ValueError: If update fails or user is not authorized
+            ValueError: If update fails, the new name is taken or user is not authorized
         """
         try:
             # Retrieve existing group
@@ -227,13 +414,7 @@ class GroupDatabaseService:
             
             # Check authorization
             # Group creator or group admins can update
-            is_authorized = (
-                group.olusturan_id == user_id or 
-                any(uye.kullanici_id == user_id and uye.rol == 'yonetici' and uye.durum == 'aktif' 
-                    for uye in group.uyeler)
-            )
-            
-            if not is_authorized:
+            if not self._has_role(group, user_id, ('yonetici',)):
                 raise ValueError("Not authorized to update this group")
             
             # Prepare update expression and values
@@ -242,7 +423,7 @@ class GroupDatabaseService:
             
             # Updatable fields
             updatable_fields = [
-                'grup_adi', 'description', 'logo_url', 
+                'grup_adi', 'description', 'logo_url',
                 'kapak_resmi_url', 'gizlilik', 'kategoriler'
             ]
             for field in updatable_fields:
@@ -256,28 +437,62 @@ class GroupDatabaseService:
             # Construct full update expression
             full_update_expr = "SET " + ", ".join(update_expr)
             
-            # Perform update
-            self.table.update_item(
-                Key={'group_id': group_id},
-                UpdateExpression=full_update_expr,
-                ExpressionAttributeValues=expr_attr_values
-            )
+            new_name = update_data.get('grup_adi')
+            if new_name is not None and group_name_key(new_name) != group_name_key(group.grup_adi):
+                expr_attr_values[':old_grup_adi'] = group.grup_adi
+                transact_write(self.client, [
+                    {'Update': {
+                        'TableName': self.table.name,
+                        'Key': {'group_id': group_id},
+                        'UpdateExpression': full_update_expr,
+                        'ConditionExpression': 'grup_adi = :old_grup_adi',
+                        'ExpressionAttributeValues': expr_attr_values
+                    }},
+                    self._reserve_name(new_name, group_id),
+                    self._release_name(group.grup_adi, group_id)
+                ])
+            else:
+                # Perform update
+                self.table.update_item(
+                    Key={'group_id': group_id},
+                    UpdateExpression=full_update_expr,
+                    ExpressionAttributeValues=expr_attr_values
+                )
             
             # Retrieve and return updated group
             updated_group = self.get_group_by_id(group_id)
+            if updated_group:
+                index_document('groups', updated_group.to_dict())
             return updated_group
         
         except ClientError as e:
+            reasons = cancellation_reasons(e) or []
+            if len(reasons) > 1 and reasons[1] == 'ConditionalCheckFailed':
+                raise ValueError("Bu grup adı zaten kullanılıyor")
+            if reasons and reasons[0] == 'ConditionalCheckFailed':
+                raise ValueError("Grup adı aynı anda değiştirildi, lütfen tekrar deneyin")
             raise ValueError(f"Error updating group: {e}")
 
+    @staticmethod
+    def _existing_membership_error(member: GroupMember) -> ValueError:
+        """Error for a user who already has a membership record"""
+        if member.durum == 'beklemede':
+            return ValueError("Üyelik başvurunuz onay bekliyor")
+        if member.durum == 'engellendi':
+            return ValueError("Bu gruba katılmanız engellendi")
+        return ValueError("Zaten bu grubun üyesisiniz")
+
     def join_group(
-        self, 
-        group_id: str, 
+        self,
+        group_id: str,
         user_id: str
     ) -> Dict[str, any]:
         """
         Add a user to a group
         
+        The membership is written only if the user has none, together with
+        the member count of an open group, in one transaction.
+        
         Args:
             group_id (str): Group's unique identifier
             user_id (str): User attempting to join the group
@@ -288,60 +503,43 @@ class GroupDatabaseService:
         Raises:
             ValueError: If joining fails
         """
-        try:
-            # Retrieve existing group
-            group = self.get_group_by_id(group_id)
-            
-            if not group:
-                raise ValueError("Group not found")
-            
-            # Check if user is already a member
-            for uye in group.uyeler:
-                if uye.kullanici_id == user_id:
-                    if uye.durum == 'aktif':
-                        raise ValueError("Zaten bu grubun üyesisiniz")
-                    elif uye.durum == 'beklemede':
-                        raise ValueError("Üyelik başvurunuz onay bekliyor")
-                    elif uye.durum == 'engellendi':
-                        raise ValueError("Bu gruba katılmanız engellendi")
-            
-            # Determine membership status based on group privacy
-            durum = 'aktif' if group.gizlilik == 'acik' else 'beklemede'
-            
-            # Prepare member update
-            update_params = {
-                'Key': {'group_id': group_id},
-                'UpdateExpression': 'SET uyeler = list_append(uyeler, :new_member)',
-                'ExpressionAttributeValues': {
-                    ':new_member': [{
-                        'kullanici_id': user_id,
-                        'rol': 'uye',
-                        'katilma_tarihi': datetime.now().isoformat(),
-                        'durum': durum
-                    }]
-                }
-            }
-            
-            # If group is open, increment member count
-            if durum == 'aktif':
-                update_params['UpdateExpression'] += ', uye_sayisi = uye_sayisi + :increment'
-                update_params['ExpressionAttributeValues'][':increment'] = 1
-            
-            # Perform update
-            self.table.update_item(**update_params)
-            
-            return {
-                'status': 'success',
-                'message': 'Gruba başarıyla katıldınız' if durum == 'aktif' else 'Üyelik başvurunuz onay bekliyor',
-                'membership_status': durum
-            }
+        # Retrieve existing group
+        group = self.get_group_by_id(group_id)
+        
+        if not group or not group.is_active:
+            raise ValueError("Group not found")
         
+        # Determine membership status based on group privacy
+        durum = 'aktif' if group.gizlilik == 'acik' else 'beklemede'
+        
+        try:
+            transact_write(self.client, [
+                {'Put': {
+                    'TableName': self.memberships_table.name,
+                    'Item': self._membership_item(group_id, user_id, 'uye', durum),
+                    'ConditionExpression': 'attribute_not_exists(user_id)'
+                }},
+                self._member_count_update(group_id, 1 if durum == 'aktif' else 0)
+            ])
         except ClientError as e:
+            reasons = cancellation_reasons(e)
+            if reasons and reasons[0] == 'ConditionalCheckFailed':
+                member = self.get_membership(group_id, user_id)
+                if member:
+                    raise self._existing_membership_error(member)
+            if reasons and len(reasons) > 1 and reasons[1] == 'ConditionalCheckFailed':
+                raise ValueError("Group not found")
             raise ValueError(f"Error joining group: {e}")
+        
+        return {
+            'status': 'success',
+            'message': 'Gruba başarıyla katıldınız' if durum == 'aktif' else 'Üyelik başvurunuz onay bekliyor',
+            'membership_status': durum
+        }
 
     def leave_group(
-        self, 
-        group_id: str, 
+        self,
+        group_id: str,
         user_id: str
     ) -> bool:
         """
@@ -357,53 +555,45 @@ class GroupDatabaseService:
         Raises:
             ValueError: If leaving fails
         """
-        try:
-            # Retrieve existing group
-            group = self.get_group_by_id(group_id)
-            
-            if not group:
-                raise ValueError("Group not found")
-            
-            # Prevent group creator from leaving
-            if group.olusturan_id == user_id:
-                raise ValueError("Grup kurucusu gruptan ayrılamaz")
-            
-            # Find the member
-            member_index = None
-            for i, uye in enumerate(group.uyeler):
-                if uye.kullanici_id == user_id:
-                    member_index = i
-                    break
-            
-            if member_index is None:
-                raise ValueError("Bu grubun üyesi değilsiniz")
-            
-            # Prepare update to remove member
-            update_params = {
-                'Key': {'group_id': group_id},
-                'UpdateExpression': 'REMOVE uyeler[{}]'.format(member_index)
-            }
-            
-            # If member was active, decrement member count
-            if group.uyeler[member_index].durum == 'aktif':
-                update_params['UpdateExpression'] += ' SET uye_sayisi = uye_sayisi - :decrement'
-                update_params['ExpressionAttributeValues'] = {
-                    ':decrement': 1
-                }
-            
-            # Perform update
-            self.table.update_item(**update_params)
-            
-            return True
+        # Retrieve existing group
+        group = self.get_group_by_id(group_id)
         
+        if not group:
+            raise ValueError("Group not found")
+        
+        # Prevent group creator from leaving
+        if group.olusturan_id == user_id:
+            raise ValueError("Grup kurucusu gruptan ayrılamaz")
+        
+        member = self.get_membership(group_id, user_id)
+        if member is None:
+            raise ValueError("Bu grubun üyesi değilsiniz")
+        
+        # The status must still be the one read, so the count matches
+        actions = [{'Delete': {
+            'TableName': self.memberships_table.name,
+            'Key': {'group_id': group_id, 'user_id': user_id},
+            'ConditionExpression': 'durum = :durum',
+            'ExpressionAttributeValues': {':durum': member.durum}
+        }}]
+        if member.durum == 'aktif':
+            actions.append(self._member_count_update(group_id, -1))
+        
+        try:
+            transact_write(self.client, actions)
         except ClientError as e:
+            reasons = cancellation_reasons(e)
+            if reasons and reasons[0] == 'ConditionalCheckFailed':
+                raise ValueError("Üyelik durumunuz değişti, lütfen tekrar deneyin")
             raise ValueError(f"Error leaving group: {e}")
+        
+        return True
 
     def approve_membership(
-        self, 
-        group_id: str, 
-        admin_id: str, 
-        user_id: str, 
+        self,
+        group_id: str,
+        admin_id: str,
+        user_id: str,
         approve: bool = True
     ) -> Dict[str, any]:
         """
@@ -421,60 +611,200 @@ class GroupDatabaseService:
         Raises:
             ValueError: If membership processing fails
         """
+        # Retrieve existing group
+        group = self.get_group_by_id(group_id)
+        
+        if not group:
+            raise ValueError("Group not found")
+        
+        # Check admin authorization
+        if not self._has_role(group, admin_id, ('yonetici', 'moderator')):
+            raise ValueError("Üyelik başvurularını yönetme yetkiniz yok")
+        
+        pending = {':beklemede': 'beklemede'}
+        if approve:
+            # Approve membership
+            actions = [
+                {'Update': {
+                    'TableName': self.memberships_table.name,
+                    'Key': {'group_id': group_id, 'user_id': user_id},
+                    'UpdateExpression': 'SET durum = :aktif, durum_rol = :durum_rol',
+                    'ConditionExpression': 'durum = :beklemede',
+                    # The role of a pending member is always 'uye'
+                    'ExpressionAttributeValues': dict(pending, **{
+                        ':aktif': 'aktif',
+                        ':durum_rol': 'aktif#uye'
+                    })
+                }},
+                self._member_count_update(group_id, 1)
+            ]
+            success_message = "Üyelik başvurusu onaylandı"
+        else:
+            # Reject membership (remove member)
+            actions = [{'Delete': {
+                'TableName': self.memberships_table.name,
+                'Key': {'group_id': group_id, 'user_id': user_id},
+                'ConditionExpression': 'durum = :beklemede',
+                'ExpressionAttributeValues': pending
+            }}]
+            success_message = "Üyelik başvurusu reddedildi"
+        
         try:
-            # Retrieve existing group
-            group = self.get_group_by_id(group_id)
-            
-            if not group:
-                raise ValueError("Group not found")
-            
-            # Check admin authorization
-            is_authorized = (
-                group.olusturan_id == admin_id or 
-                any(uye.kullanici_id == admin_id and uye.rol in ['yonetici', 'moderator'] and uye.durum == 'aktif' 
-                    for uye in group.uyeler)
-            )
-            
-            if not is_authorized:
-                raise ValueError("Üyelik başvurularını yönetme yetkiniz yok")
-            
-            # Find the member with pending status
-            member_index = None
-            for i, uye in enumerate(group.uyeler):
-                if uye.kullanici_id == user_id and uye.durum == 'beklemede':
-                    member_index = i
-                    break
-            
-            if member_index is None:
+            transact_write(self.client, actions)
+        except ClientError as e:
+            reasons = cancellation_reasons(e)
+            if reasons and reasons[0] == 'ConditionalCheckFailed':
                 raise ValueError("Bu kullanıcının onay bekleyen bir başvurusu yok")
-            
-            # Prepare update to process membership
-            if approve:
-                # Approve membership
-                update_params = {
-                    'Key': {'group_id': group_id},
-                    'UpdateExpression': 'SET uyeler[{}].durum = :aktif, uye_sayisi = uye_sayisi + :increment'.format(member_index),
-                    'ExpressionAttributeValues': {
-                        ':aktif': 'aktif',
-                        ':increment': 1
-                    }
+            raise ValueError(f"Error processing membership: {e}")
+        
+        return {
+            'status': 'success',
+            'message': success_message
+        }
+
+    def update_member_role(
+        self,
+        group_id: str,
+        admin_id: str,
+        user_id: str,
+        rol: str
+    ) -> Dict[str, any]:
+        """
+        Change an active member's role
+        
+        Args:
+            group_id (str): Group's unique identifier
+            admin_id (str): Admin changing the role
+            user_id (str): Member whose role is changed
+            rol (str): New role ('uye', 'moderator', 'yonetici')
+        
+        Returns:
+            Dict: Member ID and new role
+        
+        Raises:
+            ValueError: If the role is invalid, the admin is not authorized
+                        or the user is not an active member
+        """
+        if rol not in MEMBER_ROLES:
+            raise ValueError("Geçersiz rol")
+        
+        group = self.get_group_by_id(group_id)
+        
+        if not group:
+            raise ValueError("Group not found")
+        
+        if not self._has_role(group, admin_id, ('yonetici',)):
+            raise ValueError("Üyelerin rollerini değiştirme yetkiniz yok")
+        
+        if user_id == group.olusturan_id:
+            raise ValueError("Grup kurucusunun rolü değiştirilemez")
+        
+        try:
+            self.memberships_table.update_item(
+                Key={'group_id': group_id, 'user_id': user_id},
+                UpdateExpression='SET rol = :rol, durum_rol = :durum_rol',
+                ConditionExpression='durum = :aktif',
+                ExpressionAttributeValues={
+                    ':rol': rol,
+                    ':durum_rol': f"aktif#{rol}",
+                    ':aktif': 'aktif'
                 }
-                success_message = "Üyelik başvurusu onaylandı"
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise ValueError("Sadece aktif üyelerin rolleri değiştirilebilir")
+            raise ValueError(f"Error updating member role: {e}")
+        
+        return {
+            'user_id': user_id,
+            'role': rol
+        }
+
+    def get_group_members(
+        self,
+        group_id: str,
+        per_page: int = 20,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        role: Optional[str] = None
+    ) -> Dict[str, any]:
+        """
+        Retrieve a page of a group's members
+        
+        With a status filter the page comes from the group_id-durum_rol-index
+        GSI (status, or status and role, as a key condition); otherwise from
+        the memberships table itself. Only a role filter is applied as a
+        FilterExpression.
+        
+        Args:
+            group_id (str): Group's unique identifier
+            per_page (int): Members per page
+            cursor (str, optional): Continuation cursor from a previous page
+            status (str, optional): Membership status filter
+            role (str, optional): Role filter
+        
+        Returns:
+            Dict containing members and metadata
+        
+        Raises:
+            ValidationError: If the cursor is invalid
+        """
+        if status:
+            index_name = MEMBER_STATUS_ROLE_INDEX_NAME
+            key_condition = Key('group_id').eq(group_id)
+            if role:
+                key_condition = key_condition & Key('durum_rol').eq(f"{status}#{role}")
             else:
-                # Reject membership (remove member)
-                update_params = {
-                    'Key': {'group_id': group_id},
-                    'UpdateExpression': 'REMOVE uyeler[{}]'.format(member_index)
-                }
-                success_message = "Üyelik başvurusu reddedildi"
-            
-            # Perform update
-            self.table.update_item(**update_params)
-            
-            return {
-                'status': 'success',
-                'message': success_message
+                key_condition = key_condition & Key('durum_rol').begins_with(f"{status}#")
+            params = {'IndexName': index_name, 'KeyConditionExpression': key_condition}
+            key_attributes = ('group_id', 'user_id', 'durum_rol')
+        else:
+            index_name = None
+            params = {'KeyConditionExpression': Key('group_id').eq(group_id)}
+            if role:
+                params['FilterExpression'] = Attr('rol').eq(role)
+            key_attributes = ('group_id', 'user_id')
+        
+        exclusive_start_key = decode_cursor(cursor, index_name)
+        
+        try:
+            items, last_key = read_page(
+                self.memberships_table.query, params, per_page, exclusive_start_key, key_attributes
+            )
+        except ClientError:
+            items, last_key = [], None
+        
+        return {
+            'members': [self._member(item).to_dict() for item in items],
+            'meta': {
+                'per_page': per_page,
+                'next_cursor': encode_cursor(last_key, index_name)
             }
+        }
+
+    def get_user_groups(self, user_id: str) -> List[Dict[str, any]]:
+        """
+        Retrieve the groups a user joined or applied to
         
-        except ClientError as e:
-            raise ValueError(f"Error processing membership: {e}")
\ No newline at end of file
+        Args:
+            user_id (str): User ID
+        
+        Returns:
+            List[Dict]: Memberships of the user, each with its group_id
+        """
+        members = []
+        params = {
+            'IndexName': USER_GROUPS_INDEX_NAME,
+            'KeyConditionExpression': Key('user_id').eq(user_id)
+        }
+        try:
+            while True:
+                response = self.memberships_table.query(**params)
+                members.extend(self._member(item).to_dict() for item in response.get('Items', []))
+                if 'LastEvaluatedKey' not in response:
+                    break
+                params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        except ClientError:
+            return []
+        
+        return members
@@ -2,176 +2,202 @@
 Media Database Service
 -------------------
 DynamoDB service for media file data.
+
+Doğrudan S3 yüklemelerinde kayıt iki adımda oluşur: imzalı yükleme formu
+verilirken 'beklemede' durumunda bir kayıt yazılır, istemci yüklemeyi
+bitirdiğini bildirince nesne doğrulanıp kayıt 'hazir' durumuna geçer.
 """
 
-import boto3
-from boto3.dynamodb.conditions import Attr, Key
-import logging
 import os
-from werkzeug.utils import secure_filename
 from datetime import datetime
+from typing import Optional
+
 from botocore.exceptions import ClientError
-from app.utils.exceptions import NotFoundError, ValidationError, ForbiddenError
+
 from app.models.MediaModel import MediaModel
+from app.storage import get_dynamodb
+
+DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
+DEFAULT_MEDIA_TABLE_NAME = os.getenv('MEDIA_TABLE_NAME', 'Media')
+
+# Media kayıt durumları
+MEDIA_PENDING = 'beklemede'
+MEDIA_READY = 'hazir'
 
 
 class MediaDatabaseService:
     """Database service for media operations"""
-    
-    def __init__(self, region_name=None, table_name="Media"):
-        pass
-    
-    def create_tables(self):
-        """Create Media table if it doesn't exist"""
+
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        if MediaDatabaseService.__instance is None:
+            MediaDatabaseService()
+        return MediaDatabaseService.__instance
+
+    def __init__(
+        self,
+        region_name: str = DEFAULT_REGION,
+        table_name: str = DEFAULT_MEDIA_TABLE_NAME
+    ):
+        """
+        Initialize DynamoDB Media Service
+
+        Args:
+            region_name (str): AWS region
+            table_name (str): DynamoDB table name
+        """
+        if MediaDatabaseService.__instance is not None:
+            raise Exception("This class is a singleton!")
+        MediaDatabaseService.__instance = self
+        # DynamoDB or the local SQLite engine, per STORAGE_BACKEND
+        self.dynamodb = get_dynamodb(region_name)
+        self.table = self.dynamodb.Table(table_name)
+
+    def create_pending_media(
+        self,
+        media_id: str,
+        user_id: str,
+        s3_key: str,
+        mime_type: str,
+        max_size: int,
+        orijinal_dosya_adi: str = '',
+        ilgili_model: Optional[str] = None,
+        ilgili_id: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> MediaModel:
+        """
+        Create a media record waiting for its direct S3 upload
+
+        Args:
+            media_id (str): Media identifier
+            user_id (str): Uploader ID
+            s3_key (str): Object key the upload form is signed for
+            mime_type (str): Content type the upload form enforces
+            max_size (int): Size limit the upload form enforces (bytes)
+            orijinal_dosya_adi (str, optional): Client-side file name
+            ilgili_model (str, optional): Related model type
+            ilgili_id (str, optional): Related model ID
+            description (str, optional): File description
+
+        Returns:
+            MediaModel: Created media record
+
+        Raises:
+            ValueError: If the record cannot be written
+        """
+        media = MediaModel(
+            media_id=media_id,
+            dosya_adi=s3_key.rsplit('/', 1)[-1],
+            orijinal_dosya_adi=orijinal_dosya_adi,
+            mime_type=mime_type,
+            boyut=0,
+            depolama_yolu=s3_key,
+            depolama_tipi='s3',
+            yukleyen_id=user_id,
+            ilgili_model=ilgili_model,
+            ilgili_id=ilgili_id,
+            description=description,
+            meta_data={'max_boyut': max_size},
+            durum=MEDIA_PENDING
+        )
+        item = {key: value for key, value in vars(media).items() if value is not None}
+
         try:
-            # Check if table exists
-            self.dynamodb_client.describe_table(TableName=self.table_name)
-            self.logger.info(f"Table {self.table_name} already exists")
-        except self.dynamodb_client.exceptions.ResourceNotFoundException:
-            # Create table
-            self.logger.info(f"Creating table {self.table_name}")
-            self.dynamodb_client.create_table(
-                TableName=self.table_name,
-                KeySchema=[
-                    {'AttributeName': 'media_id', 'KeyType': 'HASH'}
-                ],
-                AttributeDefinitions=[
-                    {'AttributeName': 'media_id', 'AttributeType': 'S'}
-                ],
-                ProvisionedThroughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            self.table.put_item(
+                Item=item,
+                ConditionExpression='attribute_not_exists(media_id)'
             )
-            
-            # Wait for table to be created
-            waiter = self.dynamodb_client.get_waiter('table_exists')
-            waiter.wait(TableName=self.table_name)
-    
-    def allowed_file(self, filename):
-        """Check if file has an allowed extension"""
-        from flask import current_app
-        
-        if '.' not in filename:
-            return False
-        
-        ext = filename.rsplit('.', 1)[1].lower()
-        return ext in current_app.config['ALLOWED_EXTENSIONS']
-    
-    def upload_file(self, file, user_id, metadata=None):
-        """Upload a file and save its metadata"""
-        from flask import current_app
-        
+        except ClientError as e:
+            raise ValueError(f"Error creating media record: {e}")
+
+        return media
+
+    def get_media(self, media_id: str) -> Optional[MediaModel]:
+        """
+        Get media record by its ID
+
+        Args:
+            media_id (str): Media identifier
+
+        Returns:
+            Optional[MediaModel]: Media record if found, else None
+        """
+        try:
+            response = self.table.get_item(Key={'media_id': media_id})
+        except ClientError as e:
+            raise ValueError(f"Error retrieving media: {e}")
+
+        item = response.get('Item')
+        return MediaModel(**item) if item else None
+
+    def mark_media_ready(self, media_id: str, user_id: str, boyut: int, dosya_url: str = '') -> bool:
+        """
+        Record a finished upload
+
+        Only a pending record owned by user_id is updated, so concurrent or
+        repeated completion calls write once.
+
+        Args:
+            media_id (str): Media identifier
+            user_id (str): Uploader ID
+            boyut (int): Uploaded object size (bytes)
+            dosya_url (str, optional): Public URL of the object
+
+        Returns:
+            bool: True if this call completed the record, False if it was not pending
+        """
+        now = datetime.now().isoformat()
+        try:
+            self.table.update_item(
+                Key={'media_id': media_id},
+                UpdateExpression='SET durum = :ready, boyut = :boyut, dosya_url = :url, '
+                                 'yuklenme_tarihi = :now, updated_at = :now',
+                ConditionExpression='durum = :pending AND yukleyen_id = :user_id',
+                ExpressionAttributeValues={
+                    ':ready': MEDIA_READY,
+                    ':pending': MEDIA_PENDING,
+                    ':user_id': user_id,
+                    ':boyut': boyut,
+                    ':url': dosya_url,
+                    ':now': now
+                }
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise ValueError(f"Error completing media: {e}")
+        return True
+
+    def set_media_variants(self, media_id: str, varyantlar: dict):
+        """
+        Record the derivative objects generated for a media item
+
+        Args:
+            media_id (str): Media identifier
+            varyantlar (dict): Variant name -> {extension: object key}
+        """
         try:
-            if not file:
-                raise ValidationError("Dosya bulunamadı")
-            
-            # Check file format
-            if not self.allowed_file(file.filename):
-                raise ValidationError("Geçersiz dosya formatı")
-            
-            # Secure filename
-            filename = secure_filename(file.filename)
-            
-            # Generate unique filename
-            unique_filename = f"{self.generate_id()}-{filename}"
-            
-            # Prepare metadata
-            file_metadata = metadata or {}
-            model_type = file_metadata.get('model_type', 'genel')
-            
-            # Determine storage path
-            s3_folder = f"uploads/{model_type}/{datetime.now().strftime('%Y/%m/%d')}"
-            
-            # Store in S3 or local filesystem
-            if current_app.config.get('AWS_ACCESS_KEY_ID') and current_app.config.get('S3_BUCKET_NAME'):
-                # S3 storage logic will be implemented here
-                # For now, we'll use local storage
-                storage_path = f"{s3_folder}/{unique_filename}"
-                file_url = f"/uploads/{storage_path}"
-                storage_type = 's3'
-            else:
-                # Local storage
-                upload_folder = current_app.config['UPLOAD_FOLDER']
-                folder_path = os.path.join(upload_folder, s3_folder)
-                
-                # Create directory if it doesn't exist
-                os.makedirs(folder_path, exist_ok=True)
-                
-                file_path = os.path.join(folder_path, unique_filename)
-                file.save(file_path)
-                
-                storage_path = file_path
-                file_url = f"/uploads/{s3_folder}/{unique_filename}"
-                storage_type = 'local'
-            
-            # Create media record
-            now = self.get_timestamp()
-            media_id = self.generate_id('med')
-            
-            media = MediaModel(
-                media_id=media_id,
-                dosya_adi=unique_filename,
-                orijinal_dosya_adi=filename,
-                mime_type=file.content_type,
-                boyut=file.content_length if hasattr(file, 'content_length') else 0,
-                dosya_url=file_url,
-                depolama_yolu=storage_path,
-                depolama_tipi=storage_type,
-                yukleyen_id=user_id,
-                yuklenme_tarihi=now,
-                ilgili_model=metadata.get('model_type'),
-                ilgili_id=metadata.get('model_id'),
-                description=metadata.get('description'),
-                created_at=now,
-                updated_at=now
+            self.table.update_item(
+                Key={'media_id': media_id},
+                UpdateExpression='SET varyantlar = :varyantlar',
+                ConditionExpression='attribute_exists(media_id)',
+                ExpressionAttributeValues={':varyantlar': varyantlar}
             )
-            
-            # Save media metadata to DynamoDB
-            self.table.put_item(Item=media.to_dict())
-            
-            return media.to_dict()
-            
         except ClientError as e:
-            self.logger.error(f"Error uploading file: {e}")
-            raise ValidationError("Dosya yükleme hatası")
-    
-    def delete_file(self, file_info, user_id=None):
-        """Delete a file"""
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return
+            raise ValueError(f"Error updating media variants: {e}")
+
+    def delete_media(self, media_id: str):
+        """
+        Delete a media record
+
+        Args:
+            media_id (str): Media identifier
+        """
         try:
-            # Check permission if user_id provided
-            if user_id and file_info.get('yukleyen_id') != user_id:
-                # TODO: Add admin check here
-                raise ForbiddenError("Bu dosyayı silme yetkiniz yok")
-            
-            # Handle file deletion based on storage type
-            if file_info.get('depolama_tipi') == 's3':
-                # S3 deletion logic will be implemented here
-                # For now, just return success
-                pass
-            else:
-                # Local file deletion
-                file_path = file_info.get('depolama_yolu')
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-            
-            # Delete metadata from database
-            # This assumes file_info contains 'media_id'
-            if 'media_id' in file_info:
-                self.table.delete_item(
-                    Key={'media_id': file_info['media_id']}
-                )
-            
-            return True
-            
+            self.table.delete_item(Key={'media_id': media_id})
         except ClientError as e:
-            self.logger.error(f"Error deleting file: {e}")
-            raise ValidationError("Dosya silme hatası")
-    
-    def get_file_url(self, file_info, expires=3600):
-        """Get URL for file access"""
-        # For S3, generate a presigned URL
-        if file_info.get('depolama_tipi') == 's3':
-            # S3 presigned URL logic would be implemented here
-            # For now, just return the URL
-            return file_info.get('dosya_url')
-        else:
-            # For local files, just return the URL
-            return file_info.get('dosya_url')
\ No newline at end of file
+            raise ValueError(f"Error deleting media: {e}")
@@ -1,20 +1,38 @@
 import os
 import uuid
-import boto3
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
 
+from app.feed import record_activity, record_item, remove_item
 from app.models.PollModel import PollModel, PollOption, PollVote
+from app.utils.cache import TTLCache
+from app.search import index_document, remove_document, search as search_index
+from app.utils.dynamodb import transact_write, cancellation_reasons, batch_get_items
+from app.storage import get_dynamodb
 
 DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
 DEFAULT_POLLS_TABLE_NAME = os.getenv('POLLS_TABLE_NAME', 'Polls')
+DEFAULT_POLL_VOTES_TABLE_NAME = os.getenv('POLL_VOTES_TABLE_NAME', 'PollVotes')
+# Retries when concurrent votes on the same poll collide
+MAX_VOTE_CONFLICT_RETRIES = 3
+POLL_RESULTS_CACHE_TTL_SECONDS = float(os.getenv('POLL_RESULTS_CACHE_TTL_SECONDS', '5'))
+POLL_RESULTS_CACHE_MAX_SIZE = int(os.getenv('POLL_RESULTS_CACHE_MAX_SIZE', '10000'))
 
 class PollDatabaseService:
+
+    # Results projections keyed by poll_id; shared by every instance so that
+    # votes and result reads in one process see the same projection
+    results_cache = TTLCache(
+        maxsize=POLL_RESULTS_CACHE_MAX_SIZE,
+        ttl=POLL_RESULTS_CACHE_TTL_SECONDS
+    )
+
     def __init__(
         self, 
         region_name: str = DEFAULT_REGION, 
-        table_name: str = DEFAULT_POLLS_TABLE_NAME
+        table_name: str = DEFAULT_POLLS_TABLE_NAME,
+        votes_table_name: str = DEFAULT_POLL_VOTES_TABLE_NAME
     ):
         """
         Initialize DynamoDB Poll Service
@@ -22,22 +40,13 @@ class PollDatabaseService:
         Args:
             region_name (str): AWS region
             table_name (str): DynamoDB table name
+            votes_table_name (str): DynamoDB table holding one vote per (poll, user)
         """
-        # AWS Credentials
-        self.access_key = os.getenv('AWS_ACCESS_KEY_ID', '').strip()
-        self.secret_key = os.getenv('AWS_SECRET_ACCESS_KEY', '').strip()
-        
-        if not self.access_key or not self.secret_key:
-            raise ValueError("AWS credentials must be provided")
-        
-        # Setup AWS Resources
-        self.session = boto3.Session(
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            region_name=region_name
-        )
-        self.dynamodb = self.session.resource('dynamodb')
+        # DynamoDB or the local SQLite engine, per STORAGE_BACKEND
+        self.dynamodb = get_dynamodb(region_name)
+        self.client = self.dynamodb.meta.client
         self.table = self.dynamodb.Table(table_name)
+        self.votes_table = self.dynamodb.Table(votes_table_name)
 
     def create_poll(
         self, 
@@ -102,7 +111,6 @@ class PollDatabaseService:
             'created_at': datetime.now().isoformat(),
             'bitis_tarihi': bitis_tarihi,
             'secenekler': poll_options,
-            'oylar': [],
             'university': university,
             'category': category,
             'is_active': True
@@ -114,6 +122,8 @@ class PollDatabaseService:
         except ClientError as e:
             raise ValueError(f"Error creating poll: {e}")
         
+        index_document('polls', poll_data)
+        record_item(poll_data['poll_id'], poll_data.get('university'), poll_data['created_at'])
         return PollModel(**poll_data)
 
     def get_poll_by_id(self, poll_id: str) -> Optional[PollModel]:
@@ -143,21 +153,29 @@ class PollDatabaseService:
         per_page: int = 10,
         category: Optional[str] = None,
         university: Optional[str] = None,
-        aktif: Optional[bool] = None
+        aktif: Optional[bool] = None,
+        search: Optional[str] = None
     ) -> Dict[str, any]:
         """
         Retrieve polls with optional filtering and pagination
         
+        A search term is answered by the in-process search index, most
+        relevant first (see app.search).
+        
         Args:
             page (int): Page number
             per_page (int): Polls per page
             category (str, optional): Filter by category
             university (str, optional): Filter by university
             aktif (bool, optional): Filter by active status
+            search (str, optional): Search term
         
         Returns:
             Dict containing polls and metadata
         """
+        if search:
+            return self._search_polls(search, page, per_page, category, university, aktif)
+        
         try:
             # Base scan parameters
             scan_params = {
@@ -221,6 +239,53 @@ class PollDatabaseService:
                 }
             }
 
+    def _search_polls(
+        self,
+        search: str,
+        page: int,
+        per_page: int,
+        category: Optional[str],
+        university: Optional[str],
+        aktif: Optional[bool]
+    ) -> Dict[str, any]:
+        """
+        Retrieve a page of polls matching a search term
+        
+        The active-status filter depends on the current time, so it is
+        applied to the page read from the table; `total` counts matches
+        before that filter.
+        """
+        poll_ids, total = search_index(
+            'polls', search,
+            filters={'category': category, 'university': university},
+            limit=per_page,
+            offset=(page - 1) * per_page
+        )
+        
+        try:
+            items = batch_get_items(
+                self.dynamodb, self.table.name,
+                [{'poll_id': poll_id} for poll_id in poll_ids]
+            )
+        except ClientError:
+            items = []
+        
+        # BatchGetItem does not keep the order; restore the ranking
+        by_id = {item['poll_id']: item for item in items if item.get('is_active', True)}
+        polls = [PollModel(**by_id[poll_id]) for poll_id in poll_ids if poll_id in by_id]
+        if aktif is not None:
+            polls = [poll for poll in polls if poll.is_active_poll() == aktif]
+        
+        return {
+            'polls': [poll.to_dict() for poll in polls],
+            'meta': {
+                'total': total,
+                'page': page,
+                'per_page': per_page,
+                'total_pages': (total + per_page - 1) // per_page
+            }
+        }
+
     def update_poll(self, 
         poll_id: str, 
         user_id: str, 
@@ -305,8 +370,12 @@ class PollDatabaseService:
                 ExpressionAttributeValues=expr_attr_values
             )
             
+            self.results_cache.delete(poll_id)
+            
             # Retrieve and return updated poll
             updated_poll = self.get_poll_by_id(poll_id)
+            if updated_poll:
+                index_document('polls', dict(updated_poll.to_dict(), is_active=updated_poll.is_active))
             return updated_poll
         
         except ClientError as e:
@@ -347,6 +416,9 @@ class PollDatabaseService:
                 UpdateExpression='SET is_active = :false',
                 ExpressionAttributeValues={':false': False}
             )
+            self.results_cache.delete(poll_id)
+            remove_document('polls', poll_id)
+            remove_item(poll_id)
             
             return True
         
@@ -373,70 +445,161 @@ class PollDatabaseService:
         Raises:
             ValueError: If voting fails
         """
-        try:
-            # Retrieve existing poll
-            poll = self.get_poll_by_id(poll_id)
-            
-            if not poll:
-                raise ValueError("Poll not found")
-            
-            # Check poll activity
-            if not poll.is_active_poll():
-                raise ValueError("This poll is no longer active")
-            
-            # Verify option exists
-            option_exists = any(option.option_id == option_id for option in poll.secenekler)
-            if not option_exists:
-                raise ValueError("Invalid poll option")
-            
-            # Prepare vote update
-            update_params = {
-                'Key': {'poll_id': poll_id},
-                'UpdateExpression': 'SET oylar = list_append(oylar, :new_vote)',
-                'ExpressionAttributeValues': {
-                    ':new_vote': [{
-                        'kullanici_id': user_id,
-                        'secenek_id': option_id,
-                        'tarih': datetime.now().isoformat()
-                    }]
-                }
-            }
-            
-            # Remove previous votes by this user
-            remove_prev_vote_expr = [
-                f'secenekler[{i}].oy_sayisi = secenekler[{i}].oy_sayisi - :decrement ' 
-                for i in range(len(poll.secenekler))
-            ]
-            
-            if remove_prev_vote_expr:
-                update_params['UpdateExpression'] += ' REMOVE ' + ', '.join(
-                    f'oylar[{i}]' 
-                    for i in range(len(poll.oylar))
-                    if poll.oylar[i].kullanici_id == user_id
-                )
+        # Retrieve existing poll
+        poll = self.get_poll_by_id(poll_id)
+        
+        if not poll:
+            raise ValueError("Poll not found")
+        
+        # Check poll activity
+        if not poll.is_active_poll():
+            raise ValueError("This poll is no longer active")
+        
+        # Verify option exists
+        option_ids = [option.option_id for option in poll.secenekler]
+        if option_id not in option_ids:
+            raise ValueError("Invalid poll option")
+        
+        # Assume a first vote; the conditions tell us otherwise
+        previous = None
+        for attempt in range(MAX_VOTE_CONFLICT_RETRIES + 1):
+            try:
+                self._write_vote(poll_id, user_id, option_id, previous, option_ids)
+                break
+            except ClientError as e:
+                reasons = cancellation_reasons(e)
+                if reasons is None:
+                    raise ValueError(f"Error voting in poll: {e}")
                 
-                # Increment selected option's vote count
-                for i, option in enumerate(poll.secenekler):
-                    if option.option_id == option_id:
-                        update_params['UpdateExpression'] += f', secenekler[{i}].oy_sayisi = secenekler[{i}].oy_sayisi + :increment'
-                        update_params['ExpressionAttributeValues'][':increment'] = 1
+                if reasons and reasons[0] == 'ConditionalCheckFailed':
+                    # The stored vote is not what we assumed
+                    previous = self.get_user_vote(poll_id, user_id)
+                    if previous == option_id:
+                        return {
+                            'message': 'Oy başarıyla kaydedildi',
+                            'results': poll.get_results()
+                        }
+                    continue
                 
-                # Decrement for other options where user might have voted
-                update_params['ExpressionAttributeValues'][':decrement'] = 1
-            
-            # Perform update
-            self.table.update_item(**update_params)
-            
-            # Retrieve updated poll results
-            updated_poll = self.get_poll_by_id(poll_id)
-            
-            return {
-                'message': 'Oy başarıyla kaydedildi',
-                'results': updated_poll.get_results()
-            }
+                if len(reasons) > 1 and reasons[1] == 'ConditionalCheckFailed':
+                    # Options were replaced after we read the poll
+                    raise ValueError("Invalid poll option")
+                
+                if 'TransactionConflict' in reasons and attempt < MAX_VOTE_CONFLICT_RETRIES:
+                    continue
+                raise ValueError(f"Error voting in poll: {e}")
+        else:
+            raise ValueError("Error voting in poll: too many concurrent votes")
+        
+        # Apply our own change to the poll we read instead of reading it again
+        deltas = {option_id: 1}
+        if previous:
+            deltas[previous] = -1
+        for option in poll.secenekler:
+            option.oy_sayisi += deltas.get(option.option_id, 0)
+        if previous is None:
+            record_activity(poll_id, 'vote')
+        
+        self.results_cache.update(
+            poll_id,
+            lambda projection: self._apply_vote_deltas(projection, deltas)
+        )
         
-        except ClientError as e:
-            raise ValueError(f"Error voting in poll: {e}")
+        return {
+            'message': 'Oy başarıyla kaydedildi',
+            'results': poll.get_results()
+        }
+
+    def _write_vote(
+        self,
+        poll_id: str,
+        user_id: str,
+        option_id: str,
+        previous: Optional[str],
+        option_ids: List[str]
+    ):
+        """
+        Write the user's vote and the option counters in one transaction
+        
+        Counters live in `secenekler[i].oy_sayisi` on the poll item and are
+        changed with atomic arithmetic; each touched position is guarded by
+        its option_id so a concurrent options update cannot shift the counts.
+        
+        Args:
+            poll_id (str): Poll's unique identifier
+            user_id (str): User voting in the poll
+            option_id (str): Selected option ID
+            previous (str, optional): Option ID the stored vote is assumed to have
+            option_ids (List[str]): Option IDs in their stored order
+        """
+        now = datetime.now().isoformat()
+        key = {'poll_id': poll_id, 'user_id': user_id}
+        
+        if previous is None:
+            vote_action = {'Put': {
+                'TableName': self.votes_table.name,
+                'Item': dict(key, option_id=option_id, created_at=now),
+                'ConditionExpression': 'attribute_not_exists(user_id)'
+            }}
+        else:
+            vote_action = {'Update': {
+                'TableName': self.votes_table.name,
+                'Key': key,
+                'UpdateExpression': 'SET option_id = :new, updated_at = :now',
+                'ConditionExpression': 'option_id = :old',
+                'ExpressionAttributeValues': {
+                    ':new': option_id,
+                    ':old': previous,
+                    ':now': now
+                }
+            }}
+        
+        new_index = option_ids.index(option_id)
+        update_expr = [
+            f"secenekler[{new_index}].oy_sayisi = secenekler[{new_index}].oy_sayisi + :one"
+        ]
+        conditions = [f"secenekler[{new_index}].option_id = :new_option"]
+        values = {':one': 1, ':new_option': option_id}
+        
+        # A vote for an option that was since replaced has nothing to decrement
+        if previous in option_ids:
+            old_index = option_ids.index(previous)
+            update_expr.append(
+                f"secenekler[{old_index}].oy_sayisi = secenekler[{old_index}].oy_sayisi - :one"
+            )
+            conditions.append(f"secenekler[{old_index}].option_id = :old_option")
+            values[':old_option'] = previous
+        
+        transact_write(self.client, [
+            vote_action,
+            {'Update': {
+                'TableName': self.table.name,
+                'Key': {'poll_id': poll_id},
+                'UpdateExpression': 'SET ' + ', '.join(update_expr),
+                'ConditionExpression': ' AND '.join(conditions),
+                'ExpressionAttributeValues': values
+            }}
+        ])
+
+    def get_user_vote(self, poll_id: str, user_id: str) -> Optional[str]:
+        """
+        Get the option a user voted for
+        
+        Args:
+            poll_id (str): Poll's unique identifier
+            user_id (str): User ID
+        
+        Returns:
+            Optional[str]: Selected option ID if the user voted, else None
+        """
+        try:
+            response = self.votes_table.get_item(
+                Key={'poll_id': poll_id, 'user_id': user_id},
+                ConsistentRead=True
+            )
+            return response.get('Item', {}).get('option_id')
+        except ClientError:
+            return None
 
     def get_poll_results(
         self, 
@@ -445,6 +608,11 @@ class PollDatabaseService:
         """
         Retrieve poll results
         
+        Results are served from a projection cached for
+        POLL_RESULTS_CACHE_TTL_SECONDS. Votes cast through this process
+        update the projection in place, so reads do not hit the table until
+        the entry expires.
+        
         Args:
             poll_id (str): Poll's unique identifier
         
@@ -454,23 +622,76 @@ class PollDatabaseService:
         Raises:
             ValueError: If retrieving results fails
         """
-        try:
-            # Retrieve poll
-            poll = self.get_poll_by_id(poll_id)
-            
-            if not poll:
-                raise ValueError("Poll not found")
-            
-            return {
-                'poll': {
-                    'poll_id': poll.poll_id,
-                    'header': poll.header,
-                    'description': poll.description,
-                    'aktif': poll.is_active_poll()
-                },
-                'results': poll.get_results(),
-                'total_votes': sum(option.oy_sayisi for option in poll.secenekler)
-            }
+        projection = self.results_cache.get_or_load(
+            poll_id,
+            lambda: self._load_results(poll_id)
+        )
+        
+        if projection is None:
+            raise ValueError("Poll not found")
         
+        return projection
+
+    def _load_results(self, poll_id: str) -> Optional[Dict[str, any]]:
+        """
+        Build the results projection of a poll from the table
+        
+        Args:
+            poll_id (str): Poll's unique identifier
+        
+        Returns:
+            Optional[Dict]: Results projection, or None if the poll does not exist
+        
+        Raises:
+            ValueError: If retrieving the poll fails
+        """
+        try:
+            response = self.table.get_item(
+                Key={'poll_id': poll_id},
+                ProjectionExpression='poll_id, header, description, bitis_tarihi, secenekler'
+            )
         except ClientError as e:
-            raise ValueError(f"Error retrieving poll results: {e}")
\ No newline at end of file
+            raise ValueError(f"Error retrieving poll results: {e}")
+        
+        item = response.get('Item')
+        if not item:
+            return None
+        
+        poll = PollModel(**item)
+        results = [
+            dict(result, oy_sayisi=int(result['oy_sayisi']))
+            for result in poll.get_results()
+        ]
+        
+        return {
+            'poll': {
+                'poll_id': poll.poll_id,
+                'header': poll.header,
+                'description': poll.description,
+                'aktif': poll.is_active_poll()
+            },
+            'results': results,
+            'total_votes': sum(result['oy_sayisi'] for result in results)
+        }
+
+    @staticmethod
+    def _apply_vote_deltas(projection: Dict[str, any], deltas: Dict[str, int]) -> Dict[str, any]:
+        """
+        Return a copy of a results projection with vote changes applied
+        
+        Args:
+            projection (Dict): Cached results projection
+            deltas (Dict): option_id -> change in votes
+        
+        Returns:
+            Dict: Updated projection
+        """
+        results = [
+            dict(result, oy_sayisi=result['oy_sayisi'] + deltas.get(result['option_id'], 0))
+            for result in projection['results']
+        ]
+        return dict(
+            projection,
+            results=results,
+            total_votes=sum(result['oy_sayisi'] for result in results)
+        )
@@ -0,0 +1,357 @@
+import os
+import random
+from boto3.dynamodb.conditions import Key
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from botocore.exceptions import ClientError
+
+from app.utils.cache import TTLCache
+from app.utils.dynamodb import transact_write, cancellation_reasons, batch_get_items
+from app.storage import get_dynamodb
+
+DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
+DEFAULT_REACTIONS_TABLE_NAME = os.getenv('REACTIONS_TABLE_NAME', 'Reactions')
+DEFAULT_REACTION_COUNTERS_TABLE_NAME = os.getenv('REACTION_COUNTERS_TABLE_NAME', 'ReactionCounters')
+# Number of counter items a target's totals are spread over
+REACTION_COUNTER_SHARDS = int(os.getenv('REACTION_COUNTER_SHARDS', '10'))
+REACTION_COUNT_CACHE_TTL_SECONDS = float(os.getenv('REACTION_COUNT_CACHE_TTL_SECONDS', '5'))
+REACTION_COUNT_CACHE_MAX_SIZE = int(os.getenv('REACTION_COUNT_CACHE_MAX_SIZE', '10000'))
+
+REACTION_TYPES = ('like', 'dislike')
+# Retries on a different shard when concurrent transactions collide
+MAX_CONFLICT_RETRIES = 3
+
+class ReactionDatabaseService:
+
+    __instance = None
+
+    @staticmethod
+    def get_instance():
+        """Static access method"""
+        if ReactionDatabaseService.__instance is None:
+            ReactionDatabaseService()
+        return ReactionDatabaseService.__instance
+
+    def __init__(
+        self,
+        region_name: str = DEFAULT_REGION,
+        reactions_table_name: str = DEFAULT_REACTIONS_TABLE_NAME,
+        counters_table_name: str = DEFAULT_REACTION_COUNTERS_TABLE_NAME
+    ):
+        """
+        Initialize DynamoDB Reaction Service
+
+        Reactions are stored once per (target, user) so repeating a reaction
+        is idempotent. Totals live in REACTION_COUNTER_SHARDS counter items
+        per target; writes pick a random shard, so a popular target spreads
+        its writes instead of serializing on one item.
+
+        Args:
+            region_name (str): AWS region
+            reactions_table_name (str): Per-user reaction table name
+            counters_table_name (str): Sharded counter table name
+        """
+        if ReactionDatabaseService.__instance is not None:
+            raise Exception("This class is a singleton!")
+
+        # DynamoDB or the local SQLite engine, per STORAGE_BACKEND
+        self.dynamodb = get_dynamodb(region_name)
+        self.client = self.dynamodb.meta.client
+        self.reactions_table = self.dynamodb.Table(reactions_table_name)
+        self.counters_table = self.dynamodb.Table(counters_table_name)
+
+        # Aggregated totals keyed by target_id
+        self.count_cache = TTLCache(
+            maxsize=REACTION_COUNT_CACHE_MAX_SIZE,
+            ttl=REACTION_COUNT_CACHE_TTL_SECONDS
+        )
+
+        ReactionDatabaseService.__instance = self
+
+    def react(self, target_id: str, user_id: str, reaction_type: str) -> Dict[str, int]:
+        """
+        Record a user's reaction to a forum or comment
+
+        A first reaction is a single transaction that creates the reaction
+        record and increments one counter shard. Changing the reaction moves
+        one count between the two types; repeating it changes nothing.
+
+        Args:
+            target_id (str): Forum or comment ID
+            user_id (str): Reacting user
+            reaction_type (str): 'like' or 'dislike'
+
+        Returns:
+            Dict: Current like_count and dislike_count of the target
+
+        Raises:
+            ValueError: If the reaction type is invalid or the write fails
+        """
+        return self.record_reaction(target_id, user_id, reaction_type)[0]
+
+    def record_reaction(
+        self,
+        target_id: str,
+        user_id: str,
+        reaction_type: str
+    ) -> Tuple[Dict[str, int], Optional[str]]:
+        """
+        Record a user's reaction and report what it replaced
+
+        Same as react(), but also returns the reaction stored before this
+        call so callers can tell a first reaction from a change or a repeat.
+
+        Args:
+            target_id (str): Forum or comment ID
+            user_id (str): Reacting user
+            reaction_type (str): 'like' or 'dislike'
+
+        Returns:
+            Tuple: (current counts, previous reaction type or None if this
+                is the user's first reaction)
+
+        Raises:
+            ValueError: If the reaction type is invalid or the write fails
+        """
+        if reaction_type not in REACTION_TYPES:
+            raise ValueError("Geçersiz reaksiyon türü")
+
+        # Assume a first reaction; the conditions tell us otherwise
+        previous = None
+        for attempt in range(MAX_CONFLICT_RETRIES + 1):
+            try:
+                self._write_reaction(target_id, user_id, reaction_type, previous)
+                break
+            except ClientError as e:
+                reasons = cancellation_reasons(e)
+                if reasons is None:
+                    raise ValueError(f"Reaksiyon eklenemedi: {e}")
+
+                if reasons and reasons[0] == 'ConditionalCheckFailed':
+                    # The stored reaction is not what we assumed
+                    previous = self.get_reaction(target_id, user_id)
+                    if previous == reaction_type:
+                        return self.get_counts(target_id), previous
+                    continue
+
+                if 'TransactionConflict' in reasons and attempt < MAX_CONFLICT_RETRIES:
+                    continue
+                raise ValueError(f"Reaksiyon eklenemedi: {e}")
+        else:
+            raise ValueError("Reaksiyon eklenemedi")
+
+        deltas = {f"{reaction_type}_count": 1}
+        if previous:
+            deltas[f"{previous}_count"] = -1
+        return self._apply_cached_deltas(target_id, deltas), previous
+
+    def _write_reaction(
+        self,
+        target_id: str,
+        user_id: str,
+        reaction_type: str,
+        previous: Optional[str]
+    ):
+        """
+        Write the reaction record and one counter shard in a transaction
+
+        Args:
+            target_id (str): Forum or comment ID
+            user_id (str): Reacting user
+            reaction_type (str): New reaction type
+            previous (str, optional): Reaction type assumed to be stored
+        """
+        now = datetime.now().isoformat()
+        key = {'target_id': target_id, 'user_id': user_id}
+
+        if previous is None:
+            reaction_action = {'Put': {
+                'TableName': self.reactions_table.name,
+                'Item': dict(key, reaction_type=reaction_type, created_at=now),
+                'ConditionExpression': 'attribute_not_exists(user_id)'
+            }}
+            counter_update = f"ADD {reaction_type}_count :one"
+            counter_values = {':one': 1}
+        else:
+            reaction_action = {'Update': {
+                'TableName': self.reactions_table.name,
+                'Key': key,
+                'UpdateExpression': 'SET reaction_type = :new, updated_at = :now',
+                'ConditionExpression': 'reaction_type = :old',
+                'ExpressionAttributeValues': {
+                    ':new': reaction_type,
+                    ':old': previous,
+                    ':now': now
+                }
+            }}
+            counter_update = f"ADD {reaction_type}_count :one, {previous}_count :minus_one"
+            counter_values = {':one': 1, ':minus_one': -1}
+
+        transact_write(self.client, [
+            reaction_action,
+            {'Update': {
+                'TableName': self.counters_table.name,
+                'Key': {
+                    'target_id': target_id,
+                    'shard': random.randrange(REACTION_COUNTER_SHARDS)
+                },
+                'UpdateExpression': counter_update,
+                'ExpressionAttributeValues': counter_values
+            }}
+        ])
+
+    def get_reaction(self, target_id: str, user_id: str) -> Optional[str]:
+        """
+        Get a user's reaction to a target
+
+        Args:
+            target_id (str): Forum or comment ID
+            user_id (str): User ID
+
+        Returns:
+            Optional[str]: Reaction type if the user reacted, else None
+        """
+        try:
+            response = self.reactions_table.get_item(
+                Key={'target_id': target_id, 'user_id': user_id},
+                ConsistentRead=True
+            )
+            return response.get('Item', {}).get('reaction_type')
+        except ClientError:
+            return None
+
+    def get_counts(self, target_id: str) -> Dict[str, int]:
+        """
+        Get the aggregated reaction counts of a target
+
+        Args:
+            target_id (str): Forum or comment ID
+
+        Returns:
+            Dict: like_count and dislike_count
+        """
+        counts = self.count_cache.get_or_load(
+            target_id,
+            lambda: self._load_counts(target_id)
+        )
+        return dict(counts) if counts else self._empty_counts()
+
+    def get_counts_many(self, target_ids: List[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Get aggregated reaction counts for several targets
+
+        Targets missing from the cache are read with batched gets of all
+        their shard keys.
+
+        Args:
+            target_ids (List[str]): Forum or comment IDs
+
+        Returns:
+            Dict: target_id -> like_count and dislike_count
+        """
+        result = {}
+        missing = []
+        for target_id in dict.fromkeys(target_ids):
+            counts = self.count_cache.get(target_id)
+            if counts is None:
+                missing.append(target_id)
+            else:
+                result[target_id] = dict(counts)
+
+        if not missing:
+            return result
+
+        loaded = {target_id: self._empty_counts() for target_id in missing}
+        try:
+            items = batch_get_items(
+                self.dynamodb,
+                self.counters_table.name,
+                [
+                    {'target_id': target_id, 'shard': shard}
+                    for target_id in missing
+                    for shard in range(REACTION_COUNTER_SHARDS)
+                ]
+            )
+        except ClientError:
+            # Serve zeros for this request without caching them
+            result.update(loaded)
+            return result
+
+        for item in items:
+            self._add_shard(loaded[item['target_id']], item)
+
+        for target_id, counts in loaded.items():
+            self.count_cache.set(target_id, counts)
+            result[target_id] = dict(counts)
+        return result
+
+    def apply_counts(self, items: List[Dict[str, any]], id_key: str):
+        """
+        Overwrite like_count and dislike_count of target dictionaries in place
+
+        Args:
+            items (List[Dict]): Forum or comment dictionaries
+            id_key (str): Name of the ID field ('forum_id' or 'comment_id')
+        """
+        counts = self.get_counts_many([item[id_key] for item in items])
+        for item in items:
+            item.update(counts.get(item[id_key], self._empty_counts()))
+
+    @staticmethod
+    def _empty_counts() -> Dict[str, int]:
+        """Zero count for every reaction type"""
+        return {f"{reaction_type}_count": 0 for reaction_type in REACTION_TYPES}
+
+    @staticmethod
+    def _add_shard(counts: Dict[str, int], shard: Dict[str, any]):
+        """Add the values of one counter shard to a totals dictionary"""
+        for field in counts:
+            counts[field] += int(shard.get(field, 0))
+
+    def _load_counts(self, target_id: str) -> Optional[Dict[str, int]]:
+        """
+        Sum the counter shards of a target with a single query
+
+        Args:
+            target_id (str): Forum or comment ID
+
+        Returns:
+            Optional[Dict]: like_count and dislike_count, or None if the
+                shards could not be read (callers serve zeros uncached)
+        """
+        counts = self._empty_counts()
+        try:
+            response = self.counters_table.query(
+                KeyConditionExpression=Key('target_id').eq(target_id),
+                ConsistentRead=True
+            )
+        except ClientError:
+            return None
+
+        for shard in response.get('Items', []):
+            self._add_shard(counts, shard)
+        return counts
+
+    def _apply_cached_deltas(self, target_id: str, deltas: Dict[str, int]) -> Dict[str, int]:
+        """
+        Apply our own write to the cached totals instead of re-reading the shards
+
+        Args:
+            target_id (str): Forum or comment ID
+            deltas (Dict): Field -> change
+
+        Returns:
+            Dict: Updated like_count and dislike_count
+        """
+        def apply(counts):
+            counts = dict(counts)
+            for field, delta in deltas.items():
+                counts[field] = counts.get(field, 0) + delta
+            return counts
+
+        # update keeps the entry's expiry, so other workers' reactions are
+        # still picked up once the TTL runs out
+        counts = self.count_cache.update(target_id, apply)
+        if counts is None:
+            return self.get_counts(target_id)
+        return dict(counts)
@@ -1,19 +1,34 @@
 import os
+import copy
 import uuid
-import boto3
 from boto3.dynamodb.conditions import Key
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from app.utils.auth import hash_password, check_password
 from app.models.UserModel import UserModel
+from app.services.schema import (
+    USERS_EMAIL_INDEX_NAME as EMAIL_INDEX_NAME,
+    USERS_USERNAME_INDEX_NAME as USERNAME_INDEX_NAME
+)
+from app.utils.cache import TTLCache
+from app.utils.dynamodb import transact_write, cancellation_reasons, batch_get_items
+from app.storage import get_dynamodb
 from botocore.exceptions import ClientError
 
 DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
 DEFAULT_USERS_TABLE_NAME = os.getenv('USERS_TABLE_NAME', 'Users')
+DEFAULT_USER_KEYS_TABLE_NAME = os.getenv('USER_KEYS_TABLE_NAME', 'UserKeys')
+USER_CACHE_TTL_SECONDS = float(os.getenv('USER_CACHE_TTL_SECONDS', '30'))
+USER_CACHE_MAX_SIZE = int(os.getenv('USER_CACHE_MAX_SIZE', '10000'))
+# Upper bound on IDs accepted by batch_get_users
+BATCH_GET_USERS_MAX = 100
 
 class EmailAlreadyExistsError(Exception):
     pass
 
+class UsernameAlreadyExistsError(ValueError):
+    pass
+
 class UserDatabaseService:
 
     __instance = None
@@ -38,25 +53,55 @@ class UserDatabaseService:
             region_name (str): AWS region
             table_name (str): DynamoDB table name
         """
-        # AWS Credentials
-        self.access_key = os.getenv('AWS_ACCESS_KEY_ID', '').strip()
-        self.secret_key = os.getenv('AWS_SECRET_ACCESS_KEY', '').strip()
-        
-        if not self.access_key or not self.secret_key:
-            raise ValueError("AWS credentials must be provided")
-        
-        # Setup AWS Resources
-        self.session = boto3.Session(
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            region_name=region_name
-        )
-        self.dynamodb = self.session.resource('dynamodb')
+        # DynamoDB or the local SQLite engine, per STORAGE_BACKEND
+        self.dynamodb = get_dynamodb(region_name)
+        self.client = self.dynamodb.meta.client
         self.table = self.dynamodb.Table(table_name)
+        # Uniqueness guards: one item per taken email / username, plus one
+        # per user holding the email half of the Users table key
+        self.keys_table_name = DEFAULT_USER_KEYS_TABLE_NAME
+
+        # Process-local read-through cache of users keyed by user_id
+        self.user_cache = TTLCache(
+            maxsize=USER_CACHE_MAX_SIZE,
+            ttl=USER_CACHE_TTL_SECONDS
+        )
 
         UserDatabaseService.__instance = self
 
 
+    @staticmethod
+    def _email_key(email: str) -> str:
+        """Lookup key of the guard item reserving an email"""
+        return f"email#{email}"
+
+    @staticmethod
+    def _username_key(username: str) -> str:
+        """Lookup key of the guard item reserving a username"""
+        return f"username#{username}"
+
+    @staticmethod
+    def _user_key(user_id: str) -> str:
+        """Lookup key of the item mapping a user ID to its full table key"""
+        return f"user#{user_id}"
+
+    def _put_guard(self, lookup_key: str, user_id: str, **attributes) -> dict:
+        """Transaction action reserving a lookup key for a user"""
+        return {'Put': {
+            'TableName': self.keys_table_name,
+            'Item': dict(attributes, lookup_key=lookup_key, user_id=user_id),
+            'ConditionExpression': 'attribute_not_exists(lookup_key)'
+        }}
+
+    def _delete_guard(self, lookup_key: str, user_id: str) -> dict:
+        """Transaction action releasing a lookup key owned by a user"""
+        return {'Delete': {
+            'TableName': self.keys_table_name,
+            'Key': {'lookup_key': lookup_key},
+            'ConditionExpression': 'attribute_not_exists(lookup_key) OR user_id = :user_id',
+            'ExpressionAttributeValues': {':user_id': user_id}
+        }}
+
     def create_user(
         self, 
         email: str, 
@@ -82,16 +127,6 @@ class UserDatabaseService:
         Raises:
             ValueError: If email or username already exists
         """
-        # Check if email already exists
-        existing_email = self._get_user_by_email(email)
-        if existing_email:
-            raise EmailAlreadyExistsError("Email already exists")
-        
-        # Check if username already exists
-        existing_username = self._get_user_by_username(username)
-        if existing_username:
-            raise ValueError("Username already exists")
-        
         # Generate unique user ID
         user_id = f"usr_{str(uuid.uuid4())}"
         
@@ -115,10 +150,25 @@ class UserDatabaseService:
             'polls': []
         }
         
-        # Save to DynamoDB
+        # Save the user and reserve its email and username in one transaction,
+        # so uniqueness is enforced by DynamoDB instead of check-then-put
         try:
-            self.table.put_item(Item=user_data)
+            transact_write(self.client, [
+                {'Put': {
+                    'TableName': self.table.name,
+                    'Item': user_data,
+                    'ConditionExpression': 'attribute_not_exists(user_id)'
+                }},
+                self._put_guard(self._email_key(email), user_id),
+                self._put_guard(self._username_key(username), user_id),
+                self._put_guard(self._user_key(user_id), user_id, email=email)
+            ])
         except ClientError as e:
+            reasons = cancellation_reasons(e) or []
+            if len(reasons) > 1 and reasons[1] == 'ConditionalCheckFailed':
+                raise EmailAlreadyExistsError("Email already exists")
+            if len(reasons) > 2 and reasons[2] == 'ConditionalCheckFailed':
+                raise UsernameAlreadyExistsError("Username already exists")
             raise ValueError(f"Error creating user: {e}")
         
         return UserModel(**user_data)
@@ -146,6 +196,116 @@ class UserDatabaseService:
         except ClientError:
             return None
         
+    def get_cached_user(self, user_id: str) -> Optional[UserModel]:
+        """
+        Get user by ID through the process-local user cache
+        
+        Entries expire after USER_CACHE_TTL_SECONDS and are invalidated
+        explicitly by update_user and delete_user.
+        
+        Args:
+            user_id (str): User's ID
+        
+        Returns:
+            Optional[UserModel]: Copy of the cached user if found, else None
+        """
+        user = self.user_cache.get_or_load(
+            user_id,
+            lambda: self._get_user_by_user_id(user_id)
+        )
+        # Callers may mutate the model; never hand out the cached instance
+        return copy.deepcopy(user) if user else None
+
+    def batch_get_users(self, user_ids: List[str]) -> Dict[str, UserModel]:
+        """
+        Get several users by ID with as few round trips as possible
+        
+        Duplicate IDs are read once and cached users are served from the
+        process-local cache. The rest are resolved with one BatchGetItem on
+        UserKeys (for the email half of the table key) and one on Users;
+        unprocessed keys are retried by batch_get_items. Users created
+        before the 'user#' keys existed fall back to a single query each.
+        
+        Args:
+            user_ids (List[str]): User IDs, at most BATCH_GET_USERS_MAX
+        
+        Returns:
+            Dict[str, UserModel]: Copies of the found users keyed by user_id;
+                unknown IDs are left out
+        
+        Raises:
+            ValueError: If too many IDs are given or the batch read fails
+        """
+        user_ids = list(dict.fromkeys(user_id for user_id in user_ids if user_id))
+        if len(user_ids) > BATCH_GET_USERS_MAX:
+            raise ValueError(f"At most {BATCH_GET_USERS_MAX} users can be fetched at once")
+        
+        users = {}
+        missing = []
+        for user_id in user_ids:
+            user = self.user_cache.get(user_id)
+            if user is None:
+                missing.append(user_id)
+            else:
+                users[user_id] = user
+        
+        if missing:
+            try:
+                users.update(self._load_users(missing))
+            except ClientError as e:
+                raise ValueError(f"Error fetching users: {e}")
+        
+        # Callers may mutate the models; never hand out cached instances
+        return {user_id: copy.deepcopy(user) for user_id, user in users.items()}
+
+    def _load_users(self, user_ids: List[str]) -> Dict[str, UserModel]:
+        """
+        Read users missing from the cache and cache them
+        
+        Args:
+            user_ids (List[str]): Unique user IDs
+        
+        Returns:
+            Dict[str, UserModel]: Found users keyed by user_id
+        """
+        # Users invalidated while we read are returned but not cached
+        generations = {user_id: self.user_cache.begin_load(user_id) for user_id in user_ids}
+        users = {}
+        try:
+            key_items = batch_get_items(
+                self.dynamodb,
+                self.keys_table_name,
+                [{'lookup_key': self._user_key(user_id)} for user_id in user_ids]
+            )
+            emails = {item['user_id']: item['email'] for item in key_items}
+            
+            items = batch_get_items(
+                self.dynamodb,
+                self.table.name,
+                [{'user_id': user_id, 'email': email} for user_id, email in emails.items()]
+            )
+            
+            for item in items:
+                users[item['user_id']] = UserModel(**item)
+            for user_id in user_ids:
+                if user_id not in emails:
+                    user = self._get_user_by_user_id(user_id)
+                    if user:
+                        users[user_id] = user
+        finally:
+            for user_id, generation in generations.items():
+                self.user_cache.finish_load(user_id, generation, users.get(user_id))
+        return users
+
+    def invalidate_cached_user(self, user_id: str):
+        """
+        Drop a user from the process-local user cache
+        
+        Args:
+            user_id (str): User's ID
+        """
+        self.user_cache.delete(user_id)
+
     def _get_user_by_email(self, email: str) -> UserModel:
         """
         Get user by email
@@ -157,16 +317,15 @@ class UserDatabaseService:
             Optional[dict]: User data if found, else None
         """
         try:
-            response = self.table.scan(
-                FilterExpression='email = :email',
-                ExpressionAttributeValues={':email': email}
+            response = self.table.query(
+                IndexName=EMAIL_INDEX_NAME,
+                KeyConditionExpression=Key('email').eq(email),
+                Limit=1
             )
-            user_data = response.get('Items', [])
-            if len(user_data) != 0:
-                user_data = user_data[0]
-            else:
+            items = response.get('Items', [])
+            if not items:
                 return None
-            return UserModel(**user_data)
+            return UserModel(**items[0])
         except ClientError:
             return None
 
@@ -181,16 +340,15 @@ class UserDatabaseService:
             Optional[dict]: User data if found, else None
         """
         try:
-            response = self.table.scan(
-                FilterExpression='username = :username',
-                ExpressionAttributeValues={':username': username}
+            response = self.table.query(
+                IndexName=USERNAME_INDEX_NAME,
+                KeyConditionExpression=Key('username').eq(username),
+                Limit=1
             )
-            user_data = response.get('Items', [])
-            if len(user_data) != 0:
-                user_data = user_data[0]
-            else:
+            items = response.get('Items', [])
+            if not items:
                 return None
-            return UserModel(**user_data)
+            return UserModel(**items[0])
         except ClientError:
             return None
 
@@ -263,30 +421,43 @@ class UserDatabaseService:
             return None
         
         # Update last login
-        self._update_last_login(user_data['user_id'])
+        self.record_last_login(user_data['user_id'], user_data['email'])
         
         return UserModel(**user_data)
 
-    def _update_last_login(self, user_id: str):
+    def record_last_login(self, user_id: str, email: str, last_login: Optional[str] = None):
         """
         Update user's last login timestamp
         
+        The timestamp only moves forward, so a late or repeated deferred
+        write cannot overwrite a newer login.
+        
         Args:
             user_id (str): User's ID
+            email (str): User's email (the table's sort key)
+            last_login (str, optional): ISO timestamp, defaults to now
         """
+        last_login = last_login or datetime.now().isoformat()
         try:
             self.table.update_item(
                 Key={
-                    'user_id': user_id
-                    },
+                    'user_id': user_id,
+                    'email': email
+                },
                 UpdateExpression='SET last_login = :last_login',
+                ConditionExpression=(
+                    'attribute_exists(user_id) AND '
+                    '(attribute_not_exists(last_login) OR last_login < :last_login)'
+                ),
                 ExpressionAttributeValues={
-                    ':last_login': datetime.now().isoformat()
+                    ':last_login': last_login
                 }
             )
-        except ClientError:
-            # Log error or handle silently
-            pass
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise ValueError(f"Error updating last login: {e}")
+        finally:
+            self.invalidate_cached_user(user_id)
 
     def update_user(self, user_id: str, **params) -> UserModel:
         """
@@ -317,17 +488,15 @@ class UserDatabaseService:
         if not existing_user:
             raise ValueError(f"User with ID {user_id} does not exist")
         
-        # Check if updating email and it already exists
+        # Email is the table's sort key and cannot be updated in place
         if 'email' in params and params['email'] != existing_user.email:
-            existing_email = self._get_user_by_email(params['email'])
-            if existing_email:
-                raise EmailAlreadyExistsError("Email already exists")
+            raise ValueError("Email cannot be changed")
+        params.pop('email', None)
         
-        # Check if updating username and it already exists
-        if 'username' in params and params['username'] != existing_user.username:
-            existing_username = self._get_user_by_username(params['username'])
-            if existing_username:
-                raise ValueError("Username already exists")
+        # A new username must be reserved in the same write that sets it
+        new_username = params.get('username')
+        if new_username == existing_user.username:
+            new_username = None
         
         # Hash password if provided
         if 'password' in params:
@@ -351,18 +520,38 @@ class UserDatabaseService:
         
         update_expression = "SET " + ", ".join(update_expression_parts)
         
+        key = {
+            'user_id': user_id,
+            'email': existing_user.email
+        }
+        
         # Update user in DynamoDB
         try:
-            self.table.update_item(
-                Key={
-                    'user_id': user_id,
-                    'email': existing_user.email
-                    },
-                UpdateExpression=update_expression,
-                ExpressionAttributeValues=expression_attribute_values
-            )
+            if new_username:
+                # Swap the username guard items together with the update
+                transact_write(self.client, [
+                    {'Update': {
+                        'TableName': self.table.name,
+                        'Key': key,
+                        'UpdateExpression': update_expression,
+                        'ExpressionAttributeValues': expression_attribute_values
+                    }},
+                    self._put_guard(self._username_key(new_username), user_id),
+                    self._delete_guard(self._username_key(existing_user.username), user_id)
+                ])
+            else:
+                self.table.update_item(
+                    Key=key,
+                    UpdateExpression=update_expression,
+                    ExpressionAttributeValues=expression_attribute_values
+                )
         except ClientError as e:
+            reasons = cancellation_reasons(e) or []
+            if len(reasons) > 1 and reasons[1] == 'ConditionalCheckFailed':
+                raise ValueError("Username already exists")
             raise ValueError(f"Error updating user: {e}")
+        finally:
+            self.invalidate_cached_user(user_id)
         
         # Get and return updated user
         updated_user = self._get_user_by_user_id(user_id)
@@ -383,14 +572,22 @@ class UserDatabaseService:
         if not existing_user:
             raise ValueError(f"User with ID {user_id} does not exist")
         
-        # Delete user from DynamoDB
+        # Delete user from DynamoDB and release its email and username
         try:
-            self.table.delete_item(
-                Key={
-                    'user_id': user_id,
-                    'email': existing_user.email
-                }
-            )
+            transact_write(self.client, [
+                {'Delete': {
+                    'TableName': self.table.name,
+                    'Key': {
+                        'user_id': user_id,
+                        'email': existing_user.email
+                    }
+                }},
+                self._delete_guard(self._email_key(existing_user.email), user_id),
+                self._delete_guard(self._username_key(existing_user.username), user_id),
+                self._delete_guard(self._user_key(user_id), user_id)
+            ])
         except ClientError as e:
             raise ValueError(f"Error deleting user: {e}")
+        finally:
+            self.invalidate_cached_user(user_id)
         
\ No newline at end of file
@@ -14,6 +14,7 @@ from app.services.CommentTableDatabaseService import CommentDatabaseService
 from app.services.PollTableDatabaseService import PollDatabaseService
 from app.services.GroupTableDatabaseService import GroupDatabaseService
 from app.services.MediaDatabaseService import MediaDatabaseService
+from app.services.ReactionTableDatabaseService import ReactionDatabaseService
 
 logger = logging.getLogger(__name__)
 
@@ -27,23 +28,8 @@ def initialize_database_services(app=None):
     Args:
         app (Flask, optional): Flask uygulama örneği
     """
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
     config = app.config.get('DATABASE_CONFIG', {}) if app else {}
-
-    #prints the configs in yellow using ansi escape codes
-    print ("\033[93m" + str(config) + "\033[0m")
-    for handler in logger.handlers:
-        print(f"  - {handler.__class__.__name__}")
-        print(f"    Level: {logging.getLevelName(handler.level)}")
-        # If it's a FileHandler, you can also print the filename:
-        if isinstance(handler, logging.FileHandler):
-            print(f"    File: {handler.baseFilename}")
+    logger.debug(f"Veritabanı yapılandırması: {config}")
 
     try:
         # Veritabanı servislerini başlat
@@ -53,12 +39,15 @@ def initialize_database_services(app=None):
             ('comment', CommentDatabaseService),
             ('poll', PollDatabaseService),
             ('group', GroupDatabaseService),
-            ('media', MediaDatabaseService)
+            ('media', MediaDatabaseService),
+            ('reaction', ReactionDatabaseService)
         ]
         
         for service_name, ServiceClass in services:
             try:
-                service_instance = ServiceClass()
+                # Tekil (singleton) servisler, içe aktarma sırasında zaten oluşturulmuş olabilir
+                get_instance = getattr(ServiceClass, 'get_instance', None)
+                service_instance = get_instance() if get_instance else ServiceClass()
                 _database_services[service_name] = service_instance
                 logger.info(f"{service_name.capitalize()} veritabanı servisi başlatıldı")
             except Exception as service_error:
@@ -6,13 +6,14 @@ Handles user registration, login, and token management.
 
 import logging
 from datetime import datetime, timedelta
-from app.services.UserTableDatabaseService import UserDatabaseService, EmailAlreadyExistsError
-from app.utils.auth import hash_password, check_password, generate_token
-from app.utils.exceptions import AuthError, ValidationError, NotFoundError
+from app.services.UserTableDatabaseService import UserDatabaseService, EmailAlreadyExistsError, UsernameAlreadyExistsError
+from app.utils.auth import check_password, password_needs_rehash, generate_token
+from app.utils.exceptions import ApiError, AuthError, ValidationError, NotFoundError
+from app.tasks.deferred import defer
+from app.tasks.users import record_login
 from flask import current_app
 import jwt
 import uuid
-import traceback
 
 # Logger configuration
 logger = logging.getLogger(__name__)
@@ -28,9 +29,7 @@ class AuthService:
         self.user_db_service = UserDatabaseService.get_instance()
 
     def _generic_exception_handler(self, e):
-        logger.error(f"Error: {str(e)}")
-        logger.error(traceback.format_exc())
-        print (traceback.format_exc())
+        logger.exception(f"Error: {str(e)}")
         raise ValidationError("An error occurred")
     
     def email_exists(self, email):
@@ -64,6 +63,8 @@ class AuthService:
             }
         except EmailAlreadyExistsError:
             raise ValidationError("Bu e-posta adresi zaten kullanımda")
+        except (UsernameAlreadyExistsError, ApiError):
+            raise
         except Exception as e:
             logger.error(f"Kullanıcı kaydı sırasında hata: {str(e)}")
             self._generic_exception_handler(e)
@@ -86,14 +87,21 @@ class AuthService:
             if not user.is_active:
                 raise AuthError("Hesabınız devre dışı bırakılmış")
             
-            # Update last login
-            params = {
-                'last_login': datetime.now().isoformat()
-            }
-            self.user_db_service.update_user(
-                user_id=user.user_id,
-                **params
-            )
+            last_login = datetime.now().isoformat()
+            if password_needs_rehash(user.password_hash):
+                # Upgrade hashes made with a different work factor while the
+                # plaintext is at hand; it must not leave the request, so
+                # this write stays inline and carries last_login with it
+                self.user_db_service.update_user(
+                    user_id=user.user_id,
+                    password=password,
+                    last_login=last_login
+                )
+            else:
+                defer(
+                    record_login, user.user_id, user.email, last_login,
+                    idempotency_key=f"record_login:{user.user_id}:{last_login}"
+                )
             
             # Generate token
             token = generate_token(user.user_id)
@@ -103,7 +111,7 @@ class AuthService:
                 'token': token
             }
             
-        except AuthError:
+        except ApiError:
             raise
         except Exception as e:
             logger.error(f"Giriş sırasında hata: {str(e)}")
@@ -187,7 +195,7 @@ class AuthService:
             
             return True
             
-        except (NotFoundError, AuthError):
+        except ApiError:
             raise
         except Exception as e:
             logger.error(f"Password change error: {str(e)}")
@@ -292,7 +300,7 @@ class AuthService:
             
             return True
             
-        except AuthError:
+        except ApiError:
             raise
         except Exception as e:
             logger.error(f"Password reset error: {str(e)}")
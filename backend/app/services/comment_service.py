@@ -2,9 +2,26 @@ import logging
 from datetime import datetime
 from app.services.CommentTableDatabaseService import CommentDatabaseService
 from app.services.UserTableDatabaseService import UserDatabaseService
+from app.services.ReactionTableDatabaseService import ReactionDatabaseService
 from app.models.CommentModel import CommentModel
 from app.models.UserModel import UserModel
-import traceback
+from app.utils.exceptions import ValidationError
+from app.utils.concurrency import run_parallel
+from app.tasks.comments import link_reply
+from app.tasks.deferred import defer
+
+# Logger yapılandırması
+logger = logging.getLogger(__name__)
+
+def _with_reaction_counts(comments: list[CommentModel]) -> list[CommentModel]:
+    """Replace the stored like/dislike counts with the sharded totals"""
+    counts = ReactionDatabaseService.get_instance().get_counts_many(
+        [comment.comment_id for comment in comments]
+    )
+    for comment in comments:
+        for field, value in counts.get(comment.comment_id, {}).items():
+            setattr(comment, field, value)
+    return comments
 
 class CommentService:
 
@@ -39,8 +56,7 @@ class CommentService:
 
             return new_comment
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
-            logging.error(f"Comment creation failed: {e}")
+            logger.exception(f"Comment creation failed: {e}")
             raise e
         
     @staticmethod
@@ -56,11 +72,16 @@ class CommentService:
         """
         try:
             comment_db_service = CommentDatabaseService.get_instance()
-            comment = comment_db_service.get_comment_by_id(comment_id)
+            comment, counts = run_parallel(
+                lambda: comment_db_service.get_comment_by_id(comment_id),
+                lambda: ReactionDatabaseService.get_instance().get_counts(comment_id)
+            )
+            if comment:
+                comment.like_count = counts['like_count']
+                comment.dislike_count = counts['dislike_count']
             return comment
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
-            logging.error(f"Comment retrieval failed: {e}")
+            logger.exception(f"Comment retrieval failed: {e}")
             raise e
         
     @staticmethod
@@ -76,13 +97,48 @@ class CommentService:
         """
         try:
             comment_db_service = CommentDatabaseService.get_instance()
-            comments = comment_db_service.get_comments_by_commented_on_id(commented_on_id)
-            # prints the retrived commetns in orange color
-            print ('\033[33m' + str(comments) + '\033[0m', flush=True)
+            comments = _with_reaction_counts(
+                comment_db_service.get_comments_by_commented_on_id(commented_on_id)
+            )
             return comments
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
-            logging.error(f"Comments retrieval failed: {e}")
+            logger.exception(f"Comments retrieval failed: {e}")
+            raise e
+        
+    @staticmethod
+    def get_comment_thread(
+        commented_on_id: str,
+        per_page: int = 20,
+        cursor: str = None,
+        depth: int = 3
+    ) -> dict:
+        """
+        Retrieve a page of comments with their nested replies
+
+        Args:
+            commented_on_id (str): ID of the commented object
+            per_page (int): Top-level comments per page
+            cursor (str, optional): Continuation cursor
+            depth (int): Reply levels to load
+
+        Returns:
+            dict: Comments and pagination metadata
+
+        Raises:
+            ValidationError: If the cursor is invalid
+        """
+        try:
+            comment_db_service = CommentDatabaseService.get_instance()
+            return comment_db_service.get_comments_for_id(
+                commented_on_id,
+                per_page=per_page,
+                cursor=cursor,
+                depth=depth
+            )
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.exception(f"Comment thread retrieval failed: {e}")
             raise e
         
     @staticmethod
@@ -107,8 +163,7 @@ class CommentService:
             updated_comment = comment_db_service.update_comment(comment_id, creator_id, **kwargs)
             return updated_comment
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
-            logging.error(f"Comment update failed: {e}")
+            logger.exception(f"Comment update failed: {e}")
             raise e
         
     @staticmethod
@@ -127,8 +182,7 @@ class CommentService:
             comment_db_service = CommentDatabaseService.get_instance()
             comment_db_service.delete_comment(comment_id, user_id)
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
-            logging.error(f"Comment deletion failed: {e}")
+            logger.exception(f"Comment deletion failed: {e}")
             raise e
         
     @staticmethod
@@ -146,11 +200,10 @@ class CommentService:
         """
         try:
             comment_db_service = CommentDatabaseService.get_instance()
-            replies = comment_db_service.get_sub_comments(comment_id)
+            replies = _with_reaction_counts(comment_db_service.get_sub_comments(comment_id))
             return replies
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
-            logging.error(f"Comment replies retrieval failed: {e}")
+            logger.exception(f"Comment replies retrieval failed: {e}")
             raise e
         
     @staticmethod
@@ -175,8 +228,7 @@ class CommentService:
             comment_db_service = CommentDatabaseService.get_instance()
             return comment_db_service.react_to_comment(comment_id, user_id, reaction)
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
-            logging.error(f"Comment reaction failed: {e}")
+            logger.exception(f"Comment reaction failed: {e}")
             raise e
 
     @staticmethod
@@ -199,8 +251,7 @@ class CommentService:
                 raise Exception("User not found")
             return user.safe_dict()
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
-            logging.error(f"Creator information retrieval failed: {e}")
+            logger.exception(f"Creator information retrieval failed: {e}")
             raise e
 
     @staticmethod
@@ -222,23 +273,17 @@ class CommentService:
         """
         try:
             comment_db_service = CommentDatabaseService.get_instance()
-            reply_comment = comment_db_service.create_comment(
+            reply = comment_db_service.create_reply(
+                comment_id=comment_id,
                 user_id=creator_id,
-                commented_on_id=comment_id,
                 content=content,
                 photo_urls=photo_urls
             )
-            original_comment = comment_db_service.get_comment_by_id(comment_id)
-            original_comment.add_reply(reply_comment)
-            updated_comment = comment_db_service.update_comment(
-                comment_id,
-                original_comment.creator_id,
-                update_data=original_comment.to_dict()
-            )
-            return reply_comment
+            # The parent's reply list is denormalized after the response
+            defer(link_reply, comment_id, reply.to_dict(), idempotency_key=f"link_reply:{reply.comment_id}")
+            return reply
         
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
-            logging.error(f"Reply creation failed: {e}")
+            logger.exception(f"Reply creation failed: {e}")
             raise e
         
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Akış Servisi
+----------
+Sıcak akıştaki forum ve anket kimliklerini sıralı öğelere dönüştürür.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from app.feed import get_hot_feed
+from app.models.ForumModel import ForumModel
+from app.models.PollModel import PollModel
+from app.services.ReactionTableDatabaseService import ReactionDatabaseService
+from app.services.schema import FORUMS_TABLE_NAME, POLLS_TABLE_NAME
+from app.storage import get_dynamodb
+from app.utils.concurrency import run_parallel
+from app.utils.dynamodb import batch_get_items
+from app.utils.pagination import encode_cursor, decode_cursor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
+HOT_CURSOR_NAME = 'hot'
+
+
+def _read_items(table_name: str, id_key: str, item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Kimlikleri verilen etkin öğeleri BatchGetItem ile okur."""
+    if not item_ids:
+        return {}
+    try:
+        items = batch_get_items(
+            get_dynamodb(DEFAULT_REGION), table_name,
+            [{id_key: item_id} for item_id in item_ids]
+        )
+    except ClientError:
+        logger.exception("Akış öğeleri okunamadı")
+        return {}
+    return {item[id_key]: item for item in items if item.get('is_active', True)}
+
+
+class FeedService:
+
+    @staticmethod
+    def get_hot_feed(
+        per_page: int = 20,
+        cursor: Optional[str] = None,
+        university: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Sıcak akışın bir sayfasını döndürür.
+
+        Öğeler puana göre sıralıdır; forumlar ve anketler paralel, tablo
+        başına tek BatchGetItem ile okunur.
+
+        Args:
+            per_page (int): Sayfa başına öğe
+            cursor (str, optional): Önceki sayfanın imleci
+            university (str, optional): Üniversite; verilmezse tüm üniversiteler
+
+        Returns:
+            Dict: 'items' (type ve hot_score alanlı forum/anket sözlükleri) ve 'meta'
+
+        Raises:
+            ValidationError: İmleç geçersizse
+        """
+        offset = int((decode_cursor(cursor, HOT_CURSOR_NAME) or {}).get('offset', 0))
+        entries, total = get_hot_feed().top(university, per_page, offset)
+
+        forum_ids = [item_id for item_id, _ in entries if item_id.startswith('frm_')]
+        poll_ids = [item_id for item_id, _ in entries if item_id.startswith('pol_')]
+        forums, polls = run_parallel(
+            lambda: _read_items(FORUMS_TABLE_NAME, 'forum_id', forum_ids),
+            lambda: _read_items(POLLS_TABLE_NAME, 'poll_id', poll_ids)
+        )
+
+        forum_dicts = {forum_id: ForumModel(**item).to_dict() for forum_id, item in forums.items()}
+        ReactionDatabaseService.get_instance().apply_counts(list(forum_dicts.values()), 'forum_id')
+        poll_dicts = {poll_id: PollModel(**item).to_dict() for poll_id, item in polls.items()}
+
+        items = []
+        for item_id, score in entries:
+            if item_id in forum_dicts:
+                items.append(dict(forum_dicts[item_id], type='forum', hot_score=round(score, 4)))
+            elif item_id in poll_dicts:
+                items.append(dict(poll_dicts[item_id], type='poll', hot_score=round(score, 4)))
+
+        next_offset = offset + len(entries)
+        return {
+            'items': items,
+            'meta': {
+                'per_page': per_page,
+                'next_cursor': encode_cursor({'offset': next_offset}, HOT_CURSOR_NAME) if next_offset < total else None
+            }
+        }
@@ -8,9 +8,11 @@ import logging
 from datetime import datetime
 from app.services.ForumTableDatabaseService import ForumDatabaseService
 from app.services.UserTableDatabaseService import UserDatabaseService
+from app.services.ReactionTableDatabaseService import ReactionDatabaseService
 from app.models.ForumModel import ForumModel
 from app.models.UserModel import UserModel
-import traceback
+from app.utils.exceptions import ApiError, ValidationError
+from app.utils.concurrency import run_parallel
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -27,7 +29,8 @@ class ForumService:
         try:
             forum_db_service = ForumDatabaseService.get_instance()
             user_db_service = UserDatabaseService.get_instance()
-            user = user_db_service._get_user_by_user_id(creator_id)
+            # The forum needs the creator's university; the cache usually saves the read
+            user = user_db_service.get_cached_user(creator_id)
             if not user:
                 raise Exception("Kullanıcı bulunamadı")
             
@@ -45,38 +48,49 @@ class ForumService:
             else:
                 raise Exception("Forum yaratılamadı")
         except Exception as e:
-            traceback.print_exc()
+            logger.exception("Forum yaratırıken bir hata oluştu")
             raise Exception("Forum yaratırıken bir hata oluştu")
         
     @staticmethod
     def get_forums(
-                    page: int = 1,
                     per_page: int = 10,
+                    cursor: str = None,
                     category: str = "",
                     university: str = "",
                     search: str = ""):
         try:
             forum_db_service = ForumDatabaseService.get_instance()
             forums = forum_db_service.get_forums(
-                page=page,
                 per_page=per_page,
+                cursor=cursor,
                 category=category,
                 university=university,
                 search=search
             )
+            ReactionDatabaseService.get_instance().apply_counts(forums['forums'], 'forum_id')
             return forums
+        except ValidationError:
+            raise
         except Exception as e:
-            traceback.print_exc()
+            logger.exception("Forumlar getirilirken bir hata oluştu")
             raise Exception("Forumlar getirilirken bir hata oluştu")
         
     @staticmethod
     def get_forum_by_id(forum_id: str):
         try:
             forum_db_service = ForumDatabaseService.get_instance()
-            forum = forum_db_service.get_forum_by_id(forum_id)
+            forum, counts = run_parallel(
+                lambda: forum_db_service.get_forum_by_id(forum_id),
+                lambda: ReactionDatabaseService.get_instance().get_counts(forum_id)
+            )
+            if forum:
+                forum.like_count = counts['like_count']
+                forum.dislike_count = counts['dislike_count']
             return forum
+        except ApiError:
+            raise
         except Exception as e:
-            traceback.print_exc()
+            logger.exception("Forum getirilirken bir hata oluştu")
             raise Exception("Forum getirilirken bir hata oluştu")
         
     @staticmethod
@@ -86,7 +100,7 @@ class ForumService:
             forum = forum_db_service.update_forum(forum_id, **kwargs)
             return forum
         except Exception as e:
-            traceback.print_exc()                        
+            logger.exception("Forum güncellenirken bir hata oluştu")
             raise Exception("Forum güncellenirken bir hata oluştu")
         
     @staticmethod
@@ -95,7 +109,7 @@ class ForumService:
             forum_db_service = ForumDatabaseService.get_instance()
             forum_db_service.delete_forum(forum_id)
         except Exception as e:
-            traceback.print_exc()
+            logger.exception("Forum silinirken bir hata oluştu")
             raise Exception("Forum silinirken bir hata oluştu")
         
     @staticmethod
@@ -109,5 +123,16 @@ class ForumService:
                 raise Exception("Kullanıcı bulunamadı")
             return user.safe_dict()
         except Exception as e:
-            traceback.print_exc()
-            raise Exception("Forum yaratıcısı getirilirken bir hata oluştu")
\ No newline at end of file
+            logger.exception("Forum yaratıcısı getirilirken bir hata oluştu")
+            raise Exception("Forum yaratıcısı getirilirken bir hata oluştu")
+
+    @staticmethod
+    def react_to_forum(forum_id: str, user_id: str, reaction: str):
+        try:
+            forum_db_service = ForumDatabaseService.get_instance()
+            return forum_db_service.react_to_forum(forum_id, user_id, reaction)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.exception("Reaksiyon eklenirken bir hata oluştu")
+            raise Exception("Reaksiyon eklenirken bir hata oluştu")
@@ -1,11 +1,45 @@
+"""
+Medya Servisi
+-----------
+S3 üzerinde medya dosyalarını yönetir.
+
+Doğrudan yükleme akışında dosya Flask worker'ından geçmez: create_upload
+içerik türü ve boyut koşullarını S3'ün kendisinin uyguladığı imzalı bir POST
+formu üretir, istemci dosyayı doğrudan S3'e gönderir ve complete_upload ile
+bildirir. Böylece yavaş bir istemci yükleme boyunca worker tutmaz.
+"""
+
 import os
-import boto3
 import uuid
 from botocore.exceptions import ClientError
-import traceback
+
+from app.services.MediaDatabaseService import MediaDatabaseService, MEDIA_READY
+from app.utils.aws import get_client
+from app.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
+from app.utils.cache import TTLCache
+from app.utils.images import IMAGE_EXTENSIONS, IMAGE_VARIANTS, media_id_from_key
+from app.utils.log import get_logger
+from app.utils.s3 import presigned_url_cache
 
 DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
 DEFAULT_BUCKET = os.getenv('S3_BUCKET_NAME')
+# Doğrudan yüklemede kabul edilen en büyük dosya (bayt)
+MEDIA_MAX_UPLOAD_BYTES = int(os.getenv('MEDIA_MAX_UPLOAD_BYTES', str(16 * 1024 * 1024)))
+# İmzalı yükleme formunun geçerlilik süresi (saniye)
+MEDIA_UPLOAD_URL_EXPIRES = int(os.getenv('MEDIA_UPLOAD_URL_EXPIRES', '300'))
+# Doğrudan yüklemede izin verilen içerik türleri ve nesne uzantıları
+UPLOAD_CONTENT_TYPES = {
+    'image/png': 'png',
+    'image/jpeg': 'jpg'
+}
+# Yüklenen görseller için arka planda türev (thumb, medium, WebP) üretilsin mi
+IMAGE_DERIVATIVES_ENABLED = os.getenv('IMAGE_DERIVATIVES_ENABLED', 'true').lower() == 'true'
+# Kaydedilmiş türevlerin önbellekte tutulma süresi (saniye); türevi henüz
+# olmayan görseller daha kısa süre tutulur ki üretilince hızla görünsün
+MEDIA_VARIANTS_CACHE_TTL = float(os.getenv('MEDIA_VARIANTS_CACHE_TTL', '300'))
+MEDIA_VARIANTS_PENDING_TTL = float(os.getenv('MEDIA_VARIANTS_PENDING_TTL', '15'))
+
+logger = get_logger(__name__)
 
 class MediaService:
 
@@ -25,10 +59,11 @@ class MediaService:
             raise Exception("This class is a singleton!")
         else:
             MediaService.__instance = self
-        self.s3 = boto3.client("s3", region_name=region)
+        self.s3 = get_client("s3", region_name=region)
         self.region = region
         self.s3_bucket = s3_bucket
         self.s3_public = s3_public
+        self._variants_cache = TTLCache(maxsize=4096, ttl=MEDIA_VARIANTS_CACHE_TTL)
         return
     
     def allowed_file(self, filename: str) -> bool:
@@ -43,36 +78,229 @@ class MediaService:
     def generate_presigned_url(self, s3_key, expires_in=3600):
         """
         Helper method to generate a presigned URL for a private S3 object.
+        The URL is reused until it nears expiry (see PresignedUrlCache).
         """
+        return presigned_url_cache.get_url(self.s3, self.s3_bucket, s3_key, expires_in)
+
+    def file_url(self, s3_key: str) -> str:
+        """
+        Returns the public URL of an object, or a presigned URL if the bucket is private.
+        """
+        if self.s3_public:
+            return f"https://{self.s3_bucket}.s3.{self.region}.amazonaws.com/{s3_key}"
+        return self.generate_presigned_url(s3_key)
+
+    def recorded_variants(self, s3_key: str) -> dict:
+        """
+        Türev görevinin medya kaydına yazdığı türev anahtarlarını döndürür.
+
+        Sonuç önbelleğe alınır; kaydı olmayan (ör. medya kaydı tutulmadan
+        önce yüklenen) veya türevi henüz üretilmemiş görseller için boş sözlük döner.
+
+        Args:
+            s3_key (str): Orijinal görselin anahtarı
+
+        Returns:
+            dict: Türev adı -> {uzantı: anahtar}
+        """
+        recorded = self._variants_cache.get(s3_key)
+        if recorded is not None:
+            return recorded
+
+        recorded = {}
+        media_id = media_id_from_key(s3_key)
+        if media_id:
+            try:
+                media = MediaDatabaseService.get_instance().get_media(media_id)
+            except ValueError:
+                logger.exception("media_variants_lookup_failed", key=s3_key)
+                return {}
+            if media is not None and media.depolama_yolu == s3_key:
+                recorded = media.varyantlar or {}
+        self._variants_cache.set(s3_key, recorded, None if recorded else MEDIA_VARIANTS_PENDING_TTL)
+        return recorded
+
+    def variant_urls(self, s3_key: str, varyantlar: dict = None) -> dict:
+        """
+        Returns the WebP derivative URLs of an image object ({} for non-images).
+
+        Only derivatives recorded on the media item are advertised; the others
+        point at the original until the derivative task has written them.
+        """
+        if s3_key.rsplit('.', 1)[-1].lower() not in IMAGE_EXTENSIONS:
+            return {}
+        if varyantlar is None:
+            varyantlar = self.recorded_variants(s3_key)
+        return {
+            name: self.file_url(varyantlar[name]['webp'] if 'webp' in varyantlar.get(name, {}) else s3_key)
+            for name in IMAGE_VARIANTS
+        }
+
+    def request_derivatives(self, s3_key: str, media_id: str = None):
+        """
+        Görselin türevlerini üretecek arka plan görevini kuyruğa ekler.
+
+        Türevler isteğe bağlıdır: kuyruğa yazılamazsa yükleme yine başarılı
+        sayılır, yanıtlar orijinali kullanmaya devam edebilir.
+
+        Args:
+            s3_key (str): Orijinal görselin anahtarı
+            media_id (str, optional): Türevlerin kaydedileceği medya kaydı
+        """
+        if not IMAGE_DERIVATIVES_ENABLED or s3_key.rsplit('.', 1)[-1].lower() not in IMAGE_EXTENSIONS:
+            return
+        # Görev modülü bu servisi içe aktarır
+        from app.tasks.media import generate_image_derivatives
         try:
-            response = self.s3.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.s3_bucket, 'Key': s3_key},
-                ExpiresIn=expires_in
-            )
-        except ClientError as e:
-            raise e
-        return response
+            generate_image_derivatives.delay(s3_key, media_id)
+        except Exception:
+            logger.exception("image_derivatives_enqueue_failed", key=s3_key)
+
+    def create_upload(self,
+                      user_id: str,
+                      content_type: str,
+                      size: int = None,
+                      filename: str = '',
+                      metadata=None) -> dict:
+        """
+        İstemcinin dosyayı doğrudan S3'e yükleyeceği imzalı POST formunu üretir.
+
+        İçerik türü ve boyut sınırı imzalı politikaya yazılır; S3 bunlara
+        uymayan yüklemeyi reddeder. Medya kaydı 'beklemede' durumunda oluşturulur.
+
+        Args:
+            user_id (str): Yükleyen kullanıcı ID'si
+            content_type (str): Dosyanın içerik türü
+            size (int, optional): İstemcinin bildirdiği dosya boyutu (bayt); verilirse sınır olarak kullanılır
+            filename (str, optional): İstemcideki dosya adı
+            metadata (dict, optional): model_type, model_id, description
+
+        Returns:
+            dict: media_id, s3_key, upload (url ve fields) ve expires_in
+
+        Raises:
+            ValidationError: İçerik türü veya boyut kabul edilmiyorsa
+        """
+        metadata = metadata or {}
+        extension = UPLOAD_CONTENT_TYPES.get(content_type)
+        if extension is None:
+            raise ValidationError("Geçersiz dosya türü", {'content_type': sorted(UPLOAD_CONTENT_TYPES)})
+        if size is not None and not 0 < size <= MEDIA_MAX_UPLOAD_BYTES:
+            raise ValidationError(f"Dosya boyutu en fazla {MEDIA_MAX_UPLOAD_BYTES} bayt olabilir")
+        max_size = size or MEDIA_MAX_UPLOAD_BYTES
+
+        media_id = f"med_{uuid.uuid4()}"
+        model_type = metadata.get('model_type', 'general')
+        s3_key = f"{model_type}/{user_id}/{media_id}.{extension}"
+
+        upload = self.s3.generate_presigned_post(
+            Bucket=self.s3_bucket,
+            Key=s3_key,
+            Fields={'Content-Type': content_type},
+            Conditions=[
+                {'Content-Type': content_type},
+                ['content-length-range', 1, max_size]
+            ],
+            ExpiresIn=MEDIA_UPLOAD_URL_EXPIRES
+        )
+
+        MediaDatabaseService.get_instance().create_pending_media(
+            media_id=media_id,
+            user_id=user_id,
+            s3_key=s3_key,
+            mime_type=content_type,
+            max_size=max_size,
+            orijinal_dosya_adi=filename or '',
+            ilgili_model=metadata.get('model_type'),
+            ilgili_id=metadata.get('model_id'),
+            description=metadata.get('description')
+        )
+
+        return {
+            'media_id': media_id,
+            's3_key': s3_key,
+            'upload': upload,
+            'expires_in': MEDIA_UPLOAD_URL_EXPIRES
+        }
+
+    def complete_upload(self, media_id: str, user_id: str) -> dict:
+        """
+        Doğrudan yüklemenin bittiğini kaydeder.
+
+        Nesne S3'te aranır, içerik türü ve boyutu kayıttaki koşullarla
+        karşılaştırılır; uymayan nesne silinir. Tekrarlanan çağrılar aynı
+        kaydı döndürür.
+
+        Args:
+            media_id (str): create_upload'ın döndürdüğü medya ID'si
+            user_id (str): Yükleyen kullanıcı ID'si
+
+        Returns:
+            dict: Medya kaydı (url dahil)
+
+        Raises:
+            NotFoundError: Kayıt yoksa
+            ForbiddenError: Kayıt başka bir kullanıcıya aitse
+            ValidationError: Dosya yüklenmemişse veya koşullara uymuyorsa
+        """
+        media_db = MediaDatabaseService.get_instance()
+        media = media_db.get_media(media_id)
+        if media is None:
+            raise NotFoundError("Medya bulunamadı")
+        if media.yukleyen_id != user_id:
+            raise ForbiddenError("Bu medyayı tamamlama yetkiniz yok")
+
+        if media.durum != MEDIA_READY:
+            try:
+                head = self.s3.head_object(Bucket=self.s3_bucket, Key=media.depolama_yolu)
+            except ClientError as e:
+                if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                    raise ValidationError("Dosya henüz yüklenmedi")
+                raise
+
+            size = int(head.get('ContentLength', 0))
+            max_size = int(media.meta_data.get('max_boyut', MEDIA_MAX_UPLOAD_BYTES))
+            if head.get('ContentType') != media.mime_type or not 0 < size <= max_size:
+                # İmzalı politika bunu engeller; yine de koşula uymayan nesne
+                # tutulmaz. Kayıt hemen, nesne istekten sonra silinir.
+                from app.tasks.deferred import defer
+                from app.tasks.media import delete_media_objects
+                media_db.delete_media(media_id)
+                defer(delete_media_objects, media.depolama_yolu, idempotency_key=f"delete:{media.depolama_yolu}")
+                raise ValidationError("Yüklenen dosya izin verilen tür veya boyutta değil")
+
+            stored_url = self.file_url(media.depolama_yolu) if self.s3_public else ''
+            if media_db.mark_media_ready(media_id, user_id, size, stored_url):
+                self.request_derivatives(media.depolama_yolu, media_id)
+            media = media_db.get_media(media_id)
+
+        result = media.to_dict()
+        result['url'] = self.file_url(media.depolama_yolu)
+        result['variants'] = self.variant_urls(media.depolama_yolu, media.varyantlar)
+        return result
 
     def upload_file(self,
                     file_obj,
                     user_id,
                     metadata=None):
         """
-        Uploads a single file to S3.
+        Uploads a single file to S3 and records it as a ready media item.
+        The object is keyed by its media ID so derivatives can be recorded on it.
         :param file_obj: File object to upload
         :param user_id: Uploader ID
         :param metadata: Metadata for the file
-        :return: A dictionary containing the key and the S3 URL or presigned URL
+        :return: A dictionary containing the media ID, the key and the S3 URL or presigned URL
         """
-
-        print (f"Uploading file: {file_obj}", flush=True)
-
+        metadata = metadata or {}
         extension = file_obj.filename.rsplit('.', 1)[-1] if '.' in file_obj.filename else ''
-        random_filename = f"{uuid.uuid4()}.{extension}"
+        media_id = f"med_{uuid.uuid4()}"
         model_type = metadata.get('model_type', 'general')
 
-        s3_key = f"{model_type}/{user_id}/{random_filename}"
+        s3_key = f"{model_type}/{user_id}/{media_id}.{extension}"
+
+        file_obj.seek(0, os.SEEK_END)
+        size = file_obj.tell()
+        file_obj.seek(0)
 
         try:
             extra_args = {}
@@ -82,19 +310,29 @@ class MediaService:
                 Key=s3_key,
                 ExtraArgs=extra_args
             )
-        except ClientError as e:
-            print (traceback.format_exc(), flush=True)
-            raise Exception(f"An error occurred while uploading the file: {e}")
         except Exception as e:
-            print (traceback.format_exc(), flush=True)
+            logger.exception("s3_upload_failed", bucket=self.s3_bucket, key=s3_key)
             raise Exception(f"An error occurred while uploading the file: {e}")
-        
-        if self.s3_public:
-            file_url = f"https://{self.s3_bucket}.s3.{self.region}.amazonaws.com/{s3_key}"
-        else:
-            file_url = self.generate_presigned_url(s3_key)
+
+        media_db = MediaDatabaseService.get_instance()
+        media_db.create_pending_media(
+            media_id=media_id,
+            user_id=user_id,
+            s3_key=s3_key,
+            mime_type=file_obj.mimetype or 'application/octet-stream',
+            max_size=size,
+            orijinal_dosya_adi=file_obj.filename,
+            ilgili_model=metadata.get('model_type'),
+            ilgili_id=metadata.get('model_id'),
+            description=metadata.get('description')
+        )
+        stored_url = self.file_url(s3_key) if self.s3_public else ''
+        media_db.mark_media_ready(media_id, user_id, size, stored_url)
+        self.request_derivatives(s3_key, media_id)
 
         return {
+            'media_id': media_id,
             's3_key': s3_key,
-            'url': file_url
+            'url': self.file_url(s3_key),
+            'variants': self.variant_urls(s3_key, {})
         }
\ No newline at end of file
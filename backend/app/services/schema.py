@@ -0,0 +1,252 @@
+"""
+Veritabanı Şeması
+---------------
+Tüm DynamoDB tablolarının anahtar ve GSI tanımları ile tabloları
+oluşturan/güncelleyen şema kurulumu (bootstrap).
+"""
+
+import logging
+import os
+import time
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+USERS_TABLE_NAME = os.getenv('USERS_TABLE_NAME', 'Users')
+USER_KEYS_TABLE_NAME = os.getenv('USER_KEYS_TABLE_NAME', 'UserKeys')
+FORUMS_TABLE_NAME = os.getenv('FORUMS_TABLE_NAME', 'Forums')
+COMMENTS_TABLE_NAME = os.getenv('COMMENTS_TABLE_NAME', 'Comments')
+POLLS_TABLE_NAME = os.getenv('POLLS_TABLE_NAME', 'Polls')
+POLL_VOTES_TABLE_NAME = os.getenv('POLL_VOTES_TABLE_NAME', 'PollVotes')
+GROUPS_TABLE_NAME = os.getenv('GROUPS_TABLE_NAME', 'Groups')
+GROUP_MEMBERSHIPS_TABLE_NAME = os.getenv('GROUP_MEMBERSHIPS_TABLE_NAME', 'GroupMemberships')
+GROUP_NAMES_TABLE_NAME = os.getenv('GROUP_NAMES_TABLE_NAME', 'GroupNames')
+MEDIA_TABLE_NAME = os.getenv('MEDIA_TABLE_NAME', 'Media')
+REACTIONS_TABLE_NAME = os.getenv('REACTIONS_TABLE_NAME', 'Reactions')
+REACTION_COUNTERS_TABLE_NAME = os.getenv('REACTION_COUNTERS_TABLE_NAME', 'ReactionCounters')
+USERNAME_COUNTERS_TABLE_NAME = os.getenv('USERNAME_COUNTERS_TABLE_NAME', 'UsernameCounters')
+TASK_KEYS_TABLE_NAME = os.getenv('TASK_KEYS_TABLE_NAME', 'TaskKeys')
+
+# GSI adları; servisler sorgularında bu adları kullanır
+USERS_EMAIL_INDEX_NAME = os.getenv('USERS_EMAIL_INDEX_NAME', 'email-index')
+USERS_USERNAME_INDEX_NAME = os.getenv('USERS_USERNAME_INDEX_NAME', 'username-index')
+FORUMS_CATEGORY_INDEX_NAME = os.getenv('FORUMS_CATEGORY_INDEX_NAME', 'category-created_at-index')
+FORUMS_UNIVERSITY_INDEX_NAME = os.getenv('FORUMS_UNIVERSITY_INDEX_NAME', 'university-created_at-index')
+COMMENTS_COMMENTED_ON_INDEX_NAME = os.getenv('COMMENTS_COMMENTED_ON_INDEX_NAME', 'commented_on_id-index')
+MEMBERSHIPS_STATUS_ROLE_INDEX_NAME = os.getenv('MEMBERSHIPS_STATUS_ROLE_INDEX_NAME', 'group_id-durum_rol-index')
+MEMBERSHIPS_USER_INDEX_NAME = os.getenv('MEMBERSHIPS_USER_INDEX_NAME', 'user_id-index')
+
+
+def _key_schema(hash_key: str, range_key: str = None) -> List[Dict[str, str]]:
+    """Anahtar şeması listesini oluşturur."""
+    schema = [{'AttributeName': hash_key, 'KeyType': 'HASH'}]
+    if range_key:
+        schema.append({'AttributeName': range_key, 'KeyType': 'RANGE'})
+    return schema
+
+
+def _gsi(index_name: str, hash_key: str, range_key: str = None) -> Dict[str, any]:
+    """Tüm öznitelikleri yansıtan (ALL projection) bir GSI tanımı oluşturur."""
+    return {
+        'IndexName': index_name,
+        'KeySchema': _key_schema(hash_key, range_key),
+        'Projection': {'ProjectionType': 'ALL'}
+    }
+
+
+def _table(
+    table_name: str,
+    hash_key: str,
+    range_key: str = None,
+    indexes: List[Dict[str, any]] = None,
+    attribute_types: Dict[str, str] = None
+) -> Dict[str, any]:
+    """
+    create_table parametreleri biçiminde tablo tanımı oluşturur.
+
+    Args:
+        table_name (str): Tablo adı
+        hash_key (str): Bölüm (partition) anahtarı
+        range_key (str, optional): Sıralama anahtarı
+        indexes (list, optional): GSI tanımları
+        attribute_types (dict, optional): 'S' dışındaki anahtar tipleri
+
+    Returns:
+        dict: Tablo tanımı
+    """
+    attribute_types = attribute_types or {}
+    indexes = indexes or []
+
+    key_attributes = [hash_key] + ([range_key] if range_key else [])
+    for index in indexes:
+        key_attributes.extend(key['AttributeName'] for key in index['KeySchema'])
+
+    definition = {
+        'TableName': table_name,
+        'KeySchema': _key_schema(hash_key, range_key),
+        'AttributeDefinitions': [
+            {'AttributeName': name, 'AttributeType': attribute_types.get(name, 'S')}
+            for name in dict.fromkeys(key_attributes)
+        ],
+        'BillingMode': 'PAY_PER_REQUEST'
+    }
+    if indexes:
+        definition['GlobalSecondaryIndexes'] = indexes
+    return definition
+
+
+# Uygulamanın kullandığı tüm tablolar
+TABLE_DEFINITIONS = [
+    _table(
+        USERS_TABLE_NAME, 'user_id', 'email',
+        indexes=[
+            _gsi(USERS_EMAIL_INDEX_NAME, 'email'),
+            _gsi(USERS_USERNAME_INDEX_NAME, 'username')
+        ]
+    ),
+    # Benzersizlik kayıtları: 'email#<e-posta>', 'username#<kullanıcı adı>'
+    # ve Users tablosunun tam anahtarını veren 'user#<user_id>'
+    _table(USER_KEYS_TABLE_NAME, 'lookup_key'),
+    _table(
+        FORUMS_TABLE_NAME, 'forum_id',
+        indexes=[
+            _gsi(FORUMS_CATEGORY_INDEX_NAME, 'category', 'created_at'),
+            _gsi(FORUMS_UNIVERSITY_INDEX_NAME, 'university', 'created_at')
+        ]
+    ),
+    _table(
+        COMMENTS_TABLE_NAME, 'comment_id',
+        indexes=[_gsi(COMMENTS_COMMENTED_ON_INDEX_NAME, 'commented_on_id')]
+    ),
+    _table(POLLS_TABLE_NAME, 'poll_id'),
+    # Kullanıcı başına tek oy kaydı
+    _table(POLL_VOTES_TABLE_NAME, 'poll_id', 'user_id'),
+    _table(GROUPS_TABLE_NAME, 'group_id'),
+    # Grup başına üye kayıtları; durum_rol = '<durum>#<rol>' (ör. 'aktif#yonetici')
+    _table(
+        GROUP_MEMBERSHIPS_TABLE_NAME, 'group_id', 'user_id',
+        indexes=[
+            _gsi(MEMBERSHIPS_STATUS_ROLE_INDEX_NAME, 'group_id', 'durum_rol'),
+            _gsi(MEMBERSHIPS_USER_INDEX_NAME, 'user_id')
+        ]
+    ),
+    # Grup adı benzersizlik kayıtları; anahtar group_name_key(grup_adi)
+    _table(GROUP_NAMES_TABLE_NAME, 'name_key'),
+    _table(MEDIA_TABLE_NAME, 'media_id'),
+    # Kullanıcı başına tek reaksiyon kaydı
+    _table(REACTIONS_TABLE_NAME, 'target_id', 'user_id'),
+    # Hedef başına REACTION_COUNTER_SHARDS adet sayaç parçası
+    _table(
+        REACTION_COUNTERS_TABLE_NAME, 'target_id', 'shard',
+        attribute_types={'shard': 'N'}
+    ),
+    # Üniversite başına kullanıcı adı atama sayacı (app.utils.username)
+    _table(USERNAME_COUNTERS_TABLE_NAME, 'university'),
+    # Ertelenmiş görevlerin idempotency anahtarları (app.tasks.deferred)
+    _table(TASK_KEYS_TABLE_NAME, 'idempotency_key'),
+]
+
+# Tablo -> DynamoDB TTL özniteliği (süresi geçen öğeler kendiliğinden silinir)
+TIME_TO_LIVE_ATTRIBUTES = {
+    TASK_KEYS_TABLE_NAME: 'expires_at'
+}
+
+
+def get_table_definition(table_name: str) -> Dict[str, any]:
+    """
+    Tablo adına göre tanımı döndürür.
+
+    Args:
+        table_name (str): Tablo adı
+
+    Returns:
+        dict: Tablo tanımı
+
+    Raises:
+        KeyError: Tablo tanımlı değilse
+    """
+    for definition in TABLE_DEFINITIONS:
+        if definition['TableName'] == table_name:
+            return definition
+    raise KeyError(f"Tablo tanımı bulunamadı: {table_name}")
+
+
+def create_tables(client, wait: bool = True) -> Dict[str, str]:
+    """
+    Eksik tabloları oluşturur, mevcut tablolara eksik GSI'ları ekler.
+
+    İşlem idempotent'tir; tekrar çalıştırmak güvenlidir.
+
+    Args:
+        client: boto3 DynamoDB client'ı
+        wait (bool): Oluşturulan tabloların aktif olmasını bekle
+
+    Returns:
+        dict: Tablo adı -> yapılan işlem ('created', 'updated', 'exists')
+    """
+    results = {}
+
+    for definition in TABLE_DEFINITIONS:
+        table_name = definition['TableName']
+
+        try:
+            description = client.describe_table(TableName=table_name)['Table']
+        except client.exceptions.ResourceNotFoundException:
+            logger.info(f"Tablo oluşturuluyor: {table_name}")
+            client.create_table(**definition)
+            if wait:
+                client.get_waiter('table_exists').wait(TableName=table_name)
+            # Yerel SQLite motoru TTL desteklemez; süre kontrolü okuyan kodda da yapılır
+            if table_name in TIME_TO_LIVE_ATTRIBUTES and hasattr(client, 'update_time_to_live'):
+                client.update_time_to_live(
+                    TableName=table_name,
+                    TimeToLiveSpecification={
+                        'Enabled': True,
+                        'AttributeName': TIME_TO_LIVE_ATTRIBUTES[table_name]
+                    }
+                )
+            results[table_name] = 'created'
+            continue
+
+        existing = {
+            index['IndexName']
+            for index in description.get('GlobalSecondaryIndexes', [])
+        }
+        missing = [
+            index for index in definition.get('GlobalSecondaryIndexes', [])
+            if index['IndexName'] not in existing
+        ]
+
+        # DynamoDB tek bir update_table çağrısında yalnızca bir GSI oluşturabilir
+        for index in missing:
+            logger.info(f"GSI ekleniyor: {table_name}.{index['IndexName']}")
+            index_attributes = {key['AttributeName'] for key in index['KeySchema']}
+            client.update_table(
+                TableName=table_name,
+                AttributeDefinitions=[
+                    attribute for attribute in definition['AttributeDefinitions']
+                    if attribute['AttributeName'] in index_attributes
+                ],
+                GlobalSecondaryIndexUpdates=[{'Create': index}]
+            )
+            if wait:
+                _wait_for_indexes(client, table_name)
+
+        results[table_name] = 'updated' if missing else 'exists'
+
+    return results
+
+
+def _wait_for_indexes(client, table_name: str, delay: float = 5.0, max_attempts: int = 120):
+    """Tablonun tüm GSI'ları ACTIVE olana kadar bekler."""
+    for _ in range(max_attempts):
+        description = client.describe_table(TableName=table_name)['Table']
+        statuses = [
+            index.get('IndexStatus')
+            for index in description.get('GlobalSecondaryIndexes', [])
+        ]
+        if all(status == 'ACTIVE' for status in statuses):
+            return
+        time.sleep(delay)
+
+    raise TimeoutError(f"{table_name} index'leri aktif olmadı")
@@ -0,0 +1,107 @@
+"""
+Depolama Katmanı
+--------------
+Veritabanı servislerinin bağlı olduğu tablo arayüzünü seçer.
+
+Servisler DynamoDB resource API'sinin bir alt kümesini kullanır
+(Table(...).get_item/put_item/update_item/delete_item/query/scan/batch_writer,
+resource.batch_get_item ve meta.client.transact_write_items). STORAGE_BACKEND
+ortam değişkeni bu arayüzün uygulamasını belirler:
+
+    dynamodb (varsayılan): app.utils.aws üzerinden paylaşılan boto3 resource'u
+    sqlite: app.storage.sqlite motoru; SQLITE_PATH dosyasında (WAL modu)
+        tek sunuculu kurulumlar ve çevrimdışı testler için
+    paket.modul:fonksiyon: region_name alıp resource döndüren fabrika
+        (ör. benchmark'lardaki gecikme enjekte eden sahte motor)
+"""
+
+import os
+import threading
+from importlib import import_module
+from typing import Callable, Dict
+
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'dynamodb').strip()
+if ':' not in STORAGE_BACKEND:
+    STORAGE_BACKEND = STORAGE_BACKEND.lower()
+SQLITE_PATH = os.getenv('SQLITE_PATH', 'chrip.db')
+
+_lock = threading.Lock()
+_sqlite_resources: Dict[str, object] = {}
+
+
+def get_sqlite_resource(path: str = None):
+    """
+    Verilen dosya için paylaşılan SQLite resource'unu döndürür.
+
+    İlk açılışta app.services.schema içindeki eksik tablolar oluşturulur.
+
+    Args:
+        path (str, optional): Veritabanı dosyası; verilmezse SQLITE_PATH
+
+    Returns:
+        SQLiteResource: DynamoDB resource arayüzüyle uyumlu motor
+    """
+    from app.storage.sqlite import SQLiteResource
+    from app.services.schema import create_tables
+
+    path = path or SQLITE_PATH
+    with _lock:
+        resource = _sqlite_resources.get(path)
+        if resource is None:
+            resource = SQLiteResource(path)
+            create_tables(resource.meta.client)
+            _sqlite_resources[path] = resource
+        return resource
+
+
+def get_dynamodb(region_name: str = None):
+    """
+    Yapılandırılmış depolama motorunun tablo resource'unu döndürür.
+
+    Args:
+        region_name (str, optional): AWS bölgesi (yalnızca dynamodb için)
+
+    Returns:
+        DynamoDB resource'u veya SQLiteResource
+
+    Raises:
+        ValueError: Bilinmeyen motor veya eksik AWS kimlik bilgileri
+    """
+    if STORAGE_BACKEND == 'sqlite':
+        return get_sqlite_resource()
+
+    if ':' in STORAGE_BACKEND:
+        return _load_factory(STORAGE_BACKEND)(region_name)
+
+    if STORAGE_BACKEND != 'dynamodb':
+        raise ValueError(f"Unknown STORAGE_BACKEND: {STORAGE_BACKEND}")
+
+    # AWS Credentials
+    access_key = os.getenv('AWS_ACCESS_KEY_ID', '').strip()
+    secret_key = os.getenv('AWS_SECRET_ACCESS_KEY', '').strip()
+    if not access_key or not secret_key:
+        raise ValueError("AWS credentials must be provided")
+
+    from app.utils.aws import get_resource
+    return get_resource('dynamodb', region_name=region_name)
+
+
+def _load_factory(path: str) -> Callable:
+    """
+    'paket.modul:fonksiyon' biçimindeki fabrikayı içe aktarır.
+
+    Raises:
+        ValueError: Modül veya fonksiyon bulunamazsa
+    """
+    module_name, _, attribute = path.partition(':')
+    try:
+        return getattr(import_module(module_name), attribute)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Unknown STORAGE_BACKEND: {path} ({e})")
+
+
+__all__ = [
+    'STORAGE_BACKEND',
+    'get_dynamodb',
+    'get_sqlite_resource'
+]
@@ -0,0 +1,582 @@
+"""
+DynamoDB İfade Değerlendirici
+---------------------------
+SQLite depolama motorunun, servislerin kullandığı DynamoDB ifadelerini
+(KeyCondition/Filter/Condition, Update ve Projection) DynamoDB ile aynı
+anlamda değerlendirmesi için ayrıştırıcı ve yorumlayıcı.
+
+Desteklenenler:
+    - Karşılaştırma: =, <>, <, <=, >, >=, BETWEEN, IN, AND, OR, NOT, parantez
+    - Fonksiyonlar: attribute_exists, attribute_not_exists, attribute_type,
+      begins_with, contains, size
+    - Update: SET (+, -, if_not_exists, list_append), REMOVE, ADD, DELETE
+    - Yollar: a.b, a[0].b, #isim yer tutucuları
+"""
+
+import copy
+import re
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import Binary, TypeDeserializer, TypeSerializer
+
+# Öğede bulunmayan öznitelik
+MISSING = object()
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<value>:[A-Za-z0-9_]+)
+      | (?P<name>\#?[A-Za-z_][A-Za-z0-9_]*|\#[A-Za-z0-9_]+)
+      | (?P<number>\d+)
+      | (?P<op><>|<=|>=|[=<>(),.\[\]+\-])
+    )
+""", re.VERBOSE)
+
+_CONDITION_FUNCTIONS = {
+    'attribute_exists', 'attribute_not_exists', 'attribute_type', 'begins_with', 'contains'
+}
+_COMPARATORS = {'=', '<>', '<', '<=', '>', '>='}
+_UPDATE_CLAUSES = {'SET', 'REMOVE', 'ADD', 'DELETE'}
+
+
+class ExpressionError(ValueError):
+    """Geçersiz veya desteklenmeyen ifade (DynamoDB'de ValidationException)."""
+
+
+def normalize(value: Any) -> Any:
+    """
+    Python değerini DynamoDB'nin döndüreceği biçime çevirir (int -> Decimal).
+
+    TypeSerializer ile aynı doğrulamayı yapar; ör. float değerler reddedilir.
+
+    Raises:
+        TypeError: DynamoDB'nin desteklemediği tipler için
+    """
+    return _deserializer.deserialize(_serializer.serialize(value))
+
+
+def type_of(value: Any) -> str:
+    """Değerin DynamoDB tip kodunu döndürür ('S', 'N', 'M', ...)."""
+    return next(iter(_serializer.serialize(value)))
+
+
+def resolve(
+    expression,
+    names: Optional[Dict[str, str]] = None,
+    values: Optional[Dict[str, Any]] = None,
+    builder: Optional[ConditionExpressionBuilder] = None,
+    is_key_condition: bool = False
+) -> Tuple[Optional[str], Dict[str, str], Dict[str, Any]]:
+    """
+    boto3 koşul nesnelerini (Key/Attr) metin ifadesine çevirir ve yer
+    tutucuları birleştirir.
+
+    Args:
+        expression: Metin ifade veya boto3 koşul nesnesi
+        names (dict, optional): ExpressionAttributeNames
+        values (dict, optional): ExpressionAttributeValues
+        builder (ConditionExpressionBuilder, optional): Aynı istekteki ifadelerin
+            yer tutucuları çakışmasın diye paylaşılan builder
+        is_key_condition (bool): KeyConditionExpression ise True
+
+    Returns:
+        tuple: (metin ifade, isimler, değerler)
+    """
+    names = dict(names or {})
+    values = dict(values or {})
+    if isinstance(expression, ConditionBase):
+        built = (builder or ConditionExpressionBuilder()).build_expression(
+            expression, is_key_condition=is_key_condition
+        )
+        names.update(built.attribute_name_placeholders)
+        values.update(built.attribute_value_placeholders)
+        expression = built.condition_expression
+    return expression, names, values
+
+
+class _Parser:
+    """Tek bir ifadeyi AST'ye (tuple ağacı) çeviren özyinelemeli ayrıştırıcı."""
+
+    def __init__(self, text: str, names: Dict[str, str], values: Dict[str, Any]):
+        self.text = text
+        self.names = names or {}
+        self.values = values or {}
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+
+    def _tokenize(self, text: str) -> List[Tuple[str, str]]:
+        tokens = []
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = _TOKEN_RE.match(text, position)
+            if not match or match.end() == position:
+                raise ExpressionError(f"Invalid expression near: {text[position:]!r}")
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            position = match.end()
+        return tokens
+
+    # Belirteç yardımcıları
+
+    def peek(self, offset: int = 0) -> Tuple[Optional[str], Optional[str]]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def next(self) -> Tuple[str, str]:
+        token = self.peek()
+        if token[0] is None:
+            raise ExpressionError(f"Unexpected end of expression: {self.text!r}")
+        self.pos += 1
+        return token
+
+    def at_end(self) -> bool:
+        return self.pos >= len(self.tokens)
+
+    def accept(self, symbol: str) -> bool:
+        if self.peek() == ('op', symbol):
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, symbol: str):
+        if not self.accept(symbol):
+            raise ExpressionError(f"Expected {symbol!r} in expression: {self.text!r}")
+
+    def peek_keyword(self) -> Optional[str]:
+        kind, text = self.peek()
+        return text.upper() if kind == 'name' else None
+
+    def accept_keyword(self, keyword: str) -> bool:
+        if self.peek_keyword() == keyword:
+            self.pos += 1
+            return True
+        return False
+
+    def finish(self, node):
+        if not self.at_end():
+            raise ExpressionError(f"Unexpected token {self.peek()[1]!r} in: {self.text!r}")
+        return node
+
+    # Yol ve işlenenler
+
+    def name(self, text: str) -> str:
+        if text.startswith('#'):
+            if text not in self.names:
+                raise ExpressionError(f"Undefined attribute name placeholder: {text}")
+            return self.names[text]
+        return text
+
+    def path(self) -> Tuple[str, List]:
+        kind, text = self.next()
+        if kind != 'name':
+            raise ExpressionError(f"Expected attribute name, got {text!r}")
+        elements = [self.name(text)]
+        while True:
+            if self.accept('.'):
+                kind, text = self.next()
+                if kind != 'name':
+                    raise ExpressionError(f"Expected attribute name after '.', got {text!r}")
+                elements.append(self.name(text))
+            elif self.accept('['):
+                kind, text = self.next()
+                if kind != 'number':
+                    raise ExpressionError(f"Expected list index, got {text!r}")
+                elements.append(int(text))
+                self.expect(']')
+            else:
+                return ('path', elements)
+
+    def value(self, text: str):
+        if text not in self.values:
+            raise ExpressionError(f"Undefined attribute value placeholder: {text}")
+        return ('value', self.values[text])
+
+    def operand(self):
+        kind, text = self.peek()
+        if kind == 'value':
+            self.pos += 1
+            return self.value(text)
+        if kind == 'name' and text.lower() == 'size' and self.peek(1) == ('op', '('):
+            self.pos += 2
+            node = ('size', self.path())
+            self.expect(')')
+            return node
+        return self.path()
+
+    # Koşul ifadeleri
+
+    def condition(self):
+        node = self.and_condition()
+        while self.accept_keyword('OR'):
+            node = ('or', node, self.and_condition())
+        return node
+
+    def and_condition(self):
+        node = self.not_condition()
+        while self.accept_keyword('AND'):
+            node = ('and', node, self.not_condition())
+        return node
+
+    def not_condition(self):
+        if self.accept_keyword('NOT'):
+            return ('not', self.not_condition())
+        return self.primary_condition()
+
+    def primary_condition(self):
+        if self.accept('('):
+            node = self.condition()
+            self.expect(')')
+            return node
+
+        kind, text = self.peek()
+        if kind == 'name' and text.lower() in _CONDITION_FUNCTIONS and self.peek(1) == ('op', '('):
+            self.pos += 2
+            args = [self.operand()]
+            while self.accept(','):
+                args.append(self.operand())
+            self.expect(')')
+            return ('func', text.lower(), args)
+
+        left = self.operand()
+        if self.accept_keyword('BETWEEN'):
+            low = self.operand()
+            if not self.accept_keyword('AND'):
+                raise ExpressionError(f"Expected AND in BETWEEN: {self.text!r}")
+            return ('between', left, low, self.operand())
+        if self.accept_keyword('IN'):
+            self.expect('(')
+            options = [self.operand()]
+            while self.accept(','):
+                options.append(self.operand())
+            self.expect(')')
+            return ('in', left, options)
+
+        kind, symbol = self.next()
+        if kind != 'op' or symbol not in _COMPARATORS:
+            raise ExpressionError(f"Expected comparator, got {symbol!r} in: {self.text!r}")
+        return ('cmp', symbol, left, self.operand())
+
+    # Update ifadeleri
+
+    def update(self) -> List[Tuple]:
+        actions = []
+        while not self.at_end():
+            clause = self.peek_keyword()
+            if clause not in _UPDATE_CLAUSES:
+                raise ExpressionError(f"Expected SET, REMOVE, ADD or DELETE in: {self.text!r}")
+            self.pos += 1
+            while True:
+                if clause == 'SET':
+                    path = self.path()
+                    self.expect('=')
+                    actions.append(('SET', path, self.set_value()))
+                elif clause == 'REMOVE':
+                    actions.append(('REMOVE', self.path(), None))
+                else:
+                    path = self.path()
+                    kind, text = self.next()
+                    if kind != 'value':
+                        raise ExpressionError(f"{clause} requires a value placeholder: {self.text!r}")
+                    actions.append((clause, path, self.value(text)))
+                if not self.accept(','):
+                    break
+        if not actions:
+            raise ExpressionError("Empty update expression")
+        return actions
+
+    def set_value(self):
+        node = self.set_term()
+        for symbol in ('+', '-'):
+            if self.accept(symbol):
+                return (symbol, node, self.set_term())
+        return node
+
+    def set_term(self):
+        kind, text = self.peek()
+        if kind == 'name' and self.peek(1) == ('op', '('):
+            function = text.lower()
+            if function not in ('if_not_exists', 'list_append'):
+                raise ExpressionError(f"Unsupported function in SET: {text}")
+            self.pos += 2
+            first = self.path() if function == 'if_not_exists' else self.set_term()
+            self.expect(',')
+            second = self.set_term()
+            self.expect(')')
+            return (function, first, second)
+        return self.operand()
+
+    # Projeksiyon
+
+    def projection(self) -> List[Tuple]:
+        paths = [self.path()]
+        while self.accept(','):
+            paths.append(self.path())
+        return paths
+
+
+# Yol işlemleri
+
+def get_path(item: Dict[str, Any], elements: List) -> Any:
+    """Yolun gösterdiği değeri döndürür; yoksa MISSING."""
+    current = item
+    for element in elements:
+        if isinstance(element, int):
+            if not isinstance(current, list) or element >= len(current):
+                return MISSING
+        elif not isinstance(current, dict) or element not in current:
+            return MISSING
+        current = current[element]
+    return current
+
+
+def _parent(item: Dict[str, Any], elements: List):
+    parent = get_path(item, elements[:-1]) if len(elements) > 1 else item
+    last = elements[-1]
+    if isinstance(last, int) and not isinstance(parent, list):
+        raise ExpressionError("The document path provided in the update expression is invalid for update")
+    if isinstance(last, str) and not isinstance(parent, dict):
+        raise ExpressionError("The document path provided in the update expression is invalid for update")
+    return parent, last
+
+
+def set_path(item: Dict[str, Any], elements: List, value: Any):
+    """Yola değer yazar; liste sonunu aşan indeksler sona eklenir."""
+    parent, last = _parent(item, elements)
+    if isinstance(last, int) and last >= len(parent):
+        parent.append(value)
+    else:
+        parent[last] = value
+
+
+def remove_path(item: Dict[str, Any], elements: List):
+    """Yoldaki değeri siler; yoksa bir şey yapmaz."""
+    if get_path(item, elements) is MISSING:
+        return
+    parent, last = _parent(item, elements)
+    del parent[last]
+
+
+# Değerlendirme
+
+def _operand(node, item: Dict[str, Any]) -> Any:
+    kind = node[0]
+    if kind == 'value':
+        return node[1]
+    if kind == 'path':
+        return get_path(item, node[1])
+    if kind == 'size':
+        value = get_path(item, node[1][1])
+        if value is MISSING or not hasattr(value, '__len__') or isinstance(value, (bool, Decimal)):
+            return MISSING
+        return Decimal(len(value.value if isinstance(value, Binary) else value))
+    raise ExpressionError(f"Invalid operand: {kind}")
+
+
+def _comparable(left: Any, right: Any) -> bool:
+    ordered = (Decimal, str, Binary, bytes)
+    return any(isinstance(left, kind) and isinstance(right, kind) for kind in ordered)
+
+
+def _compare(symbol: str, left: Any, right: Any) -> bool:
+    if left is MISSING or right is MISSING:
+        return symbol == '<>'
+    if symbol == '=':
+        return type_of(left) == type_of(right) and left == right
+    if symbol == '<>':
+        return type_of(left) != type_of(right) or left != right
+    if not _comparable(left, right):
+        return False
+    if isinstance(left, Binary):
+        left, right = left.value, right.value
+    return {
+        '<': left < right,
+        '<=': left <= right,
+        '>': left > right,
+        '>=': left >= right
+    }[symbol]
+
+
+def _function(name: str, args: List, item: Dict[str, Any]) -> bool:
+    if name in ('attribute_exists', 'attribute_not_exists'):
+        exists = _operand(args[0], item) is not MISSING
+        return exists if name == 'attribute_exists' else not exists
+
+    target = _operand(args[0], item)
+    argument = _operand(args[1], item)
+    if target is MISSING:
+        return False
+    if name == 'attribute_type':
+        return type_of(target) == argument
+    if name == 'begins_with':
+        return isinstance(target, str) and isinstance(argument, str) and target.startswith(argument)
+    if name == 'contains':
+        if isinstance(target, str):
+            return isinstance(argument, str) and argument in target
+        if isinstance(target, (list, set)):
+            return argument in target
+        return False
+    raise ExpressionError(f"Unsupported function: {name}")
+
+
+def _evaluate(node, item: Dict[str, Any]) -> bool:
+    kind = node[0]
+    if kind == 'and':
+        return _evaluate(node[1], item) and _evaluate(node[2], item)
+    if kind == 'or':
+        return _evaluate(node[1], item) or _evaluate(node[2], item)
+    if kind == 'not':
+        return not _evaluate(node[1], item)
+    if kind == 'cmp':
+        return _compare(node[1], _operand(node[2], item), _operand(node[3], item))
+    if kind == 'between':
+        value = _operand(node[1], item)
+        return (_compare('>=', value, _operand(node[2], item))
+                and _compare('<=', value, _operand(node[3], item)))
+    if kind == 'in':
+        value = _operand(node[1], item)
+        return any(_compare('=', value, _operand(option, item)) for option in node[2])
+    if kind == 'func':
+        return _function(node[1], node[2], item)
+    raise ExpressionError(f"Invalid condition: {kind}")
+
+
+def parse_condition(expression: str, names: Dict[str, str], values: Dict[str, Any]):
+    """Koşul ifadesini AST'ye çevirir."""
+    parser = _Parser(expression, names, values)
+    return parser.finish(parser.condition())
+
+
+def evaluate_condition(node, item: Optional[Dict[str, Any]]) -> bool:
+    """Koşul AST'sini bir öğe için değerlendirir; öğe yoksa boş öğe kullanılır."""
+    return _evaluate(node, item or {})
+
+
+def condition_matches(
+    expression: Optional[str],
+    names: Dict[str, str],
+    values: Dict[str, Any],
+    item: Optional[Dict[str, Any]]
+) -> bool:
+    """Koşul ifadesi verilmemişse True, verilmişse öğe için sonucunu döndürür."""
+    if not expression:
+        return True
+    return evaluate_condition(parse_condition(expression, names, values), item)
+
+
+def _set_value(node, item: Dict[str, Any]) -> Any:
+    kind = node[0]
+    if kind in ('+', '-'):
+        left = _set_value(node[1], item)
+        right = _set_value(node[2], item)
+        if not isinstance(left, Decimal) or not isinstance(right, Decimal):
+            raise ExpressionError("An operand in the update expression has an incorrect data type")
+        return left + right if kind == '+' else left - right
+    if kind == 'if_not_exists':
+        existing = get_path(item, node[1][1])
+        return existing if existing is not MISSING else _set_value(node[2], item)
+    if kind == 'list_append':
+        left = _set_value(node[1], item)
+        right = _set_value(node[2], item)
+        if not isinstance(left, list) or not isinstance(right, list):
+            raise ExpressionError("An operand in the update expression has an incorrect data type")
+        return left + right
+    value = _operand(node, item)
+    if value is MISSING:
+        raise ExpressionError("The provided expression refers to an attribute that does not exist in the item")
+    return value
+
+
+def apply_update(
+    expression: str,
+    names: Dict[str, str],
+    values: Dict[str, Any],
+    item: Dict[str, Any]
+) -> Tuple[Dict[str, Any], set]:
+    """
+    Update ifadesini öğeye uygular.
+
+    DynamoDB'de olduğu gibi tüm sağ taraf değerleri güncellemeden önceki
+    öğe üzerinden hesaplanır.
+
+    Args:
+        expression (str): UpdateExpression
+        names (dict): ExpressionAttributeNames
+        values (dict): ExpressionAttributeValues
+        item (dict): Mevcut öğe (değiştirilmez)
+
+    Returns:
+        tuple: (yeni öğe, güncellenen üst seviye öznitelik adları)
+    """
+    parser = _Parser(expression, names, values)
+    actions = parser.finish(parser.update())
+
+    resolved = []
+    for clause, path, value_node in actions:
+        if clause == 'SET':
+            resolved.append((clause, path[1], copy.deepcopy(_set_value(value_node, item))))
+        else:
+            resolved.append((clause, path[1], value_node[1] if value_node else None))
+
+    updated = copy.deepcopy(item)
+    touched = set()
+    for clause, elements, value in resolved:
+        touched.add(elements[0])
+        if clause == 'SET':
+            set_path(updated, elements, value)
+        elif clause == 'REMOVE':
+            remove_path(updated, elements)
+        elif clause == 'ADD':
+            current = get_path(updated, elements)
+            if current is MISSING:
+                set_path(updated, elements, copy.deepcopy(value))
+            elif isinstance(current, Decimal) and isinstance(value, Decimal):
+                set_path(updated, elements, current + value)
+            elif isinstance(current, set) and isinstance(value, set):
+                set_path(updated, elements, current | value)
+            else:
+                raise ExpressionError("An operand in the update expression has an incorrect data type")
+        elif clause == 'DELETE':
+            current = get_path(updated, elements)
+            if current is MISSING:
+                continue
+            if not isinstance(current, set) or not isinstance(value, set):
+                raise ExpressionError("An operand in the update expression has an incorrect data type")
+            remaining = current - value
+            if remaining:
+                set_path(updated, elements, remaining)
+            else:
+                remove_path(updated, elements)
+
+    return updated, touched
+
+
+def project(
+    expression: Optional[str],
+    names: Dict[str, str],
+    item: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    ProjectionExpression'daki öznitelikleri içeren öğe kopyasını döndürür.
+
+    Liste indeksi içeren yollarda üst seviye özniteliğin tamamı döndürülür.
+    """
+    if not expression:
+        return item
+    parser = _Parser(expression, names, {})
+    result = {}
+    for _, elements in parser.finish(parser.projection()):
+        if any(isinstance(element, int) for element in elements):
+            elements = elements[:1]
+        value = get_path(item, elements)
+        if value is MISSING:
+            continue
+        target = result
+        for element in elements[:-1]:
+            target = target.setdefault(element, {})
+        target[elements[-1]] = value
+    return result
@@ -0,0 +1,908 @@
+"""
+SQLite Depolama Motoru
+--------------------
+Servislerin kullandığı DynamoDB resource/Table API alt kümesini tek bir
+SQLite dosyası üzerinde aynı anlamla sunar: anahtar şeması, GSI'lar, koşullu
+yazmalar, update ifadeleri, sayfalı query/scan, BatchGetItem ve
+TransactWriteItems.
+
+Öğeler DynamoDB JSON biçiminde saklanır; sayılar okunurken DynamoDB'de
+olduğu gibi Decimal döner. Anahtar ve GSI anahtar değerleri ayrı, indeksli
+kolonlarda tutulur. Veritabanı WAL modunda açılır; her thread kendi
+bağlantısını kullanır, yazmalar BEGIN IMMEDIATE ile sıralanır. Her işlem
+app.utils.instrumentation ile 'sqlite' servisi adı altında ölçülür.
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import wraps
+from typing import Any, Dict, List, Optional, Tuple
+
+from boto3.dynamodb.conditions import ConditionExpressionBuilder
+from boto3.dynamodb.types import Binary, TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+from app.storage import expressions
+from app.storage.expressions import ExpressionError, MISSING
+from app.utils import instrumentation
+
+SQLITE_BUSY_TIMEOUT_SECONDS = float(os.getenv('SQLITE_BUSY_TIMEOUT_SECONDS', '5'))
+
+# DynamoDB sınırları
+BATCH_GET_LIMIT = 100
+TRANSACT_WRITE_LIMIT = 100
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS storage_tables (
+        name TEXT PRIMARY KEY,
+        definition TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS items (
+        table_name TEXT NOT NULL,
+        pk NOT NULL,
+        sk NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (table_name, pk, sk)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS index_entries (
+        table_name TEXT NOT NULL,
+        index_name TEXT NOT NULL,
+        hk NOT NULL,
+        rk NOT NULL,
+        pk NOT NULL,
+        sk NOT NULL,
+        PRIMARY KEY (table_name, index_name, hk, rk, pk, sk)
+    ) WITHOUT ROWID""",
+    """CREATE INDEX IF NOT EXISTS index_entries_item
+        ON index_entries (table_name, pk, sk)""",
+)
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+class ResourceNotFoundException(ClientError):
+    """Tablo bulunamadı (client.exceptions.ResourceNotFoundException)."""
+
+
+class ResourceInUseException(ClientError):
+    """Tablo zaten var (client.exceptions.ResourceInUseException)."""
+
+
+class _Exceptions:
+    ClientError = ClientError
+    ResourceNotFoundException = ResourceNotFoundException
+    ResourceInUseException = ResourceInUseException
+
+
+def _error(code: str, message: str, operation: str, error_class=ClientError, **extra) -> ClientError:
+    """DynamoDB'nin döndürdüğü biçimde ClientError oluşturur."""
+    response = {'Error': {'Code': code, 'Message': message}}
+    response.update(extra)
+    return error_class(response, operation)
+
+
+def _validation_error(message: str, operation: str) -> ClientError:
+    return _error('ValidationException', message, operation)
+
+
+def _conditional_check_failed(operation: str) -> ClientError:
+    return _error('ConditionalCheckFailedException', 'The conditional request failed', operation)
+
+
+# Serileştirme
+
+def _encode(value: Dict[str, Any]) -> Dict[str, Any]:
+    """DynamoDB JSON değerindeki ikili verileri base64'e çevirir."""
+    (type_code, inner), = value.items()
+    if type_code == 'B':
+        return {'B': base64.b64encode(inner).decode('ascii')}
+    if type_code == 'BS':
+        return {'BS': [base64.b64encode(element).decode('ascii') for element in inner]}
+    if type_code == 'M':
+        return {'M': {key: _encode(element) for key, element in inner.items()}}
+    if type_code == 'L':
+        return {'L': [_encode(element) for element in inner]}
+    return value
+
+
+def _decode(value: Dict[str, Any]) -> Dict[str, Any]:
+    """_encode işleminin tersi."""
+    (type_code, inner), = value.items()
+    if type_code == 'B':
+        return {'B': base64.b64decode(inner)}
+    if type_code == 'BS':
+        return {'BS': [base64.b64decode(element) for element in inner]}
+    if type_code == 'M':
+        return {'M': {key: _decode(element) for key, element in inner.items()}}
+    if type_code == 'L':
+        return {'L': [_decode(element) for element in inner]}
+    return value
+
+
+def dump_item(item: Dict[str, Any]) -> str:
+    """Öğeyi saklanacak JSON metnine çevirir."""
+    return json.dumps(
+        {key: _encode(_serializer.serialize(value)) for key, value in item.items()},
+        separators=(',', ':')
+    )
+
+
+def load_item(data: str) -> Dict[str, Any]:
+    """Saklanan JSON metnini öğeye çevirir (sayılar Decimal olarak)."""
+    return {
+        key: _deserializer.deserialize(_decode(value))
+        for key, value in json.loads(data).items()
+    }
+
+
+def _measured(operation: str):
+    """
+    İşlemi istek başına çağrı ölçümüne kaydeden dekoratör.
+
+    Tablo adı ilk konumsal argümandan ya da istek parametrelerinden alınır.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tables = [args[0]] if args and isinstance(args[0], str) else instrumentation.request_tables(kwargs)
+            started = time.perf_counter()
+            response = None
+            try:
+                response = method(self, *args, **kwargs)
+                return response
+            finally:
+                instrumentation.record_call(
+                    'sqlite',
+                    operation,
+                    tables,
+                    time.perf_counter() - started,
+                    items=instrumentation.response_items(response)
+                )
+        return wrapper
+    return decorator
+
+
+def _sql_value(value: Any) -> Any:
+    """Anahtar değerini sıralanabilir bir SQLite değerine çevirir."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, Binary):
+        return bytes(value.value)
+    return value
+
+
+class _TableMeta:
+    """Tablo tanımından türetilen anahtar ve GSI bilgileri."""
+
+    def __init__(self, definition: Dict[str, Any]):
+        self.definition = definition
+        self.name = definition['TableName']
+        self.hash_key, self.range_key = self._keys(definition['KeySchema'])
+        self.attribute_types = {
+            attribute['AttributeName']: attribute['AttributeType']
+            for attribute in definition['AttributeDefinitions']
+        }
+        self.indexes = {
+            index['IndexName']: self._keys(index['KeySchema'])
+            for index in definition.get('GlobalSecondaryIndexes', [])
+        }
+
+    @staticmethod
+    def _keys(key_schema: List[Dict[str, str]]) -> Tuple[str, Optional[str]]:
+        keys = {key['KeyType']: key['AttributeName'] for key in key_schema}
+        return keys['HASH'], keys.get('RANGE')
+
+    @property
+    def key_names(self) -> List[str]:
+        return [self.hash_key] + ([self.range_key] if self.range_key else [])
+
+    def index_keys(self, index_name: Optional[str], operation: str) -> Tuple[str, Optional[str]]:
+        if index_name is None:
+            return self.hash_key, self.range_key
+        if index_name not in self.indexes:
+            raise _validation_error(
+                f"The table does not have the specified index: {index_name}", operation
+            )
+        return self.indexes[index_name]
+
+    def key(self, source: Dict[str, Any], operation: str, exact: bool = False) -> Dict[str, Any]:
+        """
+        Kaynaktan tablo anahtarını çıkarır ve doğrular.
+
+        Args:
+            source (dict): Öğe veya Key parametresi
+            operation (str): Hata mesajları için işlem adı
+            exact (bool): Kaynak yalnızca anahtar öznitelikleri içermeli
+
+        Raises:
+            ClientError: Anahtar eksik veya tipi şemaya uymuyorsa
+        """
+        key = {}
+        for name in self.key_names:
+            value = source.get(name, MISSING)
+            if (value is MISSING or value == ''
+                    or expressions.type_of(value) != self.attribute_types[name]):
+                raise _validation_error("The provided key element does not match the schema", operation)
+            key[name] = value
+        if exact and len(source) != len(key):
+            raise _validation_error("The provided key element does not match the schema", operation)
+        return key
+
+    def sql_key(self, key: Dict[str, Any]) -> Tuple[Any, Any]:
+        return (
+            _sql_value(key[self.hash_key]),
+            _sql_value(key[self.range_key]) if self.range_key else ''
+        )
+
+
+class _Waiter:
+    """Tablolar eşzamanlı oluşturulduğundan beklemeye gerek yoktur."""
+
+    def wait(self, **kwargs):
+        return None
+
+
+class _Meta:
+    def __init__(self, client):
+        self.client = client
+
+
+class SQLiteResource:
+    """
+    boto3 DynamoDB resource'unun SQLite karşılığı.
+
+    Args:
+        path (str): Veritabanı dosyası; ':memory:' tek bağlantılı bellek içi veritabanı açar
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.meta = _Meta(SQLiteClient(self))
+        self._memory = path == ':memory:'
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._shared_connection = None
+        self._definitions: Dict[str, _TableMeta] = {}
+
+        with self._guard():
+            connection = self._connection()
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    # Bağlantı ve transaction yönetimi
+
+    def _open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        if not self._memory:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+        return connection
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._memory:
+            if self._shared_connection is None:
+                self._shared_connection = self._open()
+            return self._shared_connection
+
+        # Fork sonrası ebeveynin bağlantısı kullanılmaz
+        if getattr(self._local, 'pid', None) != os.getpid():
+            self._local.connection = self._open()
+            self._local.pid = os.getpid()
+        return self._local.connection
+
+    @contextmanager
+    def _guard(self):
+        """Bellek içi veritabanında tek bağlantıya erişimi sıralar."""
+        if self._memory:
+            with self._lock:
+                yield
+        else:
+            yield
+
+    @contextmanager
+    def _transaction(self):
+        with self._guard():
+            connection = self._connection()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield connection
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            connection.execute('COMMIT')
+
+    # Tablo tanımları
+
+    def _table(self, table_name: str, operation: str) -> _TableMeta:
+        meta = self._definitions.get(table_name)
+        if meta is None:
+            with self._guard():
+                row = self._connection().execute(
+                    'SELECT definition FROM storage_tables WHERE name = ?', (table_name,)
+                ).fetchone()
+            if row is None:
+                raise _error(
+                    'ResourceNotFoundException', 'Requested resource not found',
+                    operation, ResourceNotFoundException
+                )
+            meta = _TableMeta(json.loads(row[0]))
+            self._definitions[table_name] = meta
+        return meta
+
+    def _save_definition(self, connection: sqlite3.Connection, definition: Dict[str, Any]):
+        connection.execute(
+            'INSERT OR REPLACE INTO storage_tables (name, definition) VALUES (?, ?)',
+            (definition['TableName'], json.dumps(definition))
+        )
+        self._definitions.pop(definition['TableName'], None)
+
+    # Öğe okuma/yazma
+
+    def _read(self, connection, meta: _TableMeta, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        row = connection.execute(
+            'SELECT data FROM items WHERE table_name = ? AND pk = ? AND sk = ?',
+            (meta.name,) + meta.sql_key(key)
+        ).fetchone()
+        return load_item(row[0]) if row else None
+
+    def _index_entries(self, meta: _TableMeta, item: Dict[str, Any], operation: str) -> List[Tuple]:
+        entries = []
+        for index_name, (hash_key, range_key) in meta.indexes.items():
+            values = []
+            for name in (hash_key, range_key):
+                if name is None:
+                    values.append('')
+                    continue
+                value = item.get(name, MISSING)
+                if value is MISSING:
+                    break
+                # GSI anahtarı null veya farklı tipte olamaz
+                if value == '' or expressions.type_of(value) != meta.attribute_types[name]:
+                    raise _validation_error(
+                        "One or more parameter values were invalid: "
+                        f"Type mismatch for Index Key {name}", operation
+                    )
+                values.append(_sql_value(value))
+            else:
+                entries.append((index_name, values[0], values[1]))
+        return entries
+
+    def _store(self, connection, meta: _TableMeta, item: Dict[str, Any], operation: str):
+        key = meta.sql_key(meta.key(item, operation))
+        entries = self._index_entries(meta, item, operation)
+        connection.execute(
+            'INSERT OR REPLACE INTO items (table_name, pk, sk, data) VALUES (?, ?, ?, ?)',
+            (meta.name,) + key + (dump_item(item),)
+        )
+        connection.execute(
+            'DELETE FROM index_entries WHERE table_name = ? AND pk = ? AND sk = ?',
+            (meta.name,) + key
+        )
+        connection.executemany(
+            'INSERT INTO index_entries (table_name, index_name, hk, rk, pk, sk) VALUES (?, ?, ?, ?, ?, ?)',
+            [(meta.name, index_name, hash_value, range_value) + key
+             for index_name, hash_value, range_value in entries]
+        )
+
+    def _remove(self, connection, meta: _TableMeta, key: Dict[str, Any]):
+        sql_key = (meta.name,) + meta.sql_key(key)
+        connection.execute('DELETE FROM items WHERE table_name = ? AND pk = ? AND sk = ?', sql_key)
+        connection.execute('DELETE FROM index_entries WHERE table_name = ? AND pk = ? AND sk = ?', sql_key)
+
+    @staticmethod
+    def _expression_arguments(params: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        names = dict(params.get('ExpressionAttributeNames') or {})
+        values = {
+            placeholder: expressions.normalize(value)
+            for placeholder, value in (params.get('ExpressionAttributeValues') or {}).items()
+        }
+        return names, values
+
+    def _check(self, params: Dict[str, Any], item: Optional[Dict[str, Any]], operation: str) -> bool:
+        condition, names, values = expressions.resolve(
+            params.get('ConditionExpression'), *self._expression_arguments(params)
+        )
+        try:
+            return expressions.condition_matches(condition, names, values, item)
+        except ExpressionError as e:
+            raise _validation_error(str(e), operation)
+
+    def _updated(self, meta: _TableMeta, params: Dict[str, Any], key: Dict[str, Any],
+                 old: Optional[Dict[str, Any]], operation: str) -> Tuple[Dict[str, Any], set]:
+        base = old if old is not None else dict(key)
+        if not params.get('UpdateExpression'):
+            return base, set()
+        names, values = self._expression_arguments(params)
+        try:
+            new, touched = expressions.apply_update(params['UpdateExpression'], names, values, base)
+        except ExpressionError as e:
+            raise _validation_error(str(e), operation)
+        for name in touched & set(meta.key_names):
+            raise _validation_error(
+                f"One or more parameter values were invalid: Cannot update attribute {name}. "
+                "This attribute is part of the key", operation
+            )
+        return new, touched
+
+    # Table işlemleri
+
+    @_measured('PutItem')
+    def put_item(self, table_name: str, Item: Dict[str, Any], ReturnValues: str = 'NONE', **params):
+        meta = self._table(table_name, 'PutItem')
+        item = {name: expressions.normalize(value) for name, value in Item.items()}
+        with self._transaction() as connection:
+            old = self._read(connection, meta, meta.key(item, 'PutItem'))
+            if not self._check(params, old, 'PutItem'):
+                raise _conditional_check_failed('PutItem')
+            self._store(connection, meta, item, 'PutItem')
+        return {'Attributes': old} if ReturnValues == 'ALL_OLD' and old else {}
+
+    @_measured('GetItem')
+    def get_item(self, table_name: str, Key: Dict[str, Any], ProjectionExpression: str = None,
+                 ExpressionAttributeNames: Dict[str, str] = None, **params):
+        meta = self._table(table_name, 'GetItem')
+        key = meta.key({name: expressions.normalize(value) for name, value in Key.items()},
+                       'GetItem', exact=True)
+        with self._guard():
+            item = self._read(self._connection(), meta, key)
+        if item is None:
+            return {}
+        return {'Item': expressions.project(ProjectionExpression, ExpressionAttributeNames or {}, item)}
+
+    @_measured('DeleteItem')
+    def delete_item(self, table_name: str, Key: Dict[str, Any], ReturnValues: str = 'NONE', **params):
+        meta = self._table(table_name, 'DeleteItem')
+        key = meta.key({name: expressions.normalize(value) for name, value in Key.items()},
+                       'DeleteItem', exact=True)
+        with self._transaction() as connection:
+            old = self._read(connection, meta, key)
+            if not self._check(params, old, 'DeleteItem'):
+                raise _conditional_check_failed('DeleteItem')
+            self._remove(connection, meta, key)
+        return {'Attributes': old} if ReturnValues == 'ALL_OLD' and old else {}
+
+    @_measured('UpdateItem')
+    def update_item(self, table_name: str, Key: Dict[str, Any], ReturnValues: str = 'NONE', **params):
+        meta = self._table(table_name, 'UpdateItem')
+        key = meta.key({name: expressions.normalize(value) for name, value in Key.items()},
+                       'UpdateItem', exact=True)
+        with self._transaction() as connection:
+            old = self._read(connection, meta, key)
+            if not self._check(params, old, 'UpdateItem'):
+                raise _conditional_check_failed('UpdateItem')
+            new, touched = self._updated(meta, params, key, old, 'UpdateItem')
+            self._store(connection, meta, new, 'UpdateItem')
+
+        if ReturnValues == 'ALL_NEW':
+            return {'Attributes': new}
+        if ReturnValues == 'ALL_OLD':
+            return {'Attributes': old} if old else {}
+        if ReturnValues in ('UPDATED_NEW', 'UPDATED_OLD'):
+            source = new if ReturnValues == 'UPDATED_NEW' else (old or {})
+            return {'Attributes': {name: source[name] for name in touched if name in source}}
+        return {}
+
+    @_measured('Query')
+    def query(self, table_name: str, **params):
+        return self._read_page(table_name, 'Query', params)
+
+    @_measured('Scan')
+    def scan(self, table_name: str, **params):
+        return self._read_page(table_name, 'Scan', params)
+
+    def _key_range(self, node, range_key: Optional[str], operation: str) -> Tuple[str, List]:
+        """Sıralama anahtarı koşulunu SQL'e çevirir."""
+        kind = node[0]
+        if kind == 'cmp' and node[1] != '<>' and node[2] == ('path', [range_key]) and node[3][0] == 'value':
+            return f"{node[1]} ?", [_sql_value(node[3][1])]
+        if kind == 'between' and node[1] == ('path', [range_key]):
+            return "BETWEEN ? AND ?", [_sql_value(node[2][1]), _sql_value(node[3][1])]
+        if kind == 'func' and node[1] == 'begins_with' and node[2][0] == ('path', [range_key]):
+            prefix = _sql_value(node[2][1][1])
+            return "", [prefix]
+        raise _validation_error("Query key condition not supported", operation)
+
+    def _split_key_condition(self, params: Dict[str, Any], hash_key: str, range_key: Optional[str],
+                             builder, operation: str):
+        condition, names, values = expressions.resolve(
+            params.get('KeyConditionExpression'),
+            params.get('ExpressionAttributeNames'),
+            params.get('ExpressionAttributeValues'),
+            builder,
+            is_key_condition=True
+        )
+        if not condition:
+            raise _validation_error("KeyConditionExpression is required", operation)
+        values = {placeholder: expressions.normalize(value) for placeholder, value in values.items()}
+        try:
+            node = expressions.parse_condition(condition, names, values)
+        except ExpressionError as e:
+            raise _validation_error(str(e), operation)
+
+        parts = [node[1], node[2]] if node[0] == 'and' else [node]
+        hash_value = MISSING
+        range_node = None
+        for part in parts:
+            if (part[0] == 'cmp' and part[1] == '=' and part[2] == ('path', [hash_key])
+                    and part[3][0] == 'value'):
+                hash_value = part[3][1]
+            else:
+                range_node = part
+        if hash_value is MISSING or (range_node is not None and range_key is None):
+            raise _validation_error("Query condition missed key schema element", operation)
+        return hash_value, range_node
+
+    def _read_page(self, table_name: str, operation: str, params: Dict[str, Any]):
+        meta = self._table(table_name, operation)
+        index_name = params.get('IndexName')
+        hash_key, range_key = meta.index_keys(index_name, operation)
+        forward = params.get('ScanIndexForward', True) if operation == 'Query' else True
+        limit = params.get('Limit')
+        builder = ConditionExpressionBuilder()
+
+        if index_name is None:
+            select = 'SELECT e.data, e.pk, e.sk FROM items e'
+            where = ['e.table_name = ?']
+            args = [meta.name]
+            order = ['e.sk'] if operation == 'Query' else ['e.pk', 'e.sk']
+            range_column = 'e.sk'
+        else:
+            select = (
+                'SELECT i.data, e.pk, e.sk FROM index_entries e JOIN items i '
+                'ON i.table_name = e.table_name AND i.pk = e.pk AND i.sk = e.sk'
+            )
+            where = ['e.table_name = ?', 'e.index_name = ?']
+            args = [meta.name, index_name]
+            order = (['e.rk'] if operation == 'Query' else ['e.hk', 'e.rk']) + ['e.pk', 'e.sk']
+            range_column = 'e.rk'
+        hash_column = 'e.pk' if index_name is None else 'e.hk'
+
+        if operation == 'Query':
+            hash_value, range_node = self._split_key_condition(params, hash_key, range_key, builder, operation)
+            where.append(f'{hash_column} = ?')
+            args.append(_sql_value(hash_value))
+            if range_node is not None:
+                clause, clause_args = self._key_range(range_node, range_key, operation)
+                if clause:
+                    where.append(f'{range_column} {clause}')
+                else:
+                    where.append(f'substr({range_column}, 1, ?) = ?')
+                    clause_args = [len(clause_args[0])] + clause_args
+                args.extend(clause_args)
+
+        start_key = params.get('ExclusiveStartKey')
+        if start_key:
+            start_key = {name: expressions.normalize(value) for name, value in start_key.items()}
+            table_key = meta.sql_key(meta.key(start_key, operation))
+            if index_name is None:
+                positions = {'e.pk': table_key[0], 'e.sk': table_key[1]}
+            else:
+                positions = {
+                    'e.hk': _sql_value(start_key.get(hash_key, '')),
+                    'e.rk': _sql_value(start_key.get(range_key, '')) if range_key else '',
+                    'e.pk': table_key[0],
+                    'e.sk': table_key[1]
+                }
+            comparator = '>' if forward else '<'
+            where.append(f"({', '.join(order)}) {comparator} ({', '.join('?' * len(order))})")
+            args.extend(positions[column] for column in order)
+
+        direction = 'ASC' if forward else 'DESC'
+        sql = f"{select} WHERE {' AND '.join(where)} ORDER BY {', '.join(f'{column} {direction}' for column in order)}"
+        if limit:
+            sql += ' LIMIT ?'
+            args.append(int(limit) + 1)
+
+        with self._guard():
+            rows = self._connection().execute(sql, args).fetchall()
+
+        has_more = bool(limit) and len(rows) > int(limit)
+        rows = rows[:int(limit)] if limit else rows
+
+        filter_expression, names, values = expressions.resolve(
+            params.get('FilterExpression'),
+            params.get('ExpressionAttributeNames'),
+            params.get('ExpressionAttributeValues'),
+            builder
+        )
+        values = {placeholder: expressions.normalize(value) for placeholder, value in values.items()}
+        try:
+            filter_node = expressions.parse_condition(filter_expression, names, values) if filter_expression else None
+        except ExpressionError as e:
+            raise _validation_error(str(e), operation)
+
+        items = []
+        last_item = None
+        for data, _, _ in rows:
+            item = load_item(data)
+            last_item = item
+            if filter_node is None or expressions.evaluate_condition(filter_node, item):
+                items.append(expressions.project(params.get('ProjectionExpression'), names, item))
+
+        response = {'Count': len(items), 'ScannedCount': len(rows)}
+        if params.get('Select') != 'COUNT':
+            response['Items'] = items
+        if has_more and last_item is not None:
+            key_names = meta.key_names + [name for name in (hash_key, range_key) if name]
+            response['LastEvaluatedKey'] = {
+                name: last_item[name] for name in dict.fromkeys(key_names) if name in last_item
+            }
+        return response
+
+    @_measured('BatchGetItem')
+    def batch_get_item(self, RequestItems: Dict[str, Dict[str, Any]], **params):
+        """
+        boto3 resource.batch_get_item karşılığı; tüm anahtarlar tek seferde işlenir.
+        """
+        if sum(len(request.get('Keys', [])) for request in RequestItems.values()) > BATCH_GET_LIMIT:
+            raise _validation_error("Too many items requested for the BatchGetItem call", 'BatchGetItem')
+
+        responses = {}
+        for table_name, request in RequestItems.items():
+            meta = self._table(table_name, 'BatchGetItem')
+            found = []
+            with self._guard():
+                connection = self._connection()
+                for key in request.get('Keys', []):
+                    key = meta.key({name: expressions.normalize(value) for name, value in key.items()},
+                                   'BatchGetItem', exact=True)
+                    item = self._read(connection, meta, key)
+                    if item is not None:
+                        found.append(expressions.project(
+                            request.get('ProjectionExpression'),
+                            request.get('ExpressionAttributeNames') or {},
+                            item
+                        ))
+            responses[table_name] = found
+        return {'Responses': responses, 'UnprocessedKeys': {}}
+
+    def Table(self, name: str) -> 'SQLiteTable':
+        return SQLiteTable(self, name)
+
+
+class SQLiteTable:
+    """boto3 DynamoDB Table nesnesinin SQLite karşılığı."""
+
+    def __init__(self, resource: SQLiteResource, name: str):
+        self._resource = resource
+        self.name = name
+        self.table_name = name
+
+    def put_item(self, **params):
+        return self._resource.put_item(self.name, **params)
+
+    def get_item(self, **params):
+        return self._resource.get_item(self.name, **params)
+
+    def delete_item(self, **params):
+        return self._resource.delete_item(self.name, **params)
+
+    def update_item(self, **params):
+        return self._resource.update_item(self.name, **params)
+
+    def query(self, **params):
+        return self._resource.query(self.name, **params)
+
+    def scan(self, **params):
+        return self._resource.scan(self.name, **params)
+
+    def batch_writer(self, overwrite_by_pkeys: Optional[List[str]] = None) -> '_BatchWriter':
+        return _BatchWriter(self._resource, self.name, overwrite_by_pkeys)
+
+
+class _BatchWriter:
+    """Table.batch_writer karşılığı; çıkışta tüm yazmaları tek transaction'da uygular."""
+
+    def __init__(self, resource: SQLiteResource, table_name: str, overwrite_by_pkeys: Optional[List[str]]):
+        self._resource = resource
+        self._table_name = table_name
+        self._overwrite_by_pkeys = overwrite_by_pkeys
+        self._requests = []
+
+    def _add(self, action: str, item: Dict[str, Any]):
+        if self._overwrite_by_pkeys:
+            key = tuple(item.get(name) for name in self._overwrite_by_pkeys)
+            self._requests = [
+                request for request in self._requests
+                if tuple(request[1].get(name) for name in self._overwrite_by_pkeys) != key
+            ]
+        self._requests.append((action, item))
+
+    def put_item(self, Item: Dict[str, Any]):
+        self._add('put', Item)
+
+    def delete_item(self, Key: Dict[str, Any]):
+        self._add('delete', Key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            return False
+        self._flush(self._table_name)
+        return False
+
+    @_measured('BatchWriteItem')
+    def _flush(self, table_name: str):
+        meta = self._resource._table(table_name, 'BatchWriteItem')
+        with self._resource._transaction() as connection:
+            for action, item in self._requests:
+                item = {name: expressions.normalize(value) for name, value in item.items()}
+                if action == 'put':
+                    self._resource._store(connection, meta, item, 'BatchWriteItem')
+                else:
+                    self._resource._remove(connection, meta, meta.key(item, 'BatchWriteItem', exact=True))
+        self._requests = []
+
+
+class SQLiteClient:
+    """
+    dynamodb.meta.client karşılığı: tablo yönetimi ve TransactWriteItems.
+
+    Resource'a bağlı client gibi Python değerleriyle çalışır.
+    """
+
+    exceptions = _Exceptions
+
+    def __init__(self, resource: SQLiteResource):
+        self._resource = resource
+
+    def create_table(self, TableName: str, KeySchema, AttributeDefinitions,
+                     GlobalSecondaryIndexes=None, **params):
+        resource = self._resource
+        with resource._transaction() as connection:
+            exists = connection.execute(
+                'SELECT 1 FROM storage_tables WHERE name = ?', (TableName,)
+            ).fetchone()
+            if exists:
+                raise _error('ResourceInUseException', f"Table already exists: {TableName}",
+                             'CreateTable', ResourceInUseException)
+            definition = {
+                'TableName': TableName,
+                'KeySchema': KeySchema,
+                'AttributeDefinitions': AttributeDefinitions
+            }
+            if GlobalSecondaryIndexes:
+                definition['GlobalSecondaryIndexes'] = GlobalSecondaryIndexes
+            resource._save_definition(connection, definition)
+        return self.describe_table(TableName=TableName)
+
+    def describe_table(self, TableName: str):
+        meta = self._resource._table(TableName, 'DescribeTable')
+        description = dict(meta.definition, TableStatus='ACTIVE')
+        if 'GlobalSecondaryIndexes' in description:
+            description['GlobalSecondaryIndexes'] = [
+                dict(index, IndexStatus='ACTIVE') for index in description['GlobalSecondaryIndexes']
+            ]
+        return {'Table': description}
+
+    def update_table(self, TableName: str, AttributeDefinitions=None,
+                     GlobalSecondaryIndexUpdates=None, **params):
+        resource = self._resource
+        meta = resource._table(TableName, 'UpdateTable')
+        definition = json.loads(json.dumps(meta.definition))
+
+        attributes = {attribute['AttributeName']: attribute for attribute in definition['AttributeDefinitions']}
+        for attribute in AttributeDefinitions or []:
+            attributes[attribute['AttributeName']] = attribute
+        definition['AttributeDefinitions'] = list(attributes.values())
+
+        indexes = {index['IndexName']: index for index in definition.get('GlobalSecondaryIndexes', [])}
+        for update in GlobalSecondaryIndexUpdates or []:
+            if 'Create' in update:
+                indexes[update['Create']['IndexName']] = update['Create']
+            elif 'Delete' in update:
+                indexes.pop(update['Delete']['IndexName'], None)
+        definition['GlobalSecondaryIndexes'] = list(indexes.values())
+        if not definition['GlobalSecondaryIndexes']:
+            del definition['GlobalSecondaryIndexes']
+
+        with resource._transaction() as connection:
+            resource._save_definition(connection, definition)
+            # Yeni tanıma göre tüm GSI kayıtlarını yeniden oluştur
+            new_meta = _TableMeta(definition)
+            connection.execute('DELETE FROM index_entries WHERE table_name = ?', (TableName,))
+            rows = connection.execute('SELECT data FROM items WHERE table_name = ?', (TableName,)).fetchall()
+            for (data,) in rows:
+                resource._store(connection, new_meta, load_item(data), 'UpdateTable')
+        return self.describe_table(TableName=TableName)
+
+    def delete_table(self, TableName: str):
+        resource = self._resource
+        description = self.describe_table(TableName=TableName)
+        with resource._transaction() as connection:
+            connection.execute('DELETE FROM items WHERE table_name = ?', (TableName,))
+            connection.execute('DELETE FROM index_entries WHERE table_name = ?', (TableName,))
+            connection.execute('DELETE FROM storage_tables WHERE name = ?', (TableName,))
+        resource._definitions.pop(TableName, None)
+        return description
+
+    def list_tables(self, **params):
+        with self._resource._guard():
+            rows = self._resource._connection().execute(
+                'SELECT name FROM storage_tables ORDER BY name'
+            ).fetchall()
+        return {'TableNames': [name for (name,) in rows]}
+
+    def get_waiter(self, name: str) -> _Waiter:
+        return _Waiter()
+
+    @_measured('TransactWriteItems')
+    def transact_write_items(self, TransactItems: List[Dict[str, Dict[str, Any]]], **params):
+        """
+        İşlemleri tek bir SQLite transaction'ında uygular.
+
+        Koşullardan biri sağlanmazsa hiçbir işlem uygulanmaz ve DynamoDB gibi
+        CancellationReasons içeren TransactionCanceledException yükseltilir.
+        """
+        operation = 'TransactWriteItems'
+        if len(TransactItems) > TRANSACT_WRITE_LIMIT:
+            raise _validation_error("Member must have length less than or equal to 100", operation)
+
+        resource = self._resource
+        with resource._transaction() as connection:
+            planned = []
+            reasons = []
+            seen = set()
+            for action in TransactItems:
+                (kind, request), = action.items()
+                meta = resource._table(request['TableName'], operation)
+                if kind == 'Put':
+                    item = {name: expressions.normalize(value) for name, value in request['Item'].items()}
+                    key = meta.key(item, operation)
+                else:
+                    item = None
+                    key = meta.key({name: expressions.normalize(value) for name, value in request['Key'].items()},
+                                   operation, exact=True)
+
+                item_id = (meta.name,) + meta.sql_key(key)
+                if item_id in seen:
+                    raise _validation_error(
+                        "Transaction request cannot include multiple operations on one item", operation
+                    )
+                seen.add(item_id)
+
+                old = resource._read(connection, meta, key)
+                if not resource._check(request, old, operation):
+                    reasons.append({'Code': 'ConditionalCheckFailed', 'Message': 'The conditional request failed'})
+                    continue
+                reasons.append({'Code': 'None'})
+
+                if kind == 'Put':
+                    planned.append(('store', meta, item))
+                elif kind == 'Update':
+                    new, _ = resource._updated(meta, request, key, old, operation)
+                    planned.append(('store', meta, new))
+                elif kind == 'Delete':
+                    planned.append(('remove', meta, key))
+                elif kind != 'ConditionCheck':
+                    raise _validation_error(f"Unsupported transaction action: {kind}", operation)
+
+            if any(reason['Code'] != 'None' for reason in reasons):
+                codes = ', '.join(reason['Code'] for reason in reasons)
+                raise _error(
+                    'TransactionCanceledException',
+                    f"Transaction cancelled, please refer cancellation reasons for specific reasons [{codes}]",
+                    operation,
+                    CancellationReasons=reasons
+                )
+
+            for action, meta, value in planned:
+                if action == 'store':
+                    resource._store(connection, meta, value, operation)
+                else:
+                    resource._remove(connection, meta, value)
+        return {}
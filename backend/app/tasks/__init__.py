@@ -0,0 +1,49 @@
+"""
+Arka Plan Görevleri
+-----------------
+İstek yolunun dışında çalışan işler için Celery uygulaması.
+
+Worker'ı başlatmak için:
+
+    celery -A app.tasks worker --loglevel=INFO
+
+CELERY_TASK_ALWAYS_EAGER=true görevleri kuyruğa yazmadan çağıran süreçte
+çalıştırır (testler ve broker'sız geliştirme için).
+"""
+
+import os
+
+from celery import Celery
+
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND') or None
+CELERY_TASK_ALWAYS_EAGER = os.getenv('CELERY_TASK_ALWAYS_EAGER', 'false').lower() == 'true'
+# Broker'a yazılamadığında isteğin bekleyeceği en uzun süre (saniye)
+CELERY_PUBLISH_TIMEOUT = float(os.getenv('CELERY_PUBLISH_TIMEOUT', '1'))
+
+celery_app = Celery(
+    'chrip',
+    broker=CELERY_BROKER_URL,
+    backend=CELERY_RESULT_BACKEND,
+    include=['app.tasks.media', 'app.tasks.users', 'app.tasks.comments']
+)
+celery_app.conf.update(
+    task_serializer='json',
+    accept_content=['json'],
+    task_always_eager=CELERY_TASK_ALWAYS_EAGER,
+    # Görev, worker düşerse başka bir worker'da yeniden çalışsın
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1,
+    task_ignore_result=CELERY_RESULT_BACKEND is None,
+    # Broker erişilemezken istek thread'i uzun süre takılmasın
+    broker_connection_timeout=CELERY_PUBLISH_TIMEOUT,
+    task_publish_retry_policy={
+        'max_retries': 1,
+        'interval_start': 0,
+        'interval_step': CELERY_PUBLISH_TIMEOUT,
+        'interval_max': CELERY_PUBLISH_TIMEOUT
+    }
+)
+
+__all__ = ['celery_app']
@@ -0,0 +1,20 @@
+"""
+Yorum Görevleri
+-------------
+Yanıtların üst yoruma denormalize edilmesi.
+"""
+
+from app.services.CommentTableDatabaseService import CommentDatabaseService
+from app.tasks.deferred import deferred_task
+
+
+@deferred_task()
+def link_reply(parent_id, reply):
+    """
+    Yanıtı üst yorumun sub_comment_list ve latest_sub_comment alanlarına ekler.
+
+    Args:
+        parent_id (str): Üst yorumun ID'si
+        reply (dict): Yanıtın to_dict() çıktısı
+    """
+    CommentDatabaseService.get_instance().link_reply(parent_id, reply)
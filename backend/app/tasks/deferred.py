@@ -0,0 +1,188 @@
+"""
+Ertelenmiş Yan Etkiler
+--------------------
+Yazma isteklerinin kritik olmayan takip işlerini (denormalizasyon,
+last_login, medya temizliği) istek yolundan çıkaran görev katmanı.
+
+İstek yalnızca birincil yazmayı yapar ve takip işini defer() ile kuyruğa
+bırakır. Görevler hata durumunda üstel bekleme ile yeniden denenir.
+idempotency_key verilen görevler, aynı anahtarla en fazla bir kez başarıyla
+çalışır: worker görev sırasında düşüp mesaj yeniden teslim edilirse veya
+aynı iş iki kez kuyruğa bırakılırsa ikinci çalışma atlanır.
+
+Broker yoksa (CELERY_TASK_ALWAYS_EAGER=true) veya kuyruğa yazılamazsa görev
+çağıran thread'de hemen çalıştırılır; takip işi kaybolmaz, yalnızca istek
+yoluna geri döner.
+"""
+
+import os
+import time
+from typing import Optional
+
+from botocore.exceptions import ClientError
+
+from app.services.schema import TASK_KEYS_TABLE_NAME
+from app.tasks import celery_app
+from app.utils.dynamodb import is_conditional_check_failure
+from app.utils.log import get_logger
+
+DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
+# Tamamlanan idempotency anahtarlarının saklanma süresi (saniye)
+TASK_KEY_TTL = int(os.getenv('TASK_KEY_TTL', str(7 * 24 * 3600)))
+# Çalışan bir görevin anahtarı tuttuğu süre; worker düşerse bu süreden sonra
+# başka bir teslimat anahtarı alabilir (saniye)
+TASK_KEY_LEASE = int(os.getenv('TASK_KEY_LEASE', '300'))
+DEFERRED_TASK_MAX_RETRIES = int(os.getenv('DEFERRED_TASK_MAX_RETRIES', '5'))
+
+logger = get_logger(__name__)
+
+_RUNNING = 'running'
+_DONE = 'done'
+
+
+class IdempotencyStore:
+    """
+    Görev idempotency anahtarlarını tutan tablo.
+
+    Bir görev çalışmadan önce anahtarı TASK_KEY_LEASE süreliğine 'running'
+    olarak alır, başarıyla bitince 'done' yapar, hata verirse bırakır.
+    Anahtarlar expires_at (DynamoDB TTL) ile kendiliğinden silinir.
+    """
+
+    def __init__(self, table, timer=time.time):
+        self.table = table
+        self._timer = timer
+
+    def claim(self, key: str) -> bool:
+        """
+        Anahtarı çalıştırmak için alır.
+
+        Args:
+            key (str): Idempotency anahtarı
+
+        Returns:
+            bool: Görev çalıştırılmalıysa True; anahtar tamamlanmış veya
+                başka bir teslimatta çalışıyorsa False
+        """
+        now = int(self._timer())
+        try:
+            self.table.put_item(
+                Item={
+                    'idempotency_key': key,
+                    'status': _RUNNING,
+                    'lease_until': now + TASK_KEY_LEASE,
+                    'expires_at': now + TASK_KEY_TTL
+                },
+                ConditionExpression=(
+                    'attribute_not_exists(idempotency_key) OR expires_at < :now '
+                    'OR (#status = :running AND lease_until < :now)'
+                ),
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={':now': now, ':running': _RUNNING}
+            )
+        except ClientError as e:
+            if is_conditional_check_failure(e):
+                return False
+            raise
+        return True
+
+    def complete(self, key: str):
+        """Anahtarı tamamlandı olarak işaretler."""
+        self.table.update_item(
+            Key={'idempotency_key': key},
+            UpdateExpression='SET #status = :done REMOVE lease_until',
+            ExpressionAttributeNames={'#status': 'status'},
+            ExpressionAttributeValues={':done': _DONE}
+        )
+
+    def release(self, key: str):
+        """Başarısız çalışmanın anahtarını bırakır; yeniden deneme alabilsin."""
+        self.table.delete_item(Key={'idempotency_key': key})
+
+
+_store: Optional[IdempotencyStore] = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Varsayılan (STORAGE_BACKEND tablosunu kullanan) anahtar deposunu döndürür."""
+    global _store
+    if _store is None:
+        from app.storage import get_dynamodb
+        _store = IdempotencyStore(get_dynamodb(DEFAULT_REGION).Table(TASK_KEYS_TABLE_NAME))
+    return _store
+
+
+def deferred_task(max_retries: int = DEFERRED_TASK_MAX_RETRIES, retry_backoff: int = 2):
+    """
+    Fonksiyonu yeniden denenen ve idempotency anahtarı kabul eden bir Celery
+    görevi olarak kaydeder.
+
+    Görev, fonksiyonun argümanlarına ek olarak isteğe bağlı idempotency_key
+    anahtar argümanını alır. Hata veren çalışma retry_backoff tabanlı üstel
+    bekleme (jitter ile) sonrası en fazla max_retries kez yeniden denenir.
+
+    Args:
+        max_retries (int, optional): En fazla yeniden deneme sayısı
+        retry_backoff (int, optional): İlk bekleme (saniye), her denemede iki katına çıkar
+
+    Returns:
+        function: Decorator
+    """
+    def decorator(func):
+        def run(*args, idempotency_key: str = None, **kwargs):
+            if idempotency_key is None:
+                return func(*args, **kwargs)
+
+            store = get_idempotency_store()
+            if not store.claim(idempotency_key):
+                logger.info("deferred_task_skipped", task=func.__name__, idempotency_key=idempotency_key)
+                return None
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                store.release(idempotency_key)
+                raise
+            store.complete(idempotency_key)
+            return result
+
+        run.__name__ = func.__name__
+        run.__doc__ = func.__doc__
+        run.__module__ = func.__module__
+        return celery_app.task(
+            name=f'{func.__module__}.{func.__name__}',
+            autoretry_for=(Exception,),
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            retry_jitter=True
+        )(run)
+
+    return decorator
+
+
+def defer(task, *args, idempotency_key: str = None, countdown: float = None, **kwargs):
+    """
+    Görevi kuyruğa bırakır; broker yoksa veya yazılamazsa hemen çalıştırır.
+
+    Takip işindeki hata çağıranın isteğini başarısız yapmaz, loglanır.
+
+    Args:
+        task: deferred_task ile kaydedilmiş görev
+        *args: Görev argümanları
+        idempotency_key (str, optional): Aynı işin tekrarını önleyen anahtar
+        countdown (float, optional): Çalışmadan önce bekleme (saniye, yalnızca kuyrukta)
+        **kwargs: Görev anahtar argümanları
+    """
+    if idempotency_key is not None:
+        kwargs['idempotency_key'] = idempotency_key
+
+    if not celery_app.conf.task_always_eager:
+        try:
+            task.apply_async(args=args, kwargs=kwargs, countdown=countdown)
+            return
+        except Exception:
+            logger.warning("deferred_task_enqueue_failed", task=task.name, exc_info=True)
+
+    # Satır içi çalışma isteği bekletir: yeniden denemeden tek sefer
+    result = task.apply(args=args, kwargs=kwargs, retries=task.max_retries)
+    if result.failed():
+        logger.error("deferred_task_failed", task=task.name, error=repr(result.result))
@@ -0,0 +1,96 @@
+"""
+Medya Görevleri
+-------------
+Yüklenen görsellerin türevlerini arka planda üretir.
+"""
+
+from botocore.exceptions import ClientError
+from PIL import Image, UnidentifiedImageError
+
+from app.services.MediaDatabaseService import MediaDatabaseService
+from app.services.media_service import MediaService
+from app.tasks import celery_app
+from app.tasks.deferred import deferred_task
+from app.utils.images import IMAGE_VARIANTS, render_variants, variant_key
+from app.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Türevler anahtara göre değişmez; tarayıcı ve CDN süresiz önbelleğe alabilir
+VARIANT_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=10)
+def generate_image_derivatives(self, s3_key, media_id=None):
+    """
+    Görselin türevlerini üretip orijinalin yanına yazar.
+
+    Aynı anahtar için tekrar çalışması aynı nesnelerin üzerine yazar; worker
+    düşüp görev yeniden teslim edilirse sonuç değişmez.
+
+    Args:
+        s3_key (str): Orijinal görselin anahtarı
+        media_id (str, optional): Türevlerin kaydedileceği medya kaydı
+
+    Returns:
+        list: Yazılan türev anahtarları
+    """
+    media_service = MediaService.get_instance()
+    bucket = media_service.s3_bucket
+
+    try:
+        original = media_service.s3.get_object(Bucket=bucket, Key=s3_key)['Body'].read()
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+            logger.warning("image_derivatives_missing_original", key=s3_key)
+            return []
+        raise self.retry(exc=e)
+
+    try:
+        variants = render_variants(original)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        # Bozuk veya görsel olmayan dosya: tekrar denemek sonucu değiştirmez
+        logger.warning("image_derivatives_skipped", key=s3_key, error=str(e))
+        return []
+
+    keys = {}
+    try:
+        for name, extension, body, content_type in variants:
+            key = variant_key(s3_key, name, extension)
+            media_service.s3.put_object(
+                Bucket=bucket,
+                Key=key,
+                Body=body,
+                ContentType=content_type,
+                CacheControl=VARIANT_CACHE_CONTROL
+            )
+            keys.setdefault(name, {})[extension] = key
+    except ClientError as e:
+        raise self.retry(exc=e)
+
+    if media_id:
+        MediaDatabaseService.get_instance().set_media_variants(media_id, keys)
+        media_service._variants_cache.delete(s3_key)
+
+    logger.info("image_derivatives_created", key=s3_key, count=len(variants))
+    return [key for formats in keys.values() for key in formats.values()]
+
+
+@deferred_task()
+def delete_media_objects(s3_key):
+    """
+    Nesneyi ve varsa türevlerini S3'ten siler.
+
+    Olmayan nesneyi silmek S3'te hata değildir; görev tekrar çalışabilir.
+
+    Args:
+        s3_key (str): Orijinal nesnenin anahtarı
+    """
+    media_service = MediaService.get_instance()
+    keys = [s3_key] + [
+        variant_key(s3_key, name, extension)
+        for name in IMAGE_VARIANTS
+        for extension in ('webp', 'jpg', 'png')
+    ]
+    for key in keys:
+        media_service.s3.delete_object(Bucket=media_service.s3_bucket, Key=key)
@@ -0,0 +1,21 @@
+"""
+Kullanıcı Görevleri
+-----------------
+Giriş sonrası takip işleri.
+"""
+
+from app.services.UserTableDatabaseService import UserDatabaseService
+from app.tasks.deferred import deferred_task
+
+
+@deferred_task()
+def record_login(user_id, email, last_login):
+    """
+    Kullanıcının son giriş zamanını yazar.
+
+    Args:
+        user_id (str): Kullanıcı ID'si
+        email (str): Kullanıcının e-postası (tablonun sıralama anahtarı)
+        last_login (str): Girişin ISO zamanı
+    """
+    UserDatabaseService.get_instance().record_last_login(user_id, email, last_login)
@@ -10,7 +10,9 @@ from app.utils.exceptions import (
     NotFoundError, 
     ValidationError,
     ForbiddenError,
-    ConflictError
+    ConflictError,
+    GatewayTimeoutError,
+    ServiceUnavailableError
 )
 
 from app.utils.responses import (
@@ -20,12 +22,17 @@ from app.utils.responses import (
     created_response,
     updated_response,
     deleted_response,
-    pagination_meta
+    pagination_meta,
+    cursor_meta,
+    cursor_list_response,
+    compute_etag,
+    cached_response
 )
 
 from app.utils.auth import (
     hash_password,
     check_password,
+    password_needs_rehash,
     generate_token,
     decode_token
 )
@@ -38,6 +45,8 @@ __all__ = [
     'ValidationError',
     'ForbiddenError',
     'ConflictError',
+    'GatewayTimeoutError',
+    'ServiceUnavailableError',
     
     # Responses
     'success_response',
@@ -47,10 +56,15 @@ __all__ = [
     'updated_response',
     'deleted_response',
     'pagination_meta',
+    'cursor_meta',
+    'cursor_list_response',
+    'compute_etag',
+    'cached_response',
     
     # Auth
     'hash_password',
     'check_password',
+    'password_needs_rehash',
     'generate_token',
     'decode_token',
     
@@ -4,80 +4,28 @@ Kimlik Doğrulama Yardımcı Fonksiyonları
 Şifre hash'leme ve doğrulama fonksiyonları.
 """
 
-import bcrypt
 import jwt
 import uuid
 from datetime import datetime, timedelta
 from flask import current_app
-from app.paths import *
-import json
+from app.utils.universities import get_university_registry
+# bcrypt işlemleri süreç havuzunda çalışır; mevcut içe aktarmalar için burada da sunulur
+from app.utils.passwords import hash_password, check_password, password_needs_rehash
 
 def check_university_email(email):
     """
     Verilen e-posta adresinin kayıtlı üniversitelere ait olup olmadığını kontrol eder ve ait olduğu üniversiteyi döndürür.
     
+    Alt alan adları da eşleşir (ör. ogr.etu.edu.tr -> etu.edu.tr). Liste
+    bellekte tutulur, dosya değiştiğinde otomatik yeniden yüklenir.
+    
     Args:
         email (str): Kontrol edilecek e-posta adresi
 
     Returns:
         str: E-posta adresinin ait olduğu üniversite adı veya None
     """
-    # E-posta adresini kontrol et
-    if '@' not in email:
-        return None
-    
-    # E-posta adresinin üniversiteye ait olup olmadığını kontrol et
-    university_email = email.split('@')[1]
-    
-    # Üniversiteleri yükle
-    with open(UNIVERSITY_EMAIL_DATA_FILE, 'r', encoding='utf-8') as f:
-        university_emails = json.load(f)
-    
-    # Eğer üniversite kayıtlıysa, üniversite adını döndür
-    if university_email in university_emails:
-        return university_emails[university_email]
-    
-    return None
-
-
-def hash_password(password):
-    """
-    Şifreyi güvenli bir şekilde hash'ler.
-    
-    Args:
-        password (str): Ham şifre
-    
-    Returns:
-        str: Hash'lenmiş şifre
-    """
-    # Şifreyi bytes'a dönüştür
-    password_bytes = password.encode('utf-8')
-    
-    # Salt oluştur ve şifreyi hash'le
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    
-    # Hash'i string olarak döndür
-    return hashed.decode('utf-8')
-
-
-def check_password(password, hashed_password):
-    """
-    Verilen şifrenin hash ile eşleşip eşleşmediğini kontrol eder.
-    
-    Args:
-        password (str): Kontrol edilecek ham şifre
-        hashed_password (str): Karşılaştırılacak hash'lenmiş şifre
-    
-    Returns:
-        bool: Şifreler eşleşiyorsa True, aksi halde False
-    """
-    # Şifreyi bytes'a dönüştür
-    password_bytes = password.encode('utf-8')
-    hashed_bytes = hashed_password.encode('utf-8')
-    
-    # Şifreleri karşılaştır
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    return get_university_registry().university_for_email(email)
 
 
 def generate_token(user_id, expires_delta=None):
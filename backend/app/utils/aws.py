@@ -0,0 +1,161 @@
+"""
+AWS İstemci Fabrikası
+-------------------
+Süreç başına paylaşılan, bağlantı havuzu ve yeniden deneme ayarları
+yapılmış boto3 client/resource nesneleri.
+
+boto3 client'ları thread-safe'tir; bir süreçteki tüm thread'ler aynı
+client'ı ve dolayısıyla aynı HTTP bağlantı havuzunu kullanır. Resource
+nesneleri yalnızca durumsuz Table çağrıları için paylaşılır. Oluşturulan
+her client istek başına çağrı ölçümü için app.utils.instrumentation'a
+bağlanır.
+
+Veritabanı servisleri client'larını içe aktarma ve create_app sırasında
+alır ve saklar; gunicorn --preload ile bu nesneler fork'tan önce ana
+süreçte oluşur. Fork sonrası çocuk süreçte aynı client nesneleri kullanılmaya
+devam eder, ancak bağlantı havuzları boşaltılır: çocuk, ebeveynin açtığı
+soketleri hiç kullanmaz ve ilk çağrıda kendi bağlantılarını açar.
+"""
+
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+from app.utils.instrumentation import instrument_client
+
+AWS_MAX_POOL_CONNECTIONS = int(os.getenv('AWS_MAX_POOL_CONNECTIONS', '50'))
+AWS_CONNECT_TIMEOUT = float(os.getenv('AWS_CONNECT_TIMEOUT', '2'))
+AWS_READ_TIMEOUT = float(os.getenv('AWS_READ_TIMEOUT', '5'))
+AWS_MAX_ATTEMPTS = int(os.getenv('AWS_MAX_ATTEMPTS', '5'))
+AWS_RETRY_MODE = os.getenv('AWS_RETRY_MODE', 'adaptive')
+
+_lock = threading.Lock()
+_pid = None
+_session = None
+_clients: Dict[Tuple[str, Optional[str]], object] = {}
+_resources: Dict[Tuple[str, Optional[str]], object] = {}
+
+
+def get_client_config() -> Config:
+    """
+    Tüm AWS client'larında kullanılan botocore ayarlarını döndürür.
+
+    Returns:
+        Config: Havuz boyutu, zaman aşımları, keep-alive ve yeniden deneme ayarları
+    """
+    return Config(
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        connect_timeout=AWS_CONNECT_TIMEOUT,
+        read_timeout=AWS_READ_TIMEOUT,
+        tcp_keepalive=True,
+        retries={'total_max_attempts': AWS_MAX_ATTEMPTS, 'mode': AWS_RETRY_MODE}
+    )
+
+
+def _get_session() -> boto3.Session:
+    """
+    Bu sürecin boto3 oturumunu döndürür; fork sonrası önbelleği sıfırlar.
+
+    _lock tutulurken çağrılmalıdır.
+    """
+    global _pid, _session
+
+    pid = os.getpid()
+    if _pid != pid:
+        _clients.clear()
+        _resources.clear()
+        _session = None
+        _pid = pid
+
+    if _session is None:
+        # Kimlik bilgileri ortam değişkenlerinden / varsayılan zincirden okunur
+        _session = boto3.Session(region_name=os.getenv('AWS_DEFAULT_REGION'))
+    return _session
+
+
+def get_client(service_name: str, region_name: Optional[str] = None):
+    """
+    Paylaşılan boto3 client'ını döndürür.
+
+    Args:
+        service_name (str): AWS servis adı (ör. 's3', 'dynamodb')
+        region_name (str, optional): Bölge; verilmezse AWS_DEFAULT_REGION
+
+    Returns:
+        botocore.client.BaseClient: Süreç içinde paylaşılan client
+    """
+    key = (service_name, region_name)
+    with _lock:
+        session = _get_session()
+        client = _clients.get(key)
+        if client is None:
+            client = session.client(
+                service_name,
+                region_name=region_name,
+                config=get_client_config()
+            )
+            instrument_client(client)
+            _clients[key] = client
+        return client
+
+
+def get_resource(service_name: str, region_name: Optional[str] = None):
+    """
+    Paylaşılan boto3 resource'unu döndürür.
+
+    Args:
+        service_name (str): AWS servis adı (ör. 'dynamodb')
+        region_name (str, optional): Bölge; verilmezse AWS_DEFAULT_REGION
+
+    Returns:
+        boto3.resources.base.ServiceResource: Süreç içinde paylaşılan resource
+    """
+    key = (service_name, region_name)
+    with _lock:
+        session = _get_session()
+        resource = _resources.get(key)
+        if resource is None:
+            resource = session.resource(
+                service_name,
+                region_name=region_name,
+                config=get_client_config()
+            )
+            instrument_client(resource.meta.client)
+            _resources[key] = resource
+        return resource
+
+
+def reset():
+    """Önbellekteki tüm oturum, client ve resource nesnelerini bırakır."""
+    global _pid, _session
+    with _lock:
+        _clients.clear()
+        _resources.clear()
+        _session = None
+        _pid = None
+
+
+def _drop_connections(client):
+    """Client'ın HTTP bağlantı havuzlarını boşaltır; client kullanılmaya devam eder."""
+    http_session = getattr(getattr(client, '_endpoint', None), 'http_session', None)
+    if http_session is None:
+        return
+    http_session._manager.clear()
+    for manager in http_session._proxy_managers.values():
+        manager.clear()
+
+
+# Fork edilen çocuk süreç kilidi ve soketleri ebeveynden devralmasın; servislerin
+# sakladığı client'lar geçerli kalsın diye önbellek temizlenmez
+if hasattr(os, 'register_at_fork'):
+    def _reset_after_fork():
+        global _lock, _pid
+        _lock = threading.Lock()
+        _pid = os.getpid()
+        for client in list(_clients.values()) + [resource.meta.client for resource in _resources.values()]:
+            _drop_connections(client)
+
+    os.register_at_fork(after_in_child=_reset_after_fork)
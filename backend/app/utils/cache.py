@@ -0,0 +1,222 @@
+"""
+Önbellek Yardımcıları
+-------------------
+İşlem içi (process-local), süreli ve boyut sınırlı LRU önbellek.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Thread-safe TTL + LRU önbellek.
+
+    Kayıtlar `ttl` saniye sonra geçersiz olur; kapasite dolduğunda en uzun
+    süredir kullanılmayan kayıt atılır. İsabet oranı ölçülebilsin diye
+    isabet/ıskalama sayaçları tutulur.
+
+    Yükleme sürerken silinen (geçersiz kılınan) anahtarın sonucu önbelleğe
+    yazılmaz: her yükleme begin_load ile anahtarın o anki kuşağını alır,
+    delete kuşağı artırır ve finish_load kuşak değiştiyse sonucu atar.
+
+    Attributes:
+        maxsize (int): En fazla tutulacak kayıt sayısı
+        ttl (float): Kayıtların geçerlilik süresi (saniye)
+    """
+
+    def __init__(self, maxsize=1024, ttl=60.0, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data = OrderedDict()
+        # Süren yüklemeler: anahtar -> [süren yükleme sayısı, kuşak]
+        self._loads = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """
+        Önbellekten değer döndürür.
+
+        Args:
+            key: Anahtar
+            default: Kayıt yoksa veya süresi dolmuşsa döndürülecek değer
+
+        Returns:
+            Önbellekteki değer veya default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at <= self._timer():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        """
+        Önbelleğe değer yazar.
+
+        Args:
+            key: Anahtar
+            value: Değer
+            ttl (float, optional): Bu kayda özel geçerlilik süresi
+        """
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def _store(self, key, value, ttl=None):
+        """Kaydı yazar ve kapasiteyi korur; _lock tutulurken çağrılmalıdır."""
+        self._data[key] = (value, self._timer() + (self.ttl if ttl is None else ttl))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def begin_load(self, key):
+        """
+        Anahtar için bir yüklemenin başladığını kaydeder.
+
+        Args:
+            key: Anahtar
+
+        Returns:
+            finish_load'a verilecek kuşak
+        """
+        with self._lock:
+            load = self._loads.setdefault(key, [0, 0])
+            load[0] += 1
+            return load[1]
+
+    def finish_load(self, key, generation, value=None, ttl=None):
+        """
+        Yüklemeyi bitirir; anahtar bu arada silinmediyse değeri önbelleğe yazar.
+
+        Yükleme hata verdiyse de value=None ile çağrılmalıdır.
+
+        Args:
+            key: Anahtar
+            generation: begin_load'ın döndürdüğü kuşak
+            value: Yüklenen değer; None yazılmaz
+            ttl (float, optional): Bu kayda özel geçerlilik süresi
+
+        Returns:
+            bool: Değer önbelleğe yazıldıysa True
+        """
+        with self._lock:
+            load = self._loads[key]
+            load[0] -= 1
+            if load[0] == 0:
+                del self._loads[key]
+            if value is None or load[1] != generation:
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    def update(self, key, updater):
+        """
+        Mevcut bir kaydı süresini uzatmadan günceller.
+
+        Kayıt yoksa veya süresi dolmuşsa hiçbir şey yapılmaz; böylece
+        başka süreçlerdeki değişiklikler en geç ttl sonunda yeniden okunur.
+
+        Args:
+            key: Anahtar
+            updater (callable): Eski değeri alıp yeni değeri döndüren fonksiyon
+
+        Returns:
+            Yeni değer veya kayıt yoksa None
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[1] <= self._timer():
+                return None
+
+            value = updater(entry[0])
+            self._data[key] = (value, entry[1])
+            return value
+
+    def delete(self, key):
+        """
+        Kaydı önbellekten siler.
+
+        Args:
+            key: Anahtar
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            # Süren yüklemeler eski değeri geri yazmasın
+            load = self._loads.get(key)
+            if load is not None:
+                load[1] += 1
+
+    def clear(self):
+        """Tüm kayıtları ve sayaçları sıfırlar."""
+        with self._lock:
+            self._data.clear()
+            for load in self._loads.values():
+                load[1] += 1
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_or_load(self, key, loader):
+        """
+        Kayıt önbellekte yoksa loader ile yükler ve önbelleğe yazar (read-through).
+
+        None dönen sonuçlar ve yükleme sürerken silinen anahtarın sonucu
+        önbelleğe yazılmaz.
+
+        Args:
+            key: Anahtar
+            loader (callable): Değeri üreten fonksiyon
+
+        Returns:
+            Önbellekteki veya yeni yüklenen değer
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self.begin_load(key)
+        value = None
+        try:
+            value = loader()
+        finally:
+            self.finish_load(key, generation, value)
+        return value
+
+    def stats(self):
+        """
+        Önbellek istatistiklerini döndürür.
+
+        Returns:
+            dict: Boyut, isabet, ıskalama ve isabet oranı
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': (self.hits / lookups) if lookups else 0.0
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,93 @@
+"""
+Eşzamanlılık Yardımcıları
+-----------------------
+Bir istek içindeki birbirinden bağımsız DynamoDB/S3 çağrılarını sınırlı
+bir thread havuzunda paralel çalıştırır.
+
+boto3 çağrıları ağ beklemesinde GIL'i bıraktığından thread'ler yeterlidir;
+paylaşılan client'ların bağlantı havuzu (app.utils.aws) eşzamanlı çağrıları
+karşılayacak büyüklüktedir. Her çağrı, çağıran thread'in contextvars
+kopyasıyla çalışır.
+"""
+
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from typing import Any, Callable, List, Optional
+
+from app.utils.exceptions import GatewayTimeoutError
+
+# Tüm istekler arasında paylaşılan işçi sayısı
+FANOUT_MAX_WORKERS = int(os.getenv('FANOUT_MAX_WORKERS', '16'))
+# Bir paralel çağrı grubunun varsayılan süre bütçesi (saniye)
+FANOUT_TIMEOUT_SECONDS = float(os.getenv('FANOUT_TIMEOUT_SECONDS', '3'))
+
+_lock = threading.Lock()
+_executor = None
+_executor_pid = None
+# Havuz thread'lerini işaretler; iç içe çağrılar havuzu kilitlemesin
+_worker = threading.local()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Bu sürecin thread havuzunu döndürür; fork sonrası yenisini kurar."""
+    global _executor, _executor_pid
+
+    with _lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=FANOUT_MAX_WORKERS,
+                thread_name_prefix='fanout',
+                initializer=_mark_worker
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _mark_worker():
+    _worker.active = True
+
+
+def run_parallel(*calls: Callable[[], Any], timeout: Optional[float] = None) -> List[Any]:
+    """
+    Argümansız çağrıları paralel çalıştırır ve sonuçlarını sırayla döndürür.
+
+    Çağrılardan biri hata verirse diğerleri beklenmeden ilk hata yükseltilir
+    (başlamış çağrılar arka planda tamamlanır). Havuz thread'inden yapılan
+    iç içe çağrılar kilitlenmeyi önlemek için sırayla çalıştırılır.
+
+    Args:
+        *calls: Çalıştırılacak çağrılar (ör. lambda: table.get_item(...))
+        timeout (float, optional): Süre bütçesi; verilmezse FANOUT_TIMEOUT_SECONDS
+
+    Returns:
+        list: Çağrıların sonuçları, verildikleri sırayla
+
+    Raises:
+        GatewayTimeoutError: Süre bütçesi aşılırsa
+    """
+    if len(calls) < 2 or getattr(_worker, 'active', False):
+        return [call() for call in calls]
+
+    timeout = FANOUT_TIMEOUT_SECONDS if timeout is None else timeout
+    executor = _get_executor()
+    futures = [
+        executor.submit(contextvars.copy_context().run, call)
+        for call in calls
+    ]
+
+    done, pending = wait(futures, timeout=timeout, return_when=FIRST_EXCEPTION)
+    for future in futures:
+        if future in done and future.exception() is not None:
+            for other in pending:
+                other.cancel()
+            raise future.exception()
+
+    if pending:
+        for future in pending:
+            future.cancel()
+        raise GatewayTimeoutError()
+
+    return [future.result() for future in futures]
+
@@ -0,0 +1,115 @@
+"""
+DynamoDB Yardımcıları
+-------------------
+Resource (yüksek seviye) API'nin sunmadığı işlemler için yardımcılar:
+toplu okuma, transactional yazma ve hata ayrıştırma.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+# BatchGetItem tek istekte en fazla 100 anahtar kabul eder
+BATCH_GET_LIMIT = 100
+# İşlenmemiş anahtarlar için en fazla yeniden deneme sayısı
+BATCH_GET_MAX_RETRIES = 5
+
+
+def batch_get_items(dynamodb, table_name: str, keys: List[Dict], **params) -> List[Dict]:
+    """
+    Anahtarları 100'lük gruplar halinde BatchGetItem ile okur.
+
+    İşlenmemiş (UnprocessedKeys) anahtarlar artan beklemeyle yeniden istenir.
+    Sonuçların sırası garanti değildir; bulunamayan anahtarlar atlanır.
+
+    Args:
+        dynamodb: boto3 DynamoDB resource'u
+        table_name (str): Tablo adı
+        keys (list): Tam anahtar listesi
+        **params: Tabloya özel ek parametreler (ör. ProjectionExpression)
+
+    Returns:
+        list: Bulunan öğeler
+
+    Raises:
+        ClientError: Yeniden denemelere rağmen anahtarlar işlenemezse
+    """
+    items = []
+
+    for start in range(0, len(keys), BATCH_GET_LIMIT):
+        request = {table_name: dict(params, Keys=keys[start:start + BATCH_GET_LIMIT])}
+
+        for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+            response = dynamodb.batch_get_item(RequestItems=request)
+            items.extend(response.get('Responses', {}).get(table_name, []))
+
+            request = response.get('UnprocessedKeys') or {}
+            if not request:
+                break
+            time.sleep(0.05 * (2 ** attempt))
+        else:
+            raise ClientError(
+                {'Error': {'Code': 'UnprocessedKeys', 'Message': 'Batch read did not complete'}},
+                'BatchGetItem'
+            )
+
+    return items
+
+
+def transact_write(client, actions: List[Dict[str, Dict]]):
+    """
+    İşlemleri tek bir TransactWriteItems çağrısında uygular.
+
+    Her işlem {'Put' | 'Update' | 'Delete' | 'ConditionCheck': {...}} biçimindedir.
+    client, resource'a bağlı client (dynamodb.meta.client) olmalıdır; bu client
+    Item, Key ve ExpressionAttributeValues içindeki Python değerlerini kendisi
+    serileştirir.
+
+    Args:
+        client: DynamoDB resource'unun client'ı
+        actions (list): İşlem listesi
+
+    Raises:
+        ClientError: İşlem iptal edilirse (TransactionCanceledException)
+    """
+    client.transact_write_items(TransactItems=actions)
+
+
+def is_conditional_check_failure(error: ClientError) -> bool:
+    """
+    Hatanın koşullu yazma başarısızlığı olup olmadığını kontrol eder.
+
+    Args:
+        error (ClientError): boto3 hatası
+
+    Returns:
+        bool: ConditionalCheckFailedException ise True
+    """
+    return error.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException'
+
+
+def cancellation_reasons(error: ClientError) -> Optional[List[str]]:
+    """
+    İptal edilen bir transaction'da her işlemin iptal kodunu döndürür.
+
+    Args:
+        error (ClientError): boto3 hatası
+
+    Returns:
+        list: İşlem sırasına göre iptal kodları ('None', 'ConditionalCheckFailed', ...)
+              veya hata bir transaction iptali değilse None
+    """
+    if error.response.get('Error', {}).get('Code') != 'TransactionCanceledException':
+        return None
+
+    reasons = error.response.get('CancellationReasons')
+    if reasons:
+        return [reason.get('Code', 'None') for reason in reasons]
+
+    # Bazı sürümler nedenleri yalnızca mesaj içinde döndürür:
+    # "... cancelled, please refer cancellation reasons for specific reasons [None, ConditionalCheckFailed]"
+    message = error.response.get('Error', {}).get('Message', '')
+    if '[' in message and message.endswith(']'):
+        return [code.strip() for code in message[message.rindex('[') + 1:-1].split(',')]
+    return []
@@ -123,4 +123,36 @@ class ConflictError(ApiError):
             message (str, optional): Hata mesajı
             errors (list/dict, optional): Hata detayları
         """
-        super().__init__(409, message, errors)
\ No newline at end of file
+        super().__init__(409, message, errors)
+
+class GatewayTimeoutError(ApiError):
+    """
+    Arka uç çağrıları istek süre bütçesini aştığında kullanılan istisna sınıfı.
+    """
+    
+    def __init__(self, message="İşlem zaman aşımına uğradı", errors=None):
+        """
+        GatewayTimeoutError istisnasını başlat.
+        
+        Args:
+            message (str, optional): Hata mesajı
+            errors (list/dict, optional): Hata detayları
+        """
+        super().__init__(504, message, errors)
+
+class ServiceUnavailableError(ApiError):
+    """
+    Sunucu geçici olarak aşırı yüklendiğinde (yük atma) kullanılan istisna sınıfı.
+    """
+    
+    def __init__(self, message="Sunucu şu anda yoğun, lütfen tekrar deneyin", errors=None, retry_after=1):
+        """
+        ServiceUnavailableError istisnasını başlat.
+        
+        Args:
+            message (str, optional): Hata mesajı
+            errors (list/dict, optional): Hata detayları
+            retry_after (int, optional): İstemcinin tekrar denemeden önce beklemesi gereken süre (saniye)
+        """
+        super().__init__(503, message, errors)
+        self.retry_after = retry_after
@@ -0,0 +1,144 @@
+"""
+Görsel Türevleri
+--------------
+Yüklenen görsellerden küçültülmüş türevler (thumb, medium) üretir.
+
+Her türev, orijinalin biçiminde (JPEG/PNG) ve WebP olarak orijinalin yanına
+belirli bir adla yazılır: 'forum/u1/abc.jpg' için 'forum/u1/abc__thumb.webp'
+ve 'forum/u1/abc__thumb.jpg'. Türevler arka planda üretildiği için yanıtlar
+yalnızca medya kaydına yazılmış (varyantlar) türevleri verir; henüz
+üretilmemiş türevlerin yerine orijinal URL döner.
+"""
+
+import io
+import os
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+# Türev adı -> en uzun kenar (piksel)
+IMAGE_VARIANTS = {
+    'thumb': int(os.getenv('IMAGE_THUMB_SIZE', '320')),
+    'medium': int(os.getenv('IMAGE_MEDIUM_SIZE', '1080'))
+}
+IMAGE_WEBP_QUALITY = int(os.getenv('IMAGE_WEBP_QUALITY', '80'))
+IMAGE_JPEG_QUALITY = int(os.getenv('IMAGE_JPEG_QUALITY', '85'))
+# Açılan görselin en fazla piksel sayısı (sıkıştırma bombalarına karşı)
+IMAGE_MAX_PIXELS = int(os.getenv('IMAGE_MAX_PIXELS', str(50_000_000)))
+# Türev üretilen uzantılar
+IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg'}
+
+_S3_BUCKET = os.getenv('S3_BUCKET_NAME')
+_S3_REGION = os.getenv('AWS_DEFAULT_REGION')
+
+_FORMATS = {
+    'JPEG': ('jpg', 'image/jpeg'),
+    'PNG': ('png', 'image/png'),
+    'WEBP': ('webp', 'image/webp')
+}
+
+
+def variant_key(s3_key: str, variant: str, extension: str = 'webp') -> str:
+    """
+    Orijinal nesne anahtarından türev anahtarını üretir.
+
+    Args:
+        s3_key (str): Orijinal nesnenin anahtarı
+        variant (str): Türev adı (thumb, medium)
+        extension (str, optional): Türevin uzantısı
+
+    Returns:
+        str: Türev nesnesinin anahtarı
+    """
+    stem = s3_key.rsplit('.', 1)[0] if '.' in s3_key.rsplit('/', 1)[-1] else s3_key
+    return f"{stem}__{variant}.{extension}"
+
+
+def _encode(image: Image.Image, image_format: str) -> bytes:
+    buffer = io.BytesIO()
+    if image_format == 'JPEG':
+        image.convert('RGB').save(buffer, 'JPEG', quality=IMAGE_JPEG_QUALITY, optimize=True, progressive=True)
+    elif image_format == 'WEBP':
+        image.save(buffer, 'WEBP', quality=IMAGE_WEBP_QUALITY, method=4)
+    else:
+        image.save(buffer, image_format, optimize=True)
+    return buffer.getvalue()
+
+
+def render_variants(data: bytes) -> List[Tuple[str, str, bytes, str]]:
+    """
+    Görselin tüm türevlerini üretir.
+
+    Türevler en boy oranını korur ve orijinalden büyük olmaz. EXIF yönü
+    piksellere uygulanır (türevlerde meta veri tutulmaz).
+
+    Args:
+        data (bytes): Orijinal görsel
+
+    Returns:
+        List[Tuple[str, str, bytes, str]]: (türev adı, uzantı, içerik, içerik türü)
+
+    Raises:
+        PIL.UnidentifiedImageError: Veri görsel değilse
+        PIL.Image.DecompressionBombError: Görsel IMAGE_MAX_PIXELS'in çok üstündeyse
+    """
+    Image.MAX_IMAGE_PIXELS = IMAGE_MAX_PIXELS
+    with Image.open(io.BytesIO(data)) as source:
+        source_format = source.format if source.format in ('JPEG', 'PNG') else 'PNG'
+        image = ImageOps.exif_transpose(source)
+        image.load()
+
+    if image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+
+    variants = []
+    for name, size in IMAGE_VARIANTS.items():
+        resized = image.copy()
+        resized.thumbnail((size, size), Image.LANCZOS)
+        for image_format in (source_format, 'WEBP'):
+            extension, content_type = _FORMATS[image_format]
+            variants.append((name, extension, _encode(resized, image_format), content_type))
+    return variants
+
+
+def _bucket_key(url: str) -> Optional[str]:
+    """URL bu uygulamanın herkese açık bucket'ındaki bir görselse nesne anahtarını döndürür."""
+    if not url or not _S3_BUCKET or '?' in url:
+        return None
+    prefix = f"https://{_S3_BUCKET}.s3.{_S3_REGION}.amazonaws.com/"
+    if not url.startswith(prefix):
+        return None
+    key = url[len(prefix):]
+    if key.rsplit('.', 1)[-1].lower() not in IMAGE_EXTENSIONS or '__' in key.rsplit('/', 1)[-1]:
+        return None
+    return key
+
+
+def media_id_from_key(s3_key: str) -> Optional[str]:
+    """Doğrudan yüklemenin anahtarındaki medya ID'sini döndürür ('forum/u1/med_x.jpg' -> 'med_x')."""
+    name = s3_key.rsplit('/', 1)[-1].rsplit('.', 1)[0]
+    return name if name.startswith('med_') else None
+
+
+def image_variants(url: str) -> Dict[str, str]:
+    """
+    Görsel URL'inin WebP türevlerinin URL'lerini döndürür.
+
+    Args:
+        url (str): Orijinal görselin URL'i
+
+    Returns:
+        Dict[str, str]: Türev adı -> URL; türev henüz kaydedilmemişse orijinal
+        URL, URL bu bucket'a ait bir görsel değilse boş
+    """
+    key = _bucket_key(url)
+    if key is None:
+        return {}
+    # Servisler bu modülü içe aktarır
+    from app.services.media_service import MediaService
+    recorded = MediaService.get_instance().recorded_variants(key)
+    base = url[:-len(key)]
+    return {
+        name: base + recorded[name]['webp'] if 'webp' in recorded.get(name, {}) else url
+        for name in IMAGE_VARIANTS
+    }
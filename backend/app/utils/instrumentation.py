@@ -0,0 +1,314 @@
+"""
+Arka Uç Çağrı Ölçümü
+------------------
+İstek başına DynamoDB/S3 çağrılarını (işlem, tablo, süre, dönen öğe sayısı,
+ConsumedCapacity) kaydeder.
+
+Ölçüm bağlamı bir contextvar'da tutulur; run_parallel ile başka thread'lerde
+yapılan çağrılar da bağlamı kopyaladığı için aynı isteğe yazılır. boto3
+client'ları app.utils.aws içinde instrument_client ile botocore olaylarına
+bağlanır; SQLite motoru aynı kayıt fonksiyonunu doğrudan çağırır.
+"""
+
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+# DynamoDB'den tüketilen kapasiteyi istemek için: TOTAL, INDEXES veya NONE
+AWS_RETURN_CONSUMED_CAPACITY = os.getenv('AWS_RETURN_CONSUMED_CAPACITY', 'TOTAL').upper()
+
+# ReturnConsumedCapacity parametresini kabul eden DynamoDB işlemleri
+CAPACITY_OPERATIONS = {
+    'GetItem', 'PutItem', 'UpdateItem', 'DeleteItem', 'Query', 'Scan',
+    'BatchGetItem', 'BatchWriteItem', 'TransactGetItems', 'TransactWriteItems'
+}
+
+_CONTEXT_KEY = 'chrip_instrumentation'
+
+_current: ContextVar[Optional['RequestStats']] = ContextVar('backend_request_stats', default=None)
+
+
+class RequestStats:
+    """
+    Bir istek sırasında yapılan arka uç çağrıları (thread-safe).
+
+    Attributes:
+        calls (list): Çağrı kayıtları (service, operation, table, duration_ms, items, consumed_capacity)
+        started_at (float): İsteğin başladığı an (perf_counter)
+    """
+
+    def __init__(self):
+        self.calls: List[Dict[str, Any]] = []
+        self.started_at = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, call: Dict[str, Any]):
+        with self._lock:
+            self.calls.append(call)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Çağrıları servis ve işlem bazında toplar.
+
+        Returns:
+            dict: 'service.Operation' -> çağrı sayısı, toplam süre, öğe, kapasite ve tablolar
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            calls = list(self.calls)
+
+        for call in calls:
+            entry = totals.setdefault(f"{call['service']}.{call['operation']}", {
+                'service': call['service'],
+                'operation': call['operation'],
+                'count': 0,
+                'duration_ms': 0.0,
+                'items': None,
+                'consumed_capacity': None,
+                'tables': set()
+            })
+            entry['count'] += 1
+            entry['duration_ms'] += call['duration_ms']
+            if call['items'] is not None:
+                entry['items'] = (entry['items'] or 0) + call['items']
+            if call['consumed_capacity'] is not None:
+                entry['consumed_capacity'] = (entry['consumed_capacity'] or 0) + call['consumed_capacity']
+            entry['tables'].update(call['tables'])
+        return totals
+
+    @property
+    def total_calls(self) -> int:
+        with self._lock:
+            return len(self.calls)
+
+    @property
+    def total_duration_ms(self) -> float:
+        with self._lock:
+            return sum(call['duration_ms'] for call in self.calls)
+
+
+def start_request() -> RequestStats:
+    """
+    Geçerli bağlam için yeni bir ölçüm başlatır.
+
+    Returns:
+        RequestStats: İstek boyunca doldurulacak kayıt
+    """
+    stats = RequestStats()
+    _current.set(stats)
+    return stats
+
+
+def current_stats() -> Optional[RequestStats]:
+    """Geçerli isteğin ölçümünü döndürür; istek dışında None."""
+    return _current.get()
+
+
+def end_request():
+    """Geçerli bağlamdaki ölçümü bırakır."""
+    _current.set(None)
+
+
+def record_call(service: str, operation: str, tables: List[str], duration: float,
+                items: Optional[int] = None, consumed_capacity: Optional[float] = None):
+    """
+    Bir arka uç çağrısını geçerli isteğe kaydeder; istek dışında hiçbir şey yapmaz.
+
+    Args:
+        service (str): Servis adı (ör. 'dynamodb', 's3', 'sqlite')
+        operation (str): API işlem adı (ör. 'Query')
+        tables (list): İlgili tablo (veya bucket) adları
+        duration (float): Süre (saniye)
+        items (int, optional): Dönen öğe sayısı
+        consumed_capacity (float, optional): Tüketilen kapasite birimi
+    """
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.add({
+        'service': service,
+        'operation': operation,
+        'tables': list(tables),
+        'duration_ms': duration * 1000,
+        'items': items,
+        'consumed_capacity': consumed_capacity
+    })
+
+
+def request_tables(params: Dict[str, Any]) -> List[str]:
+    """
+    İstek parametrelerinden etkilenen tablo/bucket adlarını çıkarır.
+
+    Args:
+        params (dict): API çağrı parametreleri
+
+    Returns:
+        list: Tablo adları (sırası korunur, tekrarsız)
+    """
+    tables = []
+    if 'TableName' in params:
+        tables.append(params['TableName'])
+    if 'Bucket' in params:
+        tables.append(params['Bucket'])
+    tables.extend(params.get('RequestItems', {}).keys())
+    for action in params.get('TransactItems', []):
+        for request in action.values():
+            if 'TableName' in request:
+                tables.append(request['TableName'])
+    return list(dict.fromkeys(tables))
+
+
+def response_items(response: Any) -> Optional[int]:
+    """
+    Yanıtta dönen öğe sayısını hesaplar.
+
+    Returns:
+        int: Öğe sayısı; yanıt öğe döndürmeyen bir işleme aitse None
+    """
+    if not isinstance(response, dict):
+        return None
+    if 'Count' in response:
+        return response['Count']
+    if 'Items' in response:
+        return len(response['Items'])
+    if 'Responses' in response:
+        responses = response['Responses']
+        if isinstance(responses, dict):
+            return sum(len(items) for items in responses.values())
+        return sum(1 for entry in responses if entry.get('Item'))
+    if 'Item' in response:
+        return 1
+    return None
+
+
+def consumed_capacity(response: Any) -> Optional[float]:
+    """
+    Yanıttaki ConsumedCapacity değerlerini toplar.
+
+    Returns:
+        float: Toplam kapasite birimi; yanıtta yoksa None
+    """
+    if not isinstance(response, dict) or 'ConsumedCapacity' not in response:
+        return None
+    capacity = response['ConsumedCapacity']
+    entries = capacity if isinstance(capacity, list) else [capacity]
+    return float(sum(entry.get('CapacityUnits', 0) for entry in entries))
+
+
+def _request_consumed_capacity(params, model, **kwargs):
+    """provide-client-params: DynamoDB'den tüketilen kapasiteyi ister."""
+    if (AWS_RETURN_CONSUMED_CAPACITY != 'NONE'
+            and model.name in CAPACITY_OPERATIONS
+            and 'ReturnConsumedCapacity' not in params):
+        params['ReturnConsumedCapacity'] = AWS_RETURN_CONSUMED_CAPACITY
+
+
+def _remember_request(params, model, context, **kwargs):
+    """before-parameter-build: çağrının tablolarını ve başlangıç anını saklar."""
+    context[_CONTEXT_KEY] = {
+        'service': model.service_model.service_id.hyphenize(),
+        'operation': model.name,
+        'tables': request_tables(params),
+        'started': time.perf_counter()
+    }
+
+
+def _record_response(http_response, parsed, model, context, **kwargs):
+    """after-call: çağrıyı geçerli isteğe kaydeder (hatalı yanıtlar dahil)."""
+    call = context.pop(_CONTEXT_KEY, None)
+    if call is None:
+        return
+    record_call(
+        call['service'],
+        call['operation'],
+        call['tables'],
+        time.perf_counter() - call['started'],
+        items=response_items(parsed) if call['service'] == 'dynamodb' else None,
+        consumed_capacity=consumed_capacity(parsed)
+    )
+
+
+def _record_error(exception, context, **kwargs):
+    """after-call-error: yanıt alınamayan (bağlantı hatası vb.) çağrıyı kaydeder."""
+    call = context.pop(_CONTEXT_KEY, None)
+    if call is None:
+        return
+    record_call(
+        call['service'],
+        call['operation'],
+        call['tables'],
+        time.perf_counter() - call['started']
+    )
+
+
+def instrument_client(client):
+    """
+    boto3 client'ının tüm çağrılarını ölçüme bağlar.
+
+    DynamoDB çağrılarına ReturnConsumedCapacity eklenir. Süre, yeniden
+    denemeler dahil çağrının tamamını kapsar.
+
+    Args:
+        client: botocore client'ı (resource için resource.meta.client)
+
+    Returns:
+        Aynı client
+    """
+    service = client.meta.service_model.service_id.hyphenize()
+    events = client.meta.events
+    if service == 'dynamodb':
+        events.register('provide-client-params.dynamodb.*', _request_consumed_capacity,
+                        unique_id='chrip-consumed-capacity')
+    events.register(f'before-parameter-build.{service}.*', _remember_request,
+                    unique_id='chrip-remember-request')
+    events.register(f'after-call.{service}.*', _record_response,
+                    unique_id='chrip-record-response')
+    events.register(f'after-call-error.{service}.*', _record_error,
+                    unique_id='chrip-record-error')
+    return client
+
+
+def server_timing(stats: RequestStats, total_ms: Optional[float] = None) -> str:
+    """
+    Ölçümü Server-Timing başlık değerine çevirir.
+
+    Her servis/işlem çifti ayrı bir metrik olur, ör.
+    ``dynamodb-scan;desc="21x Comments, 340 items, 42.5 CU";dur=63.2``.
+
+    Args:
+        stats (RequestStats): İstek ölçümü
+        total_ms (float, optional): İsteğin toplam süresi
+
+    Returns:
+        str: Başlık değeri
+    """
+    metrics = []
+    for entry in stats.summary().values():
+        description = f"{entry['count']}x {','.join(sorted(entry['tables']))}".strip()
+        if entry['items'] is not None:
+            description += f", {entry['items']} items"
+        if entry['consumed_capacity'] is not None:
+            description += f", {entry['consumed_capacity']:g} CU"
+        name = f"{entry['service']}-{entry['operation']}".lower()
+        metrics.append(f'{name};desc="{description}";dur={entry["duration_ms"]:.1f}')
+
+    metrics.append(f'backend;desc="{stats.total_calls} calls";dur={stats.total_duration_ms:.1f}')
+    if total_ms is not None:
+        metrics.append(f'total;dur={total_ms:.1f}')
+    return ', '.join(metrics)
+
+
+__all__ = [
+    'RequestStats',
+    'start_request',
+    'current_stats',
+    'end_request',
+    'record_call',
+    'request_tables',
+    'response_items',
+    'consumed_capacity',
+    'instrument_client',
+    'server_timing'
+]
@@ -0,0 +1,224 @@
+"""
+Günlük Kaydı (Logging) Altyapısı
+------------------------------
+structlog tabanlı, istek thread'ini bloklamayan yapılandırılmış log hattı.
+
+İstek thread'i yalnızca olayı bir kuyruğa bırakır (QueueHandler);
+biçimlendirme ve yazma işi ayrı bir dinleyici thread'inde (QueueListener)
+yapılır. Seviyesi kapalı olan olaylar structlog'un ilk işlemcisinde
+(filter_by_level) düşürülür, yani devre dışı debug log'larının maliyeti
+yoktur. structlog.contextvars ile bağlanan değerler (ör. request_id) hem
+structlog hem de standart logging kayıtlarına eklenir; run_parallel
+bağlamı kopyaladığı için paralel çağrılardaki log'lar da aynı isteğe
+bağlanır.
+
+Ayarlar (app.config):
+    LOG_LEVEL: Kök seviye
+    LOG_LEVELS: Logger bazında seviyeler, ör. "botocore=WARNING,app.middleware=DEBUG"
+    LOG_FORMAT: console veya json
+    LOG_FILE: Ek olarak yazılacak dosya
+    LOG_DEBUG_SAMPLE_RATE: structlog debug olaylarının tutulma oranı (0-1)
+"""
+
+import atexit
+import logging
+import os
+import queue
+import random
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+import structlog
+
+_listener: Optional[QueueListener] = None
+_handlers = []
+_sample_rate = 1.0
+_time_formatter = logging.Formatter(datefmt='%Y-%m-%d %H:%M:%S')
+
+
+class _ContextQueueHandler(QueueHandler):
+    """
+    Kaydı biçimlendirmeden kuyruğa bırakan QueueHandler.
+
+    Varsayılan QueueHandler.prepare kaydı çağıran thread'de biçimlendirir;
+    burada yalnızca geçerli structlog contextvars değerleri kayda eklenir,
+    biçimlendirme dinleyici thread'ine kalır.
+    """
+
+    def prepare(self, record):
+        record.context = structlog.contextvars.get_contextvars()
+        return record
+
+
+def _resolve_exc_info(logger, method_name, event_dict):
+    """exc_info=True'yu çağıran thread'de gerçek istisna bilgisine çevirir."""
+    if event_dict.get('exc_info') is True:
+        event_dict['exc_info'] = sys.exc_info()
+    return event_dict
+
+
+def _sample_debug(logger, method_name, event_dict):
+    """Debug olaylarını LOG_DEBUG_SAMPLE_RATE oranında örnekler."""
+    if method_name == 'debug' and _sample_rate < 1.0 and random.random() >= _sample_rate:
+        raise structlog.DropEvent
+    return event_dict
+
+
+def _add_record_context(logger, method_name, event_dict):
+    """Kayıt oluşturulurken yakalanan contextvars değerlerini olaya ekler."""
+    record = event_dict.get('_record')
+    for key, value in (getattr(record, 'context', None) or {}).items():
+        event_dict.setdefault(key, value)
+    return event_dict
+
+
+def _add_timestamp(logger, method_name, event_dict):
+    """Zaman damgasını yazma anı yerine kaydın oluştuğu andan alır."""
+    record = event_dict.get('_record')
+    if record is not None:
+        event_dict['timestamp'] = _time_formatter.formatTime(record, _time_formatter.datefmt)
+    return event_dict
+
+
+def parse_levels(value: str) -> Dict[str, int]:
+    """
+    "logger=SEVİYE,..." biçimindeki ayarı çözümler.
+
+    Args:
+        value (str): Ayar değeri
+
+    Returns:
+        dict: Logger adı -> logging seviyesi; tanınmayan girdiler atlanır
+    """
+    levels = {}
+    for entry in (value or '').split(','):
+        name, _, level = entry.partition('=')
+        level = getattr(logging, level.strip().upper(), None)
+        if name.strip() and isinstance(level, int):
+            levels[name.strip()] = level
+    return levels
+
+
+def _build_formatter(log_format: str) -> structlog.stdlib.ProcessorFormatter:
+    if log_format == 'json':
+        renderer = [structlog.processors.format_exc_info, structlog.processors.JSONRenderer(ensure_ascii=False)]
+    else:
+        renderer = [structlog.dev.ConsoleRenderer(colors=False)]
+
+    return structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=[
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name
+        ],
+        processors=[
+            _add_record_context,
+            _add_timestamp,
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            *renderer
+        ]
+    )
+
+
+def _start_listener():
+    """Kök logger'a yeni bir kuyruk ve dinleyici thread'i bağlar."""
+    global _listener
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, _ContextQueueHandler):
+            root.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(_ContextQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """Kuyrukta kalan kayıtları yazar ve dinleyici thread'ini durdurur."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def configure_logging(app):
+    """
+    Uygulama için günlük kaydını yapılandırır.
+
+    Birden fazla create_app çağrısında dinleyici yeniden başlatılmaz;
+    yalnızca seviyeler ve örnekleme oranı güncellenir.
+
+    Args:
+        app (Flask): Flask uygulama örneği
+    """
+    global _sample_rate
+
+    log_level = getattr(logging, app.config['LOG_LEVEL'].upper(), logging.INFO)
+    _sample_rate = float(app.config.get('LOG_DEBUG_SAMPLE_RATE', 1.0))
+
+    if _listener is None:
+        formatter = _build_formatter(app.config.get('LOG_FORMAT', 'console'))
+        _handlers.clear()
+        _handlers.append(logging.StreamHandler(sys.stderr))
+        if app.config.get('LOG_FILE'):
+            _handlers.append(logging.FileHandler(app.config['LOG_FILE'], encoding='utf-8'))
+        for handler in _handlers:
+            handler.setFormatter(formatter)
+
+        structlog.configure(
+            processors=[
+                structlog.stdlib.filter_by_level,
+                _sample_debug,
+                structlog.stdlib.add_log_level,
+                structlog.stdlib.add_logger_name,
+                _resolve_exc_info,
+                structlog.stdlib.ProcessorFormatter.wrap_for_formatter
+            ],
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
+            cache_logger_on_first_use=True
+        )
+        _start_listener()
+        atexit.register(stop_logging)
+
+    # app.logger kök handler'ı bağlandıktan sonra oluşturulmalı, yoksa Flask
+    # kendi stderr handler'ını ekler. DEBUG modunda Flask onu DEBUG'a çeker;
+    # app.* logger'ları bu seviyeyi miras aldığından açıkça ayarlanır.
+    logging.getLogger().setLevel(log_level)
+    app.logger.setLevel(log_level)
+    for name, level in parse_levels(app.config.get('LOG_LEVELS', '')).items():
+        logging.getLogger(name).setLevel(level)
+
+    app.logger.info('Logging configured')
+
+
+def get_logger(name: str = None):
+    """
+    structlog logger'ı döndürür.
+
+    Args:
+        name (str, optional): Logger adı (genellikle __name__)
+
+    Returns:
+        structlog.stdlib.BoundLogger: Anahtar-değer alanlarıyla log yazan logger
+    """
+    return structlog.stdlib.get_logger(name)
+
+
+# Fork edilen çocuk süreçte (ör. gunicorn --preload) dinleyici thread'i yoktur
+if hasattr(os, 'register_at_fork'):
+    def _restart_after_fork():
+        if _listener is not None:
+            _start_listener()
+
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+__all__ = [
+    'configure_logging',
+    'get_logger',
+    'parse_levels',
+    'stop_logging'
+]
@@ -0,0 +1,130 @@
+"""
+Sayfalama Yardımcıları
+--------------------
+DynamoDB `LastEvaluatedKey` değerlerini istemciye opak devam imleçleri
+(cursor) olarak taşımak için yardımcı fonksiyonlar.
+"""
+
+import base64
+import json
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.utils.exceptions import ValidationError
+
+# Bir sayfayı doldururken her istekte okunacak en az öğe sayısı
+MIN_READ_LIMIT = 25
+
+
+def _json_default(value):
+    """Decimal anahtar değerlerini JSON'a çevirir."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Cursor içinde desteklenmeyen tip: {type(value)}")
+
+
+def encode_cursor(last_evaluated_key: Optional[Dict], index_name: Optional[str] = None) -> Optional[str]:
+    """
+    Son değerlendirilen anahtarı opak bir cursor string'ine çevirir.
+
+    Args:
+        last_evaluated_key (dict, optional): DynamoDB LastEvaluatedKey değeri
+        index_name (str, optional): Sorgunun çalıştığı index adı
+
+    Returns:
+        str: URL güvenli cursor veya devam yoksa None
+    """
+    if not last_evaluated_key:
+        return None
+
+    payload = json.dumps(
+        {'i': index_name, 'k': last_evaluated_key},
+        default=_json_default,
+        separators=(',', ':'),
+        sort_keys=True
+    )
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str], index_name: Optional[str] = None) -> Optional[Dict]:
+    """
+    Cursor string'ini ExclusiveStartKey olarak kullanılabilecek anahtara çevirir.
+
+    Args:
+        cursor (str, optional): encode_cursor ile üretilmiş cursor
+        index_name (str, optional): Sorgunun çalışacağı index adı
+
+    Returns:
+        dict: ExclusiveStartKey veya cursor yoksa None
+
+    Raises:
+        ValidationError: Cursor çözülemezse veya başka bir sorguya aitse
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(
+            base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'),
+            parse_int=Decimal,
+            parse_float=Decimal
+        )
+        key = payload['k']
+    except (ValueError, KeyError, TypeError):
+        raise ValidationError("Geçersiz cursor")
+
+    if payload.get('i') != index_name or not isinstance(key, dict):
+        raise ValidationError("Cursor bu sorguya ait değil")
+
+    return key
+
+
+def read_page(
+    operation: Callable,
+    params: Dict,
+    per_page: int,
+    exclusive_start_key: Optional[Dict],
+    key_attributes: Tuple[str, ...]
+) -> Tuple[List[Dict], Optional[Dict]]:
+    """
+    Sayfa dolana kadar LastEvaluatedKey'i takip ederek bir sayfa öğe okur.
+
+    Filtreler yüzünden elenen öğeler her seferinde ayrı bir istek
+    gerektirmesin diye her istekte en az MIN_READ_LIMIT öğe okunur; sayfa
+    taşarsa devam anahtarı verilen son öğeden üretilir.
+
+    Args:
+        operation (callable): table.query veya table.scan
+        params (dict): Query/scan parametreleri
+        per_page (int): İstenen öğe sayısı
+        exclusive_start_key (dict, optional): Devam edilecek anahtar
+        key_attributes (tuple): Tablo ve (varsa) index anahtar öznitelikleri
+
+    Returns:
+        tuple: (öğeler, son değerlendirilen anahtar veya None)
+    """
+    items = []
+    start_key = exclusive_start_key
+
+    while True:
+        request = dict(params)
+        request['Limit'] = max(per_page - len(items), MIN_READ_LIMIT)
+        if start_key:
+            request['ExclusiveStartKey'] = start_key
+
+        response = operation(**request)
+        items.extend(response.get('Items', []))
+        start_key = response.get('LastEvaluatedKey')
+
+        if len(items) > per_page:
+            # Verilen son öğenin hemen ardından devam et
+            items = items[:per_page]
+            last_item = items[-1]
+            start_key = {attribute: last_item[attribute] for attribute in key_attributes}
+            break
+
+        if not start_key or len(items) == per_page:
+            break
+
+    return items, start_key
@@ -0,0 +1,168 @@
+"""
+Şifre Hash'leme Havuzu
+--------------------
+bcrypt işlemlerini istek thread'i yerine sınırlı bir süreç havuzunda
+çalıştırır.
+
+bcrypt CPU'ya bağlıdır ve GIL'i tutan Python thread'leri arasında
+ölçeklenmez; bir giriş dalgasında tüm worker thread'leri bcrypt'e kilitlenir
+ve ucuz GET istekleri bekler. Burada en fazla PASSWORD_HASH_WORKERS süreç
+çalışır, PASSWORD_HASH_QUEUE_SIZE iş sırada bekleyebilir. Sıra doluysa yeni
+iş PASSWORD_HASH_QUEUE_TIMEOUT kadar bekledikten sonra 503 ile reddedilir
+(yük atma); böylece kimlik doğrulamanın CPU kullanımı sınırlanır.
+
+Havuz süreçleri fork yerine forkserver (yoksa spawn) ile başlatılır: havuz
+ilk istekte, çok thread'li bir worker'dan kurulur ve fork edilen çocuk başka
+thread'lerin tuttuğu kilitleri devralabilirdi. İşler doğrudan bcrypt
+fonksiyonlarıdır, bu yüzden havuz süreçleri app paketini değil yalnızca
+bcrypt'i içe aktarır.
+
+PASSWORD_HASH_WORKERS=0 işleri çağıran thread'de çalıştırır (testler ve
+tek süreçli geliştirme için).
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple
+
+import bcrypt
+
+from app.utils.exceptions import GatewayTimeoutError, ServiceUnavailableError
+
+# Yeni hash'lerde kullanılan bcrypt maliyeti (2^n tur)
+PASSWORD_HASH_ROUNDS = int(os.getenv('PASSWORD_HASH_ROUNDS', '12'))
+# Hash'leme süreç sayısı
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(max(1, (os.cpu_count() or 2) // 2))))
+# Çalışanlara ek olarak sırada bekleyebilecek iş sayısı
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv('PASSWORD_HASH_QUEUE_SIZE', '32'))
+# Sıra doluyken yer açılmasını bekleme süresi (saniye)
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv('PASSWORD_HASH_QUEUE_TIMEOUT', '0.5'))
+# Tek bir işin sonuç bekleme süresi (saniye)
+PASSWORD_HASH_TIMEOUT = float(os.getenv('PASSWORD_HASH_TIMEOUT', '10'))
+
+_lock = threading.Lock()
+_executor: Optional[ProcessPoolExecutor] = None
+_slots: Optional[threading.BoundedSemaphore] = None
+_executor_pid = None
+
+
+def _get_pool() -> Tuple[ProcessPoolExecutor, threading.BoundedSemaphore]:
+    """Bu sürecin havuzunu döndürür; fork sonrası veya havuz bozulduysa yenisini kurar."""
+    global _executor, _slots, _executor_pid
+
+    with _lock:
+        if _executor is None or _executor_pid != os.getpid():
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            context = multiprocessing.get_context(method)
+            _executor = ProcessPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, mp_context=context)
+            _slots = threading.BoundedSemaphore(PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_SIZE)
+            _executor_pid = os.getpid()
+        return _executor, _slots
+
+
+def _reset_pool(executor: ProcessPoolExecutor):
+    """Bozulan havuzu bırakır; sonraki çağrı yenisini kurar."""
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False)
+
+
+def shutdown_pool():
+    """Havuzu kapatır (testler ve süreç sonu için)."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _run(func: Callable[..., Any], *args) -> Any:
+    """
+    İşi havuzda çalıştırıp sonucunu döndürür.
+
+    Raises:
+        ServiceUnavailableError: Sıra dolu olduğu için iş reddedildiyse
+        GatewayTimeoutError: İş PASSWORD_HASH_TIMEOUT içinde bitmediyse
+    """
+    if PASSWORD_HASH_WORKERS <= 0:
+        return func(*args)
+
+    executor, slots = _get_pool()
+    if not slots.acquire(timeout=PASSWORD_HASH_QUEUE_TIMEOUT):
+        raise ServiceUnavailableError()
+
+    try:
+        future = executor.submit(func, *args)
+    except BrokenProcessPool:
+        slots.release()
+        _reset_pool(executor)
+        raise ServiceUnavailableError()
+    except BaseException:
+        slots.release()
+        raise
+    # Yer, iş gerçekten bittiğinde açılır (zaman aşımında değil)
+    future.add_done_callback(lambda _: slots.release())
+
+    try:
+        return future.result(timeout=PASSWORD_HASH_TIMEOUT)
+    except FutureTimeoutError:
+        raise GatewayTimeoutError()
+    except BrokenProcessPool:
+        _reset_pool(executor)
+        raise ServiceUnavailableError()
+
+
+def hash_password(password: str, rounds: int = None) -> str:
+    """
+    Şifreyi havuzda bcrypt ile hash'ler.
+
+    Args:
+        password (str): Ham şifre
+        rounds (int, optional): bcrypt maliyeti; varsayılan PASSWORD_HASH_ROUNDS
+
+    Returns:
+        str: Hash'lenmiş şifre
+    """
+    salt = bcrypt.gensalt(rounds or PASSWORD_HASH_ROUNDS)
+    hashed = _run(bcrypt.hashpw, password.encode('utf-8'), salt)
+    return hashed.decode('utf-8')
+
+
+def check_password(password: str, hashed_password: str) -> bool:
+    """
+    Şifreyi havuzda hash ile karşılaştırır.
+
+    Args:
+        password (str): Ham şifre
+        hashed_password (str): Kayıtlı hash
+
+    Returns:
+        bool: Şifre eşleşiyorsa True
+    """
+    return _run(bcrypt.checkpw, password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """Hash'in bcrypt maliyetini döndürür ('$2b$12$...' -> 12); çözümlenemezse None."""
+    parts = (hashed_password or '').split('$')
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Hash'in maliyeti PASSWORD_HASH_ROUNDS'dan farklıysa True döndürür.
+
+    Args:
+        hashed_password (str): Kayıtlı hash
+
+    Returns:
+        bool: Şifre yeni maliyetle yeniden hash'lenmeliyse True
+    """
+    return hash_rounds(hashed_password) != PASSWORD_HASH_ROUNDS
@@ -4,8 +4,10 @@ API Yanıt Yardımcıları
 Tutarlı API yanıtları oluşturmak için yardımcı fonksiyonlar.
 """
 
+import hashlib
+import json
 import math
-from flask import jsonify
+from flask import jsonify, request, make_response
 
 
 def success_response(data=None, message="İşlem başarılı", status_code=200, meta=None):
@@ -35,6 +37,48 @@ def success_response(data=None, message="İşlem başarılı", status_code=200,
     return jsonify(response), status_code
 
 
+def compute_etag(data):
+    """
+    Veri için içerik tabanlı bir ETag değeri üretir.
+    
+    Aynı veri her süreçte aynı ETag'i verir.
+    
+    Args:
+        data (any): JSON'a çevrilebilir veri
+    
+    Returns:
+        str: ETag değeri (tırnaksız)
+    """
+    payload = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def cached_response(data, message="İşlem başarılı", max_age=0):
+    """
+    ETag ve If-None-Match destekli başarılı API yanıtı oluşturur.
+    
+    İstemcinin elindeki sürüm güncelse gövdesiz 304 döner.
+    
+    Args:
+        data (any): Yanıt verileri
+        message (str, optional): Başarı mesajı
+        max_age (int, optional): Cache-Control max-age değeri (saniye)
+    
+    Returns:
+        Response: Flask yanıtı
+    """
+    etag = compute_etag(data)
+    
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        response = make_response(success_response(data, message))
+    
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f"private, max-age={int(max_age)}"
+    return response
+
+
 def error_response(message="Bir hata oluştu", status_code=400, errors=None):
     """
     Hata API yanıtı oluşturur.
@@ -141,4 +185,40 @@ def deleted_response(message="Kayıt başarıyla silindi"):
     Returns:
         tuple: Yanıt ve HTTP durum kodu
     """
-    return success_response(None, message, 200)
\ No newline at end of file
+    return success_response(None, message, 200)
+
+def cursor_meta(per_page, next_cursor=None):
+    """
+    İmleç (cursor) tabanlı sayfalama meta verilerini oluşturur.
+    
+    Args:
+        per_page (int): Sayfa başına öğe sayısı
+        next_cursor (str, optional): Sonraki sayfa için cursor
+    
+    Returns:
+        dict: Sayfalama meta verileri
+    """
+    return {
+        "pagination": {
+            "per_page": per_page,
+            "next_cursor": next_cursor,
+            "has_next": next_cursor is not None
+        }
+    }
+
+
+def cursor_list_response(items, next_cursor=None, per_page=10, message="Liste başarıyla getirildi"):
+    """
+    İmleç tabanlı sayfalanmış liste yanıtı oluşturur.
+    
+    Args:
+        items (list): Öğe listesi
+        next_cursor (str, optional): Sonraki sayfa için cursor
+        per_page (int, optional): Sayfa başına öğe sayısı
+        message (str, optional): Başarı mesajı
+    
+    Returns:
+        tuple: Yanıt ve HTTP durum kodu
+    """
+    meta = cursor_meta(per_page, next_cursor)
+    return success_response(items, message, 200, meta)
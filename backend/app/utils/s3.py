@@ -6,28 +6,95 @@ S3 medya yükleme ve yönetim fonksiyonları.
 
 import uuid
 import logging
-import boto3
+import time
 from botocore.exceptions import ClientError
 from flask import current_app
 import os
 
+from app.utils.aws import get_client
+from app.utils.cache import TTLCache
+
 # Logger tanımı
 logger = logging.getLogger(__name__)
 
+# Süreç başına tutulacak en fazla imzalı URL
+PRESIGNED_URL_CACHE_SIZE = int(os.getenv('PRESIGNED_URL_CACHE_SIZE', '10000'))
+# İmzalı URL, geçerlilik süresinin bu oranı kadar yeniden kullanılır; istemciye
+# verilen URL'nin kalan ömrü en az (1 - oran) * süre olur
+PRESIGNED_URL_REUSE_RATIO = float(os.getenv('PRESIGNED_URL_REUSE_RATIO', '0.5'))
+
+
+class PresignedUrlCache:
+    """
+    İmzalı URL'leri süresi dolmaya yaklaşana kadar yeniden kullanan önbellek.
+
+    Zaman, uzunluğu expires_in * reuse_ratio olan pencerelere bölünür ve
+    URL (bucket, anahtar, süre, pencere) ile önbelleğe alınır. Aynı pencerede
+    aynı nesne için hep aynı URL döner; böylece liste sayfaları her görsel
+    için yeniden imzalama yapmaz ve tarayıcı önbelleği URL'yi tanır. Bir
+    pencerede imzalanan URL pencere bitene kadar verilir, yani istemcinin
+    eline geçen her URL'nin en az (1 - reuse_ratio) * expires_in ömrü kalır.
+
+    Attributes:
+        reuse_ratio (float): Geçerlilik süresinin yeniden kullanılan oranı
+    """
+
+    def __init__(self, maxsize=PRESIGNED_URL_CACHE_SIZE, reuse_ratio=PRESIGNED_URL_REUSE_RATIO, timer=time.time):
+        self.reuse_ratio = reuse_ratio
+        self._timer = timer
+        self._cache = TTLCache(maxsize=maxsize, ttl=0)
+
+    def get_url(self, client, bucket, key, expires_in=3600, client_method='get_object'):
+        """
+        Nesne için imzalı URL döndürür; penceresi geçerliyse önbellekten.
+
+        Args:
+            client: boto3 S3 client'ı
+            bucket (str): Bucket adı
+            key (str): Nesne anahtarı
+            expires_in (int, optional): URL'nin geçerlilik süresi (saniye)
+            client_method (str, optional): İmzalanacak S3 işlemi
+
+        Returns:
+            str: İmzalı URL
+        """
+        window = expires_in * self.reuse_ratio
+        if window < 1:
+            return client.generate_presigned_url(
+                client_method, Params={'Bucket': bucket, 'Key': key}, ExpiresIn=expires_in
+            )
+
+        now = self._timer()
+        index = int(now // window)
+        cache_key = (client_method, bucket, key, expires_in, index)
+        url = self._cache.get(cache_key)
+        if url is None:
+            url = client.generate_presigned_url(
+                client_method, Params={'Bucket': bucket, 'Key': key}, ExpiresIn=expires_in
+            )
+            # Pencerenin sonuna kadar tut
+            self._cache.set(cache_key, url, ttl=(index + 1) * window - now)
+        return url
+
+    def clear(self):
+        """Tüm kayıtları siler."""
+        self._cache.clear()
+
+    def stats(self):
+        """Önbellek istatistiklerini döndürür."""
+        return self._cache.stats()
+
+
+presigned_url_cache = PresignedUrlCache()
+
 def get_s3_client():
     """
-    S3 client'ı döndürür.
+    Süreç içinde paylaşılan S3 client'ını döndürür.
     
     Returns:
         boto3.client: S3 client
     """
-    s3_client = boto3.client(
-        's3',
-        region_name=current_app.config['S3_REGION'],
-        aws_access_key_id=current_app.config['AWS_ACCESS_KEY_ID'],
-        aws_secret_access_key=current_app.config['AWS_SECRET_ACCESS_KEY']
-    )
-    return s3_client
+    return get_client('s3', region_name=current_app.config.get('S3_REGION'))
 
 
 def upload_file_to_s3(file, folder='uploads', custom_filename=None):
@@ -119,6 +186,8 @@ def generate_presigned_url(s3_path, expiration=3600):
     """
     S3 dosyası için ön imzalı URL oluşturur.
     
+    URL, süresi dolmaya yaklaşana kadar önbellekten yeniden kullanılır.
+    
     Args:
         s3_path (str): S3'teki dosya yolu
         expiration (int, optional): URL'nin geçerlilik süresi (saniye)
@@ -127,19 +196,12 @@ def generate_presigned_url(s3_path, expiration=3600):
         str: Ön imzalı URL
     """
     try:
-        s3_client = get_s3_client()
-        bucket_name = current_app.config['S3_BUCKET_NAME']
-        
-        response = s3_client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': bucket_name,
-                'Key': s3_path
-            },
-            ExpiresIn=expiration
+        return presigned_url_cache.get_url(
+            get_s3_client(),
+            current_app.config['S3_BUCKET_NAME'],
+            s3_path,
+            expiration
         )
-        
-        return response
     
     except ClientError as e:
         logger.error(f"Failed to generate presigned URL: {e}")
@@ -0,0 +1,179 @@
+"""
+Üniversite Alan Adı Kaydı
+-----------------------
+universities_emails.json dosyasını bir kez yükleyip alan adı etiketlerini
+ters sırada (tr -> edu -> etu) tutan değişmez bir trie'ye dönüştürür.
+
+Arama en uzun eşleşen son eki döndürür; böylece alt alan adları da
+eşleşir (ör. ogr.etu.edu.tr -> etu.edu.tr). Eşleşme yalnızca etiket
+sınırlarında yapılır, notetu.edu.tr etu.edu.tr ile eşleşmez.
+
+Dosya değişiklikleri mtime ile algılanır. Kontrol en fazla
+UNIVERSITY_RELOAD_INTERVAL saniyede bir yapılır (istek başına dosya
+erişimi yoktur). Yeni trie tamamen oluşturulduktan sonra tek bir atama ile
+devreye alınır; okuyucular hiçbir zaman yarım yüklenmiş veri görmez.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.paths import UNIVERSITY_EMAIL_DATA_FILE
+
+logger = logging.getLogger(__name__)
+
+# mtime kontrolleri arasındaki en kısa süre (saniye); 0 her aramada kontrol eder
+UNIVERSITY_RELOAD_INTERVAL = float(os.getenv('UNIVERSITY_RELOAD_INTERVAL', '5'))
+
+# Düğümde eşleşen üniversite adının tutulduğu anahtar (etiketlerle çakışmaz)
+_VALUE = ''
+
+
+def normalize_domain(domain: str) -> str:
+    """Alan adını küçük harfe çevirir, boşlukları ve sondaki noktayı atar."""
+    return (domain or '').strip().rstrip('.').lower()
+
+
+class DomainTrie:
+    """
+    Alan adı son eklerine göre değer döndüren değişmez trie.
+
+    Attributes:
+        size (int): Kayıtlı alan adı sayısı
+    """
+
+    __slots__ = ('_root', 'size')
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        root: Dict[str, dict] = {}
+        size = 0
+        for domain, value in entries:
+            labels = normalize_domain(domain).split('.')
+            if not all(labels):
+                continue
+            node = root
+            for label in reversed(labels):
+                node = node.setdefault(label, {})
+            if _VALUE not in node:
+                size += 1
+            node[_VALUE] = value
+        self._root = root
+        self.size = size
+
+    def lookup(self, domain: str) -> Optional[str]:
+        """
+        Alan adının kendisi veya en uzun kayıtlı üst alan adının değerini döndürür.
+
+        Args:
+            domain (str): Aranacak alan adı (ör. 'ogr.etu.edu.tr')
+
+        Returns:
+            str: Eşleşen değer veya None
+        """
+        node = self._root
+        match = None
+        for label in reversed(normalize_domain(domain).split('.')):
+            node = node.get(label) if label else None
+            if node is None:
+                break
+            match = node.get(_VALUE, match)
+        return match
+
+    def __len__(self):
+        return self.size
+
+
+class UniversityRegistry:
+    """
+    Alan adı -> üniversite adı kaydı; dosya değiştiğinde kendini yeniler.
+
+    Attributes:
+        path (str): JSON dosyasının yolu ({"etu.edu.tr": "TOBB ...", ...})
+        reload_interval (float): mtime kontrolleri arasındaki süre (saniye)
+    """
+
+    def __init__(self, path: str = UNIVERSITY_EMAIL_DATA_FILE,
+                 reload_interval: float = UNIVERSITY_RELOAD_INTERVAL,
+                 timer=time.monotonic):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._timer = timer
+        self._lock = threading.Lock()
+        # (mtime, trie) çifti tek bir referans olarak değiştirilir
+        self._snapshot: Tuple[Optional[float], DomainTrie] = (None, DomainTrie([]))
+        self._next_check = 0.0
+        self.reload()
+
+    @property
+    def trie(self) -> DomainTrie:
+        return self._snapshot[1]
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Dosya değiştiyse (veya force) yeniden yükler.
+
+        Okuma/çözümleme hatasında mevcut kayıt korunur.
+
+        Returns:
+            bool: Yeni bir kayıt devreye alındıysa True
+        """
+        with self._lock:
+            self._next_check = self._timer() + self.reload_interval
+            try:
+                mtime = os.stat(self.path).st_mtime
+                if not force and mtime == self._snapshot[0]:
+                    return False
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    trie = DomainTrie(json.load(f).items())
+            except (OSError, ValueError, AttributeError) as e:
+                logger.error(f"Üniversite listesi yüklenemedi ({self.path}): {e}")
+                return False
+
+            self._snapshot = (mtime, trie)
+            logger.info(f"Üniversite listesi yüklendi: {len(trie)} alan adı")
+            return True
+
+    def lookup(self, domain: str) -> Optional[str]:
+        """
+        Alan adına ait üniversiteyi döndürür.
+
+        Args:
+            domain (str): E-posta adresinin '@' sonrası
+
+        Returns:
+            str: Üniversite adı veya None
+        """
+        if self._timer() >= self._next_check and not self._lock.locked():
+            self.reload()
+        return self._snapshot[1].lookup(domain)
+
+    def university_for_email(self, email: str) -> Optional[str]:
+        """
+        E-posta adresinin ait olduğu üniversiteyi döndürür.
+
+        Args:
+            email (str): E-posta adresi
+
+        Returns:
+            str: Üniversite adı veya None
+        """
+        if not email or '@' not in email:
+            return None
+        return self.lookup(email.rsplit('@', 1)[1])
+
+
+_registry: Optional[UniversityRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_university_registry() -> UniversityRegistry:
+    """Süreç genelindeki üniversite kaydını döndürür (ilk çağrıda yüklenir)."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = UniversityRegistry()
+    return _registry
@@ -1,67 +1,231 @@
-from app.paths import *
+"""
+Kullanıcı Adı Ataması
+-------------------
+"<Renk> <Şehir> <Hayvan>" biçimindeki anonim kullanıcı adlarını üniversite
+başına, listeleri bellekte veya diskte tutmadan atar.
+
+Her üniversite için UsernameCounters tablosunda atomik bir sayaç tutulur.
+Sayacın n. değeri, anahtarlı bir Feistel permütasyonu ile kombinasyon
+uzayındaki (renk x şehir x hayvan) bir indekse eşlenir. Permütasyon
+birebir olduğundan sayaç tekrar etmedikçe aynı ad iki kez üretilmez;
+dışarıdan bakıldığında sıra rastgeledir. Atama O(1) zaman ve bellek alır
+ve tek bir koşullu update_item çağrısı olduğundan süreçler/sunucular
+arasında güvenlidir.
+"""
+
+import hashlib
 import json
 import os
-import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from app.paths import USERNAMES_DATA_FILE
 
-def create_username_combinations_for_university(university_name):
+DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
+USERNAME_COUNTERS_TABLE_NAME = os.getenv('USERNAME_COUNTERS_TABLE_NAME', 'UsernameCounters')
+# Permütasyon anahtarı; değiştirilirse önceden atanmış adlarla çakışma olabilir.
+# SECRET_KEY'den ayrıdır: oturum anahtarını döndürmek adları etkilememeli
+USERNAME_PERMUTATION_KEY = os.getenv('USERNAME_PERMUTATION_KEY', '')
+# Geliştirme ve testlerde anahtar verilmezse kullanılan anahtar
+DEVELOPMENT_PERMUTATION_KEY = 'chrip-usernames'
+
+FEISTEL_ROUNDS = 4
+
+
+@lru_cache(maxsize=1)
+def load_username_parts() -> Tuple[List[str], List[str], List[str]]:
     """
-    Verilen üniversite adı için kullanıcı adı kombinasyonlarını oluşturur ve JSON dosyasına kaydeder. Dosya lokasyonunu döndürür.
-    
-    Args:
-        university_name (str): Kullanıcı adı kombinasyonlarının oluşturulacağı üniversite adı
-    
+    Renk, şehir ve hayvan listelerini kaynak JSON dosyasından bir kez okur.
+
     Returns:
-        str: Kullanıcı adı kombinasyonlarının kaydedildiği JSON dosyasının yolu
+        tuple: (renkler, şehirler, hayvanlar)
     """
-    # Kullanıcı adı kombinasyonlarını içeren JSON dosyasını oku
     with open(USERNAMES_DATA_FILE, 'r', encoding='utf-8') as f:
         username_data = json.load(f)
-    
-    # Kullanıcı adı kombinasyonlarını oluştur
-    colors = username_data["colors"]
-    cities = username_data["cities"]
-    animals = username_data["animals"]
-    
-    # Kombinasyonları oluştur
-    combinations = []
-    for color in colors:
-        for city in cities:
-            for animal in animals:
-                combinations.append(f"{color} {city} {animal}")
-        
-    available_usernames_file_for_university = os.path.join(USERNAMES_DATA_DIRECTORY, f"{university_name}_available_usernames.json")
-
-    # Kullanıcı adı kombinasyonlarını JSON dosyasına kaydet
-    with open(available_usernames_file_for_university, 'w', encoding='utf-8') as f:
-        json.dump(combinations, f, ensure_ascii=False, indent=4)
-    
-    return available_usernames_file_for_university
+    return username_data["colors"], username_data["cities"], username_data["animals"]
+
+
+class FeistelPermutation:
+    """
+    [0, size) aralığında anahtarlı, birebir ve örten bir permütasyon.
+
+    Aralık, bit genişliği çift olan en küçük 2'nin kuvvetine genişletilir ve
+    dengeli bir Feistel ağı uygulanır; aralık dışına düşen değerler yeniden
+    şifrelenir (cycle walking). Genişletilmiş uzay en fazla ~4 kat büyük
+    olduğundan beklenen tekrar sayısı sabittir.
+
+    Attributes:
+        size (int): Permütasyon uzayının büyüklüğü
+    """
+
+    def __init__(self, size: int, key: bytes, rounds: int = FEISTEL_ROUNDS):
+        if size < 1:
+            raise ValueError("Permütasyon uzayı boş olamaz")
+        self.size = size
+        self.rounds = rounds
+        self._key = hashlib.sha256(key).digest()
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self._mask = (1 << self._half_bits) - 1
+
+    def _round(self, round_index: int, value: int) -> int:
+        digest = hashlib.blake2b(
+            value.to_bytes(8, 'big') + bytes([round_index]),
+            key=self._key,
+            digest_size=8
+        ).digest()
+        return int.from_bytes(digest, 'big') & self._mask
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> self._half_bits, value & self._mask
+        for round_index in range(self.rounds):
+            left, right = right, left ^ self._round(round_index, right)
+        return (left << self._half_bits) | right
+
+    def permute(self, index: int) -> int:
+        """
+        İndeksin permütasyondaki karşılığını döndürür.
+
+        Args:
+            index (int): 0 <= index < size
+
+        Returns:
+            int: 0 <= sonuç < size
+        """
+        if not 0 <= index < self.size:
+            raise ValueError(f"İndeks aralık dışında: {index}")
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+
+def username_at(index: int, parts: Tuple[List[str], ...] = None) -> str:
+    """
+    Kombinasyon uzayındaki indeksi kullanıcı adına çevirir (karışık tabanlı sayı).
+
+    Args:
+        index (int): Kombinasyon indeksi
+        parts (tuple, optional): (renkler, şehirler, hayvanlar)
+
+    Returns:
+        str: "<Renk> <Şehir> <Hayvan>"
+    """
+    colors, cities, animals = parts or load_username_parts()
+    index, animal = divmod(index, len(animals))
+    color, city = divmod(index, len(cities))
+    return f"{colors[color]} {cities[city]} {animals[animal]}"
+
+
+class UsernameAllocator:
+    """
+    Üniversite başına sayaç + Feistel permütasyonu ile kullanıcı adı atar.
+
+    Attributes:
+        table: Sayaçların tutulduğu DynamoDB tablosu (anahtar: university)
+        capacity (int): Üniversite başına atanabilecek ad sayısı
+    """
+
+    def __init__(self, table, key: str = None,
+                 parts: Optional[Tuple[List[str], List[str], List[str]]] = None):
+        self.table = table
+        self.parts = parts or load_username_parts()
+        self.capacity = len(self.parts[0]) * len(self.parts[1]) * len(self.parts[2])
+        self._key = key or USERNAME_PERMUTATION_KEY or DEVELOPMENT_PERMUTATION_KEY
+        self._permutations: Dict[str, FeistelPermutation] = {}
+
+    def _permutation(self, university_name: str) -> FeistelPermutation:
+        permutation = self._permutations.get(university_name)
+        if permutation is None:
+            permutation = FeistelPermutation(
+                self.capacity,
+                f"{self._key}:{university_name}".encode('utf-8')
+            )
+            self._permutations[university_name] = permutation
+        return permutation
+
+    def next_index(self, university_name: str) -> int:
+        """
+        Üniversitenin sayacını koşullu ve atomik olarak bir artırır.
+
+        Args:
+            university_name (str): Üniversite adı
+
+        Returns:
+            int: Bu atamaya ait sıra numarası (0'dan başlar)
+
+        Raises:
+            ValueError: Üniversite için atanabilecek ad kalmadıysa
+        """
+        try:
+            response = self.table.update_item(
+                Key={'university': university_name},
+                UpdateExpression='ADD next_index :one',
+                ConditionExpression='attribute_not_exists(next_index) OR next_index < :capacity',
+                ExpressionAttributeValues={':one': 1, ':capacity': self.capacity},
+                ReturnValues='UPDATED_NEW'
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise ValueError(f"{university_name} için kullanılabilir kullanıcı adı kalmadı")
+            raise
+        return int(response['Attributes']['next_index']) - 1
+
+    def allocate(self, university_name: str) -> str:
+        """
+        Üniversite için yeni bir kullanıcı adı döndürür.
+
+        Args:
+            university_name (str): Üniversite adı
+
+        Returns:
+            str: Yeni kullanıcı adı
+        """
+        sequence = self.next_index(university_name)
+        return username_at(self._permutation(university_name).permute(sequence), self.parts)
+
+
+_allocator: Optional[UsernameAllocator] = None
+
+
+def check_permutation_key(app):
+    """
+    Üretimde ayrı bir USERNAME_PERMUTATION_KEY verilmesini zorunlu kılar.
+
+    Herkesçe bilinen geliştirme anahtarıyla atanan adların sırası
+    tahmin edilebilir.
+
+    Args:
+        app (Flask): Uygulama
+
+    Raises:
+        RuntimeError: Geliştirme/test dışında anahtar verilmemişse
+    """
+    if not USERNAME_PERMUTATION_KEY and not (app.config.get('DEBUG') or app.config.get('TESTING')):
+        raise RuntimeError("USERNAME_PERMUTATION_KEY ayarlanmalıdır")
+
+
+def get_username_allocator() -> UsernameAllocator:
+    """Varsayılan (STORAGE_BACKEND tablosunu kullanan) atayıcıyı döndürür."""
+    global _allocator
+    if _allocator is None:
+        from app.storage import get_dynamodb
+        _allocator = UsernameAllocator(get_dynamodb(DEFAULT_REGION).Table(USERNAME_COUNTERS_TABLE_NAME))
+    return _allocator
+
 
 def get_new_username_for_university(university_name):
     """
     Verilen üniversite adı için yeni bir kullanıcı adı döndürür.
-    
+
     Args:
-        university_name (str): Kullanıcı adı kombinasyonlarının oluşturulacağı üniversite adı
-    
+        university_name (str): Kullanıcı adının atanacağı üniversite adı
+
     Returns:
         str: Yeni kullanıcı adı
+
+    Raises:
+        ValueError: Üniversite için atanabilecek ad kalmadıysa
     """
-    available_usernames_file_for_university = os.path.join(USERNAMES_DATA_DIRECTORY, f"{university_name}_available_usernames.json")
-
-    if not os.path.exists(available_usernames_file_for_university):
-        create_username_combinations_for_university(university_name)
-    
-    # Kullanıcı adı kombinasyonlarını içeren JSON dosyasını oku
-    with open(available_usernames_file_for_university, 'r', encoding='utf-8') as f:
-        combinations = json.load(f)
-    
-    # Kullanıcı adı kombinasyonlarından rastgele birini seç
-    new_username = random.choice(combinations)
-    # Kullanıcı adı kombinasyonlarından seçilen kullanıcı adını listeden çıkar
-    combinations.remove(new_username)
-    # Güncellenmiş kombinasyonları JSON dosyasına kaydet
-    with open(available_usernames_file_for_university, 'w', encoding='utf-8') as f:
-        json.dump(combinations, f, ensure_ascii=False, indent=4)
-
-    return new_username
+    return get_username_allocator().allocate(university_name)
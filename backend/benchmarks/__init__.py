@@ -0,0 +1,5 @@
+"""
+Endpoint benchmark paketi.
+
+Çalıştırmak için: python -m benchmarks.run --help
+"""
@@ -0,0 +1,335 @@
+"""
+Gecikme Enjekte Eden Sahte Arka Uçlar
+-----------------------------------
+Benchmark'ların ağ olmadan ama gerçekçi maliyetle çalışması için
+DynamoDB ve S3 yerine geçen süreç içi nesneler.
+
+DynamoDB tarafı app.storage.sqlite motorunu sarar; her arka uç çağrısı
+yapılandırılan gecikme + rastgele sapma kadar bekletilir, sayılır ve
+okunan bayt miktarı (DynamoDB JSON boyutu) kaydedilir. Böylece bir
+endpoint'in kaç çağrı yaptığı ve ne kadar veri okuduğu ölçülebilir.
+
+Uygulama, STORAGE_BACKEND=benchmarks.fakes:dynamodb_resource ile bu modülün
+install() ile hazırlanan resource'unu kullanır. Servisler app paketi içe
+aktarılırken oluşturulduğundan bu modül app'i yalnızca fonksiyonların
+içinde içe aktarır.
+"""
+
+import io
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from botocore.exceptions import ClientError
+
+# DynamoDB BatchWriteItem tek çağrıda en fazla 25 istek kabul eder
+BATCH_WRITE_MAX = 25
+
+# Arka uca istek gönderen DynamoDB işlemleri
+DYNAMODB_OPERATIONS = {
+    'put_item', 'get_item', 'delete_item', 'update_item', 'query', 'scan',
+    'batch_get_item', 'transact_write_items', 'transact_get_items'
+}
+
+
+class LatencyModel:
+    """
+    Çağrı başına gecikme üretir.
+
+    Attributes:
+        latency_ms (float): Sabit gecikme (milisaniye)
+        jitter_ms (float): 0 ile bu değer arasında eklenen rastgele sapma
+    """
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """
+        Bir sonraki çağrının gecikmesini saniye cinsinden döndürür.
+
+        Returns:
+            float: Gecikme (saniye)
+        """
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000.0
+
+    def wait(self):
+        """Bir arka uç çağrısı kadar bekler."""
+        seconds = self.delay()
+        if seconds:
+            time.sleep(seconds)
+
+
+class CallRecorder:
+    """
+    Arka uç çağrılarını ve okunan baytları sayar (thread-safe).
+
+    Paralel çağrılar (run_parallel) farklı thread'lerden gelebildiği için
+    sayaçlar kilitle korunur.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sayaçları sıfırlar."""
+        with self._lock:
+            self.calls = Counter()
+            self.bytes_read = 0
+
+    def record(self, operation: str, bytes_read: int = 0):
+        """
+        Bir çağrıyı kaydeder.
+
+        Args:
+            operation (str): Servis ve işlem adı (ör. 'dynamodb.query')
+            bytes_read (int): Yanıtta dönen veri miktarı
+        """
+        with self._lock:
+            self.calls[operation] += 1
+            self.bytes_read += bytes_read
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Anlık sayaçları döndürür.
+
+        Returns:
+            dict: Toplam çağrı, işlem bazında çağrılar ve okunan bayt
+        """
+        with self._lock:
+            return {
+                'calls': sum(self.calls.values()),
+                'by_operation': dict(self.calls),
+                'bytes_read': self.bytes_read
+            }
+
+
+def _response_bytes(response: Any) -> int:
+    """DynamoDB yanıtında dönen öğelerin DynamoDB JSON boyutunu hesaplar."""
+    from app.storage.sqlite import dump_item
+
+    if not isinstance(response, dict):
+        return 0
+
+    total = 0
+    for name in ('Item', 'Attributes'):
+        if name in response:
+            total += len(dump_item(response[name]))
+    for item in response.get('Items', []):
+        total += len(dump_item(item))
+    for items in response.get('Responses', {}).values():
+        for item in items:
+            total += len(dump_item(item))
+    return total
+
+
+class _Instrumented:
+    """Nesnenin arka uç işlemlerini gecikme ve sayaçla saran vekil."""
+
+    def __init__(self, target, latency: LatencyModel, recorder: CallRecorder):
+        self._target = target
+        self._latency = latency
+        self._recorder = recorder
+
+    def _call(self, name: str, method, *args, **kwargs):
+        self._latency.wait()
+        try:
+            response = method(*args, **kwargs)
+        except ClientError:
+            self._recorder.record(f'dynamodb.{name}')
+            raise
+        self._recorder.record(f'dynamodb.{name}', _response_bytes(response))
+        return response
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if name in DYNAMODB_OPERATIONS and callable(attribute):
+            return lambda *args, **kwargs: self._call(name, attribute, *args, **kwargs)
+        return attribute
+
+
+class InstrumentedTable(_Instrumented):
+    """Table vekili; batch_writer yazmalarını 25'lik çağrılar olarak sayar."""
+
+    def batch_writer(self, overwrite_by_pkeys=None):
+        return _InstrumentedBatchWriter(
+            self._target.batch_writer(overwrite_by_pkeys=overwrite_by_pkeys),
+            self._latency,
+            self._recorder
+        )
+
+
+class _InstrumentedBatchWriter:
+    def __init__(self, writer, latency: LatencyModel, recorder: CallRecorder):
+        self._writer = writer
+        self._latency = latency
+        self._recorder = recorder
+        self._count = 0
+
+    def put_item(self, Item):
+        self._count += 1
+        self._writer.put_item(Item=Item)
+
+    def delete_item(self, Key):
+        self._count += 1
+        self._writer.delete_item(Key=Key)
+
+    def __enter__(self):
+        self._writer.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            for _ in range(-(-self._count // BATCH_WRITE_MAX)):
+                self._latency.wait()
+                self._recorder.record('dynamodb.batch_write_item')
+        return self._writer.__exit__(exc_type, exc_value, traceback)
+
+
+class _InstrumentedMeta:
+    def __init__(self, client):
+        self.client = client
+
+
+class FakeDynamoDBResource(_Instrumented):
+    """
+    Gecikme enjekte eden, çağrı sayan DynamoDB resource'u.
+
+    Veriler bellek içi (veya verilen dosyadaki) SQLite motorunda tutulur.
+
+    Args:
+        latency (LatencyModel): Çağrı gecikmesi
+        recorder (CallRecorder): Sayaçlar
+        path (str): SQLite veritabanı; varsayılan bellek içi
+    """
+
+    def __init__(self, latency: LatencyModel, recorder: CallRecorder, path: str = ':memory:'):
+        from app.storage.sqlite import SQLiteResource
+
+        super().__init__(SQLiteResource(path), latency, recorder)
+        self.meta = _InstrumentedMeta(_Instrumented(self._target.meta.client, latency, recorder))
+
+    def Table(self, name: str) -> InstrumentedTable:
+        return InstrumentedTable(self._target.Table(name), self._latency, self._recorder)
+
+
+_installed: Dict[str, Any] = {}
+
+
+def install(latency: LatencyModel, recorder: CallRecorder):
+    """
+    dynamodb_resource fabrikasının kullanacağı gecikme ve sayaçları ayarlar.
+
+    Uygulama içe aktarılmadan önce çağrılmalıdır.
+
+    Raises:
+        RuntimeError: Resource servisler tarafından zaten oluşturulmuşsa
+    """
+    if 'resource' in _installed:
+        raise RuntimeError("install() must be called before the app package is imported")
+    _installed.update(latency=latency, recorder=recorder)
+
+
+def dynamodb_resource(region_name: Optional[str] = None) -> FakeDynamoDBResource:
+    """
+    STORAGE_BACKEND fabrikası: süreç başına tek sahte resource döndürür.
+
+    Args:
+        region_name (str, optional): Kullanılmaz; arayüz uyumluluğu için
+
+    Returns:
+        FakeDynamoDBResource: Tabloları oluşturulmuş resource
+    """
+    from app.services.schema import create_tables
+
+    if 'resource' not in _installed:
+        if 'latency' not in _installed:
+            install(LatencyModel(), CallRecorder())
+        resource = FakeDynamoDBResource(_installed['latency'], _installed['recorder'])
+        create_tables(resource.meta.client)
+        _installed['resource'] = resource
+    return _installed['resource']
+
+
+class FakeS3Client:
+    """
+    Süreç içi S3 client'ı.
+
+    MediaService'in kullandığı çağrıları destekler; nesneler bellekte tutulur.
+    İmzalı URL üretimi yerel bir işlem olduğundan gecikme eklenmez ve
+    arka uç çağrısı sayılmaz.
+    """
+
+    def __init__(self, latency: LatencyModel, recorder: CallRecorder, region_name: str = 'eu-north-1'):
+        self._latency = latency
+        self._recorder = recorder
+        self._region = region_name
+        self._lock = threading.Lock()
+        self.objects: Dict[tuple, bytes] = {}
+        self.content_types: Dict[tuple, str] = {}
+
+    def _call(self, operation: str, bytes_read: int = 0):
+        self._latency.wait()
+        self._recorder.record(f's3.{operation}', bytes_read)
+
+    def _not_found(self, operation: str) -> ClientError:
+        return ClientError({'Error': {'Code': 'NoSuchKey', 'Message': 'Not Found'}}, operation)
+
+    def upload_fileobj(self, Fileobj, Bucket: str, Key: str, ExtraArgs: Optional[dict] = None, **kwargs):
+        self.put_object(Bucket=Bucket, Key=Key, Body=Fileobj.read())
+
+    def put_object(self, Bucket: str, Key: str, Body=b'', ContentType: str = 'binary/octet-stream', **kwargs):
+        if isinstance(Body, str):
+            Body = Body.encode('utf-8')
+        elif hasattr(Body, 'read'):
+            Body = Body.read()
+        self._call('put_object')
+        with self._lock:
+            self.objects[(Bucket, Key)] = bytes(Body)
+            self.content_types[(Bucket, Key)] = ContentType
+        return {'ETag': f'"{hash(Body) & 0xffffffff:08x}"'}
+
+    def get_object(self, Bucket: str, Key: str, **kwargs):
+        with self._lock:
+            body = self.objects.get((Bucket, Key))
+        self._call('get_object', len(body or b''))
+        if body is None:
+            raise self._not_found('GetObject')
+        return {'Body': io.BytesIO(body), 'ContentLength': len(body)}
+
+    def head_object(self, Bucket: str, Key: str, **kwargs):
+        with self._lock:
+            body = self.objects.get((Bucket, Key))
+            content_type = self.content_types.get((Bucket, Key))
+        self._call('head_object')
+        if body is None:
+            raise ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+        return {'ContentLength': len(body), 'ContentType': content_type}
+
+    def delete_object(self, Bucket: str, Key: str, **kwargs):
+        self._call('delete_object')
+        with self._lock:
+            self.objects.pop((Bucket, Key), None)
+            self.content_types.pop((Bucket, Key), None)
+        return {}
+
+    def generate_presigned_url(self, ClientMethod: str, Params: Dict[str, Any], ExpiresIn: int = 3600, **kwargs):
+        return (
+            f"https://{Params['Bucket']}.s3.{self._region}.amazonaws.com/{Params['Key']}"
+            f"?X-Amz-Expires={ExpiresIn}&X-Amz-Signature=fake"
+        )
+
+    def generate_presigned_post(self, Bucket: str, Key: str, Fields: Optional[dict] = None,
+                                Conditions: Optional[list] = None, ExpiresIn: int = 3600, **kwargs):
+        return {
+            'url': f"https://{Bucket}.s3.{self._region}.amazonaws.com/",
+            'fields': dict(Fields or {}, key=Key, policy='fake', **{'x-amz-signature': 'fake'})
+        }
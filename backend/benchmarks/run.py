@@ -0,0 +1,282 @@
+"""
+Endpoint Benchmark'ı
+------------------
+create_app() ile oluşturulan uygulamayı Flask test client'ı üzerinden,
+gecikme enjekte eden süreç içi DynamoDB/S3 ile çalıştırır ve her senaryo
+için p50/p95/p99 gecikme, istek başına arka uç çağrısı ve okunan bayt
+miktarını raporlar.
+
+Kullanım (backend dizininde):
+
+    python -m benchmarks.run --latency-ms 5 --jitter-ms 2 --output sonuc.json
+    python -m benchmarks.run --only forums,comments --compare onceki.json
+
+Aynı --seed ve veri seti ayarlarıyla alınan sonuçlar commit'ler arasında
+karşılaştırılabilir; arka uç çağrı sayıları gecikmeden bağımsızdır.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+BACKEND = 'benchmarks.fakes:dynamodb_resource'
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Doğrusal enterpolasyonla yüzdelik değer hesaplar.
+
+    Args:
+        values (list): Sıralı olması gerekmeyen ölçümler
+        fraction (float): 0 ile 1 arasında yüzdelik (ör. 0.95)
+
+    Returns:
+        float: Yüzdelik değer; liste boşsa 0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(latencies: List[float], calls: List[int], bytes_read: List[int],
+              operations: Dict[str, int], errors: int) -> Dict[str, Any]:
+    """
+    Bir senaryonun ölçümlerini özetler.
+
+    Returns:
+        dict: Gecikme yüzdelikleri (ms), ortalama çağrı/bayt ve hata sayısı
+    """
+    count = len(latencies)
+    return {
+        'requests': count,
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'calls_per_request': round(sum(calls) / count, 2) if count else 0,
+        'bytes_read_per_request': round(sum(bytes_read) / count) if count else 0,
+        'calls_by_operation': {
+            name: round(total / count, 2) for name, total in sorted(operations.items())
+        } if count else {}
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _configure_environment(args):
+    """Uygulama içe aktarılmadan önce sahte arka uçları seçer."""
+    os.environ['STORAGE_BACKEND'] = BACKEND
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'eu-north-1')
+    os.environ.setdefault('S3_BUCKET_NAME', 'benchmark')
+    os.environ.setdefault('GROUPS_TABLE_NAME', 'Groups')
+    # Görsel türevleri Celery worker'ında üretilir; ölçümde broker yok
+    os.environ.setdefault('IMAGE_DERIVATIVES_ENABLED', 'false')
+    # Ölçüm sırasında ertelenmiş görevler bellek içi kuyruğa yazılır (worker
+    # yok): ölçülen, üretimdeki gibi yalnızca istek yolu
+    os.environ.setdefault('CELERY_BROKER_URL', 'memory://localhost/')
+    # Arama dizini bellekte kurulur; data/search altına anlık görüntü yazılmaz
+    os.environ.setdefault('SEARCH_SNAPSHOT_DIR', '')
+    # Sıcak akış Redis olmadan, süreç içi depoda tutulur
+    os.environ.setdefault('FEED_BACKEND', 'memory')
+    if not args.verbose:
+        # Uygulama log'ları (stderr) raporu boğmasın
+        os.environ.setdefault('LOG_LEVEL', 'WARNING')
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def build_app(latency, recorder):
+    """
+    Sahte DynamoDB/S3 ile çalışan uygulamayı oluşturur.
+
+    Args:
+        latency (LatencyModel): Çağrı gecikmesi
+        recorder (CallRecorder): Çağrı sayaçları
+
+    Returns:
+        tuple: (Flask uygulaması, FakeS3Client)
+    """
+    from benchmarks.fakes import FakeS3Client, install
+
+    install(latency, recorder)
+
+    from app import create_app
+    from app.services.media_service import MediaService
+
+    app = create_app()
+    app.config.update({'TESTING': True})
+
+    media_service = MediaService.get_instance()
+    media_service.s3 = FakeS3Client(latency, recorder, region_name=media_service.region or 'eu-north-1')
+    return app, media_service.s3
+
+
+def run_scenarios(app, dataset, scenarios, recorder, iterations: int, warmup: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Senaryoları sırayla çalıştırır ve ölçümleri özetler.
+
+    Returns:
+        dict: Senaryo adı -> özet
+    """
+    client = app.test_client()
+    prefix = app.config['API_PREFIX']
+    results = {}
+
+    for scenario in scenarios:
+        for iteration in range(warmup):
+            scenario.request(client, prefix, dataset, iteration)
+
+        latencies, calls, bytes_read, operations, errors = [], [], [], {}, 0
+        for iteration in range(warmup, warmup + iterations):
+            recorder.reset()
+            started = time.perf_counter()
+            response = scenario.request(client, prefix, dataset, iteration)
+            latencies.append(time.perf_counter() - started)
+
+            snapshot = recorder.snapshot()
+            calls.append(snapshot['calls'])
+            bytes_read.append(snapshot['bytes_read'])
+            for name, total in snapshot['by_operation'].items():
+                operations[name] = operations.get(name, 0) + total
+            if response.status_code >= 400:
+                errors += 1
+
+        results[scenario.name] = summarize(latencies, calls, bytes_read, operations, errors)
+    return results
+
+
+def format_table(results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    """
+    Sonuçları metin tablosu olarak biçimlendirir.
+
+    Args:
+        results (dict): Senaryo özetleri
+        baseline (dict, optional): Karşılaştırılacak önceki senaryo özetleri
+
+    Returns:
+        str: Tablo
+    """
+    def delta(name, key, value):
+        if not baseline or name not in baseline:
+            return ''
+        before = baseline[name].get(key)
+        if not before:
+            return ''
+        return f' ({(value - before) / before * 100:+.0f}%)'
+
+    header = f"{'scenario':<24}{'p50 ms':>16}{'p95 ms':>16}{'p99 ms':>16}{'calls':>14}{'bytes':>16}{'err':>5}"
+    lines = [header, '-' * len(header)]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<24}"
+            f"{str(result['p50_ms']) + delta(name, 'p50_ms', result['p50_ms']):>16}"
+            f"{str(result['p95_ms']) + delta(name, 'p95_ms', result['p95_ms']):>16}"
+            f"{str(result['p99_ms']) + delta(name, 'p99_ms', result['p99_ms']):>16}"
+            f"{str(result['calls_per_request']) + delta(name, 'calls_per_request', result['calls_per_request']):>14}"
+            f"{str(result['bytes_read_per_request']) + delta(name, 'bytes_read_per_request', result['bytes_read_per_request']):>16}"
+            f"{result['errors']:>5}"
+        )
+    return '\n'.join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Chrip endpoint benchmark')
+    parser.add_argument('--iterations', type=int, default=50, help='Senaryo başına ölçülen istek sayısı')
+    parser.add_argument('--warmup', type=int, default=5, help='Ölçülmeyen ısınma isteği sayısı')
+    parser.add_argument('--latency-ms', type=float, default=5.0, help='Arka uç çağrısı başına sabit gecikme')
+    parser.add_argument('--jitter-ms', type=float, default=2.0, help='Çağrı başına 0..jitter rastgele ek gecikme')
+    parser.add_argument('--seed', type=int, default=1, help='Sapma üretecinin tohumu')
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--forums', type=int, default=50)
+    parser.add_argument('--comments', type=int, default=10, help='İlk forumdaki kök yorum sayısı')
+    parser.add_argument('--replies', type=int, default=5, help='Kök yorum başına yanıt sayısı')
+    parser.add_argument('--only', help='Virgülle ayrılmış blueprint veya senaryo adları (ör. forums,polls.vote)')
+    parser.add_argument('--output', help='Sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--compare', help='Karşılaştırılacak önceki JSON sonuç dosyası')
+    parser.add_argument('--verbose', action='store_true', help="Uygulama log'larını gizleme")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    _configure_environment(args)
+
+    from benchmarks.fakes import CallRecorder, LatencyModel
+    from benchmarks.scenarios import SCENARIOS, seed
+
+    scenarios = SCENARIOS
+    if args.only:
+        selected = {name.strip() for name in args.only.split(',') if name.strip()}
+        scenarios = [
+            scenario for scenario in SCENARIOS
+            if scenario.name in selected or scenario.blueprint in selected
+        ]
+
+    # Veri seti gecikmesiz oluşturulur; ölçüm başlamadan gecikme açılır
+    latency = LatencyModel(seed=args.seed)
+    recorder = CallRecorder()
+    app, _ = build_app(latency, recorder)
+    # Veri setinde takip işleri (ör. yanıtların üst yoruma bağlanması) hemen çalışır
+    from app.tasks import celery_app
+    celery_app.conf.task_always_eager = True
+    dataset = seed(app, app.test_client(), users=args.users, forums=args.forums,
+                   comments_per_forum=args.comments, replies_per_comment=args.replies)
+    celery_app.conf.task_always_eager = False
+    latency.latency_ms = args.latency_ms
+    latency.jitter_ms = args.jitter_ms
+
+    results = run_scenarios(app, dataset, scenarios, recorder, args.iterations, args.warmup)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            baseline = json.load(handle)['scenarios']
+
+    print(format_table(results, baseline))
+
+    if args.output:
+        report = {
+            'meta': {
+                'commit': _git_commit(),
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'python': platform.python_version(),
+                'settings': {
+                    'iterations': args.iterations,
+                    'warmup': args.warmup,
+                    'latency_ms': args.latency_ms,
+                    'jitter_ms': args.jitter_ms,
+                    'seed': args.seed,
+                    'users': args.users,
+                    'forums': args.forums,
+                    'comments': args.comments,
+                    'replies': args.replies
+                }
+            },
+            'scenarios': results
+        }
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2, ensure_ascii=False)
+
+    return 1 if any(result['errors'] for result in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Benchmark Senaryoları
+-------------------
+Her blueprint için ölçülen istekler ve bunların ihtiyaç duyduğu örnek veri.
+
+Veri seti sabit boyutlu ve deterministik oluşturulur; aynı ayarlarla
+farklı commit'lerde çalıştırılan benchmark'lar aynı istekleri aynı veri
+üzerinde yapar. app paketi, sahte arka uç kurulmadan içe aktarılmasın diye
+yalnızca seed() içinde içe aktarılır.
+"""
+
+import io
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+BENCHMARK_PASSWORD = 'benchmark-password'
+
+
+@dataclass
+class Dataset:
+    """
+    Benchmark verisi ve istek üretirken kullanılan kimlikler.
+
+    Attributes:
+        users (list): Oluşturulan kullanıcılar
+        tokens (list): Kullanıcıların JWT token'ları (aynı sırayla)
+        forum_ids (list): Forum ID'leri
+        comment_ids (list): Kök yorum ID'leri
+        poll (dict): Oylanan anket
+        group_ids (list): Grup ID'leri
+    """
+    users: List[Any] = field(default_factory=list)
+    tokens: List[str] = field(default_factory=list)
+    forum_ids: List[str] = field(default_factory=list)
+    comment_ids: List[str] = field(default_factory=list)
+    poll: Dict[str, Any] = field(default_factory=dict)
+    group_ids: List[str] = field(default_factory=list)
+
+    def headers(self, index: int = 0) -> Dict[str, str]:
+        """index'inci kullanıcının Authorization başlığı."""
+        return {'Authorization': f'Bearer {self.tokens[index % len(self.tokens)]}'}
+
+
+@dataclass
+class Scenario:
+    """
+    Ölçülen tek bir endpoint çağrısı.
+
+    Attributes:
+        name (str): Rapor adı (blueprint.işlem)
+        method (str): HTTP metodu
+        path (callable): (dataset, i) -> URL yolu
+        kwargs (callable, optional): (dataset, i) -> test client argümanları
+    """
+    name: str
+    method: str
+    path: Callable[[Dataset, int], str]
+    kwargs: Optional[Callable[[Dataset, int], Dict[str, Any]]] = None
+
+    @property
+    def blueprint(self) -> str:
+        return self.name.split('.', 1)[0]
+
+    def request(self, client, prefix: str, dataset: Dataset, iteration: int):
+        """
+        Senaryonun iteration'ıncı isteğini gönderir.
+
+        Tüm istekler, senaryo aksini belirtmedikçe iteration'a göre seçilen
+        kullanıcı adına gönderilir.
+
+        Returns:
+            Response: Flask test client yanıtı
+        """
+        kwargs = self.kwargs(dataset, iteration) if self.kwargs else {}
+        kwargs.setdefault('headers', dataset.headers(iteration))
+        return client.open(prefix + self.path(dataset, iteration), method=self.method, **kwargs)
+
+
+def _check(response, what: str):
+    if response.status_code >= 400:
+        raise RuntimeError(f"Benchmark verisi oluşturulamadı ({what}): {response.status_code} {response.get_json()}")
+    return response.get_json()['data']
+
+
+def seed(app, client, users: int = 20, forums: int = 50, comments_per_forum: int = 10,
+         replies_per_comment: int = 5) -> Dataset:
+    """
+    Benchmark veri setini API üzerinden oluşturur.
+
+    Args:
+        app (Flask): Uygulama
+        client (FlaskClient): Test client'ı
+        users (int): Kullanıcı sayısı
+        forums (int): Forum sayısı
+        comments_per_forum (int): İlk forumdaki kök yorum sayısı
+        replies_per_comment (int): Her kök yoruma verilen yanıt sayısı
+
+    Returns:
+        Dataset: Oluşturulan veri
+    """
+    from app.services.UserTableDatabaseService import UserDatabaseService
+    from app.utils.auth import generate_token
+
+    prefix = app.config['API_PREFIX']
+    dataset = Dataset()
+    user_service = UserDatabaseService.get_instance()
+
+    with app.app_context():
+        for number in range(users):
+            user = user_service.create_user(
+                email=f'bench{number}@benchmark.edu.tr',
+                username=f'bench{number}',
+                password=BENCHMARK_PASSWORD,
+                university='Benchmark Üniversitesi'
+            )
+            dataset.users.append(user)
+            dataset.tokens.append(generate_token(user.user_id))
+
+    for number in range(forums):
+        forum = _check(client.post(f'{prefix}/forums/', json={
+            'header': f'Benchmark forum {number}',
+            'description': 'Benchmark açıklaması ' * 10,
+            'category': f'kategori-{number % 5}'
+        }, headers=dataset.headers(number)), 'forum')
+        dataset.forum_ids.append(forum['forum_id'])
+
+    forum_id = dataset.forum_ids[0]
+    for number in range(comments_per_forum):
+        comment = _check(client.post(f'{prefix}/comments/', json={
+            'commented_on_id': forum_id,
+            'content': f'Benchmark yorumu {number}'
+        }, headers=dataset.headers(number)), 'comment')
+        dataset.comment_ids.append(comment['comment_id'])
+        for reply in range(replies_per_comment):
+            _check(client.post(f"{prefix}/comments/{comment['comment_id']}/reply", json={
+                'content': f'Benchmark yanıtı {reply}'
+            }, headers=dataset.headers(reply)), 'reply')
+
+    dataset.poll = _check(client.post(f'{prefix}/polls/', json={
+        'header': 'Benchmark anketi',
+        'secenekler': ['Birinci', 'İkinci', 'Üçüncü']
+    }, headers=dataset.headers(0)), 'poll')
+
+    for number in range(3):
+        group = _check(client.post(f'{prefix}/groups/', json={
+            'grup_adi': f'Benchmark grubu {number}',
+            'gizlilik': 'acik'
+        }, headers=dataset.headers(number)), 'group')
+        dataset.group_ids.append(group['group_id'])
+    for number in range(1, users):
+        _check(client.post(f'{prefix}/groups/{dataset.group_ids[0]}/join',
+                           headers=dataset.headers(number)), 'join')
+
+    return dataset
+
+
+def _poll_option(dataset: Dataset, iteration: int) -> str:
+    options = dataset.poll['secenekler']
+    return options[iteration % len(options)]['option_id']
+
+
+def _upload(dataset: Dataset, iteration: int) -> Dict[str, Any]:
+    return {
+        'data': {
+            'file': (io.BytesIO(b'\x89PNG' + b'0' * 4096), f'benchmark-{iteration}.png'),
+            'model_type': 'forum'
+        },
+        'content_type': 'multipart/form-data'
+    }
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario('auth.login', 'POST', lambda d, i: '/auth/login',
+             lambda d, i: {'json': {'email': d.users[i % len(d.users)].email, 'password': BENCHMARK_PASSWORD}}),
+    Scenario('auth.me', 'GET', lambda d, i: '/auth/me'),
+
+    Scenario('users.by_username', 'GET', lambda d, i: f'/users/by-username/{d.users[i % len(d.users)].username}'),
+    Scenario('users.batch', 'POST', lambda d, i: '/users/batch',
+             lambda d, i: {'json': {'user_ids': [user.user_id for user in d.users]}}),
+    Scenario('users.forums', 'GET', lambda d, i: '/users/forums'),
+
+    Scenario('forums.list', 'GET', lambda d, i: '/forums/?per_page=20'),
+    Scenario('forums.list_category', 'GET', lambda d, i: f'/forums/?per_page=20&category=kategori-{i % 5}'),
+    Scenario('forums.search', 'GET', lambda d, i: f'/forums/?per_page=20&search=benchmark+foru'),
+    Scenario('forums.get', 'GET', lambda d, i: f'/forums/{d.forum_ids[i % len(d.forum_ids)]}'),
+    Scenario('forums.creator_info', 'GET', lambda d, i: f'/forums/{d.forum_ids[i % len(d.forum_ids)]}/creator_info'),
+    Scenario('forums.create', 'POST', lambda d, i: '/forums/',
+             lambda d, i: {'json': {'header': f'Yeni forum {i}', 'description': 'Ölçüm', 'category': 'kategori-0'}}),
+    Scenario('forums.react', 'POST', lambda d, i: f'/forums/{d.forum_ids[0]}/react',
+             lambda d, i: {'json': {'reaction_type': 'like' if i % 2 else 'dislike'}}),
+
+    Scenario('comments.list', 'GET', lambda d, i: f'/comments/commented_on_id={d.forum_ids[0]}'),
+    Scenario('comments.thread', 'GET', lambda d, i: f'/comments/commented_on_id={d.forum_ids[0]}/thread'),
+    Scenario('comments.get', 'GET', lambda d, i: f'/comments/{d.comment_ids[i % len(d.comment_ids)]}'),
+    Scenario('comments.replies', 'GET', lambda d, i: f'/comments/{d.comment_ids[i % len(d.comment_ids)]}/replies'),
+    Scenario('comments.reply', 'POST', lambda d, i: f'/comments/{d.comment_ids[i % len(d.comment_ids)]}/reply',
+             lambda d, i: {'json': {'content': f'Ölçüm yanıtı {i}'}}),
+
+    Scenario('polls.list', 'GET', lambda d, i: '/polls/'),
+    Scenario('polls.get', 'GET', lambda d, i: f"/polls/{d.poll['poll_id']}"),
+    Scenario('polls.results', 'GET', lambda d, i: f"/polls/{d.poll['poll_id']}/results"),
+    Scenario('polls.vote', 'POST', lambda d, i: f"/polls/{d.poll['poll_id']}/vote",
+             lambda d, i: {'json': {'option_id': _poll_option(d, i)}}),
+
+    Scenario('feed.hot', 'GET', lambda d, i: '/feed/hot?per_page=20'),
+    Scenario('feed.hot_university', 'GET', lambda d, i: '/feed/hot?per_page=20&university=Benchmark+%C3%9Cniversitesi'),
+
+    Scenario('groups.list', 'GET', lambda d, i: '/groups/'),
+    Scenario('groups.get', 'GET', lambda d, i: f'/groups/{d.group_ids[i % len(d.group_ids)]}'),
+    Scenario('groups.members', 'GET', lambda d, i: f'/groups/{d.group_ids[0]}/members'),
+
+    Scenario('media.upload', 'POST', lambda d, i: '/media/upload', _upload),
+    Scenario('media.presign', 'POST', lambda d, i: '/media/uploads',
+             lambda d, i: {'json': {'content_type': 'image/png', 'size': 4100, 'model_type': 'forum'}}),
+]
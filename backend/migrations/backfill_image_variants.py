@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Görsel Türevi Doldurma Komut Dosyası
+----------------------------------
+Bucket'taki türevi olmayan veya türevi medya kaydına yazılmamış görseller
+için türev görevlerini kuyruğa ekler. Yanıtlar yalnızca kaydedilmiş türevleri
+verdiği için, türev üretimi eklenmeden önce yüklenmiş görseller bu komutla
+doldurulmalıdır.
+
+Kullanım:
+    python migrations/backfill_image_variants.py [--prefix forum/] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+
+# Proje kök dizinini Python yolu'na ekle
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from app.services.media_service import MediaService
+from app.tasks.media import generate_image_derivatives
+from app.utils.images import IMAGE_EXTENSIONS, IMAGE_VARIANTS, media_id_from_key, variant_key
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--prefix', default='', help='Yalnızca bu önekle başlayan anahtarlar')
+    parser.add_argument('--dry-run', action='store_true', help='Kuyruğa eklemeden listele')
+    args = parser.parse_args()
+
+    media_service = MediaService.get_instance()
+    paginator = media_service.s3.get_paginator('list_objects_v2')
+
+    keys = set()
+    for page in paginator.paginate(Bucket=media_service.s3_bucket, Prefix=args.prefix):
+        keys.update(obj['Key'] for obj in page.get('Contents', []))
+
+    queued = 0
+    for key in sorted(keys):
+        if key.rsplit('.', 1)[-1].lower() not in IMAGE_EXTENSIONS or '__' in key.rsplit('/', 1)[-1]:
+            continue
+        media_id = media_id_from_key(key)
+        if all(variant_key(key, name) in keys for name in IMAGE_VARIANTS) and (
+                media_id is None or media_service.recorded_variants(key)):
+            continue
+        print(key)
+        if not args.dry_run:
+            generate_image_derivatives.delay(key, media_id)
+        queued += 1
+
+    print(f"{queued} görsel {'bulundu' if args.dry_run else 'kuyruğa eklendi'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Sıcak Akış Kurma Komut Dosyası
+----------------------------
+Son FEED_MAX_AGE_DAYS gün içinde oluşturulan forum ve anketleri tablolardan
+okuyup sıcak akışı baştan kurar. Redis deposu (varsayılan) ilk kurulumda ve
+ağırlıklar değiştirildiğinde bu komutla doldurulmalıdır; süreç içi depo
+kendini arka planda kurar ve yeniler.
+
+Kullanım:
+    python migrations/build_hot_feed.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Proje kök dizinini Python yolu'na ekle
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from app.feed import get_hot_feed
+from app.feed.hot import FEED_BACKEND, FEED_MAX_AGE_DAYS, load_hot_items
+
+
+def main():
+    argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter).parse_args()
+
+    count = get_hot_feed().rebuild(load_hot_items(time.time() - FEED_MAX_AGE_DAYS * 86400))
+    print(f"{count} öğe {FEED_BACKEND} akışına yazıldı")
+
+
+if __name__ == '__main__':
+    main()
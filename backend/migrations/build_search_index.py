@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Arama Dizini Kurma Komut Dosyası
+------------------------------
+Forum, anket ve grup tablolarını tarayıp arama dizinlerinin anlık
+görüntülerini SEARCH_SNAPSHOT_DIR altına yazar. Dağıtımdan önce çalıştırılırsa
+süreçler ilk aramada tabloyu taramak yerine dosyadan yükler.
+
+Kullanım:
+    python migrations/build_search_index.py [--only forums]
+"""
+
+import argparse
+import os
+import sys
+
+# Proje kök dizinini Python yolu'na ekle
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from app.search import get_search_registry
+from app.search.registry import SEARCH_SOURCES
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--only', choices=sorted(SEARCH_SOURCES), action='append',
+                        help='Yalnızca bu dizini kur (tekrarlanabilir)')
+    args = parser.parse_args()
+
+    for kind in args.only or SEARCH_SOURCES:
+        registry = get_search_registry(kind)
+        index = registry.rebuild()
+        print(f"{kind}: {len(index)} belge -> {registry.snapshot_path or '(kaydedilmedi)'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Tablo Oluşturma Komut Dosyası
+---------------------------
+app/services/schema.py içindeki tanımlara göre eksik tabloları ve GSI'ları
+oluşturur, ardından mevcut kullanıcılar için e-posta/kullanıcı adı
+benzersizlik kayıtlarını (UserKeys) doldurur; forum/yorumlarda tutulan eski
+reaksiyon sayılarını sayaç tablosuna (ReactionCounters), anket öğelerindeki
+oyları (oylar) oy tablosuna (PollVotes), grup öğelerindeki üyeleri (uyeler)
+üyelik tablosuna (GroupMemberships) aktarır ve grup adlarını GroupNames
+tablosunda ayırır.
+
+Kullanım:
+    python migrations/create_tables.py [--no-backfill]
+"""
+
+import argparse
+import os
+import sys
+
+# Proje kök dizinini Python yolu'na ekle
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import boto3
+from botocore.exceptions import ClientError
+
+from app.services.GroupTableDatabaseService import group_name_key
+from app.services.schema import (
+    create_tables,
+    USERS_TABLE_NAME,
+    USER_KEYS_TABLE_NAME,
+    FORUMS_TABLE_NAME,
+    COMMENTS_TABLE_NAME,
+    POLLS_TABLE_NAME,
+    POLL_VOTES_TABLE_NAME,
+    GROUPS_TABLE_NAME,
+    GROUP_MEMBERSHIPS_TABLE_NAME,
+    GROUP_NAMES_TABLE_NAME,
+    REACTION_COUNTERS_TABLE_NAME
+)
+
+
+def backfill_user_keys(dynamodb) -> int:
+    """
+    Users tablosundaki kayıtlar için eksik benzersizlik kayıtlarını ve
+    'user#<user_id>' anahtar kayıtlarını yazar.
+
+    Args:
+        dynamodb: boto3 DynamoDB resource'u
+
+    Returns:
+        int: Yazılan kayıt sayısı
+    """
+    users_table = dynamodb.Table(USERS_TABLE_NAME)
+    keys_table = dynamodb.Table(USER_KEYS_TABLE_NAME)
+    written = 0
+
+    params = {'ProjectionExpression': 'user_id, email, username'}
+    while True:
+        response = users_table.scan(**params)
+
+        for user in response.get('Items', []):
+            guards = {
+                f"email#{user['email']}": {},
+                f"username#{user.get('username')}": {},
+                # Users tablosunun tam anahtarı (toplu okuma için)
+                f"user#{user['user_id']}": {'email': user['email']}
+            }
+            for lookup_key, attributes in guards.items():
+                if lookup_key.endswith('#None'):
+                    continue
+                try:
+                    keys_table.put_item(
+                        Item=dict(attributes, lookup_key=lookup_key, user_id=user['user_id']),
+                        ConditionExpression='attribute_not_exists(lookup_key)'
+                    )
+                    written += 1
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                        raise
+                    # Zaten kayıtlı; başka bir kullanıcıya aitse raporla
+                    owner = keys_table.get_item(Key={'lookup_key': lookup_key}).get('Item', {})
+                    if owner.get('user_id') != user['user_id']:
+                        print(f"Çakışma: {lookup_key} -> {owner.get('user_id')} / {user['user_id']}")
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    return written
+
+
+def backfill_reaction_counters(dynamodb) -> int:
+    """
+    Forum ve yorum öğelerindeki like_count/dislike_count değerlerini
+    hedefin 0 numaralı sayaç parçasına yazar.
+
+    Sayaç parçası zaten varsa hedef atlanır; tekrar çalıştırmak güvenlidir.
+
+    Args:
+        dynamodb: boto3 DynamoDB resource'u
+
+    Returns:
+        int: Aktarılan hedef sayısı
+    """
+    counters_table = dynamodb.Table(REACTION_COUNTERS_TABLE_NAME)
+    written = 0
+
+    for table_name, id_key in ((FORUMS_TABLE_NAME, 'forum_id'), (COMMENTS_TABLE_NAME, 'comment_id')):
+        table = dynamodb.Table(table_name)
+        params = {'ProjectionExpression': f'{id_key}, like_count, dislike_count'}
+        while True:
+            response = table.scan(**params)
+
+            for item in response.get('Items', []):
+                like_count = int(item.get('like_count') or 0)
+                dislike_count = int(item.get('dislike_count') or 0)
+                if not like_count and not dislike_count:
+                    continue
+                try:
+                    counters_table.put_item(
+                        Item={
+                            'target_id': item[id_key],
+                            'shard': 0,
+                            'like_count': like_count,
+                            'dislike_count': dislike_count
+                        },
+                        ConditionExpression='attribute_not_exists(target_id)'
+                    )
+                    written += 1
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                        raise
+
+            if 'LastEvaluatedKey' not in response:
+                break
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    return written
+
+
+def move_poll_votes(dynamodb) -> int:
+    """
+    Anket öğelerindeki 'oylar' listesini PollVotes tablosuna taşır.
+
+    Seçeneklerdeki oy_sayisi değerleri zaten güncel olduğundan yalnızca oy
+    kayıtları yazılır, ardından liste anket öğesinden silinir.
+
+    Args:
+        dynamodb: boto3 DynamoDB resource'u
+
+    Returns:
+        int: Taşınan oy sayısı
+    """
+    polls_table = dynamodb.Table(POLLS_TABLE_NAME)
+    votes_table = dynamodb.Table(POLL_VOTES_TABLE_NAME)
+    moved = 0
+
+    params = {'ProjectionExpression': 'poll_id, oylar'}
+    while True:
+        response = polls_table.scan(**params)
+
+        for poll in response.get('Items', []):
+            if 'oylar' not in poll:
+                continue
+
+            # Aynı kullanıcının birden fazla oyu varsa sonuncusu geçerlidir
+            votes = {vote['kullanici_id']: vote for vote in poll['oylar']}
+            with votes_table.batch_writer(overwrite_by_pkeys=['poll_id', 'user_id']) as batch:
+                for user_id, vote in votes.items():
+                    batch.put_item(Item={
+                        'poll_id': poll['poll_id'],
+                        'user_id': user_id,
+                        'option_id': vote['secenek_id'],
+                        'created_at': vote.get('tarih')
+                    })
+            moved += len(votes)
+
+            polls_table.update_item(
+                Key={'poll_id': poll['poll_id']},
+                UpdateExpression='REMOVE oylar'
+            )
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    return moved
+
+
+def move_group_members(dynamodb) -> int:
+    """
+    Grup öğelerindeki 'uyeler' listesini GroupMemberships tablosuna taşır.
+
+    uye_sayisi zaten güncel olduğundan yalnızca üyelik kayıtları yazılır,
+    ardından liste grup öğesinden silinir.
+
+    Args:
+        dynamodb: boto3 DynamoDB resource'u
+
+    Returns:
+        int: Taşınan üye sayısı
+    """
+    groups_table = dynamodb.Table(GROUPS_TABLE_NAME)
+    memberships_table = dynamodb.Table(GROUP_MEMBERSHIPS_TABLE_NAME)
+    moved = 0
+
+    params = {'ProjectionExpression': 'group_id, uyeler'}
+    while True:
+        response = groups_table.scan(**params)
+
+        for group in response.get('Items', []):
+            if 'uyeler' not in group:
+                continue
+
+            # Aynı kullanıcı listede birden fazla kez varsa sonuncusu geçerlidir
+            members = {member['kullanici_id']: member for member in group['uyeler']}
+            with memberships_table.batch_writer(overwrite_by_pkeys=['group_id', 'user_id']) as batch:
+                for user_id, member in members.items():
+                    rol = member.get('rol', 'uye')
+                    durum = member.get('durum', 'aktif')
+                    batch.put_item(Item={
+                        'group_id': group['group_id'],
+                        'user_id': user_id,
+                        'rol': rol,
+                        'durum': durum,
+                        'durum_rol': f"{durum}#{rol}",
+                        'katilma_tarihi': member.get('katilma_tarihi')
+                    })
+            moved += len(members)
+
+            groups_table.update_item(
+                Key={'group_id': group['group_id']},
+                UpdateExpression='REMOVE uyeler'
+            )
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    return moved
+
+
+def backfill_group_names(dynamodb) -> int:
+    """
+    Aktif gruplar için eksik ad ayırma kayıtlarını yazar.
+
+    Aynı (normalize edilmiş) adı taşıyan birden fazla grup varsa ilki
+    ayırır, diğerleri raporlanır; bunların adı elle değiştirilmelidir.
+
+    Args:
+        dynamodb: boto3 DynamoDB resource'u
+
+    Returns:
+        int: Yazılan kayıt sayısı
+    """
+    groups_table = dynamodb.Table(GROUPS_TABLE_NAME)
+    names_table = dynamodb.Table(GROUP_NAMES_TABLE_NAME)
+    written = 0
+
+    params = {'ProjectionExpression': 'group_id, grup_adi, is_active'}
+    while True:
+        response = groups_table.scan(**params)
+
+        for group in response.get('Items', []):
+            if not group.get('is_active', True) or not group.get('grup_adi'):
+                continue
+            name_key = group_name_key(group['grup_adi'])
+            try:
+                names_table.put_item(
+                    Item={'name_key': name_key, 'group_id': group['group_id']},
+                    ConditionExpression='attribute_not_exists(name_key)'
+                )
+                written += 1
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                    raise
+                owner = names_table.get_item(Key={'name_key': name_key}).get('Item', {})
+                if owner.get('group_id') != group['group_id']:
+                    print(f"Çakışma: {name_key} -> {owner.get('group_id')} / {group['group_id']}")
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DynamoDB tablolarını oluşturur")
+    parser.add_argument('--no-backfill', action='store_true',
+                        help="Mevcut verileri yeni tablolara aktarma")
+    args = parser.parse_args()
+
+    session = boto3.Session(region_name=os.getenv('AWS_DEFAULT_REGION'))
+    dynamodb = session.resource('dynamodb', endpoint_url=os.getenv('DYNAMODB_ENDPOINT_URL'))
+
+    results = create_tables(dynamodb.meta.client)
+    for table_name, result in results.items():
+        print(f"{table_name}: {result}")
+
+    if not args.no_backfill:
+        written = backfill_user_keys(dynamodb)
+        print(f"UserKeys: {written} kayıt yazıldı")
+        written = backfill_reaction_counters(dynamodb)
+        print(f"ReactionCounters: {written} hedef aktarıldı")
+        written = move_poll_votes(dynamodb)
+        print(f"PollVotes: {written} oy taşındı")
+        written = move_group_members(dynamodb)
+        print(f"GroupMemberships: {written} üye taşındı")
+        written = backfill_group_names(dynamodb)
+        print(f"GroupNames: {written} ad ayrıldı")
+
+
+if __name__ == '__main__':
+    main()
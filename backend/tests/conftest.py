@@ -15,6 +15,17 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # .env dosyasını yükle
 load_dotenv()
 
+# Testler varsayılan olarak AWS yerine bellek içi SQLite motorunda çalışır;
+# DynamoDB'ye karşı çalıştırmak için STORAGE_BACKEND=dynamodb verin
+os.environ.setdefault('STORAGE_BACKEND', 'sqlite')
+os.environ.setdefault('SQLITE_PATH', ':memory:')
+# Celery görevleri broker olmadan, çağıran süreçte çalışır
+os.environ.setdefault('CELERY_TASK_ALWAYS_EAGER', 'true')
+# Arama dizinleri bellekte kalır; anlık görüntü dosyası yazılmaz
+os.environ.setdefault('SEARCH_SNAPSHOT_DIR', '')
+# Sıcak akış Redis yerine süreç içi depoda tutulur
+os.environ.setdefault('FEED_BACKEND', 'memory')
+
 # Uygulama oluşturma
 @pytest.fixture
 def app():
@@ -0,0 +1,33 @@
+"""
+AWS İstemci Fabrikası Testleri
+----------------------------
+Fork sonrası çocuk süreçte aynı client'ların kullanıldığını ve ebeveynden
+devralınan bağlantı havuzlarının boşaltıldığını doğrular.
+"""
+
+import os
+
+import pytest
+
+from app.utils import aws
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="fork gerektirir")
+def test_clients_survive_fork_without_parent_connections(monkeypatch):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'test')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'test')
+    client = aws.get_client('s3', 'eu-north-1')
+    manager = client._endpoint.http_session._manager
+    manager.connection_from_host('chrip.s3.eu-north-1.amazonaws.com', 443, 'https')
+    assert len(manager.pools) == 1
+
+    pid = os.fork()
+    if pid == 0:
+        # Çocuk: servislerin sakladığı client geçerli, havuzu boş olmalı
+        ok = aws.get_client('s3', 'eu-north-1') is client and len(manager.pools) == 0
+        os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    # Ebeveynin havuzu etkilenmez
+    assert len(manager.pools) == 1
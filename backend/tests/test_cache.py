@@ -0,0 +1,38 @@
+"""
+Önbellek Testleri
+---------------
+Yükleme sürerken geçersiz kılınan kaydın eski değerle geri yazılmadığını
+doğrular.
+"""
+
+from app.utils.cache import TTLCache
+
+
+def test_delete_during_load_drops_the_stale_value():
+    cache = TTLCache()
+
+    def stale_loader():
+        # Yükleme sürerken kayıt güncellenip geçersiz kılınır
+        cache.delete('usr_1')
+        return 'eski'
+
+    assert cache.get_or_load('usr_1', stale_loader) == 'eski'
+    assert cache.get('usr_1') is None
+    assert cache.get_or_load('usr_1', lambda: 'yeni') == 'yeni'
+    assert cache.get('usr_1') == 'yeni'
+
+
+def test_overlapping_loads_and_clear():
+    cache = TTLCache()
+    first = cache.begin_load('k')
+    second = cache.begin_load('k')
+    cache.clear()
+
+    assert not cache.finish_load('k', first, 'a')
+    assert not cache.finish_load('k', second, 'b')
+    assert cache.get('k') is None
+
+    # Yükleme kalmayınca kuşak kaydı da tutulmaz
+    assert not cache._loads
+    assert cache.finish_load('k', cache.begin_load('k'), 'c')
+    assert cache.get('k') == 'c'
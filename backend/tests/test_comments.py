@@ -0,0 +1,26 @@
+"""
+Yorum Yanıtı Testleri
+-------------------
+Yanıtların üst yoruma bir kez eklendiğini ve sırası karışan bağlamaların
+latest_sub_comment'ı eski yanıta geri almadığını doğrular.
+"""
+
+from app.services.CommentTableDatabaseService import CommentDatabaseService
+
+
+def test_latest_reply_only_moves_forward():
+    comments = CommentDatabaseService.get_instance()
+    parent = comments.create_comment('u1', 'frm_1', 'Üst yorum')
+    older = comments.create_reply(parent.comment_id, 'u2', 'İlk yanıt').to_dict()
+    newer = comments.create_reply(parent.comment_id, 'u3', 'İkinci yanıt').to_dict()
+    older['created_at'], newer['created_at'] = '2026-01-01T10:00:00', '2026-01-01T10:05:00'
+
+    # Yeni yanıtın görevi önce, eskisininki sonra (ör. yeniden denemede) çalışır
+    assert comments.link_reply(parent.comment_id, newer)
+    assert comments.link_reply(parent.comment_id, older)
+    assert not comments.link_reply(parent.comment_id, older)
+
+    stored = comments.get_comment_by_id(parent.comment_id)
+    assert stored.sub_comment_list == [newer['comment_id'], older['comment_id']]
+    assert stored.latest_sub_comment['comment_id'] == newer['comment_id']
+    assert not comments.link_reply('cmt_missing', newer)
@@ -0,0 +1,45 @@
+"""
+Paralel Çağrı Testleri
+--------------------
+Süre bütçesini aşan paralel okumaların 504 olarak istemciye ulaştığını
+doğrular.
+"""
+
+import threading
+
+import pytest
+from flask import Flask
+
+from app.middleware.error_handler import register_error_handlers
+from app.services.ReactionTableDatabaseService import ReactionDatabaseService
+from app.services.forum_service import ForumService
+from app.utils import concurrency
+from app.utils.exceptions import GatewayTimeoutError
+
+
+@pytest.fixture
+def slow_counts(monkeypatch):
+    release = threading.Event()
+
+    def get_counts(target_id):
+        release.wait(5)
+        return {'like_count': 0, 'dislike_count': 0}
+
+    monkeypatch.setattr(concurrency, 'FANOUT_TIMEOUT_SECONDS', 0.05)
+    monkeypatch.setattr(ReactionDatabaseService.get_instance(), 'get_counts', get_counts)
+    yield
+    release.set()
+
+
+def test_timeout_is_not_turned_into_500(slow_counts):
+    with pytest.raises(GatewayTimeoutError):
+        ForumService.get_forum_by_id('frm_missing')
+
+    app = Flask(__name__)
+    register_error_handlers(app)
+
+    @app.route('/forum')
+    def forum():
+        ForumService.get_forum_by_id('frm_missing')
+
+    assert app.test_client().get('/forum').status_code == 504
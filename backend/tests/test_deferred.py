@@ -0,0 +1,98 @@
+"""
+Ertelenmiş Görev Testleri
+-----------------------
+Idempotency anahtarlarını, broker yokken satır içi çalışmayı ve yanıtların
+üst yoruma ertelenmiş bağlanmasını doğrular.
+"""
+
+import logging
+
+import pytest
+
+from app.services.CommentTableDatabaseService import CommentDatabaseService
+from app.services.schema import get_table_definition, TASK_KEYS_TABLE_NAME
+from app.storage.sqlite import SQLiteResource
+from app.tasks import celery_app
+from app.tasks import deferred
+from app.tasks.deferred import IdempotencyStore, deferred_task, defer
+
+calls = []
+
+
+@deferred_task(max_retries=2)
+def record(value, fail=False):
+    calls.append(value)
+    if fail:
+        raise RuntimeError('geçici hata')
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    resource = SQLiteResource(str(tmp_path / 'test.db'))
+    resource.meta.client.create_table(**get_table_definition(TASK_KEYS_TABLE_NAME))
+    store = IdempotencyStore(resource.Table(TASK_KEYS_TABLE_NAME))
+    monkeypatch.setattr(deferred, '_store', store)
+    calls.clear()
+    return store
+
+
+def test_same_idempotency_key_runs_once():
+    defer(record, 'a', idempotency_key='k1')
+    defer(record, 'a', idempotency_key='k1')
+    defer(record, 'b')
+    defer(record, 'b')
+
+    assert calls == ['a', 'b', 'b']
+
+
+def test_failed_run_releases_key(monkeypatch):
+    # Celery 5.2'nin hata kaydı Python 3.11'de pytest'in log yakalayıcısında
+    # traceback biçimlendirirken patlıyor; görev davranışı etkilenmez
+    monkeypatch.setattr(logging.getLogger('celery.app.trace'), 'disabled', True)
+    defer(record, 'a', fail=True, idempotency_key='k1')
+    defer(record, 'a', idempotency_key='k1')
+
+    # Satır içi çalışma yeniden denemez; ikinci teslimat anahtarı alabilir
+    assert calls == ['a', 'a']
+
+
+def test_expired_lease_can_be_claimed(store, monkeypatch):
+    now = [1000]
+    monkeypatch.setattr(store, '_timer', lambda: now[0])
+
+    assert store.claim('k1')
+    assert not store.claim('k1')
+    now[0] += deferred.TASK_KEY_LEASE + 1
+    assert store.claim('k1')
+    store.complete('k1')
+    now[0] += deferred.TASK_KEY_LEASE + 1
+    assert not store.claim('k1')
+
+
+def test_runs_inline_when_broker_unreachable(monkeypatch):
+    monkeypatch.setitem(celery_app.conf, 'task_always_eager', False)
+
+    def unreachable(*args, **kwargs):
+        raise ConnectionError('broker yok')
+
+    monkeypatch.setattr(record, 'apply_async', unreachable)
+    defer(record, 'a')
+
+    assert calls == ['a']
+
+
+def test_reply_is_linked_to_parent_once(store):
+    comments = CommentDatabaseService.get_instance()
+    parent = comments.create_comment('u1', 'frm_1', 'Üst yorum')
+
+    from app.services.comment_service import CommentService
+    reply = CommentService.add_reply(parent.comment_id, 'u2', 'Yanıt', [])
+
+    linked = comments.get_comment_by_id(parent.comment_id)
+    assert linked.sub_comment_list == [reply.comment_id]
+    assert linked.latest_sub_comment['comment_id'] == reply.comment_id
+    # Yeniden teslim edilen görev anahtarı tamamlanmış bulur ve atlanır
+    assert not store.claim(f"link_reply:{reply.comment_id}")
+    assert not comments.link_reply(parent.comment_id, reply.to_dict())
+    with pytest.raises(ValueError):
+        comments.create_reply('cmt_yok', 'u2', 'Yanıt')
@@ -0,0 +1,163 @@
+"""
+Sıcak Akış Testleri
+-----------------
+Zamanla sönümlenen puanları, üniversite başına sıralamayı, süresi dolan
+öğelerin çıkarılmasını, epoch'un ileri alınmasını ve tablolardan kurulumu
+doğrular. Depo testleri süreç içi depoyla ve (fakeredis[lua] kuruluysa)
+Redis deposunun Lua betikleriyle çalışır.
+"""
+
+import threading
+
+import pytest
+
+from app.feed import HotFeed, MemoryHotFeedStore, RedisHotFeedStore
+
+HOUR = 3600.0
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def make_store(request):
+    def make(**kwargs):
+        if request.param == 'memory':
+            return MemoryHotFeedStore(half_life=HOUR, max_age=48 * HOUR, **kwargs)
+        fakeredis = pytest.importorskip('fakeredis')
+        pytest.importorskip('lupa')
+        return RedisHotFeedStore(fakeredis.FakeRedis(), half_life=HOUR, max_age=48 * HOUR, **kwargs)
+    return make
+
+
+def _feed(make_store, clock, **kwargs):
+    return HotFeed(make_store(**kwargs), weights={'create': 1, 'like': 1, 'comment': 2}, timer=clock)
+
+
+def _epoch(store):
+    if isinstance(store, RedisHotFeedStore):
+        return float(store.client.get(f'{store.prefix}:epoch'))
+    return store._epoch
+
+
+def _wait_for_refresh():
+    for thread in threading.enumerate():
+        if thread.name == 'hot-feed-refresh':
+            thread.join(5)
+
+
+def test_scores_decay_and_rank_per_university(make_store, clock):
+    feed = _feed(make_store, clock)
+    feed.record_item('frm_old', 'ODTÜ')
+    clock.now += 2 * HOUR
+    feed.record_item('frm_new', 'ODTÜ')
+    feed.record_item('pol_other', 'Boğaziçi')
+
+    # İki yarı ömür önceki oluşturma 1/4 ağırlığındadır
+    (first, first_score), (second, second_score) = feed.top('ODTÜ')[0]
+    assert (first, second) == ('frm_new', 'frm_old')
+    assert first_score == pytest.approx(1.0)
+    assert second_score == pytest.approx(0.25)
+
+    feed.record_activity('frm_old', 'comment')
+    assert [item_id for item_id, _ in feed.top('ODTÜ')[0]] == ['frm_old', 'frm_new']
+    assert feed.top('Boğaziçi') == ([('pol_other', pytest.approx(1.0))], 1)
+    assert feed.top(limit=2, offset=1)[1] == 3
+
+    # Akışta olmayan öğelere (ör. yorumlara) gelen etkinlik yok sayılır
+    feed.record_activity('cmt_x', 'like')
+    feed.remove_item('frm_new')
+    assert [item_id for item_id, _ in feed.top()[0]] == ['frm_old', 'pol_other']
+
+
+def test_expired_items_leave_the_feed(make_store, clock):
+    feed = _feed(make_store, clock)
+    feed.record_item('frm_a', 'ODTÜ')
+    clock.now += 49 * HOUR
+    assert feed.top('ODTÜ') == ([], 0)
+    feed.record_activity('frm_a', 'like')
+    assert feed.top() == ([], 0)
+
+
+def test_rebase_keeps_order_and_scores(make_store, clock):
+    feed = _feed(make_store, clock, rebase_after=4)
+    feed.record_item('frm_a', None)
+    for _ in range(10):
+        clock.now += HOUR
+        feed.record_activity('frm_a', 'like')
+    feed.record_item('frm_b', None)
+
+    items, _ = feed.top()
+    assert [item_id for item_id, _ in items] == ['frm_a', 'frm_b']
+    # 1 + 1/2 + 1/4 + ... (11 terim)
+    assert items[0][1] == pytest.approx(2 - 2 ** -10)
+    assert _epoch(feed.store) > 1_700_000_000.0
+
+
+def test_bootstrap_from_tables_keeps_writes_made_during_load(clock):
+    store = MemoryHotFeedStore(half_life=HOUR, max_age=48 * HOUR)
+
+    def loader(since):
+        # Kurulum sürerken gelen etkinlik kaybolmamalı
+        feed.record_activity('frm_a', 'like')
+        return [('frm_a', 'ODTÜ', clock.now - HOUR, 4.0), ('frm_b', 'ODTÜ', clock.now, 1.0)]
+
+    feed = HotFeed(store, weights={'like': 1}, loader=loader, timer=clock)
+    # Kurulumdan önceki yazmalar atlanır; tablolar onları zaten içerir
+    feed.record_activity('frm_b', 'like')
+
+    items, total = feed.top('ODTÜ')
+    assert total == 2
+    assert items == [('frm_a', pytest.approx(3.0)), ('frm_b', pytest.approx(1.0))]
+
+
+def test_periodic_rebuild_picks_up_other_workers_writes(clock):
+    # Tablolar, başka bir worker'ın yazdığı forumu ikinci kurulumda içerir
+    tables = [[('frm_a', 'ODTÜ', clock.now, 1.0)]]
+
+    def loader(since):
+        return list(tables[-1])
+
+    store = MemoryHotFeedStore(half_life=HOUR, max_age=48 * HOUR)
+    feed = HotFeed(store, weights={'create': 1}, loader=loader, refresh_interval=60, timer=clock)
+    assert [item_id for item_id, _ in feed.top()[0]] == ['frm_a']
+
+    tables.append([('frm_a', 'ODTÜ', clock.now, 1.0), ('frm_b', 'ODTÜ', clock.now, 5.0)])
+    clock.now += 61
+    # Süresi dolan depo arka planda yeniden kurulurken okuma eskisinden sunulur
+    assert feed.top()[1] in (1, 2)
+    _wait_for_refresh()
+    assert [item_id for item_id, _ in feed.top('ODTÜ')[0]] == ['frm_b', 'frm_a']
+
+
+def test_memory_backend_is_refused_in_production(monkeypatch):
+    from flask import Flask
+    from app.feed import hot
+
+    app = Flask(__name__)
+    monkeypatch.setattr(hot, 'FEED_BACKEND', 'memory')
+    with pytest.raises(RuntimeError):
+        hot.check_backend(app)
+
+    app.config['TESTING'] = True
+    hot.check_backend(app)
+
+
+def test_redis_client_has_timeouts():
+    pytest.importorskip('redis')
+    from app.feed import hot
+
+    # Bağlantı tembel kurulur; istemciyi oluşturmak Redis gerektirmez
+    options = hot.create_store('redis').client.connection_pool.connection_kwargs
+    assert options['socket_timeout'] == hot.FEED_REDIS_SOCKET_TIMEOUT
+    assert options['socket_connect_timeout'] == hot.FEED_REDIS_CONNECT_TIMEOUT
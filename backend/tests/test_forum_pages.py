@@ -0,0 +1,54 @@
+"""
+Forum Sayfalama Testleri
+----------------------
+Üniversite ve kategori index'lerinden cursor ile sayfalamanın her forumu
+bir kez, en yeniden eskiye döndürdüğünü ve cursor'un sorguya bağlı
+olduğunu doğrular.
+"""
+
+import uuid
+
+import pytest
+
+from app.services import ForumTableDatabaseService as forum_module
+from app.services.ForumTableDatabaseService import ForumDatabaseService
+from app.services.schema import FORUMS_TABLE_NAME, get_table_definition
+from app.utils.exceptions import ValidationError
+
+
+@pytest.fixture
+def forums():
+    return ForumDatabaseService.get_instance()
+
+
+def _pages(forums, **filters):
+    ids, cursor = [], None
+    while True:
+        page = forums.get_forums(per_page=2, cursor=cursor, **filters)
+        ids.extend(forum['forum_id'] for forum in page['forums'])
+        cursor = page['meta']['next_cursor']
+        if not cursor:
+            return ids
+
+
+def test_cursor_pages_follow_the_index(forums):
+    university = f"Üniversite {uuid.uuid4()}"
+    created = [forums.create_forum('u1', f'Forum {n}', university=university, category='spor').forum_id
+               for n in range(5)]
+    forums.create_forum('u1', 'Başka kategori', university=university, category='sanat')
+
+    # En yeni önce; her forum bir kez
+    by_category = _pages(forums, university=university, category='spor')
+    assert by_category == created[::-1]
+    assert len(_pages(forums, university=university)) == 6
+
+    cursor = forums.get_forums(per_page=2, university=university)['meta']['next_cursor']
+    with pytest.raises(ValidationError):
+        forums.get_forums(per_page=2, cursor=cursor, category='spor')
+    with pytest.raises(ValidationError):
+        forums.get_forums(per_page=2, cursor='bozuk')
+
+
+def test_service_queries_the_indexes_the_schema_creates():
+    indexes = {index['IndexName'] for index in get_table_definition(FORUMS_TABLE_NAME)['GlobalSecondaryIndexes']}
+    assert {forum_module.CATEGORY_INDEX_NAME, forum_module.UNIVERSITY_INDEX_NAME} == indexes
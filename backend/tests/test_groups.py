@@ -0,0 +1,115 @@
+"""
+Grup Üyelik Testleri
+------------------
+Üyeliklerin GroupMemberships tablosunda tutulduğunu, üye sayısının aynı
+işlemde güncellendiğini, üye sayfalarının index'lerden okunduğunu ve grup
+adlarının GroupNames tablosunda ayrıldığını doğrular.
+"""
+
+import pytest
+
+from app.services.GroupTableDatabaseService import GroupDatabaseService, group_name_key
+
+
+@pytest.fixture
+def groups():
+    return GroupDatabaseService()
+
+
+def test_join_and_leave_keep_member_count(groups):
+    group = groups.create_group('founder', 'Satranç Kulübü')
+
+    assert groups.join_group(group.group_id, 'u1')['membership_status'] == 'aktif'
+    with pytest.raises(ValueError, match='Zaten'):
+        groups.join_group(group.group_id, 'u1')
+    assert groups.get_group_by_id(group.group_id).uye_sayisi == 2
+    assert 'uyeler' not in groups.table.get_item(Key={'group_id': group.group_id})['Item']
+
+    assert groups.leave_group(group.group_id, 'u1')
+    assert groups.get_membership(group.group_id, 'u1') is None
+    assert groups.get_group_by_id(group.group_id).uye_sayisi == 1
+    with pytest.raises(ValueError):
+        groups.leave_group(group.group_id, 'founder')
+
+
+def test_closed_group_approval_and_roles(groups):
+    group = groups.create_group('founder', 'Kapalı Grup', gizlilik='kapali')
+    groups.join_group(group.group_id, 'u1')
+    groups.join_group(group.group_id, 'u2')
+    assert groups.get_group_by_id(group.group_id).uye_sayisi == 1
+
+    with pytest.raises(ValueError):
+        groups.approve_membership(group.group_id, 'u2', 'u1')
+    groups.approve_membership(group.group_id, 'founder', 'u1')
+    groups.approve_membership(group.group_id, 'founder', 'u2', approve=False)
+    with pytest.raises(ValueError, match='onay bekleyen'):
+        groups.approve_membership(group.group_id, 'founder', 'u1')
+
+    groups.update_member_role(group.group_id, 'founder', 'u1', 'moderator')
+    assert groups.get_membership(group.group_id, 'u1').rol == 'moderator'
+    assert groups.get_group_by_id(group.group_id).uye_sayisi == 2
+    assert groups.get_membership(group.group_id, 'u2') is None
+
+
+def test_member_pages_by_status_and_role(groups):
+    group = groups.create_group('founder', 'Büyük Grup')
+    for number in range(25):
+        groups.join_group(group.group_id, f'u{number:02d}')
+    groups.update_member_role(group.group_id, 'founder', 'u07', 'moderator')
+
+    seen = []
+    cursor = None
+    while True:
+        page = groups.get_group_members(group.group_id, per_page=10, cursor=cursor, status='aktif')
+        seen.extend(member['kullanici_id'] for member in page['members'])
+        cursor = page['meta']['next_cursor']
+        if not cursor:
+            break
+    assert len(seen) == len(set(seen)) == 26
+
+    moderators = groups.get_group_members(group.group_id, status='aktif', role='moderator')
+    assert [member['kullanici_id'] for member in moderators['members']] == ['u07']
+    assert [member['group_id'] for member in groups.get_user_groups('u07')] == [group.group_id]
+
+
+def test_group_name_key_folds_case_and_turkish_i():
+    assert group_name_key('İSTANBUL  Kulübü ') == group_name_key('ıstanbul kulübü') == 'istanbul kulübü'
+    assert group_name_key('Çay Ocağı') == 'çay ocaği'
+
+
+def test_group_names_are_reserved(groups):
+    first = groups.create_group('founder', 'Kitap Kulübü İzmir')
+    with pytest.raises(ValueError, match='zaten kullanılıyor'):
+        groups.create_group('other', 'KITAP kulübü izmir')
+
+    second = groups.create_group('other', 'Kitap Kulübü Ankara')
+    with pytest.raises(ValueError, match='zaten kullanılıyor'):
+        groups.update_group(second.group_id, 'other', {'grup_adi': 'kitap kulübü izmir'})
+
+    # Yeniden adlandırma eski adı serbest bırakır
+    groups.update_group(first.group_id, 'founder', {'grup_adi': 'Kitap Kulübü Ege'})
+    renamed = groups.update_group(second.group_id, 'other', {'grup_adi': 'Kitap Kulübü İzmir'})
+    assert renamed.grup_adi == 'Kitap Kulübü İzmir'
+    # Yalnızca büyük/küçük harf değişikliği kendi ayırmasıyla çakışmaz
+    assert groups.update_group(second.group_id, 'other', {'grup_adi': 'KİTAP KULÜBÜ İZMİR'}).grup_adi == 'KİTAP KULÜBÜ İZMİR'
+
+
+def test_my_groups_route_returns_group_ids(app, client, groups):
+    from app.services.UserTableDatabaseService import UserDatabaseService
+    from app.utils.auth import generate_token
+
+    with app.app_context():
+        user = UserDatabaseService.get_instance().create_user(
+            email='uye@ornek.edu.tr', username='grup_uyesi', password='Sifre12345', university='ODTÜ'
+        )
+        token = generate_token(user.user_id)
+    open_group = groups.create_group('founder', 'Açık Grup Rotası')
+    closed_group = groups.create_group('founder', 'Kapalı Grup Rotası', gizlilik='kapali')
+    groups.join_group(open_group.group_id, user.user_id)
+    groups.join_group(closed_group.group_id, user.user_id)
+
+    response = client.get(f"{app.config['API_PREFIX']}/users/groups", headers={'Authorization': f'Bearer {token}'})
+
+    # Onay bekleyen başvuru grup listesinde yer almaz
+    assert response.status_code == 200
+    assert response.get_json()['data'] == [open_group.group_id]
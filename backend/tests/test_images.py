@@ -0,0 +1,81 @@
+"""
+Görsel Türevi Testleri
+--------------------
+Türevlerin boyut ve biçimlerini, yanıtlarda yalnızca kaydedilmiş türevlerin
+verildiğini ve türev görevinin nesneleri orijinalin yanına yazdığını doğrular.
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+from app.services.media_service import MediaService
+from app.tasks.media import generate_image_derivatives
+from app.utils import images
+from tests.test_media import S3Double
+
+
+def _jpeg(width, height):
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), (200, 30, 30)).save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+def test_render_variants_resizes_and_encodes_webp():
+    variants = images.render_variants(_jpeg(2000, 1000))
+
+    rendered = {(name, extension): Image.open(io.BytesIO(body)) for name, extension, body, _ in variants}
+    assert set(rendered) == {('thumb', 'jpg'), ('thumb', 'webp'), ('medium', 'jpg'), ('medium', 'webp')}
+    assert rendered[('thumb', 'webp')].format == 'WEBP'
+    assert rendered[('thumb', 'jpg')].size == (320, 160)
+    assert rendered[('medium', 'webp')].size == (1080, 540)
+
+
+def test_small_images_are_not_upscaled():
+    variants = images.render_variants(_jpeg(100, 50))
+
+    assert {Image.open(io.BytesIO(body)).size for _, _, body, _ in variants} == {(100, 50)}
+
+
+def test_image_variants_only_once_recorded(monkeypatch):
+    monkeypatch.setattr(images, '_S3_BUCKET', 'chrip')
+    monkeypatch.setattr(images, '_S3_REGION', 'eu-north-1')
+    service = MediaService.get_instance()
+    s3 = S3Double()
+    monkeypatch.setattr(service, 's3', s3)
+    upload = service.create_upload('u1', 'image/jpeg', metadata={'model_type': 'forum'})
+    url = f"https://chrip.s3.eu-north-1.amazonaws.com/{upload['s3_key']}"
+
+    # Türev üretilmeden önce orijinal verilir
+    assert images.image_variants(url) == {'thumb': url, 'medium': url}
+
+    s3.objects[upload['s3_key']] = (_jpeg(640, 480), 'image/jpeg')
+    generate_image_derivatives.delay(upload['s3_key'], upload['media_id']).get()
+    base = url.rsplit('.', 1)[0]
+    assert images.image_variants(url) == {'thumb': base + '__thumb.webp', 'medium': base + '__medium.webp'}
+
+    # Kaydı olmayan görseller orijinalde kalır
+    other = 'https://chrip.s3.eu-north-1.amazonaws.com/forum/u1/abc.jpg'
+    assert images.image_variants(other) == {'thumb': other, 'medium': other}
+    assert images.image_variants('https://example.com/abc.jpg') == {}
+    assert images.image_variants(url + '?X-Amz-Signature=x') == {}
+    assert images.image_variants(None) == {}
+
+
+def test_task_writes_derivatives_next_to_original(monkeypatch):
+    service = MediaService.get_instance()
+    s3 = S3Double()
+    monkeypatch.setattr(service, 's3', s3)
+    s3.objects['forum/u1/abc.jpg'] = (_jpeg(640, 480), 'image/jpeg')
+
+    keys = generate_image_derivatives.delay('forum/u1/abc.jpg').get()
+
+    assert sorted(keys) == [
+        'forum/u1/abc__medium.jpg', 'forum/u1/abc__medium.webp',
+        'forum/u1/abc__thumb.jpg', 'forum/u1/abc__thumb.webp'
+    ]
+    assert s3.objects['forum/u1/abc__thumb.webp'][1] == 'image/webp'
+    # Görsel olmayan dosya hata vermeden atlanır
+    s3.objects['forum/u1/bad.jpg'] = (b'not an image', 'image/jpeg')
+    assert generate_image_derivatives.delay('forum/u1/bad.jpg').get() == []
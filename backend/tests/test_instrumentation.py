@@ -0,0 +1,63 @@
+"""
+İstek Ölçümü Testleri
+-------------------
+Arka uç çağrılarının istek başına sayılıp Server-Timing başlığında
+raporlandığını doğrular.
+"""
+
+import pytest
+from flask import Flask, jsonify
+
+from app.middleware.instrumentation import register_instrumentation
+from app.storage.sqlite import SQLiteResource
+from app.utils.concurrency import run_parallel
+
+
+@pytest.fixture
+def table(tmp_path):
+    resource = SQLiteResource(str(tmp_path / 'test.db'))
+    resource.meta.client.create_table(
+        TableName='Posts',
+        KeySchema=[{'AttributeName': 'post_id', 'KeyType': 'HASH'}],
+        AttributeDefinitions=[{'AttributeName': 'post_id', 'AttributeType': 'S'}]
+    )
+    table = resource.Table('Posts')
+    table.put_item(Item={'post_id': 'p1'})
+    table.put_item(Item={'post_id': 'p2'})
+    return table
+
+
+@pytest.fixture
+def client(table):
+    app = Flask(__name__)
+    app.config['SERVER_TIMING_ENABLED'] = True
+    register_instrumentation(app)
+
+    @app.route('/posts')
+    def posts():
+        # İki paralel okuma da aynı isteğe yazılmalı
+        first, second = run_parallel(
+            lambda: table.get_item(Key={'post_id': 'p1'}),
+            lambda: table.scan()
+        )
+        return jsonify(len(second['Items']))
+
+    return app.test_client()
+
+
+def test_server_timing_reports_backend_calls(client):
+    response = client.get('/posts')
+
+    header = response.headers['Server-Timing']
+    assert 'sqlite-getitem;desc="1x Posts, 1 items"' in header
+    assert 'sqlite-scan;desc="1x Posts, 2 items"' in header
+    assert 'backend;desc="2 calls"' in header
+    assert 'total;dur=' in header
+
+
+def test_calls_outside_requests_are_not_recorded(client, table):
+    table.scan()
+
+    response = client.get('/posts')
+
+    assert 'backend;desc="2 calls"' in response.headers['Server-Timing']
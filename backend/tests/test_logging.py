@@ -0,0 +1,48 @@
+"""
+Günlük Kaydı Testleri
+-------------------
+request_id ilişkilendirmesini ve logger seviye ayarlarını doğrular.
+"""
+
+import logging
+
+import pytest
+import structlog
+from flask import Flask, jsonify
+
+from app.middleware.request_id import register_request_id
+from app.utils.log import parse_levels
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    register_request_id(app)
+
+    @app.route('/context')
+    def context():
+        return jsonify(structlog.contextvars.get_contextvars())
+
+    return app.test_client()
+
+
+def test_request_id_is_bound_and_returned(client):
+    response = client.get('/context', headers={'X-Request-ID': 'lb-42'})
+
+    assert response.headers['X-Request-ID'] == 'lb-42'
+    assert response.json == {'request_id': 'lb-42'}
+    assert structlog.contextvars.get_contextvars() == {}
+
+
+def test_invalid_request_id_is_replaced(client):
+    response = client.get('/context', headers={'X-Request-ID': 'bad id'})
+
+    request_id = response.headers['X-Request-ID']
+    assert request_id != 'bad id'
+    assert response.json == {'request_id': request_id}
+
+
+def test_parse_levels():
+    levels = parse_levels('botocore=WARNING, app.middleware=debug,broken,x=NOPE')
+
+    assert levels == {'botocore': logging.WARNING, 'app.middleware': logging.DEBUG}
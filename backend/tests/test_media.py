@@ -0,0 +1,118 @@
+"""
+Doğrudan S3 Yükleme Testleri
+--------------------------
+İmzalı yükleme formunun koşullarını ve tamamlama çağrısının nesneyi
+doğrulayıp kaydı güncellediğini, sunucu üzerinden yüklenen görsellerin
+de kaydedilip türevlerinin sunulduğunu doğrular.
+"""
+
+import io
+
+import pytest
+from botocore.exceptions import ClientError
+from PIL import Image
+from werkzeug.datastructures import FileStorage
+
+from app.services.media_service import MediaService
+from app.utils.exceptions import ForbiddenError, ValidationError
+
+
+class S3Double:
+    """Bellekte nesne tutan S3 client'ı; imzalı form parametrelerini saklar."""
+
+    def __init__(self):
+        self.objects = {}
+        self.posts = []
+
+    def generate_presigned_post(self, Bucket, Key, Fields=None, Conditions=None, ExpiresIn=3600):
+        self.posts.append({'Key': Key, 'Fields': Fields, 'Conditions': Conditions})
+        return {'url': f'https://{Bucket}.s3.amazonaws.com/', 'fields': dict(Fields, key=Key)}
+
+    def get_object(self, Bucket, Key):
+        body, content_type = self.objects[Key]
+        return {'Body': io.BytesIO(body), 'ContentType': content_type}
+
+    def put_object(self, Bucket, Key, Body, ContentType, **kwargs):
+        self.objects[Key] = (Body, ContentType)
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None):
+        self.objects[Key] = (Fileobj.read(), (ExtraArgs or {}).get('ContentType'))
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+        body, content_type = self.objects[Key]
+        return {'ContentLength': len(body), 'ContentType': content_type}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+
+@pytest.fixture
+def media(monkeypatch):
+    service = MediaService.get_instance()
+    s3 = S3Double()
+    monkeypatch.setattr(service, 's3', s3)
+    monkeypatch.setattr(service, 's3_bucket', 'bucket')
+    return service, s3
+
+
+def test_upload_form_enforces_type_and_size(media):
+    service, s3 = media
+
+    result = service.create_upload('u1', 'image/png', size=1000, metadata={'model_type': 'forum'})
+
+    assert result['s3_key'] == f"forum/u1/{result['media_id']}.png"
+    assert result['upload']['fields']['Content-Type'] == 'image/png'
+    assert s3.posts[0]['Conditions'] == [{'Content-Type': 'image/png'}, ['content-length-range', 1, 1000]]
+
+    with pytest.raises(ValidationError):
+        service.create_upload('u1', 'application/pdf')
+    with pytest.raises(ValidationError):
+        service.create_upload('u1', 'image/png', size=10 ** 10)
+
+
+def test_complete_records_uploaded_object(media):
+    service, s3 = media
+    upload = service.create_upload('u1', 'image/jpeg', filename='kedi.jpg')
+
+    with pytest.raises(ValidationError):
+        service.complete_upload(upload['media_id'], 'u1')
+
+    s3.objects[upload['s3_key']] = (b'x' * 2048, 'image/jpeg')
+    with pytest.raises(ForbiddenError):
+        service.complete_upload(upload['media_id'], 'u2')
+
+    result = service.complete_upload(upload['media_id'], 'u1')
+    assert result['durum'] == 'hazir'
+    assert result['boyut'] == 2048
+    assert result['orijinal_dosya_adi'] == 'kedi.jpg'
+    assert result['url'].endswith(upload['s3_key'])
+    # Tekrarlanan çağrı aynı kaydı döndürür
+    assert service.complete_upload(upload['media_id'], 'u1')['boyut'] == 2048
+
+
+def test_complete_discards_mismatched_object(media):
+    service, s3 = media
+    upload = service.create_upload('u1', 'image/png')
+    s3.objects[upload['s3_key']] = (b'<html>', 'text/html')
+
+    with pytest.raises(ValidationError):
+        service.complete_upload(upload['media_id'], 'u1')
+
+    assert upload['s3_key'] not in s3.objects
+
+
+def test_server_upload_records_media_and_its_derivatives(media):
+    service, s3 = media
+    image = io.BytesIO()
+    Image.new('RGB', (64, 48)).save(image, 'JPEG')
+    file_obj = FileStorage(io.BytesIO(image.getvalue()), filename='kedi.jpg', content_type='image/jpeg')
+
+    result = service.upload_file(file_obj, 'u1', {'model_type': 'forum'})
+
+    assert result['s3_key'] == f"forum/u1/{result['media_id']}.jpg"
+    assert len(s3.objects[result['s3_key']][0]) == len(image.getvalue())
+    # Türev görevi (testlerde eşzamanlı) sonucu medya kaydına yazar
+    assert service.recorded_variants(result['s3_key'])
+    assert all('.webp' in url for url in service.variant_urls(result['s3_key']).values())
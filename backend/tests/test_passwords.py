@@ -0,0 +1,74 @@
+"""
+Şifre Hash'leme Havuzu Testleri
+-----------------------------
+Havuzda hash'lemeyi, sıra dolduğunda yük atmayı, zaman aşımının 504 olarak
+iletilmesini ve maliyet değişiminde yeniden hash gereksinimini doğrular.
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.utils import passwords
+from app.utils.exceptions import GatewayTimeoutError, ServiceUnavailableError
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(passwords, 'PASSWORD_HASH_ROUNDS', 4)
+    monkeypatch.setattr(passwords, 'PASSWORD_HASH_WORKERS', 1)
+    passwords.shutdown_pool()
+    yield passwords
+    passwords.shutdown_pool()
+
+
+def test_hash_and_check_in_pool(pool):
+    hashed = pool.hash_password('Password123')
+
+    assert hashed.startswith('$2b$04$')
+    assert pool.check_password('Password123', hashed)
+    assert not pool.check_password('wrong', hashed)
+
+
+def test_full_queue_sheds_load(pool, monkeypatch):
+    monkeypatch.setattr(passwords, 'PASSWORD_HASH_QUEUE_SIZE', 0)
+    monkeypatch.setattr(passwords, 'PASSWORD_HASH_QUEUE_TIMEOUT', 0.01)
+    busy = threading.Thread(target=passwords._run, args=(time.sleep, 0.5))
+    busy.start()
+    time.sleep(0.1)
+
+    with pytest.raises(ServiceUnavailableError) as error:
+        pool.hash_password('Password123')
+    busy.join()
+
+    assert error.value.status_code == 503
+    # İş bitince yer açılır
+    assert pool.hash_password('Password123')
+
+
+def test_timeout_reaches_the_caller_as_504(pool, monkeypatch):
+    from app.services import auth_service
+
+    monkeypatch.setattr(passwords, 'PASSWORD_HASH_TIMEOUT', 0.05)
+    with pytest.raises(GatewayTimeoutError):
+        passwords._run(time.sleep, 0.5)
+
+    class User:
+        password_hash = '$2b$04$' + 'x' * 53
+
+    service = auth_service.AuthService()
+    monkeypatch.setattr(service.user_db_service, '_get_user_by_email', lambda email: User())
+    monkeypatch.setattr(auth_service, 'check_password', lambda *args: passwords._run(time.sleep, 0.5))
+    with pytest.raises(GatewayTimeoutError) as error:
+        service.login('a@b.edu.tr', 'Password123')
+    assert error.value.status_code == 504
+
+
+def test_needs_rehash_when_cost_differs(pool):
+    hashed = pool.hash_password('Password123', rounds=5)
+
+    assert pool.hash_rounds(hashed) == 5
+    assert pool.password_needs_rehash(hashed)
+    assert not pool.password_needs_rehash(pool.hash_password('Password123'))
+    assert pool.password_needs_rehash('not-a-hash')
@@ -0,0 +1,58 @@
+"""
+Anket Oylama Testleri
+-------------------
+Oyların kullanıcı başına bir kez sayıldığını, oy değiştirmenin sayıyı
+seçenekler arasında taşıdığını ve geçersiz seçeneğin reddedildiğini doğrular.
+"""
+
+import pytest
+
+from app.services.PollTableDatabaseService import PollDatabaseService
+
+
+@pytest.fixture
+def polls():
+    return PollDatabaseService()
+
+
+def _counts(polls, poll_id):
+    poll = polls.get_poll_by_id(poll_id)
+    return [int(option.oy_sayisi) for option in poll.secenekler]
+
+
+def test_double_vote_is_counted_once(polls):
+    poll = polls.get_poll_by_id(polls.create_poll('u1', 'Kahve mi çay mı?', ['Kahve', 'Çay']).poll_id)
+    coffee = poll.secenekler[0].option_id
+
+    polls.vote_poll(poll.poll_id, 'u2', coffee)
+    polls.vote_poll(poll.poll_id, 'u2', coffee)
+
+    assert _counts(polls, poll.poll_id) == [1, 0]
+    assert polls.get_user_vote(poll.poll_id, 'u2') == coffee
+    assert polls.get_poll_results(poll.poll_id)['total_votes'] == 1
+
+
+def test_changing_a_vote_moves_it(polls):
+    poll = polls.get_poll_by_id(polls.create_poll('u1', 'Hangi gün?', ['Cuma', 'Cumartesi']).poll_id)
+    friday, saturday = (option.option_id for option in poll.secenekler)
+    polls.vote_poll(poll.poll_id, 'u2', friday)
+    polls.vote_poll(poll.poll_id, 'u3', friday)
+    # Önbellekteki sonuçlar da kendi oyumuzla güncellenir
+    assert polls.get_poll_results(poll.poll_id)['total_votes'] == 2
+
+    result = polls.vote_poll(poll.poll_id, 'u2', saturday)
+
+    assert [int(option['oy_sayisi']) for option in result['results']] == [1, 1]
+    assert _counts(polls, poll.poll_id) == [1, 1]
+    assert polls.get_user_vote(poll.poll_id, 'u2') == saturday
+    assert [option['oy_sayisi'] for option in polls.get_poll_results(poll.poll_id)['results']] == [1, 1]
+
+
+def test_invalid_option_is_rejected(polls):
+    poll = polls.get_poll_by_id(polls.create_poll('u1', 'Renk?', ['Mavi', 'Yeşil']).poll_id)
+
+    with pytest.raises(ValueError):
+        polls.vote_poll(poll.poll_id, 'u2', 'opt_missing')
+
+    assert _counts(polls, poll.poll_id) == [0, 0]
+    assert polls.get_user_vote(poll.poll_id, 'u2') is None
@@ -0,0 +1,95 @@
+"""
+Reaksiyon Testleri
+----------------
+Reaksiyonların kullanıcı başına bir kez sayıldığını, çakışan işlemlerin
+yeniden denendiğini ve sayaçlar okunamazsa sıfır döndüğünü doğrular.
+"""
+
+import uuid
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.services import ReactionTableDatabaseService as reaction_module
+from app.services.ReactionTableDatabaseService import ReactionDatabaseService, MAX_CONFLICT_RETRIES
+from app.utils.cache import TTLCache
+
+
+@pytest.fixture
+def reactions():
+    service = ReactionDatabaseService.get_instance()
+    service.count_cache.clear()
+    return service
+
+
+@pytest.fixture
+def target():
+    return f"frm_{uuid.uuid4()}"
+
+
+def _conflict():
+    return ClientError({
+        'Error': {'Code': 'TransactionCanceledException', 'Message': 'conflict'},
+        'CancellationReasons': [{'Code': 'None'}, {'Code': 'TransactionConflict'}]
+    }, 'TransactWriteItems')
+
+
+def test_one_reaction_per_user(reactions, target):
+    assert reactions.react(target, 'u1', 'like') == {'like_count': 1, 'dislike_count': 0}
+    # Tekrar eden reaksiyon sayılmaz, değişen reaksiyon sayıyı taşır
+    assert reactions.record_reaction(target, 'u1', 'like') == ({'like_count': 1, 'dislike_count': 0}, 'like')
+    reactions.react(target, 'u2', 'like')
+    assert reactions.record_reaction(target, 'u1', 'dislike') == ({'like_count': 1, 'dislike_count': 1}, 'like')
+
+    reactions.count_cache.clear()
+    assert reactions.get_counts(target) == {'like_count': 1, 'dislike_count': 1}
+    assert reactions.get_reaction(target, 'u1') == 'dislike'
+    with pytest.raises(ValueError):
+        reactions.react(target, 'u1', 'love')
+
+
+def test_conflicts_are_retried(reactions, target, monkeypatch):
+    write = reaction_module.transact_write
+    attempts = []
+
+    def flaky(client, items):
+        attempts.append(1)
+        if len(attempts) <= MAX_CONFLICT_RETRIES:
+            raise _conflict()
+        return write(client, items)
+
+    monkeypatch.setattr(reaction_module, 'transact_write', flaky)
+    assert reactions.react(target, 'u1', 'like')['like_count'] == 1
+
+    # Denemeler tükenince hata verilir ve hiçbir şey yazılmaz
+    def always_conflicting(client, items):
+        raise _conflict()
+
+    monkeypatch.setattr(reaction_module, 'transact_write', always_conflicting)
+    with pytest.raises(ValueError):
+        reactions.react(target, 'u2', 'like')
+    assert reactions.get_reaction(target, 'u2') is None
+
+
+def test_unreadable_counters_serve_zeros_uncached(reactions, target, monkeypatch):
+    def failing_query(**kwargs):
+        raise ClientError({'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': ''}}, 'Query')
+
+    monkeypatch.setattr(reactions.counters_table, 'query', failing_query)
+    assert reactions.get_counts(target) == {'like_count': 0, 'dislike_count': 0}
+    assert reactions.count_cache.get(target) is None
+
+
+def test_other_workers_reactions_show_after_ttl(reactions, target, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(reactions, 'count_cache', TTLCache(ttl=10, timer=lambda: now[0]))
+
+    reactions.react(target, 'u1', 'like')
+    # Başka bir worker yalnızca tablolara yazar, bizim önbelleğimize değil
+    reactions._write_reaction(target, 'u2', 'like', None)
+
+    # Kendi yazmalarımız kaydın süresini uzatmaz
+    now[0] = 9
+    assert reactions.react(target, 'u3', 'like')['like_count'] == 2
+    now[0] = 11
+    assert reactions.get_counts(target)['like_count'] == 3
@@ -0,0 +1,49 @@
+"""
+İmzalı URL Önbelleği Testleri
+---------------------------
+İmzalı URL'lerin pencere içinde yeniden kullanıldığını ve süresi dolmaya
+yaklaşınca yeniden imzalandığını doğrular.
+"""
+
+from app.utils.s3 import PresignedUrlCache
+
+
+class SigningClient:
+    def __init__(self, timer):
+        self.timer = timer
+        self.calls = 0
+
+    def generate_presigned_url(self, ClientMethod, Params, ExpiresIn):
+        self.calls += 1
+        return f"https://{Params['Bucket']}/{Params['Key']}?signed={self.timer()}&expires={ExpiresIn}"
+
+
+def test_url_reused_within_window_and_resigned_after():
+    now = [1000.0]
+    client = SigningClient(lambda: now[0])
+    cache = PresignedUrlCache(maxsize=10, reuse_ratio=0.5, timer=lambda: now[0])
+
+    first = cache.get_url(client, 'bucket', 'a.jpg', expires_in=600)
+    now[0] = 1150.0
+    assert cache.get_url(client, 'bucket', 'a.jpg', expires_in=600) == first
+    assert client.calls == 1
+
+    # 300 saniyelik pencere bitti: kalan ömür yarının altına inmeden yenilenir
+    now[0] = 1200.0
+    second = cache.get_url(client, 'bucket', 'a.jpg', expires_in=600)
+    assert second != first
+    assert client.calls == 2
+
+
+def test_entries_are_keyed_by_object_and_expiry():
+    now = [0.0]
+    client = SigningClient(lambda: now[0])
+    cache = PresignedUrlCache(maxsize=10, reuse_ratio=0.5, timer=lambda: now[0])
+
+    cache.get_url(client, 'bucket', 'a.jpg', expires_in=600)
+    cache.get_url(client, 'bucket', 'b.jpg', expires_in=600)
+    cache.get_url(client, 'bucket', 'a.jpg', expires_in=60)
+    cache.get_url(client, 'bucket', 'a.jpg', expires_in=600)
+
+    assert client.calls == 3
+    assert cache.stats()['hits'] == 1
@@ -0,0 +1,78 @@
+"""
+Arama Dizini Testleri
+-------------------
+Türkçe katlamayı, BM25 sıralamasını, önek eşleşmesini, anlık görüntüyü ve
+dizin yüklenirken gelen yazmaların kaybolmadığını doğrular.
+"""
+
+import threading
+
+from app.search import SearchIndex, SearchRegistry, fold, tokenize
+from app.search.registry import SEARCH_SOURCES
+
+
+def test_fold_handles_turkish_case_and_accents():
+    assert fold('İSTANBUL') == fold('ıstanbul') == fold('Istanbul') == 'istanbul'
+    assert tokenize('Öğrenci Şenliği, Çarşamba!') == ['ogrenci', 'senligi', 'carsamba']
+
+
+def test_bm25_ranks_header_matches_and_prefixes():
+    index = SearchIndex({'header': 3})
+    index.add('a', {'header': 'Kitap kulübü', 'description': 'Haftalık buluşma'}, {'category': 'sosyal'})
+    index.add('b', {'header': 'Haftalık buluşma', 'description': 'Kitap okuyoruz'}, {'category': 'sosyal'})
+    index.add('c', {'header': 'Satranç', 'description': 'Turnuva'}, {'category': 'spor'})
+
+    assert index.search('kitap') == (['a', 'b'], 2)
+    assert index.search('KİTAPLAR') == ([], 0)
+    assert index.search('kita bulus')[0] == ['a', 'b']
+    assert index.search('kitap', {'category': 'spor'}) == ([], 0)
+    assert index.search('kitap', limit=1, offset=1) == (['b'], 2)
+
+    index.remove('a')
+    assert index.search('kitap') == (['b'], 1)
+    assert 'a' not in index and len(index) == 2
+
+
+def test_snapshot_round_trip(tmp_path):
+    index = SearchIndex({'header': 3})
+    index.add('a', {'header': 'Öğrenci konseyi'}, {'kategoriler': ['okul', 'siyaset']})
+    path = str(tmp_path / 'forums.json.gz')
+    index.save(path)
+
+    loaded = SearchIndex.load(path)
+    assert loaded.search('ogrenci', {'kategoriler': ['spor', 'okul']}) == (['a'], 1)
+    assert loaded.search('konsey')[0] == ['a']
+
+
+def test_writes_during_initial_build_are_kept():
+    started = threading.Event()
+    release = threading.Event()
+
+    def scan():
+        started.set()
+        release.wait(5)
+        yield {'forum_id': 'old', 'header': 'Eski başlık', 'is_active': True}
+
+    registry = SearchRegistry(SEARCH_SOURCES['forums'], scan=scan)
+    searcher = threading.Thread(target=registry.search, args=('eski',))
+    searcher.start()
+    started.wait(5)
+
+    registry.update({'forum_id': 'new', 'header': 'Yeni başlık', 'is_active': True})
+    registry.remove('old')
+    release.set()
+    searcher.join(5)
+
+    assert registry.search('baslik') == (['new'], 1)
+
+
+def test_writes_before_first_search_are_not_buffered():
+    registry = SearchRegistry(SEARCH_SOURCES['forums'], scan=lambda: [
+        {'forum_id': 'f1', 'header': 'Tablodaki başlık', 'is_active': True}
+    ])
+    for number in range(100):
+        registry.update({'forum_id': f'f{number}', 'header': 'Başlık', 'is_active': True})
+
+    assert registry._pending is None
+    assert registry.search('tablodaki') == (['f1'], 1)
+    assert registry._pending is None
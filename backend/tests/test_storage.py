@@ -0,0 +1,165 @@
+"""
+SQLite Depolama Motoru Testleri
+-----------------------------
+app.storage.sqlite motorunun DynamoDB ile aynı anlamda çalıştığını doğrular.
+AWS bağlantısı gerektirmez.
+"""
+
+import threading
+from decimal import Decimal
+
+import pytest
+from boto3.dynamodb.conditions import Key, Attr
+from botocore.exceptions import ClientError
+
+from app.storage.sqlite import SQLiteResource
+from app.utils.dynamodb import cancellation_reasons
+
+
+@pytest.fixture
+def dynamodb(tmp_path):
+    resource = SQLiteResource(str(tmp_path / 'test.db'))
+    client = resource.meta.client
+    client.create_table(
+        TableName='Posts',
+        KeySchema=[{'AttributeName': 'post_id', 'KeyType': 'HASH'}],
+        AttributeDefinitions=[
+            {'AttributeName': 'post_id', 'AttributeType': 'S'},
+            {'AttributeName': 'category', 'AttributeType': 'S'},
+            {'AttributeName': 'created_at', 'AttributeType': 'S'}
+        ],
+        GlobalSecondaryIndexes=[{
+            'IndexName': 'category-created_at-index',
+            'KeySchema': [
+                {'AttributeName': 'category', 'KeyType': 'HASH'},
+                {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        }]
+    )
+    client.create_table(
+        TableName='Counters',
+        KeySchema=[
+            {'AttributeName': 'target_id', 'KeyType': 'HASH'},
+            {'AttributeName': 'shard', 'KeyType': 'RANGE'}
+        ],
+        AttributeDefinitions=[
+            {'AttributeName': 'target_id', 'AttributeType': 'S'},
+            {'AttributeName': 'shard', 'AttributeType': 'N'}
+        ]
+    )
+    return resource
+
+
+def test_items_round_trip_with_decimal_numbers(dynamodb):
+    table = dynamodb.Table('Posts')
+    table.put_item(Item={'post_id': 'p1', 'likes': 3, 'tags': {'a', 'b'}, 'meta': {'x': [1, None]}})
+
+    item = table.get_item(Key={'post_id': 'p1'})['Item']
+
+    assert item == {'post_id': 'p1', 'likes': Decimal(3), 'tags': {'a', 'b'}, 'meta': {'x': [Decimal(1), None]}}
+    assert 'Item' not in table.get_item(Key={'post_id': 'missing'})
+
+
+def test_conditional_put_and_update_expressions(dynamodb):
+    table = dynamodb.Table('Posts')
+    table.put_item(Item={'post_id': 'p1', 'options': [{'id': 'o1', 'votes': 0}]})
+
+    with pytest.raises(ClientError) as error:
+        table.put_item(Item={'post_id': 'p1'}, ConditionExpression='attribute_not_exists(post_id)')
+    assert error.value.response['Error']['Code'] == 'ConditionalCheckFailedException'
+
+    response = table.update_item(
+        Key={'post_id': 'p1'},
+        UpdateExpression=(
+            'SET options[0].votes = options[0].votes + :one, '
+            'replies = list_append(if_not_exists(replies, :empty), :reply) '
+            'ADD views :one'
+        ),
+        ConditionExpression='options[0].id = :option',
+        ExpressionAttributeValues={':one': 1, ':empty': [], ':reply': ['r1'], ':option': 'o1'},
+        ReturnValues='ALL_NEW'
+    )
+
+    assert response['Attributes']['options'][0]['votes'] == 1
+    assert response['Attributes']['replies'] == ['r1']
+    assert response['Attributes']['views'] == 1
+
+
+def test_query_index_pages_newest_first_and_skips_sparse_items(dynamodb):
+    table = dynamodb.Table('Posts')
+    for number in range(5):
+        table.put_item(Item={'post_id': f'p{number}', 'category': 'news', 'created_at': f'2024-01-0{number + 1}'})
+    # Index anahtarı olmayan öğe index'e girmez
+    table.put_item(Item={'post_id': 'uncategorized', 'created_at': '2024-02-01'})
+
+    seen = []
+    params = {
+        'IndexName': 'category-created_at-index',
+        'KeyConditionExpression': Key('category').eq('news'),
+        'ScanIndexForward': False,
+        'Limit': 2
+    }
+    while True:
+        response = table.query(**params)
+        seen.extend(item['post_id'] for item in response['Items'])
+        if 'LastEvaluatedKey' not in response:
+            break
+        params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    assert seen == ['p4', 'p3', 'p2', 'p1', 'p0']
+
+    with pytest.raises(ClientError):
+        table.put_item(Item={'post_id': 'bad', 'category': None, 'created_at': 'x'})
+
+
+def test_scan_filter_applies_after_limit(dynamodb):
+    table = dynamodb.Table('Posts')
+    for number in range(4):
+        table.put_item(Item={'post_id': f'p{number}', 'active': number % 2 == 0})
+
+    response = table.scan(FilterExpression=Attr('active').eq(True), Limit=2)
+
+    assert response['ScannedCount'] == 2
+    assert response['Count'] == 1
+    assert 'LastEvaluatedKey' in response
+
+
+def test_transaction_is_all_or_nothing(dynamodb):
+    client = dynamodb.meta.client
+    table = dynamodb.Table('Posts')
+    table.put_item(Item={'post_id': 'taken'})
+
+    with pytest.raises(ClientError) as error:
+        client.transact_write_items(TransactItems=[
+            {'Put': {'TableName': 'Posts', 'Item': {'post_id': 'new'}}},
+            {'Put': {
+                'TableName': 'Posts',
+                'Item': {'post_id': 'taken'},
+                'ConditionExpression': 'attribute_not_exists(post_id)'
+            }}
+        ])
+
+    assert cancellation_reasons(error.value) == ['None', 'ConditionalCheckFailed']
+    assert 'Item' not in table.get_item(Key={'post_id': 'new'})
+
+
+def test_concurrent_counter_updates_are_not_lost(dynamodb):
+    table = dynamodb.Table('Counters')
+
+    def increment():
+        for _ in range(25):
+            table.update_item(
+                Key={'target_id': 't1', 'shard': 0},
+                UpdateExpression='ADD like_count :one',
+                ExpressionAttributeValues={':one': 1}
+            )
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    item = table.get_item(Key={'target_id': 't1', 'shard': 0})['Item']
+    assert item['like_count'] == 100
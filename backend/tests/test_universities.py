@@ -0,0 +1,68 @@
+"""
+Üniversite Alan Adı Kaydı Testleri
+--------------------------------
+Ters etiket trie'sinin eşleşmelerini ve dosya değişiminde yeniden yüklemeyi
+doğrular.
+"""
+
+import json
+import os
+
+import pytest
+
+from app.utils.universities import DomainTrie, UniversityRegistry
+
+
+@pytest.fixture
+def trie():
+    return DomainTrie([
+        ('etu.edu.tr', 'TOBB ETÜ'),
+        ('bilkent.edu.tr', 'Bilkent'),
+        ('cs.bilkent.edu.tr', 'Bilkent Bilgisayar')
+    ])
+
+
+def test_exact_and_subdomain_matches(trie):
+    assert trie.lookup('etu.edu.tr') == 'TOBB ETÜ'
+    assert trie.lookup('ogr.etu.edu.tr') == 'TOBB ETÜ'
+    assert trie.lookup('OGR.ETU.EDU.TR.') == 'TOBB ETÜ'
+    # En uzun son ek kazanır
+    assert trie.lookup('ug.cs.bilkent.edu.tr') == 'Bilkent Bilgisayar'
+
+
+def test_matches_only_on_label_boundaries(trie):
+    assert trie.lookup('notetu.edu.tr') is None
+    assert trie.lookup('edu.tr') is None
+    assert trie.lookup('etu.edu.tr.evil.com') is None
+    assert trie.lookup('') is None
+    assert len(trie) == 3
+
+
+def test_registry_reloads_when_file_changes(tmp_path):
+    path = tmp_path / 'universities.json'
+    path.write_text(json.dumps({'etu.edu.tr': 'TOBB ETÜ'}), encoding='utf-8')
+    now = [0.0]
+    registry = UniversityRegistry(str(path), reload_interval=10, timer=lambda: now[0])
+
+    assert registry.university_for_email('ali@ogr.etu.edu.tr') == 'TOBB ETÜ'
+    assert registry.university_for_email('ali@bilkent.edu.tr') is None
+
+    path.write_text(json.dumps({'bilkent.edu.tr': 'Bilkent'}), encoding='utf-8')
+    os.utime(path, (1, 1))
+    # Kontrol aralığı dolmadan dosyaya bakılmaz
+    assert registry.university_for_email('ali@bilkent.edu.tr') is None
+
+    now[0] = 11
+    assert registry.university_for_email('ali@bilkent.edu.tr') == 'Bilkent'
+    assert registry.university_for_email('ali@etu.edu.tr') is None
+
+
+def test_registry_keeps_previous_list_on_bad_file(tmp_path):
+    path = tmp_path / 'universities.json'
+    path.write_text(json.dumps({'etu.edu.tr': 'TOBB ETÜ'}), encoding='utf-8')
+    registry = UniversityRegistry(str(path), reload_interval=0)
+
+    path.write_text('{"etu.edu.tr": ', encoding='utf-8')
+    os.utime(path, (1, 1))
+
+    assert registry.university_for_email('ali@etu.edu.tr') == 'TOBB ETÜ'
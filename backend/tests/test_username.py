@@ -0,0 +1,67 @@
+"""
+Kullanıcı Adı Ataması Testleri
+----------------------------
+Feistel permütasyonunun birebirliğini ve sayaç tabanlı atamayı doğrular.
+"""
+
+import pytest
+
+from app.services.schema import get_table_definition, USERNAME_COUNTERS_TABLE_NAME
+from app.storage.sqlite import SQLiteResource
+from app.utils import username
+from app.utils.username import FeistelPermutation, UsernameAllocator, username_at
+
+PARTS = (['Siyah', 'Beyaz'], ['Adana', 'Bursa', 'Van'], ['Kedisi', 'Atı'])
+
+
+@pytest.fixture
+def table(tmp_path):
+    resource = SQLiteResource(str(tmp_path / 'test.db'))
+    resource.meta.client.create_table(**get_table_definition(USERNAME_COUNTERS_TABLE_NAME))
+    return resource.Table(USERNAME_COUNTERS_TABLE_NAME)
+
+
+@pytest.mark.parametrize('size', [1, 7, 12, 1000, 4097])
+def test_permutation_is_bijective(size):
+    permutation = FeistelPermutation(size, b'key')
+
+    assert sorted(permutation.permute(i) for i in range(size)) == list(range(size))
+
+
+def test_permutation_depends_on_key():
+    first = FeistelPermutation(1000, b'a')
+    second = FeistelPermutation(1000, b'b')
+
+    assert [first.permute(i) for i in range(20)] != [second.permute(i) for i in range(20)]
+
+
+def test_username_at_covers_every_combination():
+    names = {username_at(i, PARTS) for i in range(12)}
+
+    assert len(names) == 12
+    assert username_at(0, PARTS) == 'Siyah Adana Kedisi'
+    assert username_at(11, PARTS) == 'Beyaz Van Atı'
+
+
+def test_allocator_hands_out_unique_names_until_exhausted(table):
+    allocator = UsernameAllocator(table, key='test', parts=PARTS)
+
+    names = [allocator.allocate('ODTÜ') for _ in range(12)]
+
+    assert len(set(names)) == 12
+    with pytest.raises(ValueError):
+        allocator.allocate('ODTÜ')
+    # Sayaçlar üniversite başına tutulur
+    assert allocator.allocate('İTÜ') in names
+
+
+def test_production_requires_permutation_key(monkeypatch):
+    from flask import Flask
+
+    app = Flask(__name__)
+    monkeypatch.setattr(username, 'USERNAME_PERMUTATION_KEY', '')
+    with pytest.raises(RuntimeError):
+        username.check_permutation_key(app)
+
+    monkeypatch.setattr(username, 'USERNAME_PERMUTATION_KEY', 'ayri-anahtar')
+    username.check_permutation_key(app)